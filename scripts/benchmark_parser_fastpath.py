@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the LALR parser fast path against the Earley-only parser.
+
+For every model the preprocessed source is parsed twice, once with the
+statement-level LALR fast path (the default) and once with
+NLP2MCP_NO_LALR_FASTPATH=1 (every statement parsed by Earley). The script
+checks that both produce an identical ModelIR (or fail with the same error)
+and reports the parse time of each mode.
+
+Usage:
+    python scripts/benchmark_parser_fastpath.py                 # data/gamslib/raw
+    python scripts/benchmark_parser_fastpath.py data/gamslib/mcp tests/fixtures
+    python scripts/benchmark_parser_fastpath.py --limit 20 --verbose
+
+Exit codes:
+    0: Every model produced the same ModelIR (or the same error) in both modes
+    1: At least one model differed, or no models were found
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.ir.parser import parse_model_text  # noqa: E402
+from src.ir.preprocessor import preprocess_gams_file  # noqa: E402
+
+DEFAULT_DIR = PROJECT_ROOT / "data" / "gamslib" / "raw"
+NO_FASTPATH_ENV = "NLP2MCP_NO_LALR_FASTPATH"
+
+
+def collect_models(paths: list[Path]) -> list[Path]:
+    """Return the .gms files named by ``paths`` (directories are searched recursively)."""
+    models: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            models.extend(sorted(path.rglob("*.gms")))
+        elif path.suffix.lower() == ".gms":
+            models.append(path)
+    return models
+
+
+def timed_parse(source: str, fast_path: bool) -> tuple[object, str | None, float]:
+    """Parse ``source`` into a ModelIR and return (model, error, seconds)."""
+    previous = os.environ.get(NO_FASTPATH_ENV)
+    os.environ[NO_FASTPATH_ENV] = "0" if fast_path else "1"
+    start = time.perf_counter()
+    try:
+        return parse_model_text(source), None, time.perf_counter() - start
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}", time.perf_counter() - start
+    finally:
+        if previous is None:
+            del os.environ[NO_FASTPATH_ENV]
+        else:
+            os.environ[NO_FASTPATH_ENV] = previous
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[DEFAULT_DIR],
+        help=f"Model files or directories (default: {DEFAULT_DIR.relative_to(PROJECT_ROOT)})",
+    )
+    parser.add_argument("--limit", type=int, help="Only benchmark the first N models")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print per-model timings")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(50000)
+    models = collect_models(args.paths)
+    if args.limit:
+        models = models[: args.limit]
+    if not models:
+        print(f"No .gms models found in: {', '.join(str(p) for p in args.paths)}")
+        return 1
+
+    # Load both compiled grammars before timing anything.
+    timed_parse("Scalar x;", fast_path=True)
+
+    earley_total = fast_total = 0.0
+    identical = errors = 0
+    mismatches: list[str] = []
+    for model_path in models:
+        try:
+            source = preprocess_gams_file(model_path)
+        except Exception as e:
+            print(f"  SKIP {model_path}: preprocessing failed ({type(e).__name__})")
+            continue
+
+        reference, reference_error, earley_time = timed_parse(source, fast_path=False)
+        candidate, candidate_error, fast_time = timed_parse(source, fast_path=True)
+        earley_total += earley_time
+        fast_total += fast_time
+
+        if reference_error is not None or candidate_error is not None:
+            same = reference_error == candidate_error
+            errors += 1
+        else:
+            same = reference == candidate or repr(reference) == repr(candidate)
+        if same:
+            identical += 1
+        else:
+            mismatches.append(str(model_path))
+
+        if args.verbose or not same:
+            status = "OK  " if same else "DIFF"
+            speedup = earley_time / fast_time if fast_time > 0 else float("inf")
+            print(
+                f"  {status} {model_path.name:40s} earley {earley_time:7.3f}s"
+                f"  fast {fast_time:7.3f}s  ({speedup:5.1f}x)"
+            )
+
+    print()
+    print(f"Models:          {identical + len(mismatches)}")
+    print(f"Identical IR:    {identical} ({errors} failing identically in both modes)")
+    print(f"Mismatches:      {len(mismatches)}")
+    print(f"Earley parse:    {earley_total:.2f}s")
+    print(f"Fast-path parse: {fast_total:.2f}s")
+    if fast_total > 0:
+        print(f"Speedup:         {earley_total / fast_total:.2f}x")
+    for path in mismatches:
+        print(f"  MISMATCH: {path}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
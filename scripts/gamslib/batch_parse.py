@@ -12,7 +12,8 @@ Options:
     --limit N           Process only first N models (for testing)
     --model ID          Process a single model by ID
     --verbose           Show detailed output for each model
-    --save-every N      Save database every N models (default: 10)
+    --save-every N      Fold journaled results into the database every N models
+                        (default: only at the end)
 
 Filter Options:
     --only-failing      Only process models with parse failure status
@@ -48,9 +49,10 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from scripts.gamslib.db_manager import (
     DATABASE_PATH,
+    compact_database,
     create_backup,
     load_database,
-    save_database,
+    upsert_model,
 )
 from scripts.gamslib.error_taxonomy import categorize_parse_error
 from scripts.gamslib.utils import get_nlp2mcp_version
@@ -419,23 +421,25 @@ def run_batch_parse(
             parse_entry["error"] = result.get("error")
 
         # Find and update model in database
+        fields: dict[str, Any] = {"nlp2mcp_parse": parse_entry}
+        # Store model_statistics as separate object on success
+        if result["status"] == "success" and "model_statistics" in result:
+            fields["model_statistics"] = result["model_statistics"]
         for db_model in database.get("models", []):
             if db_model.get("model_id") == model_id:
-                db_model["nlp2mcp_parse"] = parse_entry
-                # Store model_statistics as separate object on success
-                if result["status"] == "success" and "model_statistics" in result:
-                    db_model["model_statistics"] = result["model_statistics"]
+                db_model.update(fields)
                 break
+        upsert_model(model_id, fields)
 
-        # Save periodically
-        if stats["processed"] % args.save_every == 0:
-            save_database(database)
+        # Each result is journaled as it is recorded; fold the journal in periodically
+        if args.save_every and stats["processed"] % args.save_every == 0:
+            compact_database()
             if args.verbose:
                 logger.info(f"  Saved database ({stats['processed']} models processed)")
 
-    # Final save
+    # Final save: fold this run's journaled results into the database file
     if not args.dry_run:
-        save_database(database)
+        compact_database()
         logger.info("Final database save complete")
 
     # Calculate final stats
@@ -516,8 +520,8 @@ def main() -> int:
     parser.add_argument(
         "--save-every",
         type=int,
-        default=10,
-        help="Save database every N models (default: 10)",
+        default=0,
+        help="Fold journaled results into the database every N models (default: only at the end)",
     )
 
     # Filter arguments
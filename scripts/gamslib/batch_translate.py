@@ -12,7 +12,9 @@ Options:
     --limit N      Process only first N models (for testing)
     --model ID     Process a single model by ID
     --verbose      Show detailed output for each model
-    --save-every N Save database every N models (default: 5)
+    --save-every N Fold journaled results into the database every N models
+                   (default: only at the end)
+    --jobs N       Translate N models at a time in long-lived worker processes
 
 Filter Options:
     --parse-success       Only process models with parse success status
@@ -29,6 +31,7 @@ Examples:
     python scripts/gamslib/batch_translate.py
     python scripts/gamslib/batch_translate.py --dry-run
     python scripts/gamslib/batch_translate.py --limit 5 --verbose
+    python scripts/gamslib/batch_translate.py --jobs 8
     python scripts/gamslib/batch_translate.py --model alkyl
     python scripts/gamslib/batch_translate.py --parse-success --limit 10
     python scripts/gamslib/batch_translate.py --translate-failure --limit 5
@@ -45,9 +48,11 @@ import subprocess
 import sys
 import time
 import traceback
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -55,17 +60,28 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from scripts.gamslib.db_manager import (
     DATABASE_PATH,
+    compact_database,
     create_backup,
     load_database,
-    save_database,
+    upsert_model,
 )
 from scripts.gamslib.error_taxonomy import categorize_translate_error
 from scripts.gamslib.utils import get_nlp2mcp_version
 
+if TYPE_CHECKING:
+    from src.server import TranslationPool
+
 # Paths
 RAW_MODELS_DIR = PROJECT_ROOT / "data" / "gamslib" / "raw"
 MCP_OUTPUT_DIR = PROJECT_ROOT / "data" / "gamslib" / "mcp"
 
+# Per-model translation timeout (bumped 300 -> 600 to accommodate larger models)
+TRANSLATE_TIMEOUT = 600  # seconds
+# --jobs workers are replaced after this many models...
+WORKER_MAX_MODELS = 50
+# ...or once their peak resident memory exceeds this many MB
+WORKER_RECYCLE_RSS_MB = 2048
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -217,8 +233,54 @@ def report_filter_summary(
 # =============================================================================
 
 
+def _translate_args(model_path: Path, output_path: Path, nlp_presolve: bool) -> list[str]:
+    """Return the nlp2mcp command-line arguments that translate one model."""
+    args = [str(model_path), "-o", str(output_path), "--quiet"]
+    if nlp_presolve:
+        args.append("--nlp-presolve")
+    return args
+
+
+def _translate_result(
+    succeeded: bool, stdout: str, stderr: str, elapsed: float, output_path: Path
+) -> dict[str, Any]:
+    """Build the result dictionary of a finished nlp2mcp run."""
+    if succeeded:
+        # Success - use 4 decimal precision for timing
+        return {
+            "status": "success",
+            "translate_time_seconds": round(elapsed, 4),
+            "output_file": str(output_path.relative_to(PROJECT_ROOT)),
+        }
+    # Translation failed
+    error_msg = stderr if stderr else stdout
+    return {
+        "status": "failure",
+        "translate_time_seconds": round(elapsed, 4),
+        "error": {
+            "category": categorize_translate_error(error_msg),
+            "message": error_msg[:500],  # Truncate long messages
+        },
+    }
+
+
+def _timeout_result(elapsed: float) -> dict[str, Any]:
+    return {
+        "status": "failure",
+        "translate_time_seconds": round(elapsed, 4),
+        "error": {
+            "category": "timeout",
+            "message": f"Translation timeout after {TRANSLATE_TIMEOUT} seconds",
+        },
+    }
+
+
 def translate_single_model(
-    model_path: Path, output_path: Path, *, nlp_presolve: bool = False
+    model_path: Path,
+    output_path: Path,
+    *,
+    nlp_presolve: bool = False,
+    pool: TranslationPool | None = None,
 ) -> dict[str, Any]:
     """Translate a single GAMS model to MCP format.
 
@@ -227,6 +289,8 @@ def translate_single_model(
         output_path: Path where MCP output should be written
         nlp_presolve: If True, add --nlp-presolve flag to warm-start
             MCP dual variables from an NLP pre-solve step
+        pool: Worker pool from make_translation_pool() to run the translation
+            in; by default it runs in a fresh ``src.cli`` subprocess
 
     Returns:
         Dictionary with translation results:
@@ -241,64 +305,34 @@ def translate_single_model(
     try:
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        cli_args = _translate_args(model_path, output_path, nlp_presolve)
+
+        if pool is not None:
+            # Same arguments, timeout and captured stderr as the subprocess path
+            reply = pool.translate(cli_args, timeout=TRANSLATE_TIMEOUT)
+            if reply.status == "timeout":
+                return _timeout_result(reply.elapsed)
+            return _translate_result(
+                reply.status == "ok", reply.stdout, reply.stderr, reply.elapsed, output_path
+            )
 
         # Run nlp2mcp via subprocess
-        cmd = [
-            sys.executable,
-            "-m",
-            "src.cli",
-            str(model_path),
-            "-o",
-            str(output_path),
-            "--quiet",
-        ]
-        if nlp_presolve:
-            cmd.append("--nlp-presolve")
-
         proc = subprocess.Popen(
-            cmd,
+            [sys.executable, "-m", "src.cli", *cli_args],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
         )
 
-        translate_timeout = 600  # seconds (bumped 300 -> 600 to accommodate larger models)
         try:
-            stdout, stderr = proc.communicate(timeout=translate_timeout)
+            stdout, stderr = proc.communicate(timeout=TRANSLATE_TIMEOUT)
             elapsed = time.perf_counter() - start_time
-
-            if proc.returncode == 0:
-                # Success - use 4 decimal precision for timing
-                result = {
-                    "status": "success",
-                    "translate_time_seconds": round(elapsed, 4),
-                    "output_file": str(output_path.relative_to(PROJECT_ROOT)),
-                }
-            else:
-                # Translation failed
-                error_msg = stderr if stderr else stdout
-                category = categorize_translate_error(error_msg)
-                result = {
-                    "status": "failure",
-                    "translate_time_seconds": round(elapsed, 4),
-                    "error": {
-                        "category": category,
-                        "message": error_msg[:500],  # Truncate long messages
-                    },
-                }
+            result = _translate_result(proc.returncode == 0, stdout, stderr, elapsed, output_path)
         except subprocess.TimeoutExpired:
             # Kill the subprocess on timeout to prevent orphaned processes
             proc.kill()
             proc.communicate()  # Clean up the process
-            elapsed = time.perf_counter() - start_time
-            result = {
-                "status": "failure",
-                "translate_time_seconds": round(elapsed, 4),
-                "error": {
-                    "category": "timeout",
-                    "message": f"Translation timeout after {translate_timeout} seconds",
-                },
-            }
+            result = _timeout_result(time.perf_counter() - start_time)
 
     except Exception as e:
         elapsed = time.perf_counter() - start_time
@@ -317,6 +351,83 @@ def translate_single_model(
     return result
 
 
+def make_translation_pool(jobs: int) -> TranslationPool:
+    """Start ``jobs`` long-lived nlp2mcp worker processes (see ``src/server.py``).
+
+    Each worker imports the pipeline and loads the GAMS parsers once, then
+    translates model after model. A worker is replaced after
+    ``WORKER_MAX_MODELS`` models or once its peak RSS exceeds
+    ``WORKER_RECYCLE_RSS_MB``, so state leaked by one model (or the memory
+    high-water mark of a huge one) does not accumulate over a corpus run.
+    """
+    from src.server import TranslationPool
+
+    pool = TranslationPool(
+        jobs, max_requests=WORKER_MAX_MODELS, recycle_rss_mb=WORKER_RECYCLE_RSS_MB
+    )
+    pool.start()
+    return pool
+
+
+def translate_models(
+    tasks: Sequence[tuple[Path, Path]], *, jobs: int = 1, validate: bool = False
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Translate ``(model_path, output_path)`` pairs, yielding ``(index, result)``.
+
+    With ``jobs <= 1`` every model runs in its own ``src.cli`` subprocess and
+    results arrive in order. Otherwise ``jobs`` models are translated at a
+    time by a worker pool and results are yielded as they finish. With
+    ``validate``, each successful output is also compile-checked and the
+    outcome stored under ``result["validation"]``.
+    """
+
+    def translate(model_path: Path, output_path: Path, pool: TranslationPool | None) -> dict:
+        result = translate_single_model(model_path, output_path, pool=pool)
+        if validate and result["status"] == "success":
+            result["validation"] = validate_mcp_file(output_path)
+        return result
+
+    if jobs <= 1:
+        for index, (model_path, output_path) in enumerate(tasks):
+            yield index, translate(model_path, output_path, None)
+        return
+
+    with make_translation_pool(jobs) as pool, ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(translate, model_path, output_path, pool): index
+            for index, (model_path, output_path) in enumerate(tasks)
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def warm_grammar_cache() -> None:
+    """Pre-compile the GAMS grammar into nlp2mcp's on-disk parser cache.
+
+    Each model is translated in a fresh ``src.cli`` subprocess (or, with
+    ``--jobs``, in worker processes started side by side); warming the cache
+    once up front means every one of them loads the compiled parser instead
+    of recompiling ``gams_grammar.lark``. Failure is non-fatal: the processes
+    simply build the grammar themselves.
+    """
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-m", "src.cli", "--warm-grammar-cache"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Could not warm grammar cache: {e}")
+        return
+    if proc.returncode != 0:
+        logger.warning(f"Could not warm grammar cache: {(proc.stderr or proc.stdout).strip()}")
+
+
 def validate_mcp_file(mcp_path: Path) -> dict[str, Any]:
     """Validate an MCP file using GAMS compile check.
 
@@ -472,6 +583,7 @@ def run_batch_translate(
         backup_path = create_backup()
         if backup_path:
             logger.info(f"Created backup: {backup_path}")
+        warm_grammar_cache()
 
     # Statistics
     stats: dict[str, Any] = {
@@ -490,23 +602,11 @@ def run_batch_translate(
         stats["validation_passed"] = 0
         stats["validation_failed"] = 0
 
-    # Process each model
-    for i, model in enumerate(candidates, 1):
+    # Collect the models to translate
+    tasks: list[tuple[str, Path]] = []
+    for model in candidates:
         model_id = model.get("model_id", "unknown")
         model_path = RAW_MODELS_DIR / f"{model_id}.gms"
-        output_path = MCP_OUTPUT_DIR / f"{model_id}_mcp.gms"
-
-        # Progress reporting
-        if i % 5 == 0 or i == 1:
-            elapsed = time.perf_counter() - stats["start_time"]
-            avg_time = elapsed / i
-            remaining = (len(candidates) - i) * avg_time
-            logger.info(
-                f"[{i:3d}/{len(candidates)}] {i * 100 // len(candidates):3d}% "
-                f"Translating {model_id}... "
-                f"({stats['success']} success, {stats['failure']} failure, "
-                f"~{remaining:.0f}s remaining)"
-            )
 
         # Check if file exists
         if not model_path.exists():
@@ -520,13 +620,36 @@ def run_batch_translate(
             stats["processed"] += 1
             continue
 
-        # Translate the model
-        if args.verbose:
-            logger.info(f"  Translating {model_id}...")
+        tasks.append((model_id, model_path))
+
+    jobs = getattr(args, "jobs", 1)
+    if tasks and jobs > 1:
+        logger.info(f"Translating {len(tasks)} models with {jobs} worker processes")
 
-        result = translate_single_model(model_path, output_path)
+    # Translate the models; with --jobs they finish in any order
+    results = translate_models(
+        [(model_path, MCP_OUTPUT_DIR / f"{model_id}_mcp.gms") for model_id, model_path in tasks],
+        jobs=jobs,
+        validate=args.validate,
+    )
+    for done, (index, result) in enumerate(results, 1):
+        model_id = tasks[index][0]
         stats["processed"] += 1
 
+        # Progress reporting
+        if done % 5 == 0 or done == 1:
+            elapsed = time.perf_counter() - stats["start_time"]
+            remaining = (len(tasks) - done) * elapsed / done
+            logger.info(
+                f"[{done:3d}/{len(tasks)}] {done * 100 // len(tasks):3d}% "
+                f"Translated {model_id} "
+                f"({stats['success']} success, {stats['failure']} failure, "
+                f"~{remaining:.0f}s remaining)"
+            )
+
+        if args.verbose:
+            logger.info(f"  Translated {model_id}")
+
         # Update statistics
         if result["status"] == "success":
             stats["success"] += 1
@@ -537,9 +660,9 @@ def run_batch_translate(
                     f"output: {result['output_file']}"
                 )
 
-            # Validate MCP file if --validate flag is set
-            if args.validate:
-                validation_result = validate_mcp_file(output_path)
+            # Validation result if --validate flag is set
+            if "validation" in result:
+                validation_result = result["validation"]
                 stats["validated"] += 1
                 if validation_result["valid"]:
                     stats["validation_passed"] += 1
@@ -553,8 +676,6 @@ def run_batch_translate(
                         logger.info(
                             f"    VALIDATION FAILED: {validation_result.get('error', '')[:60]}"
                         )
-                # Store validation result
-                result["validation"] = validation_result
         else:
             stats["failure"] += 1
             # Track error categories
@@ -587,16 +708,17 @@ def run_batch_translate(
             if db_model.get("model_id") == model_id:
                 db_model["nlp2mcp_translate"] = translate_entry
                 break
+        upsert_model(model_id, {"nlp2mcp_translate": translate_entry})
 
-        # Save periodically
-        if stats["processed"] % args.save_every == 0:
-            save_database(database)
+        # Each result is journaled as it is recorded; fold the journal in periodically
+        if args.save_every and stats["processed"] % args.save_every == 0:
+            compact_database()
             if args.verbose:
                 logger.info(f"  Saved database ({stats['processed']} models processed)")
 
-    # Final save
+    # Final save: fold this run's journaled results into the database file
     if not args.dry_run:
-        save_database(database)
+        compact_database()
         logger.info("Final database save complete")
 
     # Calculate final stats
@@ -684,8 +806,17 @@ def main() -> int:
     parser.add_argument(
         "--save-every",
         type=int,
-        default=5,
-        help="Save database every N models (default: 5)",
+        default=0,
+        help="Fold journaled results into the database every N models (default: only at the end)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Translate N models at a time in long-lived worker processes "
+        "(default: 1, one subprocess per model)",
     )
 
     # Filter arguments
@@ -13,6 +13,7 @@ Commands:
     list      List all models with summary
     get       Get model details (Day 4)
     update    Update model field(s) (Day 4)
+    compact   Fold journaled model updates into the database
     query     Query models by criteria (Day 5)
     export    Export to CSV/Markdown (Day 5)
     stats     Show statistics (Day 5)
@@ -42,6 +43,8 @@ _NOT_FOUND = object()
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from scripts.gamslib.results_store import ResultsStore  # noqa: E402
+
 # Paths
 DATABASE_PATH = PROJECT_ROOT / "data" / "gamslib" / "gamslib_status.json"
 CATALOG_PATH = PROJECT_ROOT / "data" / "gamslib" / "catalog.json"
@@ -67,7 +70,7 @@ logger = logging.getLogger(__name__)
 
 
 def load_database(path: Path = DATABASE_PATH) -> dict[str, Any]:
-    """Load database from JSON file.
+    """Load database from JSON file, including journaled model updates.
 
     Args:
         path: Path to database file
@@ -80,31 +83,48 @@ def load_database(path: Path = DATABASE_PATH) -> dict[str, Any]:
         json.JSONDecodeError: If database is invalid JSON
     """
     logger.debug(f"Loading database from {path}")
-    with open(path) as f:
-        return json.load(f)
+    return ResultsStore(path).load()
 
 
 def save_database(data: dict[str, Any], path: Path = DATABASE_PATH) -> None:
     """Save database to JSON file with atomic write.
 
-    Uses a temp file and rename to avoid corruption on failure.
+    Uses a temp file and rename to avoid corruption on failure. Replaces the
+    whole database, journaled model updates included; batch runs record
+    their results with upsert_model() instead.
 
     Args:
         data: Database dictionary to save
         path: Output path
     """
     logger.debug(f"Saving database to {path}")
-    path.parent.mkdir(parents=True, exist_ok=True)
+    ResultsStore(path).save(data)
+    logger.debug(f"Saved {len(data.get('models', []))} models to {path}")
 
-    # Write to temp file first
-    temp_path = path.with_suffix(".json.tmp")
-    with open(temp_path, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")  # Trailing newline
 
-    # Atomic rename
-    temp_path.replace(path)
-    logger.debug(f"Saved {len(data.get('models', []))} models to {path}")
+def upsert_model(model_id: str, fields: dict[str, Any], path: Path = DATABASE_PATH) -> None:
+    """Record new values of top-level ``fields`` of one model.
+
+    The update is appended to the database journal (see results_store.py), so
+    it is durable at once, costs one line instead of a full rewrite, and does
+    not overwrite updates other processes make to other models or fields.
+
+    Args:
+        model_id: Model to update (added if missing)
+        fields: Top-level fields to replace, e.g. {"nlp2mcp_parse": {...}}
+        path: Path to database file
+    """
+    ResultsStore(path).upsert(model_id, fields)
+
+
+def compact_database(path: Path = DATABASE_PATH) -> None:
+    """Fold journaled model updates into the database JSON file.
+
+    Args:
+        path: Path to database file
+    """
+    logger.debug(f"Compacting database journal into {path}")
+    ResultsStore(path).compact()
 
 
 def load_schema(path: Path = SCHEMA_PATH) -> dict[str, Any]:
@@ -142,7 +162,12 @@ def create_backup(db_path: Path = DATABASE_PATH) -> Path | None:
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
     backup_path = BACKUP_DIR / f"{timestamp}_{db_path.name}"
-    shutil.copy(db_path, backup_path)
+    store = ResultsStore(db_path)
+    if store.pending():
+        # Back up the current state, journaled updates included
+        store.export(backup_path)
+    else:
+        shutil.copy(db_path, backup_path)
     logger.info(f"Backup created: {backup_path}")
 
     # Prune old backups
@@ -848,6 +873,28 @@ def cmd_update(args: argparse.Namespace) -> int:
     return 0
 
 
+# =============================================================================
+# Subcommand: compact
+# =============================================================================
+
+
+def cmd_compact(args: argparse.Namespace) -> int:
+    """Fold journaled model updates into gamslib_status.json, or export them."""
+    if not DATABASE_PATH.exists():
+        logger.error(f"Database not found: {DATABASE_PATH}")
+        return 1
+
+    store = ResultsStore(DATABASE_PATH)
+    pending = store.pending()
+    if args.output:
+        store.export(args.output)
+        print(f"Exported database ({pending} journaled updates applied) to {args.output}")
+    else:
+        store.compact()
+        print(f"Compacted {pending} journaled updates into {DATABASE_PATH}")
+    return 0
+
+
 # =============================================================================
 # Main Entry Point
 # =============================================================================
@@ -869,6 +916,7 @@ Examples:
     python scripts/gamslib/db_manager.py update trnsport nlp2mcp_parse.status success
     python scripts/gamslib/db_manager.py update trnsport --set nlp2mcp_parse.status=success
     python scripts/gamslib/db_manager.py init --force
+    python scripts/gamslib/db_manager.py compact
         """,
     )
     parser.add_argument(
@@ -992,6 +1040,20 @@ Examples:
         help="Set field=value pair (can be used multiple times)",
     )
 
+    # compact subcommand
+    compact_parser = subparsers.add_parser(
+        "compact",
+        help="Fold journaled model updates into the database",
+        description="Fold the per-model updates journaled by batch runs "
+        "(gamslib_status.json.journal) into gamslib_status.json",
+    )
+    compact_parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        help="Write the up-to-date database to this file instead, leaving the journal as is",
+    )
+
     args = parser.parse_args()
 
     if args.verbose:
@@ -1008,6 +1070,7 @@ Examples:
         "list": cmd_list,
         "get": cmd_get,
         "update": cmd_update,
+        "compact": cmd_compact,
     }
 
     if args.command not in commands:
@@ -0,0 +1,130 @@
+"""Dependency fingerprints for incremental corpus runs.
+
+A model's pipeline results can only change when one of its inputs does: the
+raw ``.gms`` file, a file it pulls in with ``$include``/``$batInclude``, or
+the code that parses, translates, solves and compares it. ``run_full_test.py``
+stores a digest of all of these in each model's ``pipeline_fingerprint``
+entry, together with the stages that ran::
+
+    "pipeline_fingerprint": {
+      "digest": "3f9c...",
+      "stages": ["parse", "translate", "solve", "compare"],
+      "recorded_date": "2026-05-14T18:57:08+00:00"
+    }
+
+With ``--incremental`` a model is skipped when its current digest matches the
+recorded one and the recorded run covered every stage requested now.
+
+Usage:
+    source_digest = source_tree_digest()
+    digest = model_fingerprint(model_path, source_digest)
+    if not is_unchanged(model, digest, stages):
+        run_pipeline(...)
+        model[FINGERPRINT_FIELD] = fingerprint_entry(model, digest, stages)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from scripts.gamslib.utils import get_nlp2mcp_version
+from src.utils.disk_cache import hash_bytes
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Database field holding a model's fingerprint
+FINGERPRINT_FIELD = "pipeline_fingerprint"
+
+# Bump when the inputs of the digest change, so old fingerprints never match
+_FINGERPRINT_VERSION = "1"
+
+# Files under src/ that nlp2mcp reads at run time
+_SOURCE_SUFFIXES = (".py", ".lark")
+
+# Order stages are listed in a fingerprint entry
+_STAGE_ORDER = ("parse", "translate", "solve", "convexity", "compare")
+
+# Pipeline scripts whose logic decides the recorded results (error
+# categories, solve outcomes, comparison tolerances)
+_PIPELINE_SCRIPTS = (
+    "batch_parse.py",
+    "batch_translate.py",
+    "error_taxonomy.py",
+    "run_full_test.py",
+    "test_solve.py",
+)
+
+
+@lru_cache(maxsize=1)
+def source_tree_digest(root: Path = PROJECT_ROOT) -> str:
+    """Digest of the nlp2mcp version, every source file and the pipeline scripts."""
+    parts: list[bytes | str] = [_FINGERPRINT_VERSION, get_nlp2mcp_version()]
+    sources = sorted(path for path in (root / "src").rglob("*") if path.suffix in _SOURCE_SUFFIXES)
+    sources += [root / "scripts" / "gamslib" / name for name in _PIPELINE_SCRIPTS]
+    for path in sources:
+        parts.append(path.relative_to(root).as_posix())
+        parts.append(path.read_bytes())
+    return hash_bytes(*parts)
+
+
+def model_fingerprint(model_path: Path, source_digest: str) -> str | None:
+    """Digest of ``model_path``, its include closure and ``source_digest``.
+
+    Included files are identified relative to the model's directory, so the
+    digest does not depend on where the repository is checked out. Returns
+    None when the closure cannot be built (missing file, circular include);
+    such a model is never considered unchanged.
+    """
+    from src.ir.preprocessor import (
+        CircularIncludeError,
+        IncludeDepthExceededError,
+        include_closure,
+    )
+
+    try:
+        closure = include_closure(model_path)
+    except (OSError, UnicodeDecodeError, CircularIncludeError, IncludeDepthExceededError) as e:
+        logger.debug(f"No fingerprint for {model_path}: {e}")
+        return None
+
+    base = model_path.resolve().parent
+    parts = [_FINGERPRINT_VERSION, source_digest]
+    for path in sorted(closure):
+        parts.append(Path(os.path.relpath(path, base)).as_posix())
+        parts.append(closure[path] or "")
+    return hash_bytes(*parts)
+
+
+def is_unchanged(model: dict[str, Any], digest: str | None, stages: Sequence[str]) -> bool:
+    """Whether ``model``'s recorded run covered ``stages`` with the same inputs."""
+    recorded = model.get(FINGERPRINT_FIELD) or {}
+    return (
+        digest is not None
+        and recorded.get("digest") == digest
+        and set(stages) <= set(recorded.get("stages", []))
+    )
+
+
+def fingerprint_entry(model: dict[str, Any], digest: str, stages: Sequence[str]) -> dict[str, Any]:
+    """Fingerprint entry for ``model`` after running ``stages`` on inputs ``digest``.
+
+    Stages recorded under the same digest by earlier runs are kept, so e.g.
+    an ``--only-parse`` run followed by ``--only-translate`` covers both.
+    """
+    recorded = model.get(FINGERPRINT_FIELD) or {}
+    covered = set(stages)
+    if recorded.get("digest") == digest:
+        covered.update(recorded.get("stages", []))
+    return {
+        "digest": digest,
+        "stages": [stage for stage in _STAGE_ORDER if stage in covered],
+        "recorded_date": datetime.now(UTC).isoformat(),
+    }
@@ -0,0 +1,112 @@
+"""Per-stage concurrency limits and timings for ``run_full_test.py --jobs``.
+
+``run_full_test.py`` takes each model through parse → translate → solve →
+compare. With ``--jobs`` every model runs that chain in its own thread, so a
+model enters its next stage as soon as its previous one finishes instead of
+waiting for the rest of the corpus. ``StageScheduler`` bounds how many models
+are inside each stage at once (parse and translate are CPU-bound, solve waits
+on an external GAMS process) and records when each model queued for,
+started and finished every stage. A model's wall-clock path through its
+stages (``critical_path``) shows whether it was slow because of its own work
+or because it waited for a free slot.
+
+Usage:
+    scheduler = StageScheduler({"parse": 8, "translate": 8, "solve": 2})
+    with scheduler.slot("trnsport", "solve"):
+        solve(...)
+    scheduler.critical_path("trnsport")
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """When one model queued for, started and finished one stage (perf_counter seconds)."""
+
+    stage: str
+    queued: float
+    started: float
+    finished: float
+
+    @property
+    def wait_seconds(self) -> float:
+        return self.started - self.queued
+
+    @property
+    def run_seconds(self) -> float:
+        return self.finished - self.started
+
+
+class StageScheduler:
+    """Concurrency limit per stage plus a timeline per model.
+
+    Stages missing from ``limits`` are timed but not limited. A stage may be
+    entered more than once per model (e.g. the ``--nlp-presolve`` retry
+    translates and solves again); each pass is recorded.
+    """
+
+    def __init__(self, limits: Mapping[str, int]):
+        if any(limit < 1 for limit in limits.values()):
+            raise ValueError(f"Stage limits must be at least 1: {dict(limits)}")
+        self.limits = dict(limits)
+        self._slots = {stage: threading.BoundedSemaphore(n) for stage, n in limits.items()}
+        self._timings: dict[str, list[StageTiming]] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def slot(self, model_id: str, stage: str) -> Iterator[None]:
+        """Run the ``with`` body as ``stage`` of ``model_id`` once the stage has room."""
+        queued = time.perf_counter()
+        with self._slots.get(stage) or contextlib.nullcontext():
+            started = time.perf_counter()
+            try:
+                yield
+            finally:
+                timing = StageTiming(stage, queued, started, time.perf_counter())
+                with self._lock:
+                    self._timings.setdefault(model_id, []).append(timing)
+
+    def timings(self, model_id: str) -> list[StageTiming]:
+        """Stage passes of ``model_id`` in the order they finished."""
+        with self._lock:
+            return list(self._timings.get(model_id, []))
+
+    def critical_path(self, model_id: str) -> dict[str, Any]:
+        """Wall-clock path of ``model_id`` through its stages.
+
+        ``wall_seconds`` runs from the model first queuing for a stage to its
+        last stage finishing; per stage, ``wait_seconds`` is time spent
+        waiting for a slot and ``run_seconds`` the time spent inside it.
+        """
+        timings = self.timings(model_id)
+        if not timings:
+            return {}
+        return {
+            "wall_seconds": round(
+                max(t.finished for t in timings) - min(t.queued for t in timings), 4
+            ),
+            "wait_seconds": round(sum(t.wait_seconds for t in timings), 4),
+            "stages": [
+                {
+                    "stage": t.stage,
+                    "wait_seconds": round(t.wait_seconds, 4),
+                    "run_seconds": round(t.run_seconds, 4),
+                }
+                for t in timings
+            ],
+        }
+
+    def critical_paths(self) -> dict[str, dict[str, Any]]:
+        """``critical_path`` of every model seen, slowest first."""
+        with self._lock:
+            model_ids = list(self._timings)
+        paths = {model_id: self.critical_path(model_id) for model_id in model_ids}
+        return dict(sorted(paths.items(), key=lambda item: -item[1]["wall_seconds"]))
@@ -0,0 +1,162 @@
+"""Journaled storage for the GAMSLIB status database.
+
+``gamslib_status.json`` is a single JSON document (~460 KB, indent=2) that
+every batch script used to rewrite in full, every few models, from its own
+in-memory copy. Besides the cost, two scripts running at once (or a parallel
+``run_full_test.py --jobs`` run next to ``batch_parse.py``) silently dropped
+each other's updates: the last full rewrite won.
+
+``ResultsStore`` keeps ``gamslib_status.json`` as the snapshot that readers,
+reports and git see, plus an append-only journal of per-model updates next to
+it (``gamslib_status.json.journal``, one JSON object per line)::
+
+    {"model_id": "trnsport", "fields": {"nlp2mcp_translate": {...}}}
+
+An update replaces the listed top-level fields of one model entry and costs
+one appended line. Loading replays the journal over the snapshot; compaction
+folds it into the snapshot (same schema and formatting as before) and empties
+it. Writers hold an exclusive ``flock`` on ``gamslib_status.json.lock`` while
+appending or compacting, so concurrent processes interleave whole records.
+
+Usage:
+    store = ResultsStore(DATABASE_PATH)
+    store.upsert("trnsport", {"nlp2mcp_parse": entry})
+    database = store.load()
+    store.compact()  # rewrite gamslib_status.json, empty the journal
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, one writer at a time
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Journal size (bytes) at which upsert() folds the journal into the snapshot
+COMPACT_AFTER_BYTES = 1024 * 1024
+
+
+class ResultsStore:
+    """A status database snapshot plus its journal of per-model updates."""
+
+    def __init__(self, path: Path, *, compact_after_bytes: int = COMPACT_AFTER_BYTES):
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.compact_after_bytes = compact_after_bytes
+
+    @contextlib.contextmanager
+    def _locked(self, *, shared: bool = False) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_journal(self) -> list[dict[str, Any]]:
+        try:
+            lines = self.journal_path.read_text().splitlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A writer died mid-append; its update was never complete
+                logger.warning(f"Ignoring incomplete record in {self.journal_path}")
+        return records
+
+    def _load(self) -> dict[str, Any]:
+        with open(self.path) as f:
+            data = json.load(f)
+        records = self._read_journal()
+        if records:
+            models = data.setdefault("models", [])
+            by_id = {model.get("model_id"): model for model in models}
+            for record in records:
+                model = by_id.get(record["model_id"])
+                if model is None:
+                    model = by_id[record["model_id"]] = {"model_id": record["model_id"]}
+                    models.append(model)
+                model.update(record["fields"])
+        return data
+
+    def _write(self, data: dict[str, Any], path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to temp file first, then rename atomically
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")  # Trailing newline
+        temp_path.replace(path)
+
+    def load(self) -> dict[str, Any]:
+        """Return the database with all journaled updates applied.
+
+        Raises:
+            FileNotFoundError: If the snapshot doesn't exist
+            json.JSONDecodeError: If the snapshot is invalid JSON
+        """
+        with self._locked(shared=True):
+            return self._load()
+
+    def pending(self) -> int:
+        """Number of journaled updates not yet folded into the snapshot."""
+        with self._locked(shared=True):
+            return len(self._read_journal())
+
+    def upsert(self, model_id: str, fields: dict[str, Any]) -> None:
+        """Replace top-level ``fields`` of model ``model_id`` (added if missing)."""
+        record = json.dumps({"model_id": model_id, "fields": fields}, separators=(",", ":"))
+        with self._locked():
+            with open(self.journal_path, "a+b") as f:
+                # Start on a fresh line if a dead writer left a torn record
+                size = f.seek(0, os.SEEK_END)
+                if size:
+                    f.seek(size - 1)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")  # appends, whatever the read position
+                f.write(record.encode() + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+                size = f.tell()
+            if size >= self.compact_after_bytes:
+                self._write(self._load(), self.path)
+                self.journal_path.unlink()
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Replace the whole database with ``data`` (discarding the journal)."""
+        with self._locked():
+            self._write(data, self.path)
+            self.journal_path.unlink(missing_ok=True)
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot; a no-op when it is empty."""
+        with self._locked():
+            if self._read_journal():
+                self._write(self._load(), self.path)
+            self.journal_path.unlink(missing_ok=True)
+
+    def export(self, dest: Path) -> None:
+        """Write the current database to ``dest`` in the snapshot's format."""
+        with self._locked(shared=True):
+            data = self._load()
+        self._write(data, Path(dest))
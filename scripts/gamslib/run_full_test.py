@@ -29,7 +29,12 @@ Stage Control:
 Convenience:
     --only-failing       Re-run models where any stage failed
     --skip-completed     Skip models where all stages succeeded
+    --incremental        Skip models whose inputs (raw .gms, included files,
+                         nlp2mcp sources) are unchanged since their last run
     --quick              Shorthand for --limit=10
+    --jobs N             Stream models through the stages concurrently
+                         (N parsing and N translating at a time)
+    --solve-jobs M       With --jobs, solve up to M models at a time (default: N)
 
 Output:
     --dry-run            Preview without execution
@@ -43,6 +48,9 @@ Examples:
     python scripts/gamslib/run_full_test.py --only-parse --limit 5
     python scripts/gamslib/run_full_test.py --only-failing
     python scripts/gamslib/run_full_test.py --type LP --only-translate
+    python scripts/gamslib/run_full_test.py --only-translate --jobs 8
+    python scripts/gamslib/run_full_test.py --jobs 8 --solve-jobs 2
+    python scripts/gamslib/run_full_test.py --incremental
     python scripts/gamslib/run_full_test.py --dry-run --type LP
     python scripts/gamslib/run_full_test.py --json > results.json
 """
@@ -50,16 +58,28 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import copy
+import functools
 import json
 import logging
+import multiprocessing
 import random
 import statistics
 import sys
+import threading
 import time
 from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AbstractContextManager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.server import TranslationPool
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -80,9 +100,17 @@ def _repo_relative_path(path: "Path | str") -> str:
 
 from scripts.gamslib.db_manager import (  # noqa: E402
     DATABASE_PATH,
+    compact_database,
     create_backup,
     load_database,
-    save_database,
+    upsert_model,
+)
+from scripts.gamslib.model_fingerprint import (  # noqa: E402
+    FINGERPRINT_FIELD,
+    fingerprint_entry,
+    is_unchanged,
+    model_fingerprint,
+    source_tree_digest,
 )
 
 # Configure logging
@@ -106,10 +134,16 @@ def get_parse_function():
     return parse_single_model
 
 
-def get_translate_function():
-    """Import and return the translate function from batch_translate."""
+def get_translate_function(pool: TranslationPool | None = None):
+    """Import and return the translate function from batch_translate.
+
+    With ``pool`` (see ``make_translation_pool``), the function translates in
+    the pool's long-lived worker processes instead of a subprocess per model.
+    """
     from scripts.gamslib.batch_translate import translate_single_model
 
+    if pool is not None:
+        return functools.partial(translate_single_model, pool=pool)
     return translate_single_model
 
 
@@ -370,6 +404,8 @@ def report_filter_summary(
         filters_applied.append("only-failing")
     if args.skip_completed:
         filters_applied.append("skip-completed")
+    if getattr(args, "incremental", False):
+        filters_applied.append("incremental")
     if args.random:
         filters_applied.append(f"random={args.random}")
     if args.limit:
@@ -396,6 +432,7 @@ def run_parse_stage(
     model_path: Path,
     args: argparse.Namespace,
     stats: dict[str, Any],
+    parse_func: Callable[[Path], dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Run parse stage for a model.
 
@@ -404,13 +441,15 @@ def run_parse_stage(
         model_path: Path to the .gms file
         args: Command line arguments
         stats: Statistics dictionary to update
+        parse_func: Parse function to use (default: get_parse_function())
 
     Returns:
         Parse result dictionary
     """
     from scripts.gamslib.utils import get_nlp2mcp_version
 
-    parse_func = get_parse_function()
+    if parse_func is None:
+        parse_func = get_parse_function()
 
     if args.verbose:
         logger.info("    [PARSE] Starting...")
@@ -464,6 +503,7 @@ def run_translate_stage(
     output_path: Path,
     args: argparse.Namespace,
     stats: dict[str, Any],
+    translate_func: Callable[..., dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Run translate stage for a model.
 
@@ -473,13 +513,15 @@ def run_translate_stage(
         output_path: Path for MCP output
         args: Command line arguments
         stats: Statistics dictionary to update
+        translate_func: Translate function to use (default: get_translate_function())
 
     Returns:
         Translate result dictionary
     """
     from scripts.gamslib.utils import get_nlp2mcp_version
 
-    translate_func = get_translate_function()
+    if translate_func is None:
+        translate_func = get_translate_function()
 
     if args.verbose:
         logger.info("    [TRANSLATE] Starting...")
@@ -711,6 +753,33 @@ def _determine_stages(args: argparse.Namespace) -> list[str]:
     return stages
 
 
+def _fingerprint_stages(args: argparse.Namespace) -> list[str]:
+    """Stages a model's pipeline fingerprint records as covered by this run."""
+    stages = _determine_stages(args)
+    if "solve" in stages and getattr(args, "check_convexity", False):
+        stages.append("convexity")
+    return stages
+
+
+def _model_fingerprints(models: list[dict[str, Any]]) -> dict[str, str | None]:
+    """Current input fingerprint of each model (see model_fingerprint.py)."""
+    source_digest = source_tree_digest()
+    fingerprints = {}
+    for model in models:
+        model_id = model.get("model_id", "unknown")
+        model_path, _ = _pipeline_paths(model_id)
+        fingerprints[model_id] = model_fingerprint(model_path, source_digest)
+    return fingerprints
+
+
+def _record_fingerprint(
+    model: dict[str, Any], fingerprint: str | None, args: argparse.Namespace
+) -> None:
+    """Store the inputs ``model`` was just run on, for later --incremental runs."""
+    if fingerprint is not None:
+        model[FINGERPRINT_FIELD] = fingerprint_entry(model, fingerprint, _fingerprint_stages(args))
+
+
 def _run_convexity_check(
     model: dict[str, Any],
     model_path: Path,
@@ -788,11 +857,27 @@ def _run_convexity_check(
         logger.info(f"    [CONVEXITY] {cvx.conclusion}")
 
 
+def _unscheduled(stage: str) -> AbstractContextManager[None]:
+    """Stage context of a sequential run: no limits, no timings."""
+    return contextlib.nullcontext()
+
+
+def _pipeline_paths(model_id: str) -> tuple[Path, Path]:
+    """Return ``(model_path, mcp_path)``: the raw model and its translate output."""
+    raw_models_dir = PROJECT_ROOT / "data" / "gamslib" / "raw"
+    mcp_output_dir = PROJECT_ROOT / "data" / "gamslib" / "mcp"
+    return raw_models_dir / f"{model_id}.gms", mcp_output_dir / f"{model_id}_mcp.gms"
+
+
 def run_pipeline(
     model: dict[str, Any],
     database: dict[str, Any],
     args: argparse.Namespace,
     stats: dict[str, Any],
+    translate_func: Callable[..., dict[str, Any]] | None = None,
+    *,
+    parse_func: Callable[[Path], dict[str, Any]] | None = None,
+    stage_slot: Callable[[str], AbstractContextManager[None]] | None = None,
 ) -> None:
     """Run the full pipeline for a single model.
 
@@ -803,14 +888,19 @@ def run_pipeline(
         database: Full database (reserved for future cross-model lookups)
         args: Command line arguments
         stats: Statistics dictionary to update
+        translate_func: Translate function to use (default: get_translate_function())
+        parse_func: Parse function to use (default: get_parse_function())
+        stage_slot: Returns the context each stage runs in, given the stage
+            name (the --jobs scheduler's per-stage limits and timings)
     """
     model_id = model.get("model_id", "unknown")
+    if translate_func is None:
+        translate_func = get_translate_function()
+    if stage_slot is None:
+        stage_slot = _unscheduled
 
     # Paths
-    raw_models_dir = PROJECT_ROOT / "data" / "gamslib" / "raw"
-    mcp_output_dir = PROJECT_ROOT / "data" / "gamslib" / "mcp"
-    model_path = raw_models_dir / f"{model_id}.gms"
-    mcp_path = mcp_output_dir / f"{model_id}_mcp.gms"
+    model_path, mcp_path = _pipeline_paths(model_id)
 
     # Check if model file exists
     if not model_path.exists():
@@ -854,7 +944,8 @@ def run_pipeline(
 
     # Stage 1: Parse
     if run_parse:
-        result = run_parse_stage(model, model_path, args, stats)
+        with stage_slot("parse"):
+            result = run_parse_stage(model, model_path, args, stats, parse_func)
         if result["status"] != "success":
             if run_translate or run_solve or run_compare:
                 mark_cascade_not_tested(model, "parse", stats)
@@ -864,7 +955,8 @@ def run_pipeline(
 
     # Stage 2: Translate
     if run_translate:
-        result = run_translate_stage(model, model_path, mcp_path, args, stats)
+        with stage_slot("translate"):
+            result = run_translate_stage(model, model_path, mcp_path, args, stats, translate_func)
         if result["status"] != "success":
             if run_solve or run_compare:
                 mark_cascade_not_tested(model, "translate", stats)
@@ -888,7 +980,8 @@ def run_pipeline(
             mark_cascade_not_tested(model, "solve", stats)
             return
 
-        result = run_solve_stage(model, mcp_path, args, stats)
+        with stage_slot("solve"):
+            result = run_solve_stage(model, mcp_path, args, stats)
         cold_result = result  # Preserve for convexity check before retry overwrites
         warm_retry_result = None  # Set if presolve retry succeeds
 
@@ -914,19 +1007,20 @@ def run_pipeline(
 
             # Re-translate with --nlp-presolve
             presolve_path = mcp_path.with_name(f"{model_id}_mcp_presolve.gms")
-            translate_func = get_translate_function()
-            retry_translate = translate_func(
-                model_path, presolve_path, nlp_presolve=True
-            )
+            with stage_slot("translate"):
+                retry_translate = translate_func(
+                    model_path, presolve_path, nlp_presolve=True
+                )
 
             if retry_translate["status"] == "success":
                 # Save original mcp_solve before retry overwrites it
                 original_mcp_solve = model["mcp_solve"].copy()
 
                 # Re-solve with pre-solve MCP
-                retry_result = run_solve_stage(
-                    model, presolve_path, args, stats
-                )
+                with stage_slot("solve"):
+                    retry_result = run_solve_stage(
+                        model, presolve_path, args, stats
+                    )
 
                 # Remove retry timing entry — we keep only the
                 # cold-start time so counts stay consistent.
@@ -989,14 +1083,168 @@ def run_pipeline(
 
     # Stage 3b: Computational convexity check (optional)
     if run_solve and getattr(args, "check_convexity", False):
-        _run_convexity_check(
-            model, model_path, mcp_path, cold_result, args, stats,
-            existing_warm_result=warm_retry_result,
-        )
+        # Translates and solves the warm start, so it counts against solve slots
+        with stage_slot("solve"):
+            _run_convexity_check(
+                model, model_path, mcp_path, cold_result, args, stats,
+                existing_warm_result=warm_retry_result,
+            )
 
     # Stage 4: Compare
     if run_compare:
-        run_compare_stage(model, args, stats)
+        with stage_slot("compare"):
+            run_compare_stage(model, args, stats)
+
+
+# =============================================================================
+# Parallel Pipeline (--jobs)
+# =============================================================================
+
+
+class _ParsePool:
+    """Run the parse stage in worker processes.
+
+    Parsing is pure Python, so parse threads would take turns on the GIL.
+    Workers are replaced after WORKER_MAX_MODELS models, like the translation
+    workers; if one dies (e.g. out of memory), its model records a parse
+    failure and the pool is restarted for the others.
+    """
+
+    def __init__(self, jobs: int):
+        self.jobs = jobs
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        from scripts.gamslib.batch_translate import WORKER_MAX_MODELS
+
+        return ProcessPoolExecutor(
+            max_workers=self.jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=WORKER_MAX_MODELS,
+        )
+
+    def __call__(self, model_path: Path) -> dict[str, Any]:
+        from scripts.gamslib.error_taxonomy import categorize_parse_error
+
+        executor = self._executor
+        try:
+            return executor.submit(get_parse_function(), model_path).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._new_executor()
+                    executor.shutdown(wait=False, cancel_futures=True)
+            message = "Parse worker process died"
+            return {
+                "status": "failure",
+                "parse_time_seconds": None,
+                "error": {"category": categorize_parse_error(message), "message": message},
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> _ParsePool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def run_pipeline_parallel(
+    models: list[dict[str, Any]],
+    database: dict[str, Any],
+    args: argparse.Namespace,
+    stats: dict[str, Any],
+    fingerprints: dict[str, str | None] | None = None,
+) -> None:
+    """Run the pipeline for ``models`` concurrently (--jobs N).
+
+    Every model walks its stages in its own thread and enters the next stage
+    as soon as the previous one is done, so solves start while other models
+    are still translating. A StageScheduler caps the models inside each
+    stage: ``--jobs`` for parse and translate, ``--solve-jobs`` for solve
+    (including the presolve retry and the convexity check). Parse runs in a
+    process pool and translate in long-lived nlp2mcp workers, so those stages
+    use N cores; solve threads wait on GAMS subprocesses.
+
+    Threads update a copy of their model entry and their own stats dict;
+    both are merged into ``database`` and ``stats`` here, on the calling
+    thread, as models finish. The database journal therefore never sees a
+    half updated entry, and run_pipeline's retry bookkeeping (which pops the
+    latest solve time/error) only ever sees its own model's entries.
+
+    Each model's wall-clock path through its stages is stored in
+    ``stats["critical_paths"]``. A model with an entry in ``fingerprints``
+    gets it recorded once its pipeline has run.
+    """
+    from scripts.gamslib.batch_translate import make_translation_pool
+    from scripts.gamslib.pipeline_scheduler import StageScheduler
+
+    jobs = args.jobs
+    solve_jobs = getattr(args, "solve_jobs", None) or jobs
+    stages = _determine_stages(args)
+    scheduler = StageScheduler({"parse": jobs, "translate": jobs, "solve": solve_jobs})
+
+    with contextlib.ExitStack() as stack:
+        parse_func = stack.enter_context(_ParsePool(jobs)) if "parse" in stages else None
+        pool = stack.enter_context(make_translation_pool(jobs)) if "translate" in stages else None
+        translate_func = get_translate_function(pool)
+        # Enough models in flight to keep every stage's slots busy
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=2 * jobs + solve_jobs))
+        stack.callback(executor.shutdown, cancel_futures=True)
+
+        def run(model: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+            model_id = model.get("model_id", "unknown")
+            model_stats = _new_stats(0)
+            stage_slot = functools.partial(scheduler.slot, model_id)
+            run_pipeline(
+                model,
+                database,
+                args,
+                model_stats,
+                translate_func,
+                parse_func=parse_func,
+                stage_slot=stage_slot,
+            )
+            _record_fingerprint(model, (fingerprints or {}).get(model_id), args)
+            return model, model_stats
+
+        futures = {executor.submit(run, copy.deepcopy(model)): model for model in models}
+        for done, future in enumerate(as_completed(futures), 1):
+            model = futures[future]
+            updated, model_stats = future.result()
+            _journal_model(model, updated)
+            model.clear()
+            model.update(updated)
+            _merge_stats(stats, model_stats)
+            stats["processed"] += 1
+
+            # Progress reporting
+            if not args.quiet:
+                elapsed = time.perf_counter() - stats["start_time"]
+                remaining = (len(models) - done) * elapsed / done
+                logger.info(
+                    f"[{done:3d}/{len(models)}] {done * 100 // len(models):3d}% "
+                    f"Finished {model.get('model_id', 'unknown')} (~{remaining:.0f}s remaining)"
+                )
+
+    stats["critical_paths"] = scheduler.critical_paths()
+
+
+def _journal_model(before: dict[str, Any], after: dict[str, Any]) -> None:
+    """Journal the top-level fields of a model entry that its pipeline run changed.
+
+    Each finished model is durable at once without rewriting
+    gamslib_status.json, and fields this run did not touch are left to
+    whatever other processes record for the same model.
+    """
+    changed = {
+        key: value for key, value in after.items() if key not in before or before[key] != value
+    }
+    if changed:
+        upsert_model(after.get("model_id", "unknown"), changed)
 
 
 # =============================================================================
@@ -1040,6 +1288,17 @@ def _new_stats(total: int) -> dict[str, Any]:
     }
 
 
+def _merge_stats(stats: dict[str, Any], model_stats: dict[str, Any]) -> None:
+    """Add the counters and timing/error lists of one model's run to ``stats``."""
+    for key, value in model_stats.items():
+        if key in ("total", "start_time"):
+            continue
+        if isinstance(value, list):
+            stats.setdefault(key, []).extend(value)
+        elif isinstance(value, int):
+            stats[key] = stats.get(key, 0) + value
+
+
 # =============================================================================
 # Priority 8: --resolve-changed checkpoint re-solve (Sprint 29)
 #
@@ -1518,9 +1777,32 @@ def run_full_test(args: argparse.Namespace) -> dict[str, Any]:
     # Apply filters
     filtered = apply_filters(candidates, args)
 
+    # Fingerprint the selected models' inputs; --incremental drops the
+    # models whose last recorded run already covered them
+    fingerprints = _model_fingerprints(filtered)
+    unchanged = 0
+    if getattr(args, "incremental", False):
+        stages = _fingerprint_stages(args)
+        changed = [
+            m
+            for m in filtered
+            if not is_unchanged(m, fingerprints[m.get("model_id", "unknown")], stages)
+        ]
+        unchanged = len(filtered) - len(changed)
+        filtered = changed
+
     # Report filter summary
     if not args.quiet:
         report_filter_summary(filtered, total_candidates, args)
+        if unchanged:
+            logger.info(f"Skipped {unchanged} models unchanged since their last run")
+
+    # Nothing changed since the last run: nothing to do
+    if not filtered and unchanged:
+        stats = _new_stats(0)
+        stats["unchanged"] = unchanged
+        stats["total_time"] = 0.0
+        return stats
 
     # Check if any models match
     if not filtered:
@@ -1579,6 +1861,7 @@ def run_full_test(args: argparse.Namespace) -> dict[str, Any]:
 
     # Initialize statistics
     stats = _new_stats(len(filtered))
+    stats["unchanged"] = unchanged
 
     # Determine active stages for progress reporting
     active_stages = [s.capitalize() for s in _determine_stages(args)]
@@ -1587,33 +1870,33 @@ def run_full_test(args: argparse.Namespace) -> dict[str, Any]:
         logger.info(f"\nPipeline stages: {' → '.join(active_stages)}")
         logger.info("=" * 60)
 
-    # Process each model
-    for i, model in enumerate(filtered, 1):
-        model_id = model.get("model_id", "unknown")
-
-        # Progress reporting
-        if not args.quiet:
-            elapsed = time.perf_counter() - stats["start_time"]
-            avg_time = elapsed / i if i > 0 else 0
-            remaining = (len(filtered) - i) * avg_time
-            pct = i * 100 // len(filtered)
-            logger.info(
-                f"[{i:3d}/{len(filtered)}] {pct:3d}% Processing {model_id}... "
-                f"(~{remaining:.0f}s remaining)"
-            )
-
-        # Run pipeline for this model
-        run_pipeline(model, database, args, stats)
-        stats["processed"] += 1
+    # Process each model (with --jobs, concurrently; see run_pipeline_parallel)
+    if getattr(args, "jobs", 1) > 1:
+        run_pipeline_parallel(filtered, database, args, stats, fingerprints)
+    else:
+        for i, model in enumerate(filtered, 1):
+            model_id = model.get("model_id", "unknown")
+
+            # Progress reporting
+            if not args.quiet:
+                elapsed = time.perf_counter() - stats["start_time"]
+                avg_time = elapsed / i if i > 0 else 0
+                remaining = (len(filtered) - i) * avg_time
+                pct = i * 100 // len(filtered)
+                logger.info(
+                    f"[{i:3d}/{len(filtered)}] {pct:3d}% Processing {model_id}... "
+                    f"(~{remaining:.0f}s remaining)"
+                )
 
-        # Periodic save (every 10 models)
-        if stats["processed"] % 10 == 0:
-            save_database(database)
-            if args.verbose:
-                logger.info(f"  Database saved ({stats['processed']} models processed)")
+            # Run pipeline for this model
+            before = copy.deepcopy(model)
+            run_pipeline(model, database, args, stats)
+            stats["processed"] += 1
+            _record_fingerprint(model, fingerprints[model_id], args)
+            _journal_model(before, model)
 
-    # Final save
-    save_database(database)
+    # Final save: fold the journaled results into gamslib_status.json
+    compact_database()
     if not args.quiet:
         logger.info("\nFinal database save complete")
 
@@ -1676,6 +1959,8 @@ def generate_summary(stats: dict[str, Any], args: argparse.Namespace) -> dict[st
         "skipped": stats["skipped"],
         "total_time_seconds": round(stats.get("total_time", 0), 2),
     }
+    if stats.get("unchanged"):
+        summary["unchanged"] = stats["unchanged"]
 
     # Parse statistics
     if not args.only_translate and not args.only_solve:
@@ -1748,9 +2033,17 @@ def generate_summary(stats: dict[str, Any], args: argparse.Namespace) -> dict[st
             "success_rate": round(full_success / processed, 4) if processed > 0 else 0.0,
         }
 
+    # Per-model wall-clock path through the stages (--jobs runs), slowest first
+    if stats.get("critical_paths"):
+        summary["critical_paths"] = stats["critical_paths"]
+
     return summary
 
 
+# Number of models listed under "Critical path" in the printed summary
+CRITICAL_PATH_TOP = 10
+
+
 def print_summary(stats: dict[str, Any], args: argparse.Namespace) -> None:
     """Print summary of pipeline results.
 
@@ -1767,6 +2060,8 @@ def print_summary(stats: dict[str, Any], args: argparse.Namespace) -> None:
     print(f"\nModels processed: {summary['processed']}/{summary['total_models']}")
     if summary["skipped"] > 0:
         print(f"Models skipped: {summary['skipped']}")
+    if summary.get("unchanged"):
+        print(f"Models unchanged since their last run: {summary['unchanged']}")
 
     # Parse results
     if "parse" in summary:
@@ -1845,6 +2140,16 @@ def print_summary(stats: dict[str, Any], args: argparse.Namespace) -> None:
             f"\nFull pipeline success: {fp['success']}/{fp['total']} ({fp['success_rate'] * 100:.1f}%)"
         )
 
+    # Slowest models of a --jobs run: where their wall-clock time went
+    if summary.get("critical_paths"):
+        print("\nCritical path (slowest models):")
+        for model_id, path in list(summary["critical_paths"].items())[:CRITICAL_PATH_TOP]:
+            steps = " → ".join(f"{st['stage']} {st['run_seconds']:.1f}s" for st in path["stages"])
+            print(
+                f"  {model_id}: {path['wall_seconds']:.1f}s "
+                f"({path['wait_seconds']:.1f}s waiting for a slot): {steps}"
+            )
+
     # Timing
     print(f"\nTotal time: {summary['total_time_seconds']:.1f}s")
     if summary["processed"] > 0:
@@ -1973,11 +2278,34 @@ def main() -> int:
         action="store_true",
         help="Skip models where all stages succeeded",
     )
+    convenience_group.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip models whose raw .gms, included files and nlp2mcp sources are unchanged "
+        "since a recorded run of the same stages",
+    )
     convenience_group.add_argument(
         "--quick",
         action="store_true",
         help="Shorthand for --limit=10",
     )
+    convenience_group.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run models concurrently, each moving to its next stage as soon as the "
+        "previous one finishes; up to N models parse and N translate at a time, in "
+        "worker processes (default: 1, one model after another)",
+    )
+    convenience_group.add_argument(
+        "--solve-jobs",
+        type=int,
+        default=None,
+        metavar="M",
+        help="With --jobs, solve up to M models at a time (default: N)",
+    )
     convenience_group.add_argument(
         "--resolve-changed",
         action="store_true",
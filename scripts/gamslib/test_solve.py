@@ -12,7 +12,8 @@ Options:
     --limit N      Process only first N models (for testing)
     --model ID     Process a single model by ID
     --verbose      Show detailed output for each model
-    --save-every N Save database every N models (default: 5)
+    --save-every N Fold journaled results into the database every N models
+                   (default: only at the end)
 
 Filter Options:
     --translate-success  Only process models with successful translation
@@ -34,7 +35,6 @@ Examples:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import re
 import shutil
@@ -52,6 +52,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 import math
 
+from scripts.gamslib.db_manager import compact_database, load_database, upsert_model
 from scripts.gamslib.error_taxonomy import (
     COMPARE_BOTH_INFEASIBLE,
     COMPARE_MCP_FAILED,
@@ -132,21 +133,6 @@ SOLVER_STATUS_DESCRIPTIONS = {
 }
 
 
-def load_database(db_path: Path = DATABASE_PATH) -> dict[str, Any]:
-    """Load the GAMSLIB status database."""
-    logger.info(f"Loading database from {db_path}")
-    with open(db_path) as f:
-        return json.load(f)
-
-
-def save_database(db: dict[str, Any], db_path: Path = DATABASE_PATH) -> None:
-    """Save the GAMSLIB status database with atomic write."""
-    temp_path = db_path.with_suffix(".tmp")
-    with open(temp_path, "w") as f:
-        json.dump(db, f, indent=2)
-    temp_path.replace(db_path)
-
-
 def get_translated_models(db: dict[str, Any]) -> list[dict[str, Any]]:
     """Get models that have been successfully translated to MCP."""
     translated = []
@@ -1295,7 +1281,8 @@ def run_batch_solve(args: argparse.Namespace) -> int:
         Exit code (0 for success, 1 for failure)
     """
     # Load database
-    db = load_database()
+    logger.info(f"Loading database from {DATABASE_PATH}")
+    db = load_database(DATABASE_PATH)
     all_models = db.get("models", [])
 
     # Get translated models (baseline for filtering)
@@ -1411,16 +1398,21 @@ def run_batch_solve(args: argparse.Namespace) -> int:
                 if comparison.get("notes"):
                     logger.info(f"  Notes: {comparison['notes']}")
 
-        # Periodic save
+        # Journal this model's results; fold the journal in periodically
+        if target_model is not None:
+            fields = {"mcp_solve": target_model["mcp_solve"]}
+            if "solution_comparison" in target_model:
+                fields["solution_comparison"] = target_model["solution_comparison"]
+            upsert_model(model_id, fields, DATABASE_PATH)
         save_counter += 1
-        if save_counter >= args.save_every:
-            save_database(db)
+        if args.save_every and save_counter >= args.save_every:
+            compact_database(DATABASE_PATH)
             logger.info("Database saved")
             save_counter = 0
 
     # Final save
     if not args.dry_run:
-        save_database(db)
+        compact_database(DATABASE_PATH)
         logger.info("Final database save complete")
 
     stats["total_time"] = time.perf_counter() - start_time
@@ -1462,8 +1454,8 @@ def main() -> int:
     parser.add_argument(
         "--save-every",
         type=int,
-        default=5,
-        help="Save database every N models (default: 5)",
+        default=0,
+        help="Fold journaled results into the database every N models (default: only at the end)",
     )
 
     # Filter arguments
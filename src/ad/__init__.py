@@ -32,11 +32,16 @@ Sprint 2 Development Schedule:
 - Day 10: Integration and documentation
 """
 
-from .ad_core import differentiate, simplify
-from .api import compute_derivatives
-from .constraint_jacobian import compute_constraint_jacobian
-from .evaluator import EvaluationError, evaluate
-from .gradient import compute_objective_gradient
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .ad_core import differentiate, simplify
+    from .api import compute_derivatives
+    from .constraint_jacobian import compute_constraint_jacobian
+    from .evaluator import EvaluationError, evaluate
+    from .gradient import compute_objective_gradient
 
 __all__ = [
     "differentiate",
@@ -47,3 +52,16 @@ __all__ = [
     "compute_constraint_jacobian",
     "compute_derivatives",  # High-level API (recommended)
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "differentiate": ".ad_core",
+        "simplify": ".ad_core",
+        "compute_derivatives": ".api",
+        "compute_constraint_jacobian": ".constraint_jacobian",
+        "EvaluationError": ".evaluator",
+        "evaluate": ".evaluator",
+        "compute_objective_gradient": ".gradient",
+    },
+)
@@ -36,6 +36,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ..ir.ast import (
+    Binary,
+    Call,
+    Const,
+    DollarConditional,
+    MultiplierRef,
+    ParamRef,
+    Prod,
+    Sum,
+    SymbolRef,
+    Unary,
+    VarRef,
+)
+from ..ir.traversal import flatten_chain, rewrite
 from .term_collection import (
     collect_like_terms,
     simplify_multiplicative_cancellation,
@@ -121,23 +135,15 @@ def simplify(expr: Expr) -> Expr:
         VarRef("x", ())
 
     Note:
-        Simplification is applied recursively bottom-up through the expression tree.
+        Simplification is applied bottom-up through the expression tree, on an
+        explicit stack (``rewrite``), so arbitrarily deep trees are fine.
         The function is safe to call multiple times (idempotent for fully simplified expressions).
     """
-    from ..ir.ast import (
-        Binary,
-        Call,
-        Const,
-        DollarConditional,
-        MultiplierRef,
-        ParamRef,
-        Prod,
-        Sum,
-        SymbolRef,
-        Unary,
-        VarRef,
-    )
+    return rewrite(expr, _simplify_node, descend=_simplifies_children)
 
+
+def _simplify_node(expr: Expr) -> Expr:
+    """Apply ``simplify``'s rules to one node whose children are already simplified."""
     match expr:
         # Base cases: already simple
         case Const(_) | VarRef(_, _) | ParamRef(_, _) | MultiplierRef(_, _) | SymbolRef(_):
@@ -145,7 +151,7 @@ def simplify(expr: Expr) -> Expr:
 
         # Unary operations
         case Unary(op, child):
-            simplified_child = simplify(child)
+            simplified_child = child
 
             # Double negation: -(-x) → x
             if op == "-" and isinstance(simplified_child, Unary) and simplified_child.op == "-":
@@ -162,13 +168,11 @@ def simplify(expr: Expr) -> Expr:
                 if op == "+":
                     return simplified_child
 
-            return Unary(op, simplified_child)
+            return expr
 
         # Binary operations
         case Binary(op, left, right):
-            # First, recursively simplify children
-            simplified_left = simplify(left)
-            simplified_right = simplify(right)
+            simplified_left, simplified_right = left, right
 
             # Constant folding: operate on two constants
             if isinstance(simplified_left, Const) and isinstance(simplified_right, Const):
@@ -218,9 +222,9 @@ def simplify(expr: Expr) -> Expr:
                 if isinstance(simplified_right, Const) and simplified_right.value == 0:
                     return simplified_left
                 # 0 - x → -x
-                # Recursive call needed to handle double negation: 0 - (-x) → -(-x) → x
+                # Simplify the negation too, for double negation: 0 - (-x) → -(-x) → x
                 if isinstance(simplified_left, Const) and simplified_left.value == 0:
-                    return simplify(Unary("-", simplified_right))
+                    return _simplify_node(Unary("-", simplified_right))
                 # x - x → 0 (only if same variable reference with same indices)
                 if simplified_left == simplified_right:
                     return Const(0)
@@ -277,27 +281,21 @@ def simplify(expr: Expr) -> Expr:
                 if isinstance(simplified_left, Const) and simplified_left.value == 1:
                     return Const(1)
 
-            return Binary(op, simplified_left, simplified_right)
+            return expr
 
-        # Function calls: recursively simplify arguments
-        case Call(func, args):
-            simplified_args = tuple(simplify(arg) for arg in args)
-            return Call(func, simplified_args)
+        # Function calls: arguments are already simplified
+        case Call():
+            return expr
 
-        # DollarConditional: value$condition — simplify value, 0$cond → 0
-        case DollarConditional(value_expr, condition):
-            simplified_value = simplify(value_expr)
-            if isinstance(simplified_value, Const) and simplified_value.value == 0:
+        # DollarConditional: value$condition — 0$cond → 0
+        case DollarConditional(value_expr, _):
+            if isinstance(value_expr, Const) and value_expr.value == 0:
                 return Const(0)
-            simplified_cond = simplify(condition)
-            if simplified_value is not value_expr or simplified_cond is not condition:
-                return DollarConditional(simplified_value, simplified_cond)
             return expr
 
-        # Sum/Prod: recursively simplify body and condition
-        case Sum(index_sets, body, condition) | Prod(index_sets, body, condition):
-            simplified_body = simplify(body)
-            simp_cond: Expr | None = simplify(condition) if condition is not None else None
+        # Sum/Prod: body and condition are already simplified
+        case Sum(_, body, _) | Prod(_, body, _):
+            simplified_body = body
             # sum(set, 0) → 0 (zero summed over any index is still zero)
             if (
                 isinstance(expr, Sum)
@@ -319,13 +317,17 @@ def simplify(expr: Expr) -> Expr:
                 and simplified_body.value == 1
             ):
                 return Const(1)
-            return type(expr)(index_sets, simplified_body, simp_cond)
+            return expr
 
         case _:
             # Unknown expression type - return as-is
             return expr
 
 
+def _simplifies_children(expr: Expr) -> bool:
+    return isinstance(expr, (Unary, Binary, Call, DollarConditional, Sum, Prod))
+
+
 def simplify_advanced(expr: Expr) -> Expr:
     """
     Apply advanced simplification including term collection.
@@ -358,17 +360,22 @@ def simplify_advanced(expr: Expr) -> Expr:
     # Step 2: Apply term collection (only for additions)
     # Recursively process children first, then apply to this node
     match basic_simplified:
-        case Binary("+", left, right):
-            # Recursively simplify children with advanced rules
-            simplified_left = simplify_advanced(left)
-            simplified_right = simplify_advanced(right)
-            reconstructed = Binary("+", simplified_left, simplified_right)
-
-            # Apply term collection to this level
+        case Binary("+", _, _):
+            # Treat the whole chain of additions as one n-ary sum: simplify each
+            # addend with advanced rules, then collect like terms once. Doing
+            # this per nested "+" node re-flattened and re-simplified the chain
+            # at every level, which is quadratic in the number of terms.
+            addends = [simplify_advanced(term) for term in flatten_chain(basic_simplified, "+")]
+            reconstructed = addends[0]
+            for addend in addends[1:]:
+                reconstructed = Binary("+", reconstructed, addend)
+
+            # Apply term collection to the whole sum
             collected = collect_like_terms(reconstructed)
 
-            # If collection made progress, simplify again (may enable more basic rules)
-            if collected != reconstructed:
+            # If collection made progress, simplify again (may enable more basic rules).
+            # Compare addend lists: == on a long chain would recurse down its spine.
+            if flatten_chain(collected, "+") != addends:
                 return simplify(collected)
             return collected
 
@@ -55,10 +55,31 @@ if TYPE_CHECKING:
 
 import itertools
 
-from ..ir.ast import Const, Expr, IndexOffset, Prod, Sum, VarRef
+from ..ir.ast import (
+    Binary,
+    Call,
+    Const,
+    DollarConditional,
+    Expr,
+    IndexOffset,
+    ParamRef,
+    Prod,
+    SetMembershipTest,
+    Sum,
+    Unary,
+    VarRef,
+    interning,
+)
 from ..ir.normalize import NormalizedEquation
 from ..ir.symbols import EquationDef
+from ..ir.traversal import rewrite
 from .ad_core import apply_simplification, get_simplification_mode
+from .derivative_blocks import (
+    DerivativeBlock,
+    DerivativeMemo,
+    block_jacobian_enabled,
+    derivative_block,
+)
 from .derivative_rules import differentiate_expr
 from .index_mapping import build_index_mapping, enumerate_variable_instances, resolve_set_members
 from .jacobian import JacobianStructure
@@ -260,8 +281,6 @@ def _resolve_index_offsets(
     Returns:
         Expression with IndexOffset nodes resolved to plain string indices
     """
-    from ..ir.ast import Binary, Call, ParamRef, Prod, Sum, Unary, VarRef
-
     # Use provided cache or create a new one for this call tree
     if _domain_cache is None:
         _domain_cache = {}
@@ -408,69 +427,33 @@ def _resolve_index_offsets(
                 return param.domain
         return ()
 
-    if isinstance(expr, VarRef):
-        domain = _get_domain_for_ref(expr.name, is_var=True)
+    def _resolve_ref(node: Expr) -> Expr:
+        """Resolve the offsets in a VarRef/ParamRef's indices; other nodes pass through."""
+        if not isinstance(node, (VarRef, ParamRef)):
+            return node
+        domain = _get_domain_for_ref(node.name, is_var=isinstance(node, VarRef))
         new_indices = []
-        for i, idx in enumerate(expr.indices):
+        for i, idx in enumerate(node.indices):
             domain_set = domain[i] if i < len(domain) else None
             resolved, valid = _resolve_idx(idx, domain_set)
             if not valid:
                 # Out-of-bounds lead/lag → zero (GAMS convention)
                 return Const(0)
             new_indices.append(resolved)
-        return VarRef(expr.name, tuple(new_indices), expr.attribute)
+        if all(new is old for new, old in zip(new_indices, node.indices, strict=True)):
+            return node
+        if isinstance(node, VarRef):
+            return VarRef(node.name, tuple(new_indices), node.attribute)
+        return ParamRef(node.name, tuple(new_indices))
 
-    elif isinstance(expr, ParamRef):
-        domain = _get_domain_for_ref(expr.name, is_var=False)
-        new_indices = []
-        for i, idx in enumerate(expr.indices):
-            domain_set = domain[i] if i < len(domain) else None
-            resolved, valid = _resolve_idx(idx, domain_set)
-            if not valid:
-                return Const(0)
-            new_indices.append(resolved)
-        return ParamRef(expr.name, tuple(new_indices))
+    # IndexOffset nodes inside conditional subtrees (DollarConditional,
+    # SetMembershipTest) are resolved too; other node types pass through
+    # unchanged.
+    return rewrite(expr, _resolve_ref, descend=_resolves_offsets_below)
 
-    elif isinstance(expr, Binary):
-        new_left = _resolve_index_offsets(expr.left, model_ir, _domain_cache)
-        new_right = _resolve_index_offsets(expr.right, model_ir, _domain_cache)
-        return Binary(expr.op, new_left, new_right)
 
-    elif isinstance(expr, Unary):
-        new_child = _resolve_index_offsets(expr.child, model_ir, _domain_cache)
-        return Unary(expr.op, new_child)
-
-    elif isinstance(expr, Call):
-        new_args = tuple(_resolve_index_offsets(arg, model_ir, _domain_cache) for arg in expr.args)
-        return Call(expr.func, new_args)
-
-    elif isinstance(expr, (Sum, Prod)):
-        new_body = _resolve_index_offsets(expr.body, model_ir, _domain_cache)
-        new_condition = (
-            _resolve_index_offsets(expr.condition, model_ir, _domain_cache)
-            if expr.condition is not None
-            else None
-        )
-        return type(expr)(expr.index_sets, new_body, new_condition)
-
-    else:
-        # Handle DollarConditional and SetMembershipTest so IndexOffset nodes
-        # inside conditional subtrees are also resolved.
-        from ..ir.ast import DollarConditional, SetMembershipTest
-
-        if isinstance(expr, DollarConditional):
-            new_val = _resolve_index_offsets(expr.value_expr, model_ir, _domain_cache)
-            new_cond = _resolve_index_offsets(expr.condition, model_ir, _domain_cache)
-            return DollarConditional(value_expr=new_val, condition=new_cond)
-
-        if isinstance(expr, SetMembershipTest):
-            new_idx = tuple(
-                _resolve_index_offsets(idx, model_ir, _domain_cache) for idx in expr.indices
-            )
-            return SetMembershipTest(expr.set_name, new_idx)
-
-    # Other expression types pass through unchanged
-    return expr
+def _resolves_offsets_below(expr: Expr) -> bool:
+    return isinstance(expr, (Binary, Unary, Call, Sum, Prod, DollarConditional, SetMembershipTest))
 
 
 def _expand_sums_with_unresolved_offsets(
@@ -825,6 +808,7 @@ def _substitute_single_index(expr: Expr, var_name: str, value: str) -> Expr:
     return _sub(expr)
 
 
+@interning()
 def compute_constraint_jacobian(
     model_ir: ModelIR,
     normalized_eqs: dict[str, NormalizedEquation] | None = None,
@@ -870,22 +854,7 @@ def compute_constraint_jacobian(
     config = ensure_config_with_model_ir(config, model_ir)
 
     # Build index mapping for variables (shared across both Jacobians)
-    base_index_mapping = build_index_mapping(model_ir)
-
-    # Count equation instances for each constraint type
-    # Note: Bounds in normalized_bounds are usually in model.inequalities, but
-    # for backward compatibility with tests, we also count any bounds that aren't
-    num_equality_rows = _count_equation_instances(model_ir, model_ir.equalities)
-    num_inequality_rows = _count_equation_instances(model_ir, model_ir.inequalities)
-
-    # Add count of bounds that aren't in model.inequalities (for test compatibility)
-    for bound_name, norm_eq in model_ir.normalized_bounds.items():
-        if bound_name not in model_ir.inequalities:
-            # If index_values is set, it's a single specific instance
-            if norm_eq.index_values:
-                num_inequality_rows += 1
-            else:
-                num_inequality_rows += _count_equation_instances(model_ir, [bound_name])
+    base_index_mapping = build_index_mapping(model_ir, include_equations=False)
 
     # Create separate index mapping for equalities (rows 0..num_equalities-1)
     # This ensures J_h row IDs are independent from global equation ordering
@@ -894,17 +863,18 @@ def compute_constraint_jacobian(
     # Create Jacobian structure for equalities
     J_h = JacobianStructure(
         index_mapping=eq_index_mapping,
-        num_rows=num_equality_rows,
+        num_rows=eq_index_mapping.num_eqs,
         num_cols=base_index_mapping.num_vars,
     )
 
     # Create separate index mapping for inequalities (rows 0..num_inequalities-1)
     # This includes both regular inequality equations and normalized bounds
+    # (bounds that aren't in model.inequalities are kept for test compatibility)
     ineq_index_mapping = _build_inequality_index_mapping(base_index_mapping, model_ir)
 
     J_g = JacobianStructure(
         index_mapping=ineq_index_mapping,
-        num_rows=num_inequality_rows,
+        num_rows=ineq_index_mapping.num_eqs,
         num_cols=base_index_mapping.num_vars,
     )
 
@@ -969,13 +939,8 @@ def _build_equality_index_mapping(base_mapping, model_ir: ModelIR):
     Returns:
         IndexMapping with equality-specific row numbering
     """
-    from .index_mapping import IndexMapping
-
-    # Create new mapping with same variable mappings but new equation mappings
-    eq_mapping = IndexMapping()
-    eq_mapping.var_to_col = base_mapping.var_to_col.copy()
-    eq_mapping.col_to_var = base_mapping.col_to_var.copy()
-    eq_mapping.num_vars = base_mapping.num_vars
+    # Share the variable mappings, number equation rows from 0
+    eq_mapping = base_mapping.with_same_variables()
 
     # Build row mappings for equality constraints only, starting from row 0
     row_id = 0
@@ -1008,13 +973,8 @@ def _build_inequality_index_mapping(base_mapping, model_ir: ModelIR):
     Returns:
         IndexMapping with inequality-specific row numbering
     """
-    from .index_mapping import IndexMapping
-
-    # Create a new mapping with the same variable mappings but new equation mappings
-    ineq_mapping = IndexMapping()
-    ineq_mapping.var_to_col = base_mapping.var_to_col.copy()
-    ineq_mapping.col_to_var = base_mapping.col_to_var.copy()
-    ineq_mapping.num_vars = base_mapping.num_vars
+    # Share the variable mappings, number equation rows from 0
+    ineq_mapping = base_mapping.with_same_variables()
 
     # Build row mappings for all inequality constraints, starting from row 0
     row_id = 0
@@ -1097,6 +1057,15 @@ def _compute_equality_jacobian(
     # LP fast path: use basic simplification instead of advanced for LP models
     use_lp_fast_path = model_ir.solve_type is not None and model_ir.solve_type.upper() == "LP"
 
+    # LP fast path: cap at basic simplification (identity/zero elimination),
+    # but respect "none" from config
+    effective_mode = simp_mode
+    if use_lp_fast_path and simp_mode != "none":
+        effective_mode = "basic"
+
+    use_blocks = block_jacobian_enabled()
+    memo = DerivativeMemo(config, effective_mode)
+
     for eq_name in model_ir.equalities:
         # Prefer normalized equations if provided, otherwise fall back to original
         eq_def: EquationDef | NormalizedEquation
@@ -1132,28 +1101,19 @@ def _compute_equality_jacobian(
         # Shared cache for IndexOffset resolution across all instances of this equation
         resolve_cache: dict[str, tuple[list[str], dict[str, int]] | None] = {}
 
+        # Variables whose derivative is the same template on every row
+        # (see derivative_blocks); differentiated once, on first use
+        blocks: dict[str, DerivativeBlock | None] = {}
+
         for eq_indices in eq_instances:
             # Get row ID for this equation instance
             row_id = index_mapping.get_row_id(eq_name, eq_indices)
             if row_id is None:
                 continue
 
-            # Substitute symbolic indices with concrete indices for this instance
-            constraint_expr = base_expr
-            if eq_domain:
-                constraint_expr = _substitute_indices(constraint_expr, eq_domain, eq_indices)
-                # Issue #1045: Resolve IndexOffset nodes to concrete domain elements.
-                # After substitution, k(t+1) with t→"1990" becomes k(IndexOffset("1990",1)).
-                # This resolves it to k("1995") so differentiation can match var instances.
-                constraint_expr = _resolve_index_offsets(constraint_expr, model_ir, resolve_cache)
-
-                # Issue #1081: Expand sums with unresolved IndexOffset nodes.
-                # When a sum body contains offsets like ord(l) that reference the
-                # sum variable, expand the sum into explicit terms so each term
-                # can have its IndexOffset resolved to a concrete element.
-                constraint_expr = _expand_sums_with_unresolved_offsets(
-                    constraint_expr, model_ir, resolve_cache
-                )
+            # The concrete row instance, built only if a variable falls back
+            # from the derivative blocks to instance-by-instance differentiation
+            constraint_expr: Expr | None = None
 
             # Differentiate w.r.t. each variable (only those referenced)
             for var_name, var_instances in var_instances_cache:
@@ -1161,6 +1121,25 @@ def _compute_equality_jacobian(
                 if var_name not in referenced_vars:
                     continue
 
+                if use_blocks and _set_block_derivative(
+                    J_h,
+                    blocks,
+                    row_id,
+                    eq_indices,
+                    base_expr,
+                    eq_domain,
+                    var_name,
+                    index_mapping,
+                    config,
+                    effective_mode,
+                ):
+                    continue
+
+                if constraint_expr is None:
+                    constraint_expr = _instantiate_constraint(
+                        base_expr, eq_domain, eq_indices, model_ir, resolve_cache
+                    )
+
                 # Sprint 38 P2 (#1385): narrow to the instances this row can
                 # actually reference. `None` means "could not establish
                 # conservatively" and falls back to the full declared list.
@@ -1187,19 +1166,75 @@ def _compute_equality_jacobian(
                         continue
 
                     # Differentiate constraint w.r.t. this specific variable instance
-                    derivative = differentiate_expr(constraint_expr, var_name, var_indices, config)
-
-                    # LP fast path: cap at basic simplification (identity/zero
-                    # elimination), but respect "none" from config
-                    effective_mode = simp_mode
-                    if use_lp_fast_path and simp_mode != "none":
-                        effective_mode = "basic"
-                    derivative = apply_simplification(derivative, effective_mode)
+                    derivative = memo.derivative(constraint_expr, eq_indices, var_name, var_indices)
 
                     # Store in Jacobian only if non-zero
                     if not _is_zero_const(derivative):
                         J_h.set_derivative(row_id, col_id, derivative)
 
+    J_h.derivative_memo_hits += memo.hits
+    J_h.derivative_memo_lookups += memo.lookups
+
+
+def _instantiate_constraint(
+    base_expr: Expr,
+    eq_domain: tuple[str, ...],
+    eq_indices: tuple[str, ...],
+    model_ir: ModelIR,
+    resolve_cache: dict[str, tuple[list[str], dict[str, int]] | None],
+) -> Expr:
+    """Substitute one row's concrete indices into an equation template.
+
+    ``resolve_cache`` is shared across all instances of the equation.
+    """
+    if not eq_domain:
+        return base_expr
+    expr = _substitute_indices(base_expr, eq_domain, eq_indices)
+    # Issue #1045: Resolve IndexOffset nodes to concrete domain elements.
+    # After substitution, k(t+1) with t→"1990" becomes k(IndexOffset("1990",1)).
+    # This resolves it to k("1995") so differentiation can match var instances.
+    expr = _resolve_index_offsets(expr, model_ir, resolve_cache)
+    # Issue #1081: Expand sums with unresolved IndexOffset nodes.
+    # When a sum body contains offsets like ord(l) that reference the
+    # sum variable, expand the sum into explicit terms so each term
+    # can have its IndexOffset resolved to a concrete element.
+    return _expand_sums_with_unresolved_offsets(expr, model_ir, resolve_cache)
+
+
+def _set_block_derivative(
+    jacobian: JacobianStructure,
+    blocks: dict[str, DerivativeBlock | None],
+    row_id: int,
+    eq_indices: tuple[str, ...],
+    base_expr: Expr,
+    eq_domain: tuple[str, ...],
+    var_name: str,
+    index_mapping,
+    config: Config | None,
+    simplification: str,
+) -> bool:
+    """Fill row ``row_id``'s entry for ``var_name`` from the equation's derivative block.
+
+    Returns False, leaving the row untouched, when the equation/variable pair
+    is not a block or this row cannot be instantiated from it; the caller then
+    differentiates the row instance by instance.
+    """
+    if var_name not in blocks:
+        blocks[var_name] = derivative_block(base_expr, eq_domain, var_name, config, simplification)
+    block = blocks[var_name]
+    if block is None:
+        return False
+    instance = block.instantiate(eq_indices)
+    if instance is None:
+        return False
+    var_indices, derivative = instance
+    col_id = index_mapping.get_col_id(var_name, var_indices)
+    if col_id is None:
+        return False
+    if not _is_zero_const(derivative):
+        jacobian.set_derivative(row_id, col_id, derivative)
+    return True
+
 
 def _compute_inequality_jacobian(
     model_ir: ModelIR,
@@ -1240,6 +1275,15 @@ def _compute_inequality_jacobian(
     # LP fast path: use basic simplification instead of advanced for LP models
     use_lp_fast_path = model_ir.solve_type is not None and model_ir.solve_type.upper() == "LP"
 
+    # LP fast path: cap at basic simplification (identity/zero elimination),
+    # but respect "none" from config
+    effective_mode = simp_mode
+    if use_lp_fast_path and simp_mode != "none":
+        effective_mode = "basic"
+
+    use_blocks = block_jacobian_enabled()
+    memo = DerivativeMemo(config, effective_mode)
+
     for eq_name in model_ir.inequalities:
         # Prefer normalized equation if provided, otherwise fall back to original
         eq_def: EquationDef | NormalizedEquation
@@ -1273,23 +1317,18 @@ def _compute_inequality_jacobian(
         # Shared cache for IndexOffset resolution across all instances of this equation
         resolve_cache: dict[str, tuple[list[str], dict[str, int]] | None] = {}
 
+        # Variables whose derivative is the same template on every row
+        blocks: dict[str, DerivativeBlock | None] = {}
+
         for eq_indices in eq_instances:
             # Get row ID for this equation instance
             row_id = index_mapping.get_row_id(eq_name, eq_indices)
             if row_id is None:
                 continue
 
-            # Substitute symbolic indices with concrete indices for this instance
-            constraint_expr = base_expr
-            if eq_domain:
-                constraint_expr = _substitute_indices(constraint_expr, eq_domain, eq_indices)
-                # Issue #1045: Resolve IndexOffset nodes to concrete domain elements
-                constraint_expr = _resolve_index_offsets(constraint_expr, model_ir, resolve_cache)
-
-                # Issue #1081: Expand sums with unresolved IndexOffset nodes
-                constraint_expr = _expand_sums_with_unresolved_offsets(
-                    constraint_expr, model_ir, resolve_cache
-                )
+            # The concrete row instance, built only if a variable falls back
+            # from the derivative blocks to instance-by-instance differentiation
+            constraint_expr: Expr | None = None
 
             # Differentiate w.r.t. each variable (only those referenced)
             for var_name, var_instances in var_instances_cache:
@@ -1297,25 +1336,40 @@ def _compute_inequality_jacobian(
                 if var_name not in referenced_vars:
                     continue
 
+                if use_blocks and _set_block_derivative(
+                    J_g,
+                    blocks,
+                    row_id,
+                    eq_indices,
+                    base_expr,
+                    eq_domain,
+                    var_name,
+                    index_mapping,
+                    config,
+                    effective_mode,
+                ):
+                    continue
+
+                if constraint_expr is None:
+                    constraint_expr = _instantiate_constraint(
+                        base_expr, eq_domain, eq_indices, model_ir, resolve_cache
+                    )
+
                 for var_indices in var_instances:
                     col_id = index_mapping.get_col_id(var_name, var_indices)
                     if col_id is None:
                         continue
 
                     # Differentiate constraint w.r.t. this specific variable instance
-                    derivative = differentiate_expr(constraint_expr, var_name, var_indices, config)
-
-                    # LP fast path: cap at basic simplification (identity/zero
-                    # elimination), but respect "none" from config
-                    effective_mode = simp_mode
-                    if use_lp_fast_path and simp_mode != "none":
-                        effective_mode = "basic"
-                    derivative = apply_simplification(derivative, effective_mode)
+                    derivative = memo.derivative(constraint_expr, eq_indices, var_name, var_indices)
 
                     # Store in Jacobian only if non-zero
                     if not _is_zero_const(derivative):
                         J_g.set_derivative(row_id, col_id, derivative)
 
+    J_g.derivative_memo_hits += memo.hits
+    J_g.derivative_memo_lookups += memo.lookups
+
 
 def _compute_bound_jacobian(
     model_ir: ModelIR,
@@ -1400,42 +1454,6 @@ def _compute_bound_jacobian(
                     J_g.set_derivative(row_id, col_id, derivative)
 
 
-def _count_equation_instances(model_ir: ModelIR, equation_names: list[str]) -> int:
-    """
-    Count total number of equation instances (rows) from a list of equation names.
-
-    Handles indexed equations that expand to multiple instances.
-    Checks both model.equations and model.normalized_bounds for equation definitions.
-
-    Args:
-        model_ir: Model IR with equations and sets
-        equation_names: List of equation names to count
-
-    Returns:
-        Total number of equation instances
-    """
-    from .index_mapping import enumerate_equation_instances
-
-    total_count = 0
-    for eq_name in equation_names:
-        # Check in regular equations first
-        if eq_name in model_ir.equations:
-            eq_def = model_ir.equations[eq_name]
-            eq_instances = enumerate_equation_instances(
-                eq_name, eq_def.domain, model_ir, eq_def.condition
-            )
-            total_count += len(eq_instances)
-        # Check in normalized bounds (e.g., fixed variables)
-        elif eq_name in model_ir.normalized_bounds:
-            norm_eq = model_ir.normalized_bounds[eq_name]
-            eq_instances = enumerate_equation_instances(
-                eq_name, norm_eq.domain_sets, model_ir, norm_eq.condition
-            )
-            total_count += len(eq_instances)
-
-    return total_count
-
-
 def _substitute_indices(expr, symbolic_indices: tuple[str, ...], concrete_indices: tuple[str, ...]):
     """
     Substitute symbolic indices with concrete indices in an expression.
@@ -0,0 +1,389 @@
+"""
+Block-level (symbolic) differentiation of indexed constraints.
+
+The constraint Jacobian is built per instance: every row of an indexed equation
+gets its indices substituted, and the result is differentiated and simplified
+once per variable instance it references. For the most common shape of
+equation/variable pair that work is the same for every row:
+
+    demand(i)..  y(i) * p(i) =e= d(i) + z(i)
+
+Row demand('a') depends on y('a') only, with derivative p('a'), and likewise
+for every other element of i. When every reference to a variable in an
+equation has the same index tuple, made of distinct equation-domain indices,
+and none of them sits inside an aggregation, each row depends on exactly one
+instance of the variable and its derivative is the symbolic derivative with
+labels filled in. Such a pair is a *block*: ``derivative_block``
+differentiates and simplifies the symbolic equation once, and
+``DerivativeBlock.instantiate`` turns the template into one row's (column
+indices, derivative) by relabeling.
+
+Relabeling only commutes with differentiation and simplification when it
+cannot make two different index expressions equal. Rows whose labels repeat,
+or coincide with a label, set name or bound index already present in the
+template, are declined and left to the per-instance path, as are equations
+with lead/lag offsets (whose resolution depends on the labels themselves).
+
+Set NLP2MCP_NO_BLOCK_JACOBIAN=1 to differentiate every instance separately.
+
+Pairs that are not blocks (a variable summed over, lead/lag references, mixed
+index patterns) are differentiated per instance, but their rows usually still
+share a shape: ``sum(j, a(i,j) * x(j))`` w.r.t. x('c') looks the same in row
+'a' as in row 'b' once the row label is abstracted. ``DerivativeMemo`` keys each
+(instance, variable instance) pair by its expression with the row and column
+labels replaced by placeholders, plus the set memberships of those labels that
+differentiation can consult, and reuses the derivative of the first instance
+of each shape by relabeling it. Set NLP2MCP_NO_DERIVATIVE_MEMO=1 to turn the
+memo off.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ..ir.ast import (
+    Binary,
+    Call,
+    Const,
+    DollarConditional,
+    Expr,
+    IndexOffset,
+    MultiplierRef,
+    ParamRef,
+    Prod,
+    SetMembershipTest,
+    Sum,
+    SymbolRef,
+    Unary,
+    VarRef,
+)
+from ..ir.traversal import iter_postorder, rewrite
+from .ad_core import apply_simplification
+from .derivative_rules import _is_concrete_instance_of, differentiate_expr
+
+if TYPE_CHECKING:
+    from ..config import Config
+
+_NO_BLOCK_JACOBIAN_ENV = "NLP2MCP_NO_BLOCK_JACOBIAN"
+_NO_DERIVATIVE_MEMO_ENV = "NLP2MCP_NO_DERIVATIVE_MEMO"
+
+# Calls that bind their leading SymbolRef arguments as iteration indices
+_AGGREGATE_CALLS = frozenset({"smin", "smax"})
+
+
+def block_jacobian_enabled() -> bool:
+    return os.environ.get(_NO_BLOCK_JACOBIAN_ENV, "").strip().lower() not in ("1", "true", "yes")
+
+
+def derivative_memo_enabled() -> bool:
+    return os.environ.get(_NO_DERIVATIVE_MEMO_ENV, "").strip().lower() not in ("1", "true", "yes")
+
+
+def _normalize_label(label: str) -> str:
+    if len(label) >= 2 and label[0] == label[-1] and label[0] in ('"', "'"):
+        label = label[1:-1]
+    return label.lower()
+
+
+@dataclass(frozen=True)
+class DerivativeBlock:
+    """Derivative of an indexed equation w.r.t. one indexed variable, for all rows.
+
+    Attributes:
+        eq_domain: Equation domain indices the template is written in
+        columns: For each variable index position, its position in ``eq_domain``
+        template: Simplified derivative in terms of ``eq_domain``
+        reserved: Normalized labels a row must not use (labels, set names and
+            bound indices in the template); relabeling onto them could make
+            distinct references equal
+    """
+
+    eq_domain: tuple[str, ...]
+    columns: tuple[int, ...]
+    template: Expr
+    reserved: frozenset[str]
+
+    def instantiate(self, eq_indices: tuple[str, ...]) -> tuple[tuple[str, ...], Expr] | None:
+        """Variable indices and derivative for row ``eq_indices``.
+
+        Returns None when the row's labels repeat or hit a reserved label; the
+        caller then differentiates that row on its own.
+        """
+        from .constraint_jacobian import _substitute_indices
+
+        labels = [_normalize_label(label) for label in eq_indices]
+        if len(set(labels)) != len(labels) or not self.reserved.isdisjoint(labels):
+            return None
+        var_indices = tuple(eq_indices[position] for position in self.columns)
+        return var_indices, _substitute_indices(self.template, self.eq_domain, eq_indices)
+
+
+def _column_positions(
+    expr: Expr, var_name: str, eq_domain: tuple[str, ...]
+) -> tuple[int, ...] | None:
+    """Positions in ``eq_domain`` of ``var_name``'s indices, if the pair forms a block."""
+    pattern: tuple[str | IndexOffset, ...] | None = None
+    stack: list[tuple[Expr, bool]] = [(expr, False)]
+    while stack:
+        node, aggregated = stack.pop()
+        # Lead/lag offsets (and subset index forms) are resolved per row
+        if isinstance(node, IndexOffset):
+            return None
+        if not all(isinstance(idx, (str, SymbolRef)) for idx in getattr(node, "indices", ())):
+            return None
+        if isinstance(node, VarRef) and node.name == var_name:
+            if aggregated or (pattern is not None and node.indices != pattern):
+                return None
+            pattern = node.indices
+        inner = aggregated or isinstance(node, (Sum, Prod))
+        if isinstance(node, Call) and node.func in _AGGREGATE_CALLS:
+            inner = True
+        stack.extend((child, inner) for child in node.children())
+
+    if pattern is None:
+        return None
+    names = [idx for idx in pattern if isinstance(idx, str) and idx in eq_domain]
+    if len(names) != len(pattern) or len(set(names)) != len(names):
+        return None
+    return tuple(eq_domain.index(name) for name in names)
+
+
+def _reserved_labels(template: Expr, eq_domain: tuple[str, ...], config: Config | None) -> set[str]:
+    reserved = {_normalize_label(name) for name in eq_domain}
+    for node in iter_postorder(template):
+        if isinstance(node, SymbolRef):
+            reserved.add(_normalize_label(node.name))
+        if isinstance(node, (Sum, Prod)):
+            reserved.update(_normalize_label(idx) for idx in node.index_sets)
+        for idx in getattr(node, "indices", ()):
+            if isinstance(idx, str):
+                reserved.add(_normalize_label(idx))
+    model_ir = config.model_ir if config is not None else None
+    if model_ir is not None:
+        reserved.update(_normalize_label(name) for name in model_ir.sets)
+        reserved.update(_normalize_label(name) for name in model_ir.aliases)
+    return reserved
+
+
+def derivative_block(
+    expr: Expr,
+    eq_domain: tuple[str, ...],
+    var_name: str,
+    config: Config | None,
+    simplification: str,
+) -> DerivativeBlock | None:
+    """The block for ``expr``'s derivative w.r.t. ``var_name``, or None if the pair is not one.
+
+    Args:
+        expr: Symbolic (domain-indexed) constraint expression
+        eq_domain: The equation's domain indices
+        var_name: Variable to differentiate with respect to
+        config: Differentiation config (with model_ir)
+        simplification: Simplification mode applied to the template
+
+    Without simplification ("none") the per-instance derivatives are stored as
+    produced, and their exact shape depends on the labels, so no block is built.
+    """
+    if simplification == "none" or len(set(eq_domain)) != len(eq_domain):
+        return None
+    columns = _column_positions(expr, var_name, eq_domain)
+    if columns is None:
+        return None
+    wrt_indices = tuple(eq_domain[position] for position in columns)
+    template = apply_simplification(
+        differentiate_expr(expr, var_name, wrt_indices, config), simplification
+    )
+    reserved = _reserved_labels(template, eq_domain, config)
+    return DerivativeBlock(eq_domain, columns, template, frozenset(reserved))
+
+
+# Nodes whose label-carrying fields ``_relabel`` knows how to rewrite
+_RELABELABLE = (
+    Const,
+    SymbolRef,
+    VarRef,
+    ParamRef,
+    MultiplierRef,
+    Unary,
+    Binary,
+    Sum,
+    Prod,
+    Call,
+    SetMembershipTest,
+    DollarConditional,
+)
+
+
+def _placeholder(position: int) -> str:
+    # NUL never occurs in a GAMS label, so placeholders cannot meet real labels
+    return f"\0{position}"
+
+
+def _names_in(expr: Expr) -> tuple[set[str], set[str]] | None:
+    """Names used in ``expr``, or None if it has a node ``_relabel`` cannot handle.
+
+    The first set holds every string index and ``SymbolRef`` name, the second
+    the index sets of every ``Sum``/``Prod``.
+    """
+    names: set[str] = set()
+    index_sets: set[str] = set()
+    for node in iter_postorder(expr):
+        if not isinstance(node, _RELABELABLE):
+            return None
+        if isinstance(node, SymbolRef):
+            names.add(node.name)
+        elif isinstance(node, (VarRef, ParamRef, MultiplierRef)):
+            for idx in node.indices:
+                if not isinstance(idx, str):
+                    return None
+                names.add(idx)
+        elif isinstance(node, (Sum, Prod)):
+            index_sets.update(node.index_sets)
+    return names, index_sets
+
+
+def _relabel(expr: Expr, mapping: dict[str, str]) -> Expr:
+    """``expr`` with every index label and ``SymbolRef`` name in ``mapping`` replaced."""
+
+    def rule(node: Expr) -> Expr:
+        if isinstance(node, SymbolRef) and node.name in mapping:
+            return SymbolRef(mapping[node.name])
+        if isinstance(node, (VarRef, ParamRef, MultiplierRef)):
+            if any(idx in mapping for idx in node.indices):
+                indices = tuple(mapping.get(idx, idx) for idx in node.indices)
+                if isinstance(node, VarRef):
+                    return VarRef(node.name, indices, node.attribute)
+                return type(node)(node.name, indices)
+        return node
+
+    return rewrite(expr, rule)
+
+
+@dataclass(frozen=True)
+class _RowShape:
+    """One equation instance with its row labels abstracted."""
+
+    labels: tuple[str, ...]
+    template: Expr
+    # Normalized labels left concrete in the template
+    literals: frozenset[str]
+    # Set names differentiation may test the labels' membership of
+    symbols: tuple[str, ...]
+
+
+class DerivativeMemo:
+    """Simplified derivatives of equation instances, shared between instances of one shape.
+
+    ``derivative`` returns what ``apply_simplification(differentiate_expr(...))``
+    would. Label identity matters to differentiation only through equality
+    between labels, which relabeling preserves, and membership tests against
+    the sets the expression aggregates over, which are part of the key.
+    Instances that could defeat that argument (labels that repeat up to case or
+    quotes, coincide with set names or with labels left in the expression, or
+    expressions with lead/lag offsets and other nodes the relabeling does not
+    cover) are differentiated directly.
+
+    Attributes:
+        hits: Derivatives served by relabeling a stored one
+        lookups: Derivatives requested
+    """
+
+    def __init__(self, config: Config | None, simplification: str) -> None:
+        self.config = config
+        self.simplification = simplification
+        self.hits = 0
+        self.lookups = 0
+        self._enabled = derivative_memo_enabled()
+        self._templates: dict[tuple, Expr] = {}
+        self._membership: dict[tuple[str, str], bool] = {}
+        self._row_expr: Expr | None = None
+        self._row_indices: tuple[str, ...] = ()
+        self._row: _RowShape | None = None
+        model_ir = config.model_ir if config is not None else None
+        self._set_names: frozenset[str] = frozenset(
+            _normalize_label(name)
+            for name in ([*model_ir.sets, *model_ir.aliases] if model_ir is not None else [])
+        )
+
+    def derivative(
+        self,
+        expr: Expr,
+        eq_indices: tuple[str, ...],
+        var_name: str,
+        var_indices: tuple[str, ...],
+    ) -> Expr:
+        """Simplified derivative of instance ``expr`` (row ``eq_indices``) w.r.t. one column.
+
+        Consecutive calls for the same row should pass the same ``expr``
+        object; its abstraction is computed once per row.
+        """
+        self.lookups += 1
+        key: tuple | None = None
+        labels: tuple[str, ...] = ()
+        if self._enabled:
+            if expr is not self._row_expr or eq_indices != self._row_indices:
+                self._row_expr, self._row_indices = expr, eq_indices
+                self._row = self._row_shape(expr, eq_indices)
+            if self._row is not None:
+                key, labels = self._key(self._row, var_name, var_indices)
+
+        if key is not None:
+            template = self._templates.get(key)
+            if template is not None:
+                self.hits += 1
+                return _relabel(
+                    template, {_placeholder(k): label for k, label in enumerate(labels)}
+                )
+
+        derivative = apply_simplification(
+            differentiate_expr(expr, var_name, var_indices, self.config), self.simplification
+        )
+        if key is not None and _names_in(derivative) is not None:
+            self._templates[key] = _relabel(
+                derivative, {label: _placeholder(k) for k, label in enumerate(labels)}
+            )
+        return derivative
+
+    def _row_shape(self, expr: Expr, eq_indices: tuple[str, ...]) -> _RowShape | None:
+        labels = tuple(dict.fromkeys(eq_indices))
+        normalized = {_normalize_label(label) for label in labels}
+        if len(normalized) != len(labels) or not self._set_names.isdisjoint(normalized):
+            return None
+        found = _names_in(expr)
+        if found is None:
+            return None
+        names, index_sets = found
+        residual = names.difference(labels)
+        literals = frozenset(_normalize_label(name) for name in residual)
+        if not literals.isdisjoint(normalized):
+            return None
+        template = _relabel(expr, {label: _placeholder(k) for k, label in enumerate(labels)})
+        return _RowShape(labels, template, literals, tuple(sorted(index_sets | residual)))
+
+    def _key(
+        self, row: _RowShape, var_name: str, var_indices: tuple[str, ...]
+    ) -> tuple[tuple | None, tuple[str, ...]]:
+        columns = [label for label in dict.fromkeys(var_indices) if label not in row.labels]
+        if columns:
+            seen = {_normalize_label(label) for label in row.labels} | row.literals
+            for label in columns:
+                normalized = _normalize_label(label)
+                if normalized in seen or normalized in self._set_names:
+                    return None, ()
+                seen.add(normalized)
+        labels = row.labels + tuple(columns)
+        positions = {label: _placeholder(k) for k, label in enumerate(labels)}
+        membership = tuple(
+            tuple(self._is_member(label, symbol) for symbol in row.symbols) for label in labels
+        )
+        key = (row.template, var_name, tuple(positions[idx] for idx in var_indices), membership)
+        return key, labels
+
+    def _is_member(self, label: str, symbol: str) -> bool:
+        cached = self._membership.get((label, symbol))
+        if cached is None:
+            cached = _is_concrete_instance_of(label, symbol, self.config)
+            self._membership[(label, symbol)] = cached
+        return cached
@@ -45,6 +45,7 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Generator
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -65,6 +66,7 @@ from ..ir.ast import (
     Unary,
     VarRef,
 )
+from ..ir.traversal import fold
 
 # SPRINT25_DAY2: Debug instrumentation for the Phase 1 investigation into
 # `_partial_collapse_sum` multi-index concrete→symbolic gap (qabel / #1089).
@@ -617,25 +619,12 @@ def _diff_binary(
     """
     op = expr.op
 
-    if op == "+":
+    if op in ("+", "-"):
         # Sum rule: d(a+b)/dx = da/dx + db/dx
-        left_deriv = differentiate_expr(
-            expr.left, wrt_var, wrt_indices, config, bound_indices=bound_indices
-        )
-        right_deriv = differentiate_expr(
-            expr.right, wrt_var, wrt_indices, config, bound_indices=bound_indices
-        )
-        return Binary("+", left_deriv, right_deriv)
-
-    elif op == "-":
         # Difference rule: d(a-b)/dx = da/dx - db/dx
-        left_deriv = differentiate_expr(
-            expr.left, wrt_var, wrt_indices, config, bound_indices=bound_indices
-        )
-        right_deriv = differentiate_expr(
-            expr.right, wrt_var, wrt_indices, config, bound_indices=bound_indices
-        )
-        return Binary("-", left_deriv, right_deriv)
+        # Long linear sums are deep chains of these nodes; walk them on an
+        # explicit stack rather than one differentiate_expr frame per term.
+        return fold(_diff_additive, expr, wrt_var, wrt_indices, config, bound_indices)
 
     elif op == "*":
         # Product rule: d(a*b)/dx = b*(da/dx) + a*(db/dx)
@@ -680,6 +669,24 @@ def _diff_binary(
         )
 
 
+def _diff_additive(
+    expr: Expr,
+    wrt_var: str,
+    wrt_indices: tuple[str | IndexOffset, ...] | None,
+    config: Config | None,
+    bound_indices: frozenset[str],
+) -> Generator[tuple, Expr, Expr]:
+    """``fold`` walker applying the sum and difference rules for ``_diff_binary``.
+
+    Other nodes are handed back to differentiate_expr.
+    """
+    if isinstance(expr, Binary) and expr.op in ("+", "-"):
+        left_deriv = yield (expr.left, wrt_var, wrt_indices, config, bound_indices)
+        right_deriv = yield (expr.right, wrt_var, wrt_indices, config, bound_indices)
+        return Binary(expr.op, left_deriv, right_deriv)
+    return differentiate_expr(expr, wrt_var, wrt_indices, config, bound_indices=bound_indices)
+
+
 def _diff_unary(
     expr: Unary,
     wrt_var: str,
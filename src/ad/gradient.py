@@ -59,10 +59,25 @@ Implementation:
 Backward Compatibility:
 - When wrt_indices=None (default), differentiates w.r.t. scalar variable
 - Existing code without indexed variables continues to work unchanged
+
+Sparse Objectives:
+-----------------
+Differentiating the whole objective once per variable instance costs
+O(#instances x |objective|), which is quadratic for objectives written out
+term by term (10^4 terms over 10^4 variables). ``_AdditiveTerms`` first walks
+the objective's top-level additive terms once, recording which variable
+instances each term references; every partial is then differentiated from the
+terms that reference its instance only. Terms whose references cannot be read
+off statically (aggregations, lead/lag offsets, set-valued indices) are part
+of every partial. The partials are the same expressions the full
+differentiation yields after simplification, since terms left out only
+contribute zeros that simplification drops. Set NLP2MCP_NO_REVERSE_GRADIENT=1
+to differentiate the whole objective for every instance.
 """
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -70,13 +85,31 @@ if TYPE_CHECKING:
     from ..ir.ast import Expr
     from ..ir.model_ir import ModelIR
 
-from ..ir.ast import Binary, Const, DollarConditional, Unary
+from ..ir.ast import (
+    Binary,
+    Call,
+    Const,
+    DollarConditional,
+    IndexOffset,
+    Prod,
+    Sum,
+    Unary,
+    VarRef,
+    interning,
+)
 from ..ir.symbols import ObjSense, Rel
-from .ad_core import apply_simplification, get_simplification_mode
-from .derivative_rules import differentiate_expr
+from ..ir.traversal import iter_postorder
+from .ad_core import apply_simplification, get_simplification_mode, simplify
+from .derivative_rules import _strip_quotes, differentiate_expr
 from .index_mapping import build_index_mapping, enumerate_variable_instances
 from .jacobian import GradientVector
 
+_NO_REVERSE_GRADIENT_ENV = "NLP2MCP_NO_REVERSE_GRADIENT"
+
+
+def _reverse_gradient_enabled() -> bool:
+    return os.environ.get(_NO_REVERSE_GRADIENT_ENV, "").strip().lower() not in ("1", "true", "yes")
+
 
 def find_objective_expression(model_ir: ModelIR) -> Expr:
     """
@@ -219,6 +252,7 @@ def _is_symbol_ref(expr: Expr, name: str) -> bool:
     return False
 
 
+@interning()
 def compute_objective_gradient(model_ir: ModelIR, config: Config | None = None) -> GradientVector:
     """
     Compute gradient of objective function with respect to all variables.
@@ -255,8 +289,8 @@ def compute_objective_gradient(model_ir: ModelIR, config: Config | None = None)
     # Find objective expression
     obj_expr = find_objective_expression(model_ir)
 
-    # Build index mapping for all variables
-    index_mapping = build_index_mapping(model_ir)
+    # Build index mapping for all variables (the gradient has no rows)
+    index_mapping = build_index_mapping(model_ir, include_equations=False)
 
     # Create gradient vector
     gradient = GradientVector(index_mapping=index_mapping, num_cols=index_mapping.num_vars)
@@ -276,9 +310,20 @@ def compute_objective_gradient(model_ir: ModelIR, config: Config | None = None)
     # would be corrupted by this enumeration; the gradient re-symbolization that
     # consumes the enumerated cross-terms lives only in _build_indexed_gradient_term.
     # Scope the flag tightly and always restore it.
+    # LP fast path: cap simplification at basic (identity/zero
+    # elimination) instead of expensive advanced simplification,
+    # but still respect an explicit "none" mode from config.
+    is_lp = model_ir.solve_type is not None and model_ir.solve_type.upper() == "LP"
+    mode = get_simplification_mode(config)
+    if is_lp and mode != "none":
+        mode = "basic"
+
     prev_flag = getattr(config, "enable_obj_offset_crossterms", False)
     config.enable_obj_offset_crossterms = True
     try:
+        # max f(x) = min -f(x), so gradient is -∇f
+        terms = _AdditiveTerms(obj_expr, model_ir, config, mode, negate=sense == ObjSense.MAX)
+
         # Differentiate objective w.r.t. each variable
         for var_name in sorted(model_ir.variables.keys()):
             var_def = model_ir.variables[var_name]
@@ -294,21 +339,7 @@ def compute_objective_gradient(model_ir: ModelIR, config: Config | None = None)
 
                 # Differentiate objective w.r.t. this specific variable instance
                 # Index-aware differentiation: pass indices to distinguish x(i1) from x(i2)
-                derivative = differentiate_expr(obj_expr, var_name, indices, config)
-
-                # Apply objective sense
-                if sense == ObjSense.MAX:
-                    # max f(x) = min -f(x), so gradient is -∇f
-                    derivative = Unary("-", derivative)
-
-                # LP fast path: cap simplification at basic (identity/zero
-                # elimination) instead of expensive advanced simplification,
-                # but still respect an explicit "none" mode from config.
-                is_lp = model_ir.solve_type is not None and model_ir.solve_type.upper() == "LP"
-                mode = get_simplification_mode(config)
-                if is_lp and mode != "none":
-                    mode = "basic"
-                derivative = apply_simplification(derivative, mode)
+                derivative = terms.derivative(var_name, indices)
 
                 # Store in gradient vector
                 gradient.set_derivative(col_id, derivative)
@@ -434,8 +465,8 @@ def compute_gradient_for_expression(
         >>> gradient.get_derivative_by_name("x")  # Returns: 2*x
         >>> gradient.get_derivative_by_name("y")  # Returns: 1
     """
-    # Build index mapping
-    index_mapping = build_index_mapping(model_ir)
+    # Build index mapping (variables only; the gradient has no rows)
+    index_mapping = build_index_mapping(model_ir, include_equations=False)
 
     # Create gradient vector
     gradient = GradientVector(index_mapping=index_mapping, num_cols=index_mapping.num_vars)
@@ -445,6 +476,9 @@ def compute_gradient_for_expression(
 
     config = ensure_config_with_model_ir(config, model_ir)
 
+    # Simplify derivative expressions based on config
+    terms = _AdditiveTerms(expr, model_ir, config, get_simplification_mode(config), negate)
+
     # Differentiate w.r.t. each variable
     for var_name in sorted(model_ir.variables.keys()):
         var_def = model_ir.variables[var_name]
@@ -459,17 +493,143 @@ def compute_gradient_for_expression(
 
             # Differentiate w.r.t. this specific variable instance
             # Index-aware differentiation: pass indices to distinguish x(i1) from x(i2)
-            derivative = differentiate_expr(expr, var_name, indices, config)
-
-            # Apply negation if requested
-            if negate:
-                derivative = Unary("-", derivative)
-
-            # Simplify derivative expression based on config
-            mode = get_simplification_mode(config)
-            derivative = apply_simplification(derivative, mode)
+            derivative = terms.derivative(var_name, indices)
 
             # Store
             gradient.set_derivative(col_id, derivative)
 
     return gradient
+
+
+def _normalize_indices(indices: tuple) -> tuple[str, ...]:
+    # Same comparison as derivative_rules._indices_match
+    return tuple(_strip_quotes(idx).lower() for idx in indices)
+
+
+class _AdditiveTerms:
+    """An expression split into its top-level additive terms, indexed by the instances they use.
+
+    ``derivative(var_name, indices)`` returns what differentiating the whole
+    expression w.r.t. that instance (negated if ``negate``) and simplifying it
+    with ``mode`` returns, but only differentiates the terms that reference the
+    instance, plus those whose references are not known statically. The other
+    terms' derivatives simplify to zero constants, which the ``x + 0``,
+    ``0 + x`` and ``x - 0`` rules remove before any rule looks at the sum as a
+    whole; a partial no term contributes to is that same folded zero.
+
+    Terms qualify for the index when they contain no aggregation or lead/lag
+    offset, every variable index is a plain label that is not a set name, and
+    their derivative w.r.t. instances they do not reference simplifies to a
+    zero constant. Simplification "none" keeps the zeros, so then every term
+    takes part in every partial.
+    """
+
+    def __init__(
+        self, expr: Expr, model_ir: ModelIR, config: Config | None, mode: str, negate: bool
+    ) -> None:
+        self.expr = expr
+        self.config = config
+        self.mode = mode
+        self.negate = negate
+        self._set_names = {name.lower() for name in (*model_ir.sets, *model_ir.aliases)}
+        self._arity = {name: len(var.domain) for name, var in model_ir.variables.items()}
+
+        # Left spine of the "+"/"-" chain: expr = ((t0 op1 t1) op2 t2) ...
+        ops: list[str] = []
+        node = expr
+        spine: list[Expr] = []
+        while isinstance(node, Binary) and node.op in ("+", "-"):
+            ops.append(node.op)
+            spine.append(node.right)
+            node = node.left
+        spine.append(node)
+        ops.append("+")
+        self.terms = spine[::-1]
+        self.ops = ops[::-1]
+
+        # Per term: the zero its derivative simplifies to for instances it does
+        # not reference, by variable ("" for variables it does not mention)
+        self._zeros: list[dict[str, Const]] = []
+        # Terms that may contribute to every partial
+        self._general: list[int] = []
+        self._by_instance: dict[tuple[str, tuple[str, ...]], list[int]] = {}
+        enabled = mode != "none" and _reverse_gradient_enabled()
+        for position, term in enumerate(self.terms):
+            instances = self._instances_in(term) if enabled else None
+            zeros = self._zeros_of(term, instances) if instances is not None else None
+            if instances is None or zeros is None:
+                self._general.append(position)
+                self._zeros.append({})
+                continue
+            self._zeros.append(zeros)
+            for instance in instances:
+                self._by_instance.setdefault(instance, []).append(position)
+        self._no_terms: dict[str, Expr] = {}
+
+    def _instances_in(self, term: Expr) -> set[tuple[str, tuple[str, ...]]] | None:
+        instances: set[tuple[str, tuple[str, ...]]] = set()
+        for node in iter_postorder(term):
+            if isinstance(node, (Sum, Prod, IndexOffset)):
+                return None
+            if isinstance(node, Call) and node.func in ("smin", "smax"):
+                return None
+            if isinstance(node, VarRef):
+                if not all(isinstance(idx, str) for idx in node.indices):
+                    return None
+                labels = _normalize_indices(node.indices)
+                if not self._set_names.isdisjoint(labels):
+                    return None
+                instances.add((node.name, labels))
+        return instances
+
+    def _zeros_of(
+        self, term: Expr, instances: set[tuple[str, tuple[str, ...]]]
+    ) -> dict[str, Const] | None:
+        zeros: dict[str, Const] = {}
+        for var_name in {"", *(name for name, _ in instances)}:
+            # NUL never occurs in a GAMS label, so this instance matches nothing
+            unmatched = ("\0",) * self._arity.get(var_name, 0)
+            zero = simplify(differentiate_expr(term, var_name or "\0", unmatched, self.config))
+            if not (isinstance(zero, Const) and zero.value == 0):
+                return None
+            zeros[var_name] = zero
+        return zeros
+
+    def derivative(self, var_name: str, indices: tuple[str, ...]) -> Expr:
+        """Simplified derivative w.r.t. ``var_name(indices)``."""
+        labels = _normalize_indices(indices)
+        if self._general and len(self._general) == len(self.terms):
+            return self._finish(differentiate_expr(self.expr, var_name, indices, self.config))
+        if not self._set_names.isdisjoint(labels):
+            return self._finish(differentiate_expr(self.expr, var_name, indices, self.config))
+
+        positions = sorted([*self._by_instance.get((var_name, labels), ()), *self._general])
+        if not positions:
+            if var_name not in self._no_terms:
+                self._no_terms[var_name] = self._finish(self._chain_of_zeros(var_name))
+            return self._no_terms[var_name]
+
+        first = positions[0]
+        relevant = self.terms[first]
+        if first > 0 and self.ops[first] == "-":
+            relevant = Binary("-", Const(0.0), relevant)
+        for position in positions[1:]:
+            relevant = Binary(self.ops[position], relevant, self.terms[position])
+        return self._finish(differentiate_expr(relevant, var_name, indices, self.config))
+
+    def _chain_of_zeros(self, var_name: str) -> Expr:
+        # The unsimplified derivative of the whole chain, up to simplifying
+        # each term's derivative to its zero
+        chain: Expr = self._zero(0, var_name)
+        for position in range(1, len(self.terms)):
+            chain = Binary(self.ops[position], chain, self._zero(position, var_name))
+        return chain
+
+    def _zero(self, position: int, var_name: str) -> Const:
+        zeros = self._zeros[position]
+        return zeros.get(var_name, zeros[""])
+
+    def _finish(self, derivative: Expr) -> Expr:
+        if self.negate:
+            derivative = Unary("-", derivative)
+        return apply_simplification(derivative, self.mode)
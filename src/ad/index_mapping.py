@@ -52,6 +52,10 @@ class IndexMapping:
         row_to_eq: Map row_id → (eq_name, index_tuple)
         num_vars: Total number of variable instances (columns)
         num_eqs: Total number of equation instances (rows)
+
+    Mappings made by ``with_same_variables`` share ``var_to_col`` and
+    ``col_to_var`` with the mapping they came from, so the variable side is
+    not changed after ``build_index_mapping`` returns.
     """
 
     var_to_col: dict[tuple[str, tuple[str, ...]], int] = field(default_factory=dict)
@@ -111,6 +115,20 @@ class IndexMapping:
         """
         return self.row_to_eq.get(row_id)
 
+    def with_same_variables(self) -> IndexMapping:
+        """
+        Get a mapping with this mapping's columns and no rows.
+
+        The variable dicts are shared, not copied, so the equality and
+        inequality Jacobians can number their own rows over one column space.
+
+        Returns:
+            IndexMapping sharing var_to_col and col_to_var with this one
+        """
+        return IndexMapping(
+            var_to_col=self.var_to_col, col_to_var=self.col_to_var, num_vars=self.num_vars
+        )
+
 
 def resolve_set_members(
     set_or_alias_name: str,
@@ -604,7 +622,7 @@ def _cross_product(lists: list[list[str]]) -> list[tuple[str, ...]]:
     return result
 
 
-def build_index_mapping(model_ir: ModelIR) -> IndexMapping:
+def build_index_mapping(model_ir: ModelIR, include_equations: bool = True) -> IndexMapping:
     """
     Build complete index mapping for all variables and equations.
 
@@ -614,6 +632,8 @@ def build_index_mapping(model_ir: ModelIR) -> IndexMapping:
 
     Args:
         model_ir: Model IR with variables, equations, sets, and aliases
+        include_equations: Whether to number equation instances as rows. Callers
+            that number their own rows (see ``with_same_variables``) skip it.
 
     Returns:
         IndexMapping with populated mappings
@@ -641,6 +661,9 @@ def build_index_mapping(model_ir: ModelIR) -> IndexMapping:
 
     mapping.num_vars = col_id
 
+    if not include_equations:
+        return mapping
+
     # Enumerate all equations (sorted by name for deterministic ordering)
     row_id = 0
     for eq_name in sorted(model_ir.equations.keys()):
@@ -10,6 +10,10 @@ Day 7 Scope:
 - Storage format: J[row_id][col_id] = derivative_expr (AST)
 - Query interface: get_derivative(eq_instance, var_instance)
 - Integration with IndexMapping from Day 6
+- Column queries (get_col) read a column-major index built on first use,
+  so walking every column costs O(nnz) rather than O(rows x columns)
+- Coordinate (COO) arrays plus an expression table for numeric consumers
+  (to_coo), in row-major (CSR) order
 
 Mathematical Background:
 -----------------------
@@ -37,6 +41,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from ..ir.ast import Expr
     from .index_mapping import IndexMapping
 
@@ -51,12 +57,30 @@ class JacobianStructure:
         index_mapping: IndexMapping for variable/equation instance lookups
         num_rows: Total number of rows (equations)
         num_cols: Total number of columns (variables)
+        derivative_memo_hits: Entries reused from an instance of the same shape
+            (see ``DerivativeMemo`` in derivative_blocks.py)
+        derivative_memo_lookups: Entries differentiated instance by instance
+
+    Entries must be added through ``set_derivative``, which drops the cached
+    column index and coordinate arrays; writing to ``entries`` directly
+    leaves them stale.
     """
 
     entries: dict[int, dict[int, Expr]] = field(default_factory=dict)
     index_mapping: IndexMapping | None = None
     num_rows: int = 0
     num_cols: int = 0
+    derivative_memo_hits: int = 0
+    derivative_memo_lookups: int = 0
+    # Column-major copy of entries: col_id -> {row_id: derivative_expr}, with
+    # rows in ascending order. Built by get_col, dropped by set_derivative.
+    _columns: dict[int, dict[int, Expr]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (rows, cols, exprs) as returned by to_coo, dropped by set_derivative
+    _coo: tuple[np.ndarray, np.ndarray, list[Expr]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def set_derivative(self, row_id: int, col_id: int, derivative_expr: Expr) -> None:
         """
@@ -70,6 +94,8 @@ class JacobianStructure:
         if row_id not in self.entries:
             self.entries[row_id] = {}
         self.entries[row_id][col_id] = derivative_expr
+        self._columns = None
+        self._coo = None
 
     def get_derivative(self, row_id: int, col_id: int) -> Expr | None:
         """
@@ -133,17 +159,51 @@ class JacobianStructure:
         """
         Get all nonzero entries in a column.
 
+        The first call builds a column-major index of all entries in
+        O(nnz); later calls are dict lookups until the next ``set_derivative``.
+
         Args:
             col_id: Column index
 
         Returns:
-            Dict mapping row_id → derivative_expr for nonzero entries
+            Dict mapping row_id → derivative_expr for nonzero entries, in
+            ascending row order. The dict is shared; do not modify it.
         """
-        col_entries: dict[int, Expr] = {}
-        for row_id, row_dict in self.entries.items():
-            if col_id in row_dict:
-                col_entries[row_id] = row_dict[col_id]
-        return col_entries
+        if self._columns is None:
+            columns: dict[int, dict[int, Expr]] = {}
+            for row_id in sorted(self.entries):
+                for c, derivative_expr in self.entries[row_id].items():
+                    columns.setdefault(c, {})[row_id] = derivative_expr
+            self._columns = columns
+        return self._columns.get(col_id, {})
+
+    def to_coo(self) -> tuple[np.ndarray, np.ndarray, list[Expr]]:
+        """
+        Get all nonzero entries as coordinate arrays plus an expression table.
+
+        Entries are ordered by row, then column, so ``rows`` is sorted and
+        the arrays are in CSR order. Built on first use and kept until the
+        next ``set_derivative``.
+
+        Returns:
+            Tuple of (rows, cols, exprs): int64 arrays of length nnz, and the
+            derivative expression of entry k at ``exprs[k]``. The arrays are
+            shared; do not modify them.
+        """
+        if self._coo is None:
+            import numpy as np  # deferred: only scaling and Matrix Market export need arrays
+
+            rows: list[int] = []
+            cols: list[int] = []
+            exprs: list[Expr] = []
+            for row_id in sorted(self.entries):
+                row_dict = self.entries[row_id]
+                for col_id in sorted(row_dict):
+                    rows.append(row_id)
+                    cols.append(col_id)
+                    exprs.append(row_dict[col_id])
+            self._coo = (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), exprs)
+        return self._coo
 
     def get_nonzero_entries(self) -> list[tuple[int, int]]:
         """
@@ -17,6 +17,7 @@ This is integrated as an optional pass in the main simplify() function.
 from dataclasses import dataclass
 
 from ..ir.ast import Binary, Const, Expr, Unary
+from ..ir.traversal import flatten_chain
 
 
 @dataclass(frozen=True)
@@ -53,14 +54,7 @@ def _flatten_addition(expr: Expr) -> list[Expr]:
     Returns:
         List of terms (flattened if expr is addition, [expr] otherwise)
     """
-    if not isinstance(expr, Binary) or expr.op != "+":
-        return [expr]
-
-    # Recursively flatten left and right
-    result = []
-    result.extend(_flatten_addition(expr.left))
-    result.extend(_flatten_addition(expr.right))
-    return result
+    return flatten_chain(expr, "+")
 
 
 def _flatten_multiplication(expr: Expr) -> list[Expr]:
@@ -77,14 +71,7 @@ def _flatten_multiplication(expr: Expr) -> list[Expr]:
     Returns:
         List of factors (flattened if expr is multiplication, [expr] otherwise)
     """
-    if not isinstance(expr, Binary) or expr.op != "*":
-        return [expr]
-
-    # Recursively flatten left and right
-    result = []
-    result.extend(_flatten_multiplication(expr.left))
-    result.extend(_flatten_multiplication(expr.right))
-    return result
+    return flatten_chain(expr, "*")
 
 
 def _extract_term(expr: Expr) -> Term:
@@ -12,35 +12,14 @@ from pathlib import Path
 
 import click
 
-from src.ad.constraint_jacobian import compute_constraint_jacobian
-from src.ad.gradient import compute_objective_gradient
 from src.config import Config
-from src.diagnostics import compute_model_statistics, export_jacobian_matrix_market
-from src.diagnostics.convexity.patterns import (
-    BilinearTermPattern,
-    NonlinearEqualityPattern,
-    OddPowerPattern,
-    QuotientPattern,
-    TrigonometricPattern,
-)
-from src.emit.emit_gams import emit_gams_mcp
-from src.ir.diagnostics import DiagnosticContext, Stage, create_report
-from src.ir.normalize import normalize_model
-from src.ir.parser import parse_model_file
-from src.kkt.assemble import assemble_kkt_system
-from src.kkt.reformulation import reformulate_model
-from src.kkt.scaling import byvar_scaling, curtis_reid_scaling
-from src.kkt.sqr_reformulation import reformulate_sqr_equalities
 from src.logging_config import setup_logging
 from src.utils.error_codes import get_error_info
-from src.validation.discreteness import MINLPNotSupportedError, validate_continuous
-from src.validation.driver import (
-    MultiSolveDriverError,
-    scan_multi_solve_driver,
-    validate_single_optimization,
-)
-from src.validation.model import validate_model_structure
-from src.validation.numerical import validate_jacobian_entries, validate_parameter_values
+
+# Pipeline stages (parser, AD, KKT assembly, emitter, NumPy-based scaling,
+# diagnostics, validation) are imported inside main() when they are reached,
+# so `nlp2mcp --help`, usage errors and early failures do not pay for the
+# whole import graph.
 
 # Distinct exit code so callers (CI, batch scripts) can distinguish
 # "model is out of scope" from generic translation failures.
@@ -82,8 +61,35 @@ def _install_repo_relative_formatwarning() -> None:
 EXIT_MULTI_SOLVE_OUT_OF_SCOPE = 4
 
 
+def _warm_grammar_cache_callback(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    """Eager ``--warm-grammar-cache`` handler: rebuild the grammar cache and exit.
+
+    Batch drivers that spawn one CLI process per model call this once up front
+    so every subsequent process loads the pre-compiled parsers instead of
+    recompiling ``gams_grammar.lark`` and its LALR fast-path subset.
+    """
+    if not value or ctx.resilient_parsing:
+        return
+    from src.ir.parser import warm_grammar_cache
+
+    cache_paths = warm_grammar_cache()
+    if not cache_paths:
+        click.echo("Grammar cache not written: caching is disabled (NLP2MCP_NO_CACHE)")
+    for cache_path in cache_paths:
+        click.echo(f"✓ Grammar cache written: {cache_path}")
+    ctx.exit(0)
+
+
 @click.command()
 @click.argument("input_file", type=click.Path(exists=True))
+@click.option(
+    "--warm-grammar-cache",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_warm_grammar_cache_callback,
+    help="Compile the GAMS grammar into the on-disk parser cache and exit",
+)
 @click.option("-o", "--output", type=click.Path(), help="Output file path")
 @click.option(
     "--verbose",
@@ -215,6 +221,18 @@ EXIT_MULTI_SOLVE_OUT_OF_SCOPE = 4
         "multistart = perturbed-.l restart loop; optfile = emitted PATH proximal_perturbation/merit optfile."
     ),
 )
+@click.option(
+    "--parse-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Parse independent statements in N worker processes (for very large models)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Re-parse only the statements changed since the last run on this file",
+)
 def main(
     input_file,
     output,
@@ -237,6 +255,8 @@ def main(
     allow_discrete,
     allow_multi_solve,
     force,
+    parse_workers,
+    incremental,
 ):
     """Convert GAMS NLP model to MCP format using KKT conditions.
 
@@ -272,9 +292,14 @@ def main(
     # gamslib DB `message` field) doesn't leak the runner's absolute home path.
     _install_repo_relative_formatwarning()
 
+    from src.validation.discreteness import MINLPNotSupportedError
+    from src.validation.driver import MultiSolveDriverError
+
     # Initialize diagnostic report if requested
     diag_report = None
     if diagnostics:
+        from src.ir.diagnostics import DiagnosticContext, Stage, create_report
+
         diag_report = create_report(Path(input_file).name)
 
     try:
@@ -288,18 +313,24 @@ def main(
         # Set up logging
         setup_logging(verbosity=verbosity_level)
         # Step 1: Parse model
+        from src.ir.parser import parse_model_file
+
         if verbose:
             click.echo(f"Parsing model: {input_file}")
 
         if diag_report:
             with DiagnosticContext(diag_report, Stage.PARSE) as ctx:
-                model = parse_model_file(input_file)
+                model = parse_model_file(
+                    input_file, parse_workers=parse_workers, incremental=incremental
+                )
                 ctx.add_detail("sets", len(model.sets))
                 ctx.add_detail("parameters", len(model.params))
                 ctx.add_detail("variables", len(model.variables))
                 ctx.add_detail("equations", len(model.equations))
         else:
-            model = parse_model_file(input_file)
+            model = parse_model_file(
+                input_file, parse_workers=parse_workers, incremental=incremental
+            )
 
         if verbose >= 2:
             click.echo(f"  Sets: {len(model.sets)}")
@@ -308,6 +339,11 @@ def main(
             click.echo(f"  Equations: {len(model.equations)}")
 
         # Step 1.5: Validate model structure (Sprint 5 Day 4 - Task 4.2)
+        from src.validation.discreteness import validate_continuous
+        from src.validation.driver import scan_multi_solve_driver, validate_single_optimization
+        from src.validation.model import validate_model_structure
+        from src.validation.numerical import validate_jacobian_entries, validate_parameter_values
+
         if verbose:
             click.echo("Validating model structure...")
 
@@ -367,6 +403,14 @@ def main(
 
         # Step 1.7: Check for convexity warnings (Sprint 6 Day 4)
         if not skip_convexity_check:
+            from src.diagnostics.convexity.patterns import (
+                BilinearTermPattern,
+                NonlinearEqualityPattern,
+                OddPowerPattern,
+                QuotientPattern,
+                TrigonometricPattern,
+            )
+
             if verbose:
                 click.echo("Checking for potential nonconvex patterns...")
 
@@ -408,6 +452,10 @@ def main(
                 click.echo()
 
         # Step 2: Normalize model and reformulate (Simplification stage)
+        from src.ir.normalize import normalize_model
+        from src.kkt.reformulation import reformulate_model
+        from src.kkt.sqr_reformulation import reformulate_sqr_equalities
+
         if verbose:
             click.echo("Normalizing model...")
 
@@ -467,6 +515,11 @@ def main(
                     )
 
         # Step 3: Compute derivatives (IR Generation stage)
+        from src.ad.constraint_jacobian import compute_constraint_jacobian
+        from src.ad.gradient import compute_objective_gradient
+        from src.kkt.assemble import assemble_kkt_system
+        from src.kkt.scaling import byvar_scaling, curtis_reid_scaling
+
         if verbose:
             click.echo("Computing derivatives...")
 
@@ -508,6 +561,14 @@ def main(
                 ctx.add_detail("gradient_cols", gradient.num_cols)
                 ctx.add_detail("eq_jacobian_rows", J_eq.num_rows)
                 ctx.add_detail("ineq_jacobian_rows", J_ineq.num_rows)
+                memo_hits = J_eq.derivative_memo_hits + J_ineq.derivative_memo_hits
+                memo_lookups = J_eq.derivative_memo_lookups + J_ineq.derivative_memo_lookups
+                ctx.add_detail("derivative_memo_hits", memo_hits)
+                ctx.add_detail("derivative_memo_lookups", memo_lookups)
+                ctx.add_detail(
+                    "derivative_memo_hit_rate",
+                    round(memo_hits / memo_lookups, 3) if memo_lookups else 0.0,
+                )
                 ctx.add_detail("stationarity_eqs", len(kkt.stationarity))
         else:
             gradient = compute_objective_gradient(model, config)
@@ -592,11 +653,15 @@ def main(
 
         # Step 5.5: Diagnostics (if requested)
         if stats:
+            from src.diagnostics.statistics import compute_model_statistics
+
             logger = logging.getLogger("nlp2mcp")
             model_stats = compute_model_statistics(kkt)
             logger.info("\n" + model_stats.format_report())
 
         if dump_jacobian:
+            from src.diagnostics.matrix_market import export_jacobian_matrix_market
+
             if verbose:
                 click.echo(f"Exporting Jacobian to: {dump_jacobian}")
 
@@ -607,6 +672,8 @@ def main(
                 click.echo(f"✓ Jacobian exported to {dump_jacobian}")
 
         # Step 6: Emit GAMS MCP code (MCP Generation stage)
+        from src.emit.emit_gams import emit_gams_mcp
+
         if verbose:
             click.echo("Generating GAMS MCP code...")
 
@@ -1,8 +1,13 @@
 """Diagnostics module for model analysis and validation."""
 
-from .convexity_numerical import ConvexityResult, check_convexity_numerical
-from .matrix_market import export_jacobian_matrix_market
-from .statistics import compute_model_statistics
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .convexity_numerical import ConvexityResult, check_convexity_numerical
+    from .matrix_market import export_jacobian_matrix_market
+    from .statistics import compute_model_statistics
 
 __all__ = [
     "ConvexityResult",
@@ -10,3 +15,13 @@ __all__ = [
     "compute_model_statistics",
     "export_jacobian_matrix_market",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ConvexityResult": ".convexity_numerical",
+        "check_convexity_numerical": ".convexity_numerical",
+        "export_jacobian_matrix_market": ".matrix_market",
+        "compute_model_statistics": ".statistics",
+    },
+)
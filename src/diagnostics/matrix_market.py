@@ -155,7 +155,7 @@ def export_full_kkt_jacobian_matrix_market(kkt: KKTSystem, output_path: Path | s
     bound_lo_keys = sorted(kkt.complementarity_bounds_lo.keys())
     bound_up_keys = sorted(kkt.complementarity_bounds_up.keys())
 
-    for bound_key in bound_lo_keys:
+    for multiplier_idx, bound_key in enumerate(bound_lo_keys):
         var_name, var_indices = bound_key
 
         # Get primal variable column index
@@ -165,7 +165,6 @@ def export_full_kkt_jacobian_matrix_market(kkt: KKTSystem, output_path: Path | s
                 entries.append((row_idx + 1, var_col + 1, 1.0))
 
         # Get multiplier column index
-        multiplier_idx = bound_lo_keys.index(bound_key)
         multiplier_col = multiplier_col_offset + multiplier_idx
         entries.append((row_idx + 1, multiplier_col + 1, 1.0))
 
@@ -174,7 +173,7 @@ def export_full_kkt_jacobian_matrix_market(kkt: KKTSystem, output_path: Path | s
     # Upper bound equations: (up - x) ⊥ π^U
     multiplier_col_offset += len(kkt.complementarity_bounds_lo)
 
-    for bound_key in bound_up_keys:
+    for multiplier_idx, bound_key in enumerate(bound_up_keys):
         var_name, var_indices = bound_key
 
         # Get primal variable column index
@@ -184,7 +183,6 @@ def export_full_kkt_jacobian_matrix_market(kkt: KKTSystem, output_path: Path | s
                 entries.append((row_idx + 1, var_col + 1, 1.0))
 
         # Get multiplier column index
-        multiplier_idx = bound_up_keys.index(bound_key)
         multiplier_col = multiplier_col_offset + multiplier_idx
         entries.append((row_idx + 1, multiplier_col + 1, 1.0))
 
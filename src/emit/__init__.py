@@ -3,16 +3,21 @@
 This module provides functions for emitting GAMS code from KKT systems.
 """
 
-from src.emit.emit_gams import emit_gams_mcp
-from src.emit.equations import emit_equation_def, emit_equation_definitions
-from src.emit.expr_to_gams import expr_to_gams
-from src.emit.model import emit_model_mcp, emit_solve
-from src.emit.original_symbols import (
-    emit_original_aliases,
-    emit_original_parameters,
-    emit_original_sets,
-    emit_set_assignments,
-)
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from src.emit.emit_gams import emit_gams_mcp
+    from src.emit.equations import emit_equation_def, emit_equation_definitions
+    from src.emit.expr_to_gams import expr_to_gams
+    from src.emit.model import emit_model_mcp, emit_solve
+    from src.emit.original_symbols import (
+        emit_original_aliases,
+        emit_original_parameters,
+        emit_original_sets,
+        emit_set_assignments,
+    )
 
 __all__ = [
     "emit_original_sets",
@@ -26,3 +31,19 @@ __all__ = [
     "emit_solve",
     "emit_gams_mcp",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "emit_gams_mcp": "src.emit.emit_gams",
+        "emit_equation_def": "src.emit.equations",
+        "emit_equation_definitions": "src.emit.equations",
+        "expr_to_gams": "src.emit.expr_to_gams",
+        "emit_model_mcp": "src.emit.model",
+        "emit_solve": "src.emit.model",
+        "emit_original_aliases": "src.emit.original_symbols",
+        "emit_original_parameters": "src.emit.original_symbols",
+        "emit_original_sets": "src.emit.original_symbols",
+        "emit_set_assignments": "src.emit.original_symbols",
+    },
+)
@@ -517,37 +517,36 @@ def _collect_additive_terms(expr: Expr, sign: int = 1) -> list[tuple[int, Expr]]
     """Flatten an expression into signed additive terms.
 
     Returns a list of (sign, term) pairs where sign is +1 or -1.
-    Recursively expands Binary(+/-) and Unary(-) to collect leaf terms.
+    Expands Binary(+/-) and Unary(-) to collect leaf terms, using an explicit
+    stack so long sums are flattened in linear time at any depth.
 
     Used by section 2c to detect cancellation patterns like p(r,c) - p(r,c).
     """
     result: list[tuple[int, Expr]] = []
-    _collect_additive_terms_acc(expr, sign, result)
+    stack = [(sign, expr)]
+    while stack:
+        sign, expr = stack.pop()
+        # Children are pushed right first so terms come out left to right
+        if isinstance(expr, Binary) and expr.op == "+":
+            stack.append((sign, expr.right))
+            stack.append((sign, expr.left))
+        elif isinstance(expr, Binary) and expr.op == "-":
+            stack.append((-sign, expr.right))
+            stack.append((sign, expr.left))
+        elif isinstance(expr, Unary) and expr.op == "-":
+            stack.append((-sign, expr.child))
+        # Check for (-1) * expr pattern
+        elif isinstance(expr, Binary) and expr.op == "*" and _is_minus_one(expr.left):
+            stack.append((-sign, expr.right))
+        elif isinstance(expr, Binary) and expr.op == "*" and _is_minus_one(expr.right):
+            stack.append((-sign, expr.left))
+        else:
+            result.append((sign, expr))
     return result
 
 
-def _collect_additive_terms_acc(expr: Expr, sign: int, acc: list[tuple[int, Expr]]) -> None:
-    """Accumulator helper — appends (sign, term) pairs to *acc* in-place."""
-    if isinstance(expr, Binary) and expr.op == "+":
-        _collect_additive_terms_acc(expr.left, sign, acc)
-        _collect_additive_terms_acc(expr.right, sign, acc)
-        return
-    if isinstance(expr, Binary) and expr.op == "-":
-        _collect_additive_terms_acc(expr.left, sign, acc)
-        _collect_additive_terms_acc(expr.right, -sign, acc)
-        return
-    if isinstance(expr, Unary) and expr.op == "-":
-        _collect_additive_terms_acc(expr.child, -sign, acc)
-        return
-    if isinstance(expr, Binary) and expr.op == "*":
-        # Check for (-1) * expr pattern
-        if isinstance(expr.left, Const) and expr.left.value == -1.0:
-            _collect_additive_terms_acc(expr.right, -sign, acc)
-            return
-        if isinstance(expr.right, Const) and expr.right.value == -1.0:
-            _collect_additive_terms_acc(expr.left, -sign, acc)
-            return
-    acc.append((sign, expr))
+def _is_minus_one(expr: Expr) -> bool:
+    return isinstance(expr, Const) and expr.value == -1.0
 
 
 def _contains_variable(expr: Expr) -> bool:
@@ -9,6 +9,7 @@ in a nested sum.
 """
 
 import math
+from collections.abc import Generator
 
 from src.ir.ast import (
     Binary,
@@ -31,6 +32,7 @@ from src.ir.ast import (
     VarRef,
 )
 from src.ir.constants import GAMS_RESERVED_CONSTANTS
+from src.ir.traversal import fold
 
 # Operator precedence levels (higher = tighter binding)
 PRECEDENCE = {
@@ -415,8 +417,13 @@ def expr_to_gams(
         >>> expr_to_gams(Binary("^", VarRef("x", ()), Const(2)))
         'sqr(x)'
     """
-    if domain_vars is None:
-        domain_vars = frozenset()
+    return fold(_to_gams, expr, parent_op, is_right, domain_vars or frozenset())
+
+
+def _to_gams(
+    expr: Expr, parent_op: str | None, is_right: bool, domain_vars: frozenset[str]
+) -> Generator[tuple, str, str]:
+    """``expr_to_gams`` for one node, as a ``fold`` walker (operands are yielded)."""
     match expr:
         case Const(value):
             return _format_numeric(value)
@@ -462,7 +469,7 @@ def expr_to_gams(
             return f"mcp_model.{ma_ref.attribute}"
 
         case Unary(op, child):
-            child_str = expr_to_gams(child, parent_op=op, domain_vars=domain_vars)
+            child_str = yield (child, op, False, domain_vars)
             # GAMS unary operators: +, -, not
             # For unary minus, ALWAYS convert to multiplication form to avoid GAMS Error 445
             # ("More than one operator in a row"). This happens when unary minus follows
@@ -493,18 +500,14 @@ def expr_to_gams(
                 # Use sqr() for x**2 — GAMS rPower rejects negative bases
                 # (e.g. (-1)**2 raises FUNC DOMAIN) but sqr() handles them (#982).
                 if isinstance(right, Const) and right.value == 2.0:
-                    left_str = expr_to_gams(
-                        left, parent_op=None, is_right=False, domain_vars=domain_vars
-                    )
+                    left_str = yield (left, None, False, domain_vars)
                     result = f"sqr({left_str})"
                     needs_parens = _needs_parens(parent_op, "**", is_right)
                     return f"({result})" if needs_parens else result
 
                 # GAMS uses ** for exponentiation
-                left_str = expr_to_gams(left, parent_op=op, is_right=False, domain_vars=domain_vars)
-                right_str = expr_to_gams(
-                    right, parent_op=op, is_right=True, domain_vars=domain_vars
-                )
+                left_str = yield (left, op, False, domain_vars)
+                right_str = yield (right, op, True, domain_vars)
 
                 # Subcategory D: GAMS Error $445 ("more than one operator in a row")
                 # when the exponent is negative, e.g., x ** -0.9904. GAMS requires
@@ -518,23 +521,12 @@ def expr_to_gams(
                 result = f"{left_str} ** {right_str}"
                 return f"({result})" if needs_parens else result
 
-            # Special handling for subtraction of negative constants
-            # Convert "x - (-5)" to "x + 5" to avoid double operators
-            if op == "-" and isinstance(right, Const) and right.value < 0:
-                left_str = expr_to_gams(
-                    left, parent_op="+", is_right=False, domain_vars=domain_vars
-                )
-                # Negate the negative value to get positive
-                right_val = -right.value
-                right_str = _format_numeric(right_val)
-                # Use addition instead
-                needs_parens = _needs_parens(parent_op, "+", is_right)
-                result = f"{left_str} + {right_str}"
-                return f"({result})" if needs_parens else result
+            if op in ("+", "-"):
+                return (yield from _additive_chain_to_gams(expr, parent_op, is_right, domain_vars))
 
             # Other binary operators
-            left_str = expr_to_gams(left, parent_op=op, is_right=False, domain_vars=domain_vars)
-            right_str = expr_to_gams(right, parent_op=op, is_right=True, domain_vars=domain_vars)
+            left_str = yield (left, op, False, domain_vars)
+            right_str = yield (right, op, True, domain_vars)
 
             # Special handling: wrap negative constants in parentheses to avoid GAMS Error 445
             # ("More than one operator in a row").
@@ -563,30 +555,30 @@ def expr_to_gams(
             # (e.g., literal co-index subset where outer domain controls all vars).
             # Collapse to body$condition instead of invalid sum(()$..., body).
             if not index_sets:
-                body_str = expr_to_gams(body, domain_vars=domain_vars)
+                body_str = yield (body, None, False, domain_vars)
                 if condition is not None:
-                    cond_str = expr_to_gams(condition, domain_vars=domain_vars)
+                    cond_str = yield (condition, None, False, domain_vars)
                     return f"(({body_str})$({cond_str}))"
                 # Preserve Sum precedence when collapsing to bare body.
                 return f"({body_str})"
             # GAMS: sum(i$cond, body) or sum((i,j), body)
             extended_domain_vars = domain_vars | frozenset(index_sets)
-            body_str = expr_to_gams(body, domain_vars=extended_domain_vars)
+            body_str = yield (body, None, False, extended_domain_vars)
             domain_str = _agg_domain_str(index_sets, condition, extended_domain_vars)
             return f"sum({domain_str}, {body_str})"
 
         case Prod(index_sets, body, condition):
             # Issue #1155: Empty index_sets — collapse to conditional (identity=1).
             if not index_sets:
-                body_str = expr_to_gams(body, domain_vars=domain_vars)
+                body_str = yield (body, None, False, domain_vars)
                 if condition is not None:
-                    cond_str = expr_to_gams(condition, domain_vars=domain_vars)
+                    cond_str = yield (condition, None, False, domain_vars)
                     return f"(({body_str})$({cond_str}))"
                 # Preserve Prod precedence when collapsing to bare body.
                 return f"({body_str})"
             # GAMS: prod(i$cond, body) or prod((i,j), body) — Issue #709
             extended_domain_vars = domain_vars | frozenset(index_sets)
-            body_str = expr_to_gams(body, domain_vars=extended_domain_vars)
+            body_str = yield (body, None, False, extended_domain_vars)
             domain_str = _agg_domain_str(index_sets, condition, extended_domain_vars)
             return f"prod({domain_str}, {body_str})"
 
@@ -608,14 +600,14 @@ def expr_to_gams(
                     remaining = args[len(domain_indices) :]
                     extended_domain_vars = domain_vars | frozenset(domain_indices)
                     # Last remaining arg is the body; anything before it is a condition
-                    body_str = expr_to_gams(remaining[-1], domain_vars=extended_domain_vars)
+                    body_str = yield (remaining[-1], None, False, extended_domain_vars)
                     if len(domain_indices) == 1:
                         idx_str = domain_indices[0]
                     else:
                         idx_str = "(" + ",".join(domain_indices) + ")"
                     if len(remaining) > 1:
                         # There's a condition expression before the body
-                        cond_str = expr_to_gams(remaining[0], domain_vars=extended_domain_vars)
+                        cond_str = yield (remaining[0], None, False, extended_domain_vars)
                         return f"{func}({idx_str}$({cond_str}), {body_str})"
                     return f"{func}({idx_str}, {body_str})"
 
@@ -637,12 +629,8 @@ def expr_to_gams(
                         if value != int(value):
                             use_infix = True
                 if use_infix:
-                    base_str = expr_to_gams(
-                        args[0], parent_op="**", is_right=False, domain_vars=domain_vars
-                    )
-                    exp_str = expr_to_gams(
-                        args[1], parent_op="**", is_right=True, domain_vars=domain_vars
-                    )
+                    base_str = yield (args[0], "**", False, domain_vars)
+                    exp_str = yield (args[1], "**", True, domain_vars)
                     # Wrap negative exponents in parens (GAMS Error $445)
                     if exp_str.startswith("-"):
                         exp_str = f"({exp_str})"
@@ -650,14 +638,16 @@ def expr_to_gams(
                     if _needs_parens(parent_op, "**", is_right):
                         return f"({result})"
                     return result
-            args_str = ", ".join(expr_to_gams(arg, domain_vars=domain_vars) for arg in args)
-            return f"{func}({args_str})"
+            arg_strs = []
+            for arg in args:
+                arg_strs.append((yield (arg, None, False, domain_vars)))
+            return f"{func}({', '.join(arg_strs)})"
 
         case DollarConditional(value_expr, condition):
             # Dollar conditional: value_expr$condition
             # Evaluates to value_expr if condition is non-zero, otherwise 0
-            value_str = expr_to_gams(value_expr, domain_vars=domain_vars)
-            condition_str = expr_to_gams(condition, domain_vars=domain_vars)
+            value_str = yield (value_expr, None, False, domain_vars)
+            condition_str = yield (condition, None, False, domain_vars)
             # Parenthesize value if it's a complex expression to avoid precedence issues
             # Also parenthesize negative constants to avoid "+-1$" patterns ($445)
             if isinstance(value_expr, (Binary, Unary, DollarConditional)) or (
@@ -676,10 +666,10 @@ def expr_to_gams(
             # Set membership test: set_name(indices)
             # In GAMS conditional context, tests if index combination is in set
             if indices:
-                indices_str = ",".join(
-                    expr_to_gams(idx, domain_vars=domain_vars) for idx in indices
-                )
-                return f"{set_name}({indices_str})"
+                index_strs = []
+                for idx in indices:
+                    index_strs.append((yield (idx, None, False, domain_vars)))
+                return f"{set_name}({','.join(index_strs)})"
             return set_name
 
         case LhsConditionalAssign(rhs=rhs_expr):
@@ -688,9 +678,7 @@ def expr_to_gams(
             # (e.g., in emit_gams.py bound emission or original_symbols.py).
             # When this node reaches expr_to_gams() directly (e.g., via KKT
             # equation expressions), only the value matters, not the condition.
-            return expr_to_gams(
-                rhs_expr, parent_op=parent_op, is_right=is_right, domain_vars=domain_vars
-            )
+            return (yield (rhs_expr, parent_op, is_right, domain_vars))
 
         case IndexOffset():
             # IndexOffset can appear as a top-level expression when used inside
@@ -704,6 +692,42 @@ def expr_to_gams(
             raise ValueError(f"Unknown expression type: {type(expr).__name__}")
 
 
+def _additive_op(link: Binary) -> str:
+    """Operator ``link`` is emitted with: ``x - (-5)`` becomes ``x + 5``."""
+    if link.op == "-" and isinstance(link.right, Const) and link.right.value < 0:
+        return "+"
+    return link.op
+
+
+def _additive_chain_to_gams(
+    expr: Binary, parent_op: str | None, is_right: bool, domain_vars: frozenset[str]
+) -> Generator[tuple, str, str]:
+    """Emit the left-nested ``+``/``-`` chain rooted at ``expr`` for ``_to_gams``.
+
+    Sums are left-associative, so ``a + b - c + d`` is a chain of Binary nodes
+    down the left operand. No link in the chain needs parentheses (equal
+    precedence, left side), and joining all terms once avoids re-copying the
+    growing left-hand string at every level of a long sum.
+    """
+    spine = []
+    node: Expr = expr
+    while isinstance(node, Binary) and node.op in ("+", "-"):
+        spine.append(node)
+        node = node.left
+
+    parts = [(yield (node, _additive_op(spine[-1]), False, domain_vars))]
+    for link in reversed(spine):
+        op = _additive_op(link)
+        if op != link.op and isinstance(link.right, Const):
+            # Subtraction of a negative constant: avoid double operators
+            parts.append(f" + {_format_numeric(-link.right.value)}")
+        else:
+            parts.append(f" {op} {(yield (link.right, op, True, domain_vars))}")
+
+    result = "".join(parts)
+    return f"({result})" if _needs_parens(parent_op, _additive_op(expr), is_right) else result
+
+
 def _agg_domain_str(
     index_sets: tuple[str, ...],
     condition: Expr | None,
@@ -1,23 +1,403 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import dataclass
+import contextlib
+import functools
+import math
+import operator
+import os
+import sys
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, fields
+from typing import Any
+
+# ---------- Interning ----------
+#
+# Inside an ``interning()`` block every node constructed on the current thread
+# is hash-consed: the constructor returns the existing node with the same type
+# and field values, where child expressions are compared by identity. Since
+# children built in the block are interned too, structurally equal trees
+# built in the block are the same object, so ``==`` short-circuits on
+# identity and repeated subtrees (the same derivative or index expression for
+# many equation instances) are stored once. The table holds its nodes weakly
+# (a node keeps its children, and so their ids, alive) and is dropped when the
+# outermost block exits.
+#
+# Interning is scoped rather than global because the parser and
+# normalize_model() attach metadata to nodes (``domain``, ``rank``, ...) with
+# ``object.__setattr__`` and the parser rewrites some nodes in place; a shared
+# node would leak those writes into unrelated expressions. The derivative and
+# KKT stages, which only build new nodes, run in a block. Equality stays
+# structural, so nodes built outside a block still compare equal to their
+# interned twins.
+#
+# Interning is off unless NLP2MCP_INTERNING is set: building a table key for
+# every node slows differentiation down by more than the identity
+# short-circuits win back, so the memory saving is opt-in.
+
+# Set to 1 to intern nodes built in ``interning()`` blocks
+_INTERNING_ENV = "NLP2MCP_INTERNING"
+
+
+class _InternState(threading.local):
+    depth = 0
+
+    def __init__(self) -> None:
+        # (node type, field keys) -> interned node; see _field_key()
+        self.table: weakref.WeakValueDictionary[tuple, Expr] = weakref.WeakValueDictionary()
+
+
+_intern_state = _InternState()
+
+
+def _interning_enabled() -> bool:
+    return os.environ.get(_INTERNING_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+@contextlib.contextmanager
+def interning() -> Iterator[None]:
+    """Intern expression nodes constructed on this thread until the block exits.
+
+    Blocks nest; can also be used as a function decorator (``@interning()``).
+    Does nothing unless ``NLP2MCP_INTERNING=1``.
+    """
+    if not _interning_enabled():
+        yield
+        return
+    state = _intern_state
+    state.depth += 1
+    try:
+        yield
+    finally:
+        state.depth -= 1
+        if not state.depth:
+            state.table = weakref.WeakValueDictionary()
+
+
+def _field_key(value: object) -> object:
+    """Key of a field value: children by identity, scalars by type and value."""
+    if type(value) is str:
+        return value
+    if isinstance(value, Expr):
+        return id(value)
+    if isinstance(value, tuple):
+        if all(type(v) is str for v in value):
+            return value
+        return tuple(_field_key(v) for v in value)
+    if isinstance(value, float):
+        # Keep 0.0 and -0.0 apart; they compare equal but print differently
+        return (float, value, math.copysign(1.0, value))
+    return (type(value), value)
+
+
+class _InterningMeta(type):
+    """Metaclass of Expr: returns the interned node when in an ``interning()`` block."""
+
+    def __call__(cls, *args, **kwargs):
+        node = super().__call__(*args, **kwargs)
+        state = _intern_state
+        if not state.depth:
+            return node
+        try:
+            key = (cls, *map(_field_key, _field_values(node)))
+            return state.table.setdefault(key, node)
+        except TypeError:  # unhashable field value
+            return node
+
 
 # ---------- Expression AST ----------
 
+# Length of a node's _cache list: node_count, depth, free_variables, free_indices
+# and structure_key, in that order
+_NUM_SUMMARIES = 5
+
+
+def _metadata_attr(name: str) -> property:
+    """Metadata attribute kept in the node's ``_metadata`` dict.
+
+    Reading it before it was set raises AttributeError, like a plain attribute,
+    so ``getattr(node, name, default)`` and ``hasattr`` keep working.
+    """
+
+    def get(node: Expr) -> Any:
+        try:
+            return node._metadata[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(name) from None
+
+    def set_(node: Expr, value: Any) -> None:
+        try:
+            node._metadata[name] = value
+        except AttributeError:
+            object.__setattr__(node, "_metadata", {name: value})
+
+    return property(get, set_)
+
+
+class Expr(metaclass=_InterningMeta):
+    """Base class for all expression nodes.
+
+    Node classes are frozen dataclasses declared with ``eq=False`` and
+    ``slots=True``: equality and hashing are structural and defined here, so
+    that the hash can be cached on the node. The structural summaries below
+    (node count, depth, free variables and indices, structure key) are likewise
+    computed on first use and cached; nodes are immutable, so a cached value
+    never goes stale.
+
+    Nodes have no ``__dict__``; besides its fields a node has four slots: the
+    cached hash, a dict of the metadata the parser and normalize_model() attach
+    (``domain``, ``rank``, ...; the properties below), a list of cached summaries, and a weak reference slot
+    for ``interning()``. The dict and list are only allocated when first
+    written, so a node built by differentiation costs its fields plus four
+    pointers.
+    """
+
+    __slots__ = ("_hash", "_metadata", "_cache", "__weakref__")
+    _hash: int
+    _metadata: dict[str, Any]
+    _cache: list[Any]
 
-class Expr:
-    """Base class for all expression nodes."""
+    domain = _metadata_attr("domain")
+    free_domain = _metadata_attr("free_domain")
+    rank = _metadata_attr("rank")
+    symbol_domain = _metadata_attr("symbol_domain")
+    index_values = _metadata_attr("index_values")
 
     def children(self) -> Iterable[Expr]:
         return []
 
+    def with_children(self, children: Iterable[Expr]) -> Expr:
+        """This node with its ``children()`` replaced, in order, by ``children``.
+
+        Returns ``self`` when every replacement is the original child.
+        """
+        replaced = {
+            id(old): new
+            for old, new in zip(self.children(), children, strict=True)
+            if new is not old
+        }
+        if not replaced:
+            return self
+        values = []
+        for value in _field_values(self):
+            if isinstance(value, Expr):
+                value = replaced.get(id(value), value)
+            elif type(value) is tuple:
+                value = tuple(
+                    replaced.get(id(item), item) if isinstance(item, Expr) else item
+                    for item in value
+                )
+            values.append(value)
+        return type(self)(*values)
+
     def pretty(self) -> str:
         """Debug-friendly single-line rendering."""
         return repr(self)
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Different cached hashes prove inequality without walking the trees
+        mine = getattr(self, "_hash", None)
+        if mine is not None and mine != getattr(other, "_hash", mine):
+            return False
+        values = _fields_getter(self.__class__)
+        return values(self) == values(other)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:  # first call; the slot is unset
+            pass
+        value = hash((self.__class__, _fields_getter(self.__class__)(self)))
+        object.__setattr__(self, "_hash", value)
+        return value
+
+    def __reduce__(self) -> tuple:
+        # Fields plus attached metadata. Cached summaries are dropped: str
+        # hashes differ between processes. Takes precedence over the
+        # fields-only __getstate__ that dataclass(slots=True) adds.
+        metadata = dict(getattr(self, "_metadata", None) or {})
+        return (_restore_node, (self.__class__, _field_values(self), metadata))
+
+    def _summaries(self) -> list[Any]:
+        cache = getattr(self, "_cache", None)
+        if cache is None:
+            cache = [None] * _NUM_SUMMARIES
+            object.__setattr__(self, "_cache", cache)
+        return cache
+
+    # The summaries, like ``hash`` and ``==``, recurse through the children's
+    # methods: one Python frame per tree level, no helper frames in between.
+    # Deep trees such as a 10^5-term left-nested sum therefore need the raised
+    # recursion limit that the CLI sets; the iterative walkers live in
+    # src/ir/traversal.py. A summary is computed once per node and cached.
+
+    def node_count(self) -> int:
+        """Number of nodes in this tree (index expressions of references excluded)."""
+        cache = self._summaries()
+        if cache[0] is None:
+            cache[0] = 1 + sum(child.node_count() for child in self.children())
+        return cache[0]
+
+    def depth(self) -> int:
+        """Height of this tree; a leaf has depth 1."""
+        cache = self._summaries()
+        if cache[1] is None:
+            cache[1] = 1 + max((child.depth() for child in self.children()), default=0)
+        return cache[1]
+
+    def free_variables(self) -> frozenset[str]:
+        """Names of the variables referenced anywhere in this tree, index expressions included."""
+        cache = self._summaries()
+        if cache[2] is None:
+            own = (self.name,) if isinstance(self, VarRef) else ()
+            cache[2] = _union(own, [e.free_variables() for e in _subexpressions(self)])
+        return cache[2]
+
+    def free_indices(self) -> frozenset[str]:
+        """Lowercased names that may be free set indices in this tree.
+
+        These are the index labels of references, ``IndexOffset`` bases and
+        bare ``SymbolRef`` names, minus those bound by an enclosing ``Sum`` or
+        ``Prod``. Literal element labels and scalar symbols are included too;
+        callers filter against the model's sets.
+        """
+        cache = self._summaries()
+        if cache[3] is None:
+            if isinstance(self, SymbolRef):
+                own: tuple[str, ...] = (self.name,)
+            elif isinstance(self, IndexOffset):
+                own = (self.base,)
+            else:
+                own = tuple(i for i in getattr(self, "indices", ()) if isinstance(i, str))
+            free = _union(
+                (name.lower() for name in own), [e.free_indices() for e in _subexpressions(self)]
+            )
+            if isinstance(self, (Sum, Prod)):
+                free = free - {name.lower() for name in self.index_sets}
+            cache[3] = free
+        return cache[3]
+
+    def structure_key(self) -> tuple:
+        """Shape of this tree with concrete index labels abstracted away.
+
+        Node types, operators, names and constants are kept; index tuples are
+        reduced to their length and bare symbols to a wildcard, so trees that
+        differ only in the set elements they index share a key.
+        """
+        cache = self._summaries()
+        if cache[4] is None:
+            cache[4] = _structure_key(self)
+        return cache[4]
+
+
+@functools.cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+@functools.cache
+def _fields_getter(cls: type) -> Callable[[Expr], tuple]:
+    """Function returning the field values of a ``cls`` node as a tuple.
+
+    An ``operator.attrgetter`` built once per class, so ``==`` and ``hash``
+    read the fields in C rather than through a generator of ``getattr`` calls.
+    """
+    names = _field_names(cls)
+    if len(names) > 1:
+        return operator.attrgetter(*names)
+    if names:
+        getter = operator.attrgetter(names[0])
+        return lambda node: (getter(node),)
+    return lambda node: ()
+
+
+def _field_values(node: Expr) -> tuple:
+    return _fields_getter(node.__class__)(node)
 
-@dataclass(frozen=True)
+
+def _restore_node(cls: type[Expr], values: tuple, metadata: dict[str, Any]) -> Expr:
+    """Unpickle a node; bypasses the constructor so it is never interned."""
+    node = object.__new__(cls)
+    for name, value in zip(_field_names(cls), values, strict=True):
+        object.__setattr__(node, name, value)
+    if metadata:
+        object.__setattr__(node, "_metadata", metadata)
+    return node
+
+
+def _intern_reference(node: VarRef | ParamRef | EquationRef | MultiplierRef) -> None:
+    """Swap a reference's name and string index labels for their interned copies.
+
+    The parser hands over lark tokens and per-occurrence copies of the same
+    labels; interning leaves one ``str`` per distinct label. The caller's
+    index tuple is kept when its labels are already interned, so nodes built
+    from another node's indices keep sharing the tuple.
+    """
+    if isinstance(node.name, str):
+        name = sys.intern(str(node.name))
+        if name is not node.name:
+            object.__setattr__(node, "name", name)
+    indices = node.indices
+    if type(indices) is tuple:
+        labels = tuple(sys.intern(str(i)) if isinstance(i, str) else i for i in indices)
+        if not all(map(operator.is_, labels, indices)):
+            object.__setattr__(node, "indices", labels)
+
+
+def _subexpressions(node: Expr) -> list[Expr]:
+    """Children of ``node`` plus the expressions in its index tuple (e.g. offsets)."""
+    subexprs = list(node.children())
+    if not isinstance(node, SetMembershipTest):  # its indices are its children
+        subexprs += [i for i in getattr(node, "indices", ()) if isinstance(i, Expr)]
+    return subexprs
+
+
+def _union(own: Iterable[str], parts: list[frozenset[str]]) -> frozenset[str]:
+    """Union of ``own`` and ``parts``, reusing a part's set when it already covers the rest."""
+    result = frozenset(own)
+    for part in parts:
+        if not result:
+            result = part
+        elif part and not part <= result:
+            result = result | part
+    return result
+
+
+def _structure_key(node: Expr) -> tuple:
+    if isinstance(node, Const):
+        return ("C", str(node.value))
+    if isinstance(node, SymbolRef):
+        return ("S",)
+    if isinstance(node, ParamRef):
+        return ("P", node.name, len(node.indices))
+    if isinstance(node, VarRef):
+        return ("V", node.name, len(node.indices))
+    if isinstance(node, MultiplierRef):
+        return ("M", node.name, len(node.indices))
+    if isinstance(node, Binary):
+        return ("B", node.op, node.left.structure_key(), node.right.structure_key())
+    if isinstance(node, Unary):
+        return ("U", node.op, node.child.structure_key())
+    if isinstance(node, Call):
+        return ("F", node.func, *(arg.structure_key() for arg in node.args))
+    if isinstance(node, (Sum, Prod)):
+        cond = node.condition.structure_key() if node.condition is not None else None
+        return (type(node).__name__, len(node.index_sets), node.body.structure_key(), cond)
+    if isinstance(node, DollarConditional):
+        return ("DC", node.value_expr.structure_key(), node.condition.structure_key())
+    if isinstance(node, SetMembershipTest):
+        return ("SMT", node.set_name, len(node.indices))
+    if isinstance(node, EquationRef):
+        return ("EQ", node.name, len(node.indices), node.attribute)
+    return (type(node).__name__,)
+
+
+@dataclass(frozen=True, eq=False, slots=True)
 class Const(Expr):
     value: float
 
@@ -25,7 +405,7 @@ class Const(Expr):
         return f"Const({self.value})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class SymbolRef(Expr):
     """Reference to a scalar symbol (variable or parameter) without indices."""
 
@@ -35,7 +415,7 @@ class SymbolRef(Expr):
         return f"SymbolRef({self.name})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class VarRef(Expr):
     """Reference to a variable; indices are symbolic (strings or IndexOffset).
 
@@ -52,6 +432,9 @@ class VarRef(Expr):
     indices: tuple[str | IndexOffset, ...] = ()
     attribute: str = ""  # e.g. "l", "m", "lo", "up"; empty means bare variable ref
 
+    def __post_init__(self) -> None:
+        _intern_reference(self)
+
     def indices_as_strings(self) -> tuple[str, ...]:
         """Convert indices to strings, including IndexOffset in GAMS syntax."""
         result = []
@@ -69,13 +452,16 @@ class VarRef(Expr):
         return f"VarRef({base}({idx}))" if idx else f"VarRef({base})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class ParamRef(Expr):
     """Reference to a parameter; indices symbolic (strings or IndexOffset)."""
 
     name: str
     indices: tuple[str | IndexOffset, ...] = ()
 
+    def __post_init__(self) -> None:
+        _intern_reference(self)
+
     def indices_as_strings(self) -> tuple[str, ...]:
         """Convert indices to strings, including IndexOffset in GAMS syntax."""
         result = []
@@ -91,7 +477,7 @@ class ParamRef(Expr):
         return f"ParamRef({self.name}({idx}))" if idx else f"ParamRef({self.name})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class EquationRef(Expr):
     """Reference to an equation with attribute access (e.g., eq1.m, eq2.l).
 
@@ -103,6 +489,9 @@ class EquationRef(Expr):
     indices: tuple[str | IndexOffset, ...] = ()
     attribute: str = "l"  # Default to level attribute (.l)
 
+    def __post_init__(self) -> None:
+        _intern_reference(self)
+
     def indices_as_strings(self) -> tuple[str, ...]:
         """Convert indices to strings, including IndexOffset in GAMS syntax."""
         result = []
@@ -119,7 +508,7 @@ class EquationRef(Expr):
         return f"EquationRef({base}.{self.attribute})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class SetAttrRef(Expr):
     """Reference to a set attribute (e.g., ss.off, ss.pos, ss.ord).
 
@@ -135,7 +524,7 @@ class SetAttrRef(Expr):
         return f"SetAttrRef({self.name}.{self.attribute})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class ModelAttrRef(Expr):
     """Reference to a model attribute (e.g., m.modelStat, m.solveStat).
 
@@ -151,13 +540,16 @@ class ModelAttrRef(Expr):
         return f"ModelAttrRef({self.model_name}.{self.attribute})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class MultiplierRef(Expr):
     """Reference to a KKT multiplier variable (λ, ν, π)."""
 
     name: str
     indices: tuple[str | IndexOffset, ...] = ()
 
+    def __post_init__(self) -> None:
+        _intern_reference(self)
+
     def indices_as_strings(self) -> tuple[str, ...]:
         """Convert indices to strings, including IndexOffset in GAMS syntax."""
         result = []
@@ -173,7 +565,7 @@ class MultiplierRef(Expr):
         return f"MultiplierRef({self.name}({idx}))" if idx else f"MultiplierRef({self.name})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class Unary(Expr):
     op: str  # "+", "-", maybe functions map elsewhere
     child: Expr
@@ -185,7 +577,7 @@ class Unary(Expr):
         return f"Unary({self.op}, {self.child!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class Binary(Expr):
     op: str  # "+", "-", "*", "/", "^", comparisons, "and", "or"
     left: Expr
@@ -199,7 +591,7 @@ class Binary(Expr):
         return f"Binary({self.op}, {self.left!r}, {self.right!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class Sum(Expr):
     """sum(i,j, body) or sum(i$cond, body) — indices are symbolic set names.
 
@@ -224,7 +616,7 @@ class Sum(Expr):
         return f"Sum(({idx}), {self.body!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class Prod(Expr):
     """prod(i,j, body) or prod(i$cond, body) — product over indices.
 
@@ -252,7 +644,7 @@ class Prod(Expr):
         return f"Prod(({idx}), {self.body!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class Call(Expr):
     """Function call: exp(x), log(x), power(x,y), etc."""
 
@@ -267,7 +659,7 @@ class Call(Expr):
         return f"Call({self.func}, ({args}))"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class SetMembershipTest(Expr):
     """Set membership test: set_name(indices).
 
@@ -289,7 +681,7 @@ class SetMembershipTest(Expr):
         return f"SetMembershipTest({self.set_name}, ({idx}))"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class DollarConditional(Expr):
     """Dollar conditional operator: expr$condition
 
@@ -316,7 +708,7 @@ class DollarConditional(Expr):
         return f"DollarConditional({self.value_expr!r}${self.condition!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class LhsConditionalAssign(Expr):
     """LHS-conditional assignment: param(i)$cond = rhs.
 
@@ -342,7 +734,7 @@ class LhsConditionalAssign(Expr):
         return f"LhsConditionalAssign(${self.condition!r} = {self.rhs!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class IndexOffset(Expr):
     """
     Lead/lag indexing offset (Sprint 9 Day 3).
@@ -589,7 +981,7 @@ class IndexOffset(Expr):
             )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class SubsetIndex(Expr):
     """
     Subset indexing for variable bounds (Sprint 12 - Issue #455).
@@ -621,7 +1013,7 @@ class SubsetIndex(Expr):
         return f"SubsetIndex({self.subset_name}({idx}))"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class CompileTimeConstant(Expr):
     """
     GAMS compile-time constant using %...% syntax.
@@ -7,6 +7,7 @@ which equation instances should be generated.
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from typing import TYPE_CHECKING
 
 from .ast import (
@@ -20,6 +21,7 @@ from .ast import (
     Unary,
     VarRef,
 )
+from .traversal import fold
 
 if TYPE_CHECKING:
     from .model_ir import ModelIR
@@ -134,7 +136,7 @@ def _eval_expr(
     _visiting: frozenset[tuple[str, tuple[str, ...]]] | None = None,
 ) -> float | str:
     """
-    Recursively evaluate an expression with index substitution.
+    Evaluate an expression with index substitution.
 
     Args:
         _visiting: Set of (param_name, indices) currently being evaluated,
@@ -143,8 +145,16 @@ def _eval_expr(
     Returns:
         Numeric value or string (for set element comparisons)
     """
-    if _visiting is None:
-        _visiting = frozenset()
+    return fold(_eval_node, expr, index_map, model_ir, _visiting or frozenset())
+
+
+def _eval_node(
+    expr: Expr,
+    index_map: dict[str, str],
+    model_ir: ModelIR,
+    _visiting: frozenset[tuple[str, tuple[str, ...]]],
+) -> Generator[tuple, float | str, float | str]:
+    """``_eval_expr`` for one node, as a ``fold`` walker (sub-evaluations are yielded)."""
     if isinstance(expr, Const):
         return expr.value
 
@@ -255,7 +265,7 @@ def _eval_expr(
                 if not matches_literal_filters:
                     continue
                 try:
-                    return _eval_expr(expr_body, expr_index_map, model_ir, _visiting=next_visiting)
+                    return (yield (expr_body, expr_index_map, model_ir, next_visiting))
                 except ConditionCycleError:
                     raise  # Cycles won't resolve by trying earlier assignments
                 except ConditionEvaluationError:
@@ -268,8 +278,8 @@ def _eval_expr(
         return 0.0
 
     if isinstance(expr, Binary):
-        left = _eval_expr(expr.left, index_map, model_ir, _visiting=_visiting)
-        right = _eval_expr(expr.right, index_map, model_ir, _visiting=_visiting)
+        left = yield (expr.left, index_map, model_ir, _visiting)
+        right = yield (expr.right, index_map, model_ir, _visiting)
 
         # Comparison operators (work with both float and str for set comparisons)
         if expr.op == ">":
@@ -318,7 +328,7 @@ def _eval_expr(
         raise ConditionEvaluationError(f"Unsupported binary operator '{expr.op}' in condition")
 
     if isinstance(expr, Unary):
-        operand_val = _eval_expr(expr.child, index_map, model_ir, _visiting=_visiting)
+        operand_val = yield (expr.child, index_map, model_ir, _visiting)
         if expr.op.lower() == "not":
             return 1.0 if not operand_val else 0.0
         if expr.op == "-":
@@ -403,7 +413,7 @@ def _eval_expr(
                 member_key.append(val)
             else:
                 # Try evaluating as expression
-                resolved = _eval_expr(idx_expr, index_map, model_ir, _visiting)
+                resolved = yield (idx_expr, index_map, model_ir, _visiting)
                 member_key.append(str(resolved))
         # Check membership — use cached set for O(1) lookups since conditions
         # are evaluated many times during domain enumeration
@@ -0,0 +1,252 @@
+"""
+Fast-path reader for pure-data ``Table`` and ``Parameter`` statements.
+
+Large data blocks dominate parse time: the Earley parser builds a chart over
+every cell of a ``Table`` and ``_ModelBuilder._handle_table_block`` then
+regroups the resulting tokens by line and column, so a table with 10^5 cells
+takes minutes and hundreds of megabytes. Most big tables are nothing more
+than a header line of column labels followed by rows of a label and numbers,
+and most big parameter data lists are ``key value`` pairs. This module reads
+exactly those shapes straight from the statement text:
+
+- ``scan_table`` returns the finished ``(row, column) -> value`` mapping,
+  using the same gap-midpoint column matching as ``_handle_table_block``;
+- ``scan_parameter`` returns the keys and values of a single-parameter
+  ``/ ... /`` data list; domain checks still happen in the model builder.
+
+Both return None for anything outside the supported subset (quoted labels,
+``+`` continuation blocks, dotted column headers, special values, comments,
+unquoted descriptions, ...), and the statement then goes through the regular
+grammar. What they do accept yields the same ModelIR as the grammar path;
+tests/unit/ir/test_data_scanner.py checks this statement by statement.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+# Left tolerance (in columns) for range-based column matching in table parsing.
+# A value token is assigned to a column header if it falls within
+# [col_pos - COL_LEFT_TOLERANCE, next_col_pos).  Shared with the section-based
+# and non-section paths of ``_ModelBuilder._handle_table_block``.
+COL_LEFT_TOLERANCE = 3
+
+_IDENT = r"[A-Za-z_][A-Za-z0-9_]*"
+_DOMAIN = rf"(?:{_IDENT}|\*)(?:[ \t]*,[ \t]*(?:{_IDENT}|\*))*"
+_QUOTED = r"""(?:'[^'\n]*'|"[^"\n]*")"""
+
+_TABLE_HEAD_RE = re.compile(
+    rf"[ \t]*Table[ \t]+({_IDENT})[ \t]*\([ \t]*({_DOMAIN})[ \t]*\)(?:[ \t]*{_QUOTED})?[ \t]*",
+    re.IGNORECASE,
+)
+_PARAMETER_RE = re.compile(
+    rf"[ \t]*Parameters?\s+({_IDENT})(?:\s*\(\s*({_DOMAIN})\s*\))?(?:\s*{_QUOTED})?"
+    r"\s*/([^/]*)/\s*;",
+    re.IGNORECASE,
+)
+_LABEL_RE = re.compile(rf"{_IDENT}(?:\.{_IDENT})*|[0-9]+")
+_HEADER_RE = re.compile(rf"{_IDENT}|[0-9]+")
+# The grammar's NUMBER terminal, minus the leading ``+`` (a continuation
+# marker in tables); Python's float() accepts every match.
+_NUMBER_RE = re.compile(r"-?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+_DATA_ITEM_RE = re.compile(rf"\s*((?:{_IDENT}(?:\.{_IDENT})*|[0-9]+))\s+({_NUMBER_RE.pattern})\s*")
+_TOKEN_RE = re.compile(r"\S+")
+_ROW_VALUES_RE = re.compile(rf"(?:[ \t]+{_NUMBER_RE.pattern})*[ \t]*")
+
+# Words the grammar lexes as special values or keywords rather than labels.
+_RESERVED_LABELS = frozenset({"inf", "eps", "na", "undf", "yes", "no", "table"})
+
+
+@dataclass
+class ScannedTable:
+    """A ``Table`` statement read by ``scan_table``."""
+
+    name: str
+    domain: tuple[str, ...]
+    values: dict[tuple[str, ...], float | str] = field(default_factory=dict)
+
+
+@dataclass
+class ScannedParameter:
+    """A single-parameter ``/ key value, ... /`` statement read by ``scan_parameter``.
+
+    ``name_position`` and ``positions`` hold the (line, column) of the name
+    and of each key, for error reporting.
+    """
+
+    name: str
+    domain: tuple[str, ...]
+    name_position: tuple[int, int] = (1, 1)
+    keys: list[tuple[str, ...]] = field(default_factory=list)
+    values: list[float] = field(default_factory=list)
+    positions: list[tuple[int, int]] = field(default_factory=list)
+
+
+def _split_domain(domain: str) -> tuple[str, ...]:
+    return tuple(part.strip() for part in domain.split(","))
+
+
+def _is_reserved(label: str) -> bool:
+    return any(part.lower() in _RESERVED_LABELS for part in label.split("."))
+
+
+def _match_column(
+    col: int,
+    headers: list[tuple[str, int, int]],
+    positions: list[int],
+    bounds: list[float],
+    used: set[str],
+) -> str | None:
+    """Return the header a value starting at column ``col`` belongs to.
+
+    Mirrors the non-section path of ``_handle_table_block``: the first unused
+    header whose gap-midpoint range contains ``col``, else the nearest unused
+    header. ``positions`` are the header columns and ``bounds[k]`` is the
+    boundary between headers ``k`` and ``k + 1``; neighbouring ranges share
+    their (inclusive) boundary.
+    """
+    k = bisect_left(bounds, col)
+    low = bounds[k - 1] if k > 0 else headers[0][1] - COL_LEFT_TOLERANCE
+    if low <= col:
+        if headers[k][0] not in used:
+            return headers[k][0]
+        if k < len(bounds) and col == bounds[k] and headers[k + 1][0] not in used:
+            return headers[k + 1][0]
+    # Nearest unused header (ties go to the left one, the lower index)
+    right = bisect_left(positions, col)
+    left = right - 1
+    while left >= 0 and headers[left][0] in used:
+        left -= 1
+    while right < len(headers) and headers[right][0] in used:
+        right += 1
+    if left < 0:
+        return headers[right][0] if right < len(headers) else None
+    if right == len(headers) or col - positions[left] <= positions[right] - col:
+        return headers[left][0]
+    return headers[right][0]
+
+
+def scan_table(text: str) -> ScannedTable | None:
+    """Read a column-aligned ``Table`` statement, or return None.
+
+    ``text`` is the statement up to and including its ``;``, padded on its
+    first line so that columns match the source. The supported layout is the
+    declaration line (``Table name(domain)`` with an optional quoted
+    description), one line of plain column labels, and rows of a (possibly
+    dotted) row label followed by numbers. Like ``_handle_table_block``,
+    cells left empty in a row are stored as 0.
+    """
+    body = text.rstrip()
+    if not body.endswith(";") or ";" in body[:-1]:
+        return None
+    lines = body[:-1].split("\n")
+    head = _TABLE_HEAD_RE.fullmatch(lines[0])
+    if head is None:
+        return None
+    name, domain = head.group(1), _split_domain(head.group(2))
+
+    rows = iter(line for line in lines[1:] if line.strip())
+    header_line = next(rows, None)
+    if header_line is None:
+        return None
+    headers: list[tuple[str, int, int]] = []
+    for match in _TOKEN_RE.finditer(header_line):
+        label = match.group()
+        if not _HEADER_RE.fullmatch(label) or _is_reserved(label):
+            return None
+        headers.append((label, match.start() + 1, len(label)))
+    if len({label for label, _, _ in headers}) != len(headers):
+        return None
+    positions = [pos for _, pos, _ in headers]
+    first_col = positions[0]
+    bounds = [
+        ((pos + width) + next_pos) / 2
+        for (_, pos, width), (_, next_pos, _) in zip(headers, headers[1:], strict=False)
+    ]
+
+    values: dict[tuple[str, ...], float | str] = {}
+    row_labels: list[str] = []
+    layouts: dict[tuple[int, ...], list[str | None]] = {}
+    for line in rows:
+        tokens = _TOKEN_RE.finditer(line)
+        label_match = next(tokens)
+        label = label_match.group()
+        label_col = label_match.start() + 1
+        label_end = label_col + len(label)
+        if not _LABEL_RE.fullmatch(label) or _is_reserved(label) or label_end >= first_col:
+            return None
+        if label[0].isdigit() and label_col >= first_col - COL_LEFT_TOLERANCE:
+            return None  # would be read as a secondary header line
+        row_labels.append(label)
+
+        if not _ROW_VALUES_RE.fullmatch(line, label_end - 1):
+            return None
+        cells = [(match.start() + 1, match.group()) for match in tokens]
+        if cells and cells[0][0] < first_col and cells[0][0] <= label_end + 1:
+            return None  # would be absorbed into the row label
+        # Aligned rows share their value columns, so match each layout once
+        layout = tuple(col for col, _ in cells)
+        columns = layouts.get(layout)
+        if columns is None:
+            used: set[str] = set()
+            columns = []
+            for col in layout:
+                column = _match_column(col, headers, positions, bounds, used)
+                if column is not None:
+                    used.add(column)
+                columns.append(column)
+            layouts[layout] = columns
+        for column, (_, value) in zip(columns, cells, strict=True):
+            if column is not None:
+                values[(label, column)] = float(value)
+
+    if not row_labels:
+        return None
+    labels = dict.fromkeys(row_labels)
+    if len(values) < len(labels) * len(headers):
+        for label in labels:
+            for column, _, _ in headers:
+                values.setdefault((label, column), 0.0)
+    return ScannedTable(name=name, domain=domain, values=values)
+
+
+def scan_parameter(text: str, first_line: int = 1) -> ScannedParameter | None:
+    """Read a ``Parameter name(domain) / key value, ... /;`` statement, or return None.
+
+    Only a single parameter with a non-empty data list is supported; keys are
+    plain or dotted labels and values are numbers. Domain membership is not
+    checked here. ``text`` is padded like for ``scan_table``; ``first_line``
+    is the source line it starts on.
+    """
+    match = _PARAMETER_RE.fullmatch(text.rstrip())
+    if match is None:
+        return None
+    name = match.group(1)
+    # Parameter domains are normalized to lowercase, table domains are not
+    domain = tuple(d.lower() for d in _split_domain(match.group(2))) if match.group(2) else ()
+    name_pos = match.start(1)
+    line = first_line + text.count("\n", 0, name_pos)
+    line_start = text.rfind("\n", 0, name_pos) + 1
+    result = ScannedParameter(
+        name=name, domain=domain, name_position=(line, name_pos - line_start + 1)
+    )
+
+    cursor = name_pos
+    offset = match.start(3)
+    for item in match.group(3).split(","):
+        item_match = _DATA_ITEM_RE.fullmatch(item)
+        if item_match is None or _is_reserved(item_match.group(1)):
+            return None
+        key_pos = offset + item_match.start(1)
+        newlines = text.count("\n", cursor, key_pos)
+        if newlines:
+            line += newlines
+            line_start = text.rfind("\n", cursor, key_pos) + 1
+        cursor = key_pos
+        result.keys.append(tuple(item_match.group(1).split(".")))
+        result.values.append(float(item_match.group(2)))
+        result.positions.append((line, key_pos - line_start + 1))
+        offset += len(item) + 1
+    return result
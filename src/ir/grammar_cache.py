@@ -0,0 +1,159 @@
+"""
+Persistent cache of compiled Lark parsers for the GAMS grammar.
+
+Building the Earley parser for ``gams_grammar.lark`` (grammar load, rule
+compilation and Earley FIRST/FOLLOW analysis) costs several hundred
+milliseconds, and the GAMSLIB batch scripts pay it once per model because
+they run the CLI as one subprocess per model. Lark's own ``cache=`` option
+only supports LALR, and ``Lark.save()`` is likewise LALR-only, so this module
+pickles the fully constructed ``Lark`` instance instead. LALR parsers (the
+fast-path subset grammar) are stored with ``Lark.save()``: their parse
+tables reference rules through Lark's serialization memo, which a plain
+pickle round-trip does not restore.
+
+Cache entries are keyed by:
+
+- the SHA-256 of the grammar file,
+- the installed Lark version and the Python ``major.minor`` version
+  (pickled parser internals are not stable across either),
+- the Lark constructor options,
+
+so editing the grammar or upgrading Lark simply produces a new key. Stale
+or corrupt entries are ignored and rebuilt; new entries are written
+atomically so parallel batch workers never observe half-written files.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import logging
+import pickle
+import sys
+import types
+from pathlib import Path
+from typing import Any
+
+import lark
+from lark import Lark
+
+from ..utils.disk_cache import atomic_write_bytes, cache_enabled, cache_subdir, hash_bytes
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of an entry changes.
+_CACHE_FORMAT_VERSION = "2"
+
+_CACHE_SUBDIR = "grammar"
+
+
+class _ModulePickler(pickle.Pickler):
+    """Pickler that stores module references by name.
+
+    Lark parser objects hold references to the ``re`` module (lexer
+    configuration), which the stock pickler rejects.
+    """
+
+    def persistent_id(self, obj: Any) -> tuple[str, str] | None:
+        if isinstance(obj, types.ModuleType):
+            return ("module", obj.__name__)
+        return None
+
+
+class _ModuleUnpickler(pickle.Unpickler):
+    """Counterpart of ``_ModulePickler``: re-imports modules by name."""
+
+    def persistent_load(self, pid: Any) -> Any:
+        kind, name = pid
+        if kind != "module":
+            raise pickle.UnpicklingError(f"Unsupported persistent id: {pid!r}")
+        return importlib.import_module(name)
+
+
+def grammar_cache_key(grammar_path: Path, options: dict[str, Any]) -> str:
+    """Return the cache key for ``grammar_path`` built with ``options``."""
+    return hash_bytes(
+        _CACHE_FORMAT_VERSION,
+        Path(grammar_path).read_bytes(),
+        lark.__version__,
+        f"{sys.version_info.major}.{sys.version_info.minor}",
+        repr(sorted(options.items())),
+    )
+
+
+def grammar_cache_path(grammar_path: Path, options: dict[str, Any]) -> Path:
+    """Return the cache file that holds the parser for ``grammar_path``/``options``."""
+    key = grammar_cache_key(grammar_path, options)
+    return cache_subdir(_CACHE_SUBDIR) / f"{Path(grammar_path).stem}-{key[:32]}.pickle"
+
+
+def _is_lalr(options: dict[str, Any]) -> bool:
+    return options.get("parser") == "lalr"
+
+
+def _load_entry(path: Path, options: dict[str, Any]) -> Lark | None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        if _is_lalr(options):
+            parser = Lark.load(io.BytesIO(data))
+        else:
+            parser = _ModuleUnpickler(io.BytesIO(data)).load()
+    except Exception as exc:  # corrupt / truncated / incompatible entry
+        logger.debug("Ignoring unreadable grammar cache entry %s: %s", path, exc)
+        return None
+    if not isinstance(parser, Lark):
+        logger.debug("Ignoring grammar cache entry %s: not a Lark instance", path)
+        return None
+    return parser
+
+
+def _store_entry(path: Path, parser: Lark, options: dict[str, Any]) -> None:
+    buffer = io.BytesIO()
+    try:
+        if _is_lalr(options):
+            parser.save(buffer)
+        else:
+            _ModulePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(parser)
+        atomic_write_bytes(path, buffer.getvalue())
+    except Exception as exc:  # read-only home, full disk, unpicklable internals
+        logger.debug("Could not write grammar cache entry %s: %s", path, exc)
+
+
+def load_or_build_parser(grammar_path: Path, **options: Any) -> Lark:
+    """Return a ``Lark`` parser for ``grammar_path``, using the on-disk cache.
+
+    On a hit the pickled parser is loaded; on a miss (or when caching is
+    disabled via ``NLP2MCP_NO_CACHE``) the grammar is compiled with
+    ``Lark.open(grammar_path, **options)`` and, if caching is enabled, the
+    result is stored for the next process.
+    """
+    if not cache_enabled():
+        return Lark.open(str(grammar_path), **options)
+
+    path = grammar_cache_path(grammar_path, options)
+    cached = _load_entry(path, options)
+    if cached is not None:
+        return cached
+
+    parser = Lark.open(str(grammar_path), **options)
+    _store_entry(path, parser, options)
+    return parser
+
+
+def warm_grammar_cache(grammar_path: Path, **options: Any) -> Path | None:
+    """Compile ``grammar_path`` and (re)write its cache entry unconditionally.
+
+    Returns the path of the cache entry, or None without compiling anything
+    when caching is disabled via ``NLP2MCP_NO_CACHE``. Used by
+    ``nlp2mcp --warm-grammar-cache`` so batch jobs can pay the compilation
+    cost once up front.
+    """
+    if not cache_enabled():
+        return None
+    path = grammar_cache_path(grammar_path, options)
+    parser = Lark.open(str(grammar_path), **options)
+    _store_entry(path, parser, options)
+    return path
@@ -25,6 +25,7 @@ See: docs/research/minmax_objective_reformulation.md
 
 from __future__ import annotations
 
+from dataclasses import fields, is_dataclass
 from typing import TYPE_CHECKING
 
 from src.ir.ast import Call, Expr, VarRef
@@ -379,9 +380,9 @@ def _extract_variables(expr: Expr) -> list[str]:
             # Traverse function arguments
             for arg in node.args:
                 traverse(arg)
-        elif hasattr(node, "__dict__"):
+        elif is_dataclass(node):
             # Generic traversal for other expression types
-            for value in node.__dict__.values():
+            for value in (getattr(node, f.name) for f in fields(node)):
                 if isinstance(value, Expr):
                     traverse(value)
                 elif isinstance(value, (list, tuple)):
@@ -0,0 +1,193 @@
+"""
+Persistent cache of parsed ``ModelIR`` objects.
+
+Parsing and IR building dominate translation time, yet experiments routinely
+translate the same model many times with different downstream settings
+(``--simplification``, ``--scale``, ``--nlp-presolve``, ...), none of which
+affect the IR ``parse_model_file`` returns. This module stores that IR on
+disk so later runs load it in milliseconds instead of re-parsing.
+
+Entries are a short header followed by a zlib-compressed pickle (protocol
+5) of the whole ``ModelIR``: symbol tables, statements, the expression ASTs
+of ``src/ir/ast.py`` and the raw Lark trees kept for re-emission. All of
+these are plain dataclasses, enums, tuples and Lark objects, so pickling
+them is lossless; compression shrinks a typical entry about threefold.
+
+Entries are keyed by:
+
+- the SHA-256 of the preprocessed source,
+- the nlp2mcp version and a fingerprint of the parser's own sources
+  (``src/ir/*.py``, the grammars and ``CaseInsensitiveDict``), so editing
+  the parser never serves an IR the new code would not build,
+- the parser fast-path toggles (``NLP2MCP_NO_LALR_FASTPATH``,
+  ``NLP2MCP_NO_DATA_FASTPATH``).
+
+The same directory keeps the state of ``parse_model_file(...,
+incremental=True)`` between runs: one ``IncrementalParser`` per model path
+(``load_session`` / ``store_session``), keyed by the resolved path and the
+same version and parser fingerprint.
+
+The directory is bounded by ``NLP2MCP_MODEL_CACHE_MB`` (default 512) with
+least recently used entries evicted first. As with the other caches, any
+failure is a miss and ``NLP2MCP_NO_CACHE=1`` turns it off.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import zlib
+from functools import lru_cache
+from pathlib import Path
+
+from .. import __version__
+from ..utils.disk_cache import (
+    atomic_write_bytes,
+    cache_enabled,
+    cache_subdir,
+    hash_bytes,
+    prune_lru,
+    touch,
+)
+from .model_ir import ModelIR
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of an entry changes.
+_CACHE_FORMAT_VERSION = "2"
+_MAGIC = b"NLP2MCP-IR" + _CACHE_FORMAT_VERSION.encode("ascii") + b"\n"
+
+_SESSION_MAGIC = b"NLP2MCP-SESSION" + _CACHE_FORMAT_VERSION.encode("ascii") + b"\n"
+
+_CACHE_SUBDIR = "model_ir"
+
+MAX_SIZE_ENV = "NLP2MCP_MODEL_CACHE_MB"
+_DEFAULT_MAX_MB = 512
+
+_PARSER_TOGGLES = ("NLP2MCP_NO_LALR_FASTPATH", "NLP2MCP_NO_DATA_FASTPATH")
+
+
+@lru_cache(maxsize=1)
+def _parser_fingerprint() -> str:
+    src = Path(__file__).resolve().parents[1]
+    sources = sorted(
+        [
+            *(src / "ir").glob("*.py"),
+            *(src / "gams").glob("*.lark"),
+            src / "utils" / "case_insensitive_dict.py",
+        ]
+    )
+    parts: list[str | bytes] = [__version__]
+    for path in sources:
+        parts.append(path.name)
+        parts.append(path.read_bytes())
+    return hash_bytes(*parts)
+
+
+def model_cache_key(preprocessed_source: str) -> str:
+    """Return the cache key for the IR built from ``preprocessed_source``."""
+    return hash_bytes(
+        _CACHE_FORMAT_VERSION,
+        _parser_fingerprint(),
+        repr([os.environ.get(name, "") for name in _PARSER_TOGGLES]),
+        preprocessed_source,
+    )
+
+
+def model_cache_path(preprocessed_source: str) -> Path:
+    """Return the cache file that holds the IR built from ``preprocessed_source``."""
+    return cache_subdir(_CACHE_SUBDIR) / f"{model_cache_key(preprocessed_source)[:32]}.ir"
+
+
+def dumps_model(model: ModelIR) -> bytes:
+    """Serialize ``model`` into the cache entry format."""
+    payload = pickle.dumps(model, protocol=5)
+    return _MAGIC + zlib.compress(payload, 1)
+
+
+def loads_model(data: bytes) -> ModelIR:
+    """Inverse of ``dumps_model``; raises ValueError for foreign or corrupt data."""
+    if not data.startswith(_MAGIC):
+        raise ValueError("not a ModelIR cache entry")
+    try:
+        model = pickle.loads(zlib.decompress(data[len(_MAGIC) :]))
+    except Exception as exc:  # truncated stream, renamed classes, ...
+        raise ValueError(f"corrupt ModelIR cache entry: {exc}") from exc
+    if not isinstance(model, ModelIR):
+        raise ValueError(f"cache entry holds {type(model).__name__}, not ModelIR")
+    return model
+
+
+def _max_bytes() -> int:
+    try:
+        megabytes = float(os.environ.get(MAX_SIZE_ENV, _DEFAULT_MAX_MB))
+    except ValueError:
+        megabytes = _DEFAULT_MAX_MB
+    return int(megabytes * 1024 * 1024)
+
+
+def load_model(preprocessed_source: str) -> ModelIR | None:
+    """Return the cached IR for ``preprocessed_source``, or None on a miss."""
+    if not cache_enabled():
+        return None
+    path = model_cache_path(preprocessed_source)
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        model = loads_model(data)
+    except ValueError as exc:
+        logger.debug("Ignoring unreadable ModelIR cache entry %s: %s", path, exc)
+        return None
+    touch(path)
+    return model
+
+
+def store_model(preprocessed_source: str, model: ModelIR) -> None:
+    """Store ``model`` as the IR built from ``preprocessed_source``."""
+    if not cache_enabled():
+        return
+    path = model_cache_path(preprocessed_source)
+    try:
+        atomic_write_bytes(path, dumps_model(model))
+        prune_lru(path.parent, _max_bytes())
+    except Exception as exc:  # read-only home, full disk, too deep to pickle
+        logger.debug("Could not write ModelIR cache entry %s: %s", path, exc)
+
+
+def session_cache_path(model_path: Path) -> Path:
+    """Return the cache file that holds the incremental parse state of ``model_path``."""
+    key = hash_bytes(_CACHE_FORMAT_VERSION, _parser_fingerprint(), str(Path(model_path).resolve()))
+    return cache_subdir(_CACHE_SUBDIR) / f"{key[:32]}.session"
+
+
+def load_session(model_path: Path) -> object | None:
+    """Return the stored incremental parse state of ``model_path``, or None."""
+    if not cache_enabled():
+        return None
+    path = session_cache_path(model_path)
+    try:
+        data = path.read_bytes()
+        if not data.startswith(_SESSION_MAGIC):
+            return None
+        session = pickle.loads(zlib.decompress(data[len(_SESSION_MAGIC) :]))
+    except Exception as exc:  # missing, truncated, renamed classes, ...
+        logger.debug("Ignoring incremental parse state %s: %s", path, exc)
+        return None
+    touch(path)
+    return session
+
+
+def store_session(model_path: Path, session: object) -> None:
+    """Store the incremental parse state of ``model_path``."""
+    if not cache_enabled():
+        return
+    path = session_cache_path(model_path)
+    try:
+        payload = pickle.dumps(session, protocol=5)
+        atomic_write_bytes(path, _SESSION_MAGIC + zlib.compress(payload, 1))
+        prune_lru(path.parent, _max_bytes())
+    except Exception as exc:  # read-only home, full disk, too deep to pickle
+        logger.debug("Could not write incremental parse state %s: %s", path, exc)
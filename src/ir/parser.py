@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 import math
+import os
+import pickle
 import re
 import sys
 from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from functools import lru_cache
 from itertools import product
@@ -14,7 +17,12 @@ from pathlib import Path
 from typing import ClassVar
 
 from lark import Lark, Token, Tree
-from lark.exceptions import UnexpectedCharacters, UnexpectedEOF, UnexpectedToken
+from lark.exceptions import (
+    UnexpectedCharacters,
+    UnexpectedEOF,
+    UnexpectedInput,
+    UnexpectedToken,
+)
 
 from ..utils.error_enhancer import ErrorEnhancer
 from ..utils.errors import ParseError
@@ -37,15 +45,21 @@ from .ast import (
     Unary,
     VarRef,
 )
+from .data_scanner import (
+    COL_LEFT_TOLERANCE,
+    ScannedParameter,
+    ScannedTable,
+    scan_parameter,
+    scan_table,
+)
+from .grammar_cache import load_or_build_parser
+from .grammar_cache import warm_grammar_cache as _warm_grammar_cache
+from .model_cache import load_model, load_session, store_model, store_session
 from .model_ir import ModelIR, ObjectiveIR
 from .preprocessor import (
-    expand_multi_segment_tuple_row_labels,
-    expand_tuple_only_table_rows,
-    join_multiline_table_row_parens,
-    normalize_double_commas,
-    normalize_multi_line_continuations,
-    normalize_special_identifiers,
+    normalize_for_parser,
     preprocess_gams_file,
+    split_statements,
 )
 from .symbols import (
     AliasDef,
@@ -85,6 +99,7 @@ class ParserSemanticError(ValueError):
 
 _ROOT = Path(__file__).resolve().parents[1]
 _GRAMMAR_PATH = _ROOT / "gams" / "gams_grammar.lark"
+_LALR_GRAMMAR_PATH = _ROOT / "gams" / "gams_grammar_lalr.lark"
 
 _WRAPPER_NODES = {
     "sum_expr",
@@ -148,20 +163,263 @@ _PREDEFINED_CONSTANTS: dict[str, float] = {
 }
 
 
+# Note: Using standard lexer (not dynamic_complete) to avoid tokenization issues
+# where multi-character identifiers are split into individual characters.
+_LARK_OPTIONS: dict[str, object] = {
+    "parser": "earley",
+    "start": "start",
+    "maybe_placeholders": False,
+    "ambiguity": "resolve",
+}
+
+
+# The LALR fast-path grammar has one start symbol per statement kind it
+# accepts (see the header of gams_grammar_lalr.lark).
+_LALR_OPTIONS: dict[str, object] = {
+    "parser": "lalr",
+    "lexer": "contextual",
+    "start": ["equation_def", "assignment_stmt"],
+    "maybe_placeholders": False,
+}
+
+# Set to 1 to parse every statement with the Earley parser (used to compare
+# the LALR fast path against the reference parser).
+_NO_LALR_FASTPATH_ENV = "NLP2MCP_NO_LALR_FASTPATH"
+
+# Statements containing any of these are left to the Earley parser: quoted
+# labels, `%` compile-time references, braces and comments are all lexed
+# context-sensitively by the Earley grammar.
+_LALR_EXCLUDED_RE = re.compile(r"""['"%{}]|//|^[ \t]*\*""", re.MULTILINE)
+
+# Set to 1 to send Table and Parameter data statements through the grammar
+# even when the data scanner (src/ir/data_scanner.py) can read them.
+_NO_DATA_FASTPATH_ENV = "NLP2MCP_NO_DATA_FASTPATH"
+
+_DATA_STATEMENT_RE = re.compile(r"(table|parameters?)\s", re.IGNORECASE)
+
+
 @lru_cache
 def _build_lark() -> Lark:
     """Load the shared Lark parser (cached for reuse across tests).
 
-    Note: Using standard lexer (not dynamic_complete) to avoid tokenization issues
-    where multi-character identifiers are split into individual characters.
+    Within a process the parser is memoized by ``lru_cache``; across processes
+    the compiled parser is loaded from the on-disk grammar cache (see
+    ``src/ir/grammar_cache.py``) and only rebuilt when the grammar file or
+    the Lark version changes.
+    """
+    return load_or_build_parser(_GRAMMAR_PATH, **_LARK_OPTIONS)
+
+
+@lru_cache
+def _build_lalr() -> Lark:
+    """Load the LALR parser for the fast-path subset grammar (cached like ``_build_lark``)."""
+    return load_or_build_parser(_LALR_GRAMMAR_PATH, **_LALR_OPTIONS)
+
+
+def warm_grammar_cache() -> list[Path]:
+    """Rebuild the on-disk compiled-grammar cache entries and return their paths.
+
+    Returns an empty list, writing nothing, when caching is disabled.
+    """
+    paths = [
+        _warm_grammar_cache(_GRAMMAR_PATH, **_LARK_OPTIONS),
+        _warm_grammar_cache(_LALR_GRAMMAR_PATH, **_LALR_OPTIONS),
+    ]
+    return [path for path in paths if path is not None]
+
+
+def _lalr_fastpath_enabled() -> bool:
+    return os.environ.get(_NO_LALR_FASTPATH_ENV, "").strip().lower() not in ("1", "true", "yes")
+
+
+def _data_fastpath_enabled() -> bool:
+    return os.environ.get(_NO_DATA_FASTPATH_ENV, "").strip().lower() not in ("1", "true", "yes")
+
+
+def _lalr_start_symbol(statement: str) -> str | None:
+    """Return the LALR start symbol to try for ``statement``, or None to skip it."""
+    if not (statement[0].isalpha() or statement[0] == "_"):
+        return None
+    if _LALR_EXCLUDED_RE.search(statement):
+        return None
+    # Only equation definitions contain `..` (`name(i)$cond.. lhs =e= rhs;`)
+    if ".." in statement:
+        return "equation_def"
+    return "assignment_stmt"
+
+
+def _span_text(source: str, start: int, end: int) -> tuple[str, int, int]:
+    """Return ``source[start:end]`` padded to its column, with its line/offset shift.
+
+    The span is padded with spaces up to its starting column so columns come
+    out right; the returned line and character offsets are what
+    ``_shift_token_positions`` adds to move tokens back into ``source``.
+    """
+    line_start = source.rfind("\n", 0, start) + 1
+    text = " " * (start - line_start) + source[start:end]
+    return text, source.count("\n", 0, start), line_start
+
+
+def _shift_token_positions(tree: Tree, line_offset: int, pos_offset: int) -> Tree:
+    """Shift token line numbers and character offsets in place and return ``tree``.
+
+    The parser builder and error messages rely on absolute token positions.
+    The (line, column) positions of ``ScannedParameter`` data are shifted
+    along with the tokens.
+    """
+    if line_offset or pos_offset:
+        values = {
+            id(v): v for v in tree.scan_values(lambda v: isinstance(v, Token | ScannedParameter))
+        }
+        for tok in values.values():
+            if isinstance(tok, ScannedParameter):
+                line, column = tok.name_position
+                tok.name_position = (line + line_offset, column)
+                tok.positions = [(line + line_offset, column) for line, column in tok.positions]
+                continue
+            if tok.line is not None:
+                tok.line += line_offset
+            if tok.end_line is not None:
+                tok.end_line += line_offset
+            if tok.start_pos is not None:
+                tok.start_pos += pos_offset
+            if tok.end_pos is not None:
+                tok.end_pos += pos_offset
+    return tree
+
+
+def _parse_span(
+    parser: Lark, source: str, start: int, end: int, start_symbol: str | None = None
+) -> Tree:
+    """Parse ``source[start:end]`` with token positions relative to ``source``."""
+    text, line_offset, pos_offset = _span_text(source, start, end)
+    return _shift_token_positions(parser.parse(text, start=start_symbol), line_offset, pos_offset)
+
+
+def _parse_earley_chunk(text: str, line_offset: int, pos_offset: int) -> Tree | None:
+    """Worker entry point for ``parse_workers > 1``: Earley-parse one statement.
+
+    Returns None on a syntax error instead of raising, because Lark's
+    exceptions carry parser state that does not survive pickling; the
+    caller re-parses the statement in-process to get the real exception.
+    """
+    try:
+        tree = _build_lark().parse(text)
+    except UnexpectedInput:
+        return None
+    return _shift_token_positions(tree, line_offset, pos_offset)
+
+
+def _scan_data_statement(source: str, start: int, end: int) -> Tree | None:
+    """Read a pure-data Table/Parameter statement without the grammar, if possible.
+
+    Returns a ``scanned_table`` / ``scanned_parameter`` node holding the
+    name token and the scanner result, or None when the statement is not in
+    the subset ``src/ir/data_scanner.py`` reads.
+    """
+    keyword = _DATA_STATEMENT_RE.match(source, start)
+    if keyword is None:
+        return None
+    text, line_offset, _ = _span_text(source, start, end)
+    scanned: ScannedTable | ScannedParameter | None
+    if keyword.group(1).lower() == "table":
+        scanned = scan_table(text)
+        if scanned is None:
+            return None
+        return Tree("scanned_table", [Token("ID", scanned.name), scanned])
+    scanned = scan_parameter(text, first_line=line_offset + 1)
+    if scanned is None:
+        return None
+    line, column = scanned.name_position
+    name = Token("ID", scanned.name, line=line, column=column)
+    return Tree("scanned_parameter", [name, scanned])
+
+
+def _parse_statement_spans(
+    source: str,
+    spans: Sequence[tuple[int, int]],
+    use_lalr: bool = True,
+    workers: int = 1,
+    use_scanner: bool = True,
+) -> list[list[Tree | Token]] | None:
+    """Parse each ``source[start:end]`` span on its own.
+
+    Returns the top-level nodes of every span, in order. Equation
+    definitions and assignments are first tried with the LALR subset
+    grammar, which is orders of magnitude faster than Earley and yields
+    identical trees for what it accepts. With ``workers > 1`` the spans left
+    to Earley are parsed in a process pool; their trees are put back in
+    source order. With ``use_scanner``, pure-data Table and Parameter
+    statements are read by ``_scan_data_statement`` and never reach a
+    grammar.
+
+    Returns None when a span cannot be parsed in isolation (one that starts
+    with ``*`` mid-line would be taken for a comment line) and raises the
+    Lark exception of the first span that fails to parse.
+    """
+    earley = _build_lark()
+    lalr = _build_lalr() if use_lalr else None
+    parts: list[list[Tree | Token]] = []
+    earley_spans: list[tuple[int, int, int]] = []  # (part index, start, end)
+    for start, end in spans:
+        if source[start] == "*":
+            return None
+        if use_scanner:
+            scanned = _scan_data_statement(source, start, end)
+            if scanned is not None:
+                parts.append([scanned])
+                continue
+        if lalr is not None:
+            start_symbol = _lalr_start_symbol(source[start:end])
+            if start_symbol is not None:
+                try:
+                    parts.append([_parse_span(lalr, source, start, end, start_symbol)])
+                    continue
+                except UnexpectedInput:
+                    pass
+        earley_spans.append((len(parts), start, end))
+        parts.append([])
+
+    if workers > 1 and len(earley_spans) > 1:
+        jobs = [_span_text(source, start, end) for _, start, end in earley_spans]
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            trees = list(pool.map(_parse_earley_chunk, *zip(*jobs, strict=True), chunksize=4))
+        for (index, start, end), tree in zip(earley_spans, trees, strict=True):
+            if tree is None:
+                tree = _parse_span(earley, source, start, end)  # raises the syntax error
+            parts[index] = tree.children
+    else:
+        for index, start, end in earley_spans:
+            parts[index] = _parse_span(earley, source, start, end).children
+    return parts
+
+
+def _parse_statements(
+    source: str, use_lalr: bool = True, workers: int = 1, use_scanner: bool = True
+) -> Tree | None:
+    """Parse ``source`` one top-level statement at a time.
+
+    Each statement is parsed on its own (see ``_parse_statement_spans``), so
+    the Earley chart only ever spans a single statement and peak memory is
+    bounded by the largest statement (typically a big ``Table``) rather than
+    the whole model. The statement trees are stitched into the single
+    ``program`` tree ``_ModelBuilder.build`` consumes.
+
+    Returns None when a statement cannot be parsed in isolation and raises
+    the Lark exception of the first statement that fails to parse; in both
+    cases the caller re-parses the whole document with Earley, so syntax
+    errors are always reported exactly as before.
     """
-    return Lark.open(
-        _GRAMMAR_PATH,
-        parser="earley",
-        start="start",
-        maybe_placeholders=False,
-        ambiguity="resolve",
+    parts = _parse_statement_spans(
+        source,
+        split_statements(source),
+        use_lalr=use_lalr,
+        workers=workers,
+        use_scanner=use_scanner,
     )
+    if parts is None:
+        return None
+    return Tree("program", [child for part in parts for child in part])
 
 
 def _is_bare_number_row(row: Tree) -> Token | None:
@@ -486,7 +744,8 @@ def _resolve_ambiguities(node: Tree | Token) -> Tree | Token:
     while stack:
         current, is_return = stack.pop()
 
-        if isinstance(current, Token):
+        if not isinstance(current, Tree):
+            # Tokens, and the scanner results held by scanned_* nodes
             resolved[id(current)] = current
             continue
 
@@ -527,8 +786,8 @@ _ERROR_ENHANCER = ErrorEnhancer()
 # Left tolerance (in columns) for range-based column matching in table parsing.
 # A value token is assigned to a column header if it falls within
 # [col_pos - _COL_LEFT_TOLERANCE, next_col_pos).  Used by both the section-based
-# and non-section table parsing paths.
-_COL_LEFT_TOLERANCE = 3
+# and non-section table parsing paths, and by the data scanner's fast path.
+_COL_LEFT_TOLERANCE = COL_LEFT_TOLERANCE
 
 
 def _extract_source_line_with_adjusted_column(
@@ -559,11 +818,17 @@ def _extract_source_line_with_adjusted_column(
     return source_line, adjusted_column
 
 
-def parse_text(source: str) -> Tree:
+def parse_text(source: str, *, parse_workers: int = 1) -> Tree:
     """Parse a source string and return a disambiguated Lark parse tree.
 
+    The source is parsed one top-level statement at a time (see
+    ``_parse_statements``); if any statement fails on its own the whole
+    document is parsed in one piece, which also produces the error report.
+
     Args:
         source: GAMS source code to parse
+        parse_workers: Number of worker processes for the Earley statement
+            parses (1 = parse in-process)
 
     Returns:
         Disambiguated parse tree
@@ -571,51 +836,30 @@ def parse_text(source: str) -> Tree:
     Raises:
         ParseError: If syntax errors are found (wraps Lark exceptions)
     """
-    # Issue #612: Normalize multi-line continuations to add missing commas.
-    # This handles GAMS syntax where set/parameter members on separate lines
-    # don't require explicit commas, e.g.:
-    #   Set tw / (jan,feb).wet
-    #            (mar,apr).dry /;
-    # NOTE: The same normalization is also performed in `preprocess_gams_file()`.
-    # It is intentionally duplicated here so that callers which invoke `parse_text`
-    # directly on raw GAMS source (bypassing preprocessing) still get correct
-    # handling of multi-line data blocks.
-    source = normalize_multi_line_continuations(source)
-
-    # Issue #565: Normalize double commas to single commas before parsing.
-    # This handles GAMS visual alignment syntax like: Set l / a,, b /;.
-    # NOTE: The same normalization is also performed in `preprocess_gams_file()`.
-    # It is intentionally duplicated here so that callers which invoke `parse_text`
-    # directly on raw GAMS source (bypassing preprocessing) still get correct
-    # handling of visual-alignment double commas.
-    source = normalize_double_commas(source)
-
-    # Issue #665: Quote identifiers with special characters (-, +) in data blocks.
-    # This handles identifiers like "20-bond-wt", "light-ind", "food+agr" in
-    # Set/Parameter/Table declarations and data. Without quoting, these get
-    # misinterpreted as arithmetic expressions.
-    # NOTE: This normalization is also performed in `_preprocess_content()` (called
-    # by `preprocess_gams_file()`). The duplication is intentional: file-based
-    # parsing uses `preprocess_gams_file()` → `parse_text()`, while test code and
-    # direct API users may call `parse_text()` directly with raw GAMS source.
-    # Both paths must normalize special identifiers for correct parsing.
-    source = normalize_special_identifiers(source)
-
-    # Sprint 20 Day 8: Join multi-line parenthesized table row labels onto one line.
-    # Must run before expand_tuple_only_table_rows.
-    source = join_multiline_table_row_parens(source)
-
-    # Day 8: Expand (a,b,c) tuple-only row labels in tables to individual rows.
-    # Must run after normalize_special_identifiers.
-    source = expand_tuple_only_table_rows(source)
-
-    # Day 9: Expand multi-segment tuple/range row labels: a.(b,c).d, a.b.(c*e), etc.
-    # Must run after expand_tuple_only_table_rows (Step 15b).
-    source = expand_multi_segment_tuple_row_labels(source)
-
-    parser = _build_lark()
+    # Re-apply the data-block normalizations the grammar depends on:
+    # multi-line continuation commas (Issue #612), double commas (Issue #565),
+    # quoting of identifiers with - and + (Issue #665), and the multi-line,
+    # tuple-only and multi-segment table row label expansions.
+    # NOTE: The same normalizations are also performed in `_preprocess_content()`
+    # (called by `preprocess_gams_file()`). The duplication is intentional: test
+    # code and direct API users may call `parse_text()` on raw GAMS source.
+    source = normalize_for_parser(source)
+
     try:
-        raw = parser.parse(source)
+        try:
+            raw = _parse_statements(
+                source,
+                use_lalr=_lalr_fastpath_enabled(),
+                workers=parse_workers,
+                use_scanner=_data_fastpath_enabled(),
+            )
+        except UnexpectedInput:
+            # Let the whole-document parse produce the error (with
+            # whole-document context) or, should statement splitting have
+            # misjudged a boundary, the correct tree.
+            raw = None
+        if raw is None:
+            raw = _build_lark().parse(source)
         resolved = _resolve_ambiguities(raw)
         return _normalize_parsed_tables(resolved)
     except UnexpectedToken as e:
@@ -708,28 +952,210 @@ def parse_file(path: str | Path) -> Tree:
     return parse_tree(path)
 
 
-def parse_model_text(source: str) -> ModelIR:
+def parse_model_text(source: str, *, parse_workers: int = 1) -> ModelIR:
     """Parse a source string into a populated ModelIR instance.
 
+    ``parse_workers > 1`` parses statements in that many worker processes
+    (see ``parse_text``).
+
     Note: For large models (1000+ variables), this function requires an increased
     Python recursion limit due to deeply nested expression trees. The CLI automatically
     manages this, but if calling this function directly from other code, ensure
     sys.setrecursionlimit() is set appropriately (recommended: 10000).
     """
-    tree = parse_text(source)
+    tree = parse_text(source, parse_workers=parse_workers)
     return _ModelBuilder(source=source).build(tree)
 
 
-def parse_model_file(path: str | Path) -> ModelIR:
+@dataclass
+class _StatementEntry:
+    """One top-level statement remembered by ``IncrementalParser``.
+
+    ``payload`` is the pickled list of the statement's resolved top-level
+    nodes, with token positions as of ``line_offset`` / ``pos_offset``
+    (see ``_span_text``). Pickling gives every build its own copy, since
+    handlers keep references to the nodes they were given.
+    """
+
+    text: str
+    column: int
+    line_offset: int
+    pos_offset: int
+    payload: bytes
+
+
+@dataclass
+class IncrementalParser:
+    """Parse successive versions of one model, redoing only what an edit touched.
+
+    ``parse`` splits the source into top-level statements and diffs them
+    against the previous version: the unchanged leading and trailing runs
+    keep their parse trees (trailing ones are moved to their new line and
+    offset), and only the statements in between are parsed again.
+
+    ``_ModelBuilder`` handlers run in source order and evaluate eagerly (an
+    assignment reads the parameter values built so far, a loop mutates
+    them), so the IR after a statement depends on every statement before
+    it. Instead of patching the previous IR, the builder state is
+    checkpointed every ``checkpoint_interval`` statements and an edit
+    resumes from the last checkpoint before the first changed statement.
+    The resulting ``ModelIR`` is identical to ``parse_model_text`` on the
+    same source.
+
+    Sources that the statement-level parser cannot handle (and syntax
+    errors) go through ``parse_model_text`` and clear the remembered state.
+    """
+
+    checkpoint_interval: int = 32
+    parse_workers: int = 1
+    # Statements parsed and handler runs replayed by the last ``parse`` call
+    last_parsed: int = 0
+    last_replayed: int = 0
+    _statements: list[_StatementEntry] = field(default_factory=list)
+    _checkpoints: dict[int, bytes] = field(default_factory=dict)
+    _toggles: tuple[bool, bool] | None = None
+
+    def reset(self) -> None:
+        """Forget the previous version; the next ``parse`` starts from scratch."""
+        self._statements = []
+        self._checkpoints = {}
+
+    def parse(self, source: str) -> ModelIR:
+        """Parse ``source`` (the new version of the model) into a ModelIR."""
+        toggles = (_lalr_fastpath_enabled(), _data_fastpath_enabled())
+        if toggles != self._toggles:
+            self.reset()
+            self._toggles = toggles
+        normalized = normalize_for_parser(source)
+        spans = split_statements(normalized)
+        texts = [normalized[start:end] for start, end in spans]
+        offsets: list[tuple[int, int]] = []  # (line_offset, pos_offset) as in _span_text
+        line, last = 0, 0
+        for start, _ in spans:
+            line += normalized.count("\n", last, start)
+            last = start
+            offsets.append((line, normalized.rfind("\n", 0, start) + 1))
+        columns = [start - pos for (start, _), (_, pos) in zip(spans, offsets, strict=True)]
+
+        # Leading statements must be unchanged in place; trailing ones may
+        # have moved and are shifted below.
+        old = self._statements
+        limit = min(len(old), len(spans))
+        prefix = 0
+        while prefix < limit and (
+            old[prefix].text,
+            old[prefix].column,
+            old[prefix].line_offset,
+            old[prefix].pos_offset,
+        ) == (texts[prefix], columns[prefix], *offsets[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and (old[-1 - suffix].text, old[-1 - suffix].column) == (
+            texts[-1 - suffix],
+            columns[-1 - suffix],
+        ):
+            suffix += 1
+
+        changed = spans[prefix : len(spans) - suffix]
+        try:
+            parts = _parse_statement_spans(
+                normalized,
+                changed,
+                use_lalr=toggles[0],
+                workers=self.parse_workers,
+                use_scanner=toggles[1],
+            )
+        except UnexpectedInput:
+            parts = None
+        if parts is None:
+            self.reset()
+            self.last_parsed, self.last_replayed = len(spans), len(spans)
+            return parse_model_text(source, parse_workers=self.parse_workers)
+
+        entries = old[:prefix]
+        for index, nodes in enumerate(parts, start=prefix):
+            program = _normalize_parsed_tables(_resolve_ambiguities(Tree("program", nodes)))
+            entries.append(
+                _StatementEntry(
+                    text=texts[index],
+                    column=columns[index],
+                    line_offset=offsets[index][0],
+                    pos_offset=offsets[index][1],
+                    payload=pickle.dumps(program.children, protocol=5),
+                )
+            )
+        for entry, (line_offset, pos_offset) in zip(
+            old[len(old) - suffix :], offsets[len(spans) - suffix :], strict=True
+        ):
+            if (line_offset, pos_offset) != (entry.line_offset, entry.pos_offset):
+                program = _shift_token_positions(
+                    Tree("program", pickle.loads(entry.payload)),
+                    line_offset - entry.line_offset,
+                    pos_offset - entry.pos_offset,
+                )
+                entry = _StatementEntry(
+                    text=entry.text,
+                    column=entry.column,
+                    line_offset=line_offset,
+                    pos_offset=pos_offset,
+                    payload=pickle.dumps(program.children, protocol=5),
+                )
+            entries.append(entry)
+        self._statements = entries
+
+        resume = max((index for index in self._checkpoints if index <= prefix), default=0)
+        self._checkpoints = {
+            index: state for index, state in self._checkpoints.items() if index <= resume
+        }
+        if resume:
+            builder = pickle.loads(self._checkpoints[resume])
+            builder.source = source
+        else:
+            builder = _ModelBuilder(source=source)
+        for index in range(resume, len(entries)):
+            if index and index % self.checkpoint_interval == 0:
+                self._checkpoints.setdefault(index, pickle.dumps(builder, protocol=5))
+            builder._build_nodes(pickle.loads(entries[index].payload))
+        self.last_parsed = len(changed)
+        self.last_replayed = len(entries) - resume
+        builder._validate()
+        return builder.model
+
+
+def parse_model_file(
+    path: str | Path, *, parse_workers: int = 1, incremental: bool = False
+) -> ModelIR:
     """
     Parse a file path into a populated ModelIR instance.
 
     This function automatically handles $include directives by preprocessing
-    the file before parsing.
+    the file before parsing. ``parse_workers`` is passed to ``parse_text``.
+
+    The IR is cached on disk keyed by the preprocessed source (see
+    ``model_cache``); a hit skips parsing entirely and returns a fresh copy.
+
+    With ``incremental``, a miss is parsed by the ``IncrementalParser`` kept
+    on disk for this path, so after an edit only the changed statements are
+    parsed again.
     """
     # Preprocess to expand all $include directives
     data = preprocess_gams_file(Path(path))
-    return parse_model_text(data)
+    cached = load_model(data)
+    if cached is not None:
+        return cached
+    if incremental:
+        session = load_session(Path(path))
+        if not isinstance(session, IncrementalParser):
+            session = IncrementalParser()
+        session.parse_workers = parse_workers
+        try:
+            model = session.parse(data)
+        finally:
+            store_session(Path(path), session)
+    else:
+        model = parse_model_text(data, parse_workers=parse_workers)
+    store_model(data, model)
+    return model
 
 
 def _is_literal_const(expr: Expr) -> bool:
@@ -1729,7 +2155,13 @@ class _ModelBuilder:
             self.model.params[name] = param_def
 
     def build(self, tree: Tree) -> ModelIR:
-        for child in tree.children:
+        self._build_nodes(tree.children)
+        self._validate()
+        return self.model
+
+    def _build_nodes(self, nodes: Sequence[Tree | Token]) -> None:
+        """Run the handlers for a run of top-level nodes, in order."""
+        for child in nodes:
             if not isinstance(child, Tree):
                 continue
             # Issue #1270: capture top-level (program-level) marginal-feedback
@@ -1746,8 +2178,6 @@ class _ModelBuilder:
             handler = getattr(self, f"_handle_{child.data}", None)
             if handler:
                 handler(child)
-        self._validate()
-        return self.model
 
     def _record_top_level_marginal_reads(self, assign_node: Tree) -> None:
         """Issue #1270: scan a top-level `assign` Tree for symbol-attribute
@@ -3434,6 +3864,63 @@ class _ModelBuilder:
 
         self.model.add_param(ParameterDef(name=name, domain=domain, values=values))
 
+    def _handle_scanned_table(self, node: Tree) -> None:
+        """Add a table read by the data scanner (see ``_scan_data_statement``)."""
+        table = node.children[1]
+        self.model.add_param(
+            ParameterDef(name=table.name, domain=table.domain, values=table.values)
+        )
+
+    def _handle_scanned_parameter(self, node: Tree) -> None:
+        """Add a parameter data list read by the data scanner.
+
+        Performs the same domain checks as ``_parse_param_decl`` does for
+        ``param_data_scalar`` items.
+        """
+        scanned = node.children[1]
+        name, domain = scanned.name, scanned.domain
+        param = ParameterDef(name=name, domain=domain)
+        if domain:
+            self._ensure_sets(domain, f"parameter '{name}' domain", node)
+            for key, position in zip(scanned.keys, scanned.positions, strict=True):
+                try:
+                    self._check_param_data_key(name, domain, key)
+                except ParserSemanticError:
+                    # Repeat the check with a positioned token for the error report
+                    line, column = position
+                    self._check_param_data_key(
+                        name, domain, key, Token("ID", key[0], line=line, column=column)
+                    )
+                    raise
+        param.values.update(zip(scanned.keys, scanned.values, strict=True))
+        if not domain:
+            # Issue #911: infer the domain from the data keys
+            key_lengths = {len(key) for key in scanned.keys}
+            if len(key_lengths) > 1:
+                line, column = scanned.positions[0]
+                raise self._error(
+                    f"Parameter '{name}' data has inconsistent tuple arity: {sorted(key_lengths)}",
+                    Token("ID", scanned.keys[0][0], line=line, column=column),
+                )
+            param.domain = ("*",) * key_lengths.pop()
+        self.model.add_param(param)
+
+    def _check_param_data_key(
+        self,
+        param_name: str,
+        domain: tuple[str, ...],
+        key: tuple[str, ...],
+        node: Tree | Token | None = None,
+    ) -> None:
+        if len(key) != len(domain):
+            raise self._error(
+                f"Parameter '{param_name}' data index mismatch: expected {len(domain)} dims, got {len(key)}",
+                node,
+            )
+        for idx, set_name in zip(key, domain, strict=True):
+            if set_name != "*":
+                self._verify_member_in_domain(param_name, set_name, idx, node)
+
     def _handle_variables_block(self, node: Tree) -> None:
         # Check for block-level variable kind (e.g., "Positive Variables")
         block_kind = None
@@ -0,0 +1,150 @@
+"""
+Persistent cache of preprocessed GAMS sources, keyed by include closure.
+
+``preprocess_gams_file`` expands every ``$include`` / ``$batInclude`` and
+then runs the whole macro/conditional/normalization pipeline, which is pure
+work repeated verbatim every time the same model is translated again (e.g.
+once per ``--simplification`` setting in an experiment). This module stores
+the result on disk so a repeat translation skips preprocessing entirely.
+
+An entry is only valid for the exact set of files it was built from, so the
+cache keeps two kinds of files under ``<cache root>/preprocess``:
+
+- a *manifest* per root file, listing every file ``preprocess_includes`` and
+  ``preprocess_bat_includes`` read for it (the include closure) with the
+  digest of its contents, or ``None`` for a ``$batInclude`` target that did
+  not exist;
+- the preprocessed *entry*, content-addressed by the digests of the whole
+  closure plus the preprocessor's own source and the nlp2mcp version.
+
+A lookup re-hashes the files listed in the manifest and loads the entry for
+the resulting key, so editing (or creating, or deleting) any file in the
+closure produces a different key and therefore a miss. The directory is
+bounded by size (``NLP2MCP_PREPROCESS_CACHE_MB``, default 256) and evicts
+least recently used files first. Like the grammar cache, every failure is a
+miss and ``NLP2MCP_NO_CACHE=1`` turns it off.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from .. import __version__
+from ..utils.disk_cache import (
+    atomic_write_bytes,
+    cache_enabled,
+    cache_subdir,
+    hash_bytes,
+    prune_lru,
+    touch,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of a manifest or entry changes.
+_CACHE_FORMAT_VERSION = "1"
+
+_CACHE_SUBDIR = "preprocess"
+
+MAX_SIZE_ENV = "NLP2MCP_PREPROCESS_CACHE_MB"
+_DEFAULT_MAX_MB = 256
+
+# Include closure: resolved path -> content digest (None = file was missing)
+IncludeClosure = dict[Path, str | None]
+
+
+def content_digest(text: str) -> str:
+    """Return the digest recorded for a file whose contents are ``text``."""
+    return hash_bytes(text)
+
+
+def file_digest(path: Path) -> str | None:
+    """Return the current digest of ``path``, or None if it cannot be read."""
+    try:
+        return content_digest(path.read_text())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def _preprocessor_fingerprint() -> str:
+    # Any change to the preprocessor may change its output
+    source = (Path(__file__).parent / "preprocessor.py").read_bytes()
+    return hash_bytes(source, __version__)
+
+
+def preprocess_cache_key(closure: IncludeClosure) -> str:
+    """Return the entry key for an include closure."""
+    parts: list[str] = [_CACHE_FORMAT_VERSION, _preprocessor_fingerprint()]
+    for path in sorted(closure):
+        parts.append(str(path))
+        parts.append(closure[path] or "")
+    return hash_bytes(*parts)
+
+
+def _max_bytes() -> int:
+    try:
+        megabytes = float(os.environ.get(MAX_SIZE_ENV, _DEFAULT_MAX_MB))
+    except ValueError:
+        megabytes = _DEFAULT_MAX_MB
+    return int(megabytes * 1024 * 1024)
+
+
+def _manifest_path(root: Path) -> Path:
+    name = hash_bytes(_CACHE_FORMAT_VERSION, str(root))[:32]
+    return cache_subdir(_CACHE_SUBDIR) / f"{name}.manifest.json"
+
+
+def _entry_path(key: str) -> Path:
+    return cache_subdir(_CACHE_SUBDIR) / f"{key[:32]}.gms"
+
+
+def _read_manifest(path: Path) -> list[Path] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return [Path(name) for name in data["files"]]
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.debug("Ignoring unreadable preprocess manifest %s: %s", path, exc)
+        return None
+
+
+def load_preprocessed(root: Path) -> str | None:
+    """Return the cached preprocessed source of ``root``, or None on a miss."""
+    if not cache_enabled():
+        return None
+    root = root.resolve()
+    manifest = _manifest_path(root)
+    files = _read_manifest(manifest)
+    if files is None:
+        return None
+    closure = {path: file_digest(path) for path in files}
+    if closure.get(root) is None:
+        return None
+    entry = _entry_path(preprocess_cache_key(closure))
+    try:
+        text = entry.read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    touch(entry)
+    touch(manifest)
+    return text
+
+
+def store_preprocessed(root: Path, closure: IncludeClosure, text: str) -> None:
+    """Store ``text`` as the preprocessed source of ``root`` built from ``closure``."""
+    if not cache_enabled():
+        return
+    root = root.resolve()
+    manifest = _manifest_path(root)
+    entry = _entry_path(preprocess_cache_key(closure))
+    payload = json.dumps({"root": str(root), "files": [str(path) for path in sorted(closure)]})
+    try:
+        atomic_write_bytes(entry, text.encode("utf-8"))
+        atomic_write_bytes(manifest, payload.encode("utf-8"))
+        prune_lru(manifest.parent, _max_bytes())
+    except OSError as exc:  # read-only home, full disk
+        logger.debug("Could not write preprocess cache entry %s: %s", entry, exc)
@@ -17,6 +17,8 @@ Based on KNOWN_UNKNOWNS.md findings:
 import re
 from pathlib import Path
 
+from . import preprocess_cache
+
 # Regex pattern for GAMS declaration keywords (both singular and plural forms)
 DECLARATION_KEYWORDS_PATTERN = r"\b(Set|Sets|Parameter|Parameters|Scalar|Scalars|Alias)\b"
 
@@ -44,6 +46,14 @@ BLOCK_KEYWORDS = [
     "sos2",
 ]
 
+# Line patterns shared by the line stages (see _run_line_stages). Block
+# keywords and ``Table`` are matched against stripped lines.
+_BLOCK_KEYWORD_START_RE = re.compile(r"^\s*(?:" + "|".join(BLOCK_KEYWORDS) + r")\b", re.IGNORECASE)
+_DECLARATION_START_RE = re.compile(rf"^\s*{DECLARATION_KEYWORDS_PATTERN}", re.IGNORECASE)
+_DECLARATION_KEYWORD_RE = re.compile(DECLARATION_KEYWORDS_PATTERN, re.IGNORECASE)
+_TABLE_START_RE = re.compile(r"^Table\b", re.IGNORECASE)
+_QUOTED_STRING_RE = re.compile(r"'[^']*'|\"[^\"]*\"")
+
 
 # Sprint 21 Day 2: System macros with reasonable defaults
 # These are GAMS built-in compile-time macros that expand to solver names,
@@ -185,6 +195,9 @@ def process_conditionals(source: str, macros: dict[str, str]) -> str:
         - Expression evaluation is basic (comparisons, logical ops)
         - Excluded blocks are replaced with comments to preserve line numbers
     """
+    if "$" not in source:
+        return source
+
     lines = source.split("\n")
     result = []
 
@@ -508,6 +521,7 @@ def preprocess_bat_includes(
     source: str,
     max_depth: int = 100,
     _include_stack: list[Path] | None = None,
+    _dependencies: preprocess_cache.IncludeClosure | None = None,
 ) -> str:
     """Process $batInclude directives with argument substitution.
 
@@ -519,6 +533,8 @@ def preprocess_bat_includes(
         source: Source code containing $batInclude directives
         max_depth: Maximum allowed include nesting depth (default: 100)
         _include_stack: Internal parameter for tracking include chain
+        _dependencies: Internal parameter collecting the digest of every file
+            looked up (None for missing files), for the preprocess cache
 
     Returns:
         Source code with $batInclude directives expanded
@@ -577,6 +593,8 @@ def preprocess_bat_includes(
 
         # Check if file exists
         if not included_path.exists():
+            if _dependencies is not None:
+                _dependencies[included_path] = None
             # File doesn't exist - comment out the directive
             result_parts.append(
                 f"\n* Stripped: $batInclude {included_filename} {args_str} - file not found\n"
@@ -591,6 +609,8 @@ def preprocess_bat_includes(
 
         # Read the included file
         included_content = included_path.read_text()
+        if _dependencies is not None:
+            _dependencies[included_path] = preprocess_cache.content_digest(included_content)
 
         # Substitute %1, %2, etc. with arguments
         # Note: GAMS $batInclude uses %1, %2, etc. (not %1%, %2%)
@@ -610,6 +630,7 @@ def preprocess_bat_includes(
             included_content,
             max_depth=max_depth,
             _include_stack=new_stack,
+            _dependencies=_dependencies,
         )
 
         result_parts.append(included_content)
@@ -629,6 +650,7 @@ def preprocess_includes(
     file_path: Path,
     max_depth: int = 100,
     _include_stack: list[Path] | None = None,
+    _dependencies: preprocess_cache.IncludeClosure | None = None,
 ) -> str:
     """Recursively expand all $include directives in a GAMS file.
 
@@ -641,6 +663,8 @@ def preprocess_includes(
         file_path: Path to the GAMS file to preprocess
         max_depth: Maximum allowed include nesting depth (default: 100)
         _include_stack: Internal parameter for tracking include chain
+        _dependencies: Internal parameter collecting the digest of every file
+            read, for the preprocess cache
 
     Returns:
         The preprocessed file content with all includes expanded
@@ -690,6 +714,8 @@ def preprocess_includes(
             raise FileNotFoundError(f"File not found: {file_path}")
 
     content = file_path.read_text()
+    if _dependencies is not None:
+        _dependencies[file_path] = preprocess_cache.content_digest(content)
 
     # Pattern matches: $include filename.inc OR $include "filename with spaces.inc"
     # Case-insensitive, allows optional whitespace
@@ -722,6 +748,7 @@ def preprocess_includes(
             included_path,
             max_depth=max_depth,
             _include_stack=new_stack,
+            _dependencies=_dependencies,
         )
 
         result_parts.append(included_content)
@@ -750,6 +777,12 @@ def _has_statement_ending_semicolon(line: str) -> bool:
     are responsible for any preprocessing (such as stripping comments) that
     is required for their use case.
     """
+    # Called for every line of every table: settle the common cases without
+    # the character scan.
+    if ";" not in line:
+        return False
+    if '"' not in line and "'" not in line:
+        return True
     in_string = None
     i = 0
     while i < len(line):
@@ -825,6 +858,36 @@ def _find_char_outside_strings(line: str, char: str, start: int = 0) -> int:
     return -1
 
 
+def _skip_quoted(source: str, pos: int, quote: str) -> int:
+    """Return the index just past the string opened before ``pos``.
+
+    GAMS quoting: a doubled quote (``''`` / ``""``) stays inside the string
+    and a quote preceded by an odd number of backslashes does not close it.
+    Strings never span lines: an unterminated
+    quote, e.g. an apostrophe in unquoted description text, ends at the
+    newline so it cannot swallow the rest of the file.
+    """
+    n = len(source)
+    i = pos
+    while i < n:
+        c = source[i]
+        if c == "\n":
+            return i
+        if c == quote:
+            if i + 1 < n and source[i + 1] == quote:
+                i += 2
+                continue
+            backslash_count = 0
+            j = i - 1
+            while j >= pos and source[j] == "\\":
+                backslash_count += 1
+                j -= 1
+            if backslash_count % 2 == 0:
+                return i + 1
+        i += 1
+    return n
+
+
 def _find_statement_semicolon_pos(line: str) -> int:
     """Return the index of the first statement-ending semicolon in line, or -1.
 
@@ -833,28 +896,11 @@ def _find_statement_semicolon_pos(line: str) -> int:
     Used to strip trailing content (including inline comments) after the
     semicolon when checking for tuple row expansion.
     """
-    in_string = None
     i = 0
     while i < len(line):
         c = line[i]
-        if in_string:
-            if c == in_string:
-                # GAMS-style doubled-quote escape: '' or "" stays in string
-                if i + 1 < len(line) and line[i + 1] == in_string:
-                    i += 2
-                    continue
-                backslash_count = 0
-                j = i - 1
-                while j >= 0 and line[j] == "\\":
-                    backslash_count += 1
-                    j -= 1
-                if backslash_count % 2 == 0:
-                    in_string = None
-            i += 1
-            continue
         if c in ('"', "'"):
-            in_string = c
-            i += 1
+            i = _skip_quoted(line, i + 1, c)
             continue
         if c == ";":
             return i
@@ -862,6 +908,93 @@ def _find_statement_semicolon_pos(line: str) -> int:
     return -1
 
 
+# Characters (and comment openers) that matter when locating statement ends.
+_STATEMENT_SCAN_RE = re.compile(r"""[;()\[\]{}'"\n]|//|\$ontext""", re.IGNORECASE)
+# A full-line ``*`` comment starting at the given position (a line start).
+_COMMENT_LINE_RE = re.compile(r"[ \t]*\*[^\n]*")
+# Whitespace and comments that precede the first token of a statement.
+_LEADING_TRIVIA_RE = re.compile(
+    r"(?:\s+|^[ \t]*\*[^\n]*|//[^\n]*|\$ontext.*?\$offtext)*",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+
+
+def split_statements(source: str) -> list[tuple[int, int]]:
+    """Split GAMS source into top-level statements.
+
+    Returns ``(start, end)`` spans into ``source``. A statement ends at a
+    semicolon outside strings (quoted as in ``_find_statement_semicolon_pos``),
+    comments and brackets; its span runs from its first token (leading
+    whitespace and comments are skipped) through the semicolon. Trailing code
+    without a semicolon forms a final span.
+
+    The spans are used by the parser to parse statements independently, so
+    they only ever split at positions where the grammar itself ends a
+    statement; any text between spans is whitespace or comments.
+
+    Example:
+        >>> split_statements("x = 1;\\n* note\\ny = 2;")
+        [(0, 6), (14, 20)]
+    """
+    spans: list[tuple[int, int]] = []
+    n = len(source)
+    lowered = source.lower()  # for finding $offtext, once rather than per $ontext
+    seg_start = 0
+    depth = 0
+    pos = 0
+    comment = _COMMENT_LINE_RE.match(source, 0)
+    if comment:
+        pos = comment.end()
+    while True:
+        match = _STATEMENT_SCAN_RE.search(source, pos)
+        if match is None:
+            break
+        tok = match.group()
+        pos = match.end()
+        if tok == "\n":
+            comment = _COMMENT_LINE_RE.match(source, pos)
+            if comment:
+                pos = comment.end()
+        elif tok == ";":
+            if depth == 0:
+                spans.append((seg_start, pos))
+                seg_start = pos
+        elif tok in ("(", "[", "{"):
+            depth += 1
+        elif tok in (")", "]", "}"):
+            depth = max(depth - 1, 0)
+        elif tok in ("'", '"'):
+            pos = _skip_quoted(source, pos, tok)
+        elif tok == "//":
+            eol = source.find("\n", pos)
+            pos = n if eol < 0 else eol
+        else:  # $ontext ... $offtext block comment
+            close = lowered.find("$offtext", pos)
+            pos = n if close < 0 else close + len("$offtext")
+
+    if seg_start < n:
+        spans.append((seg_start, n))
+
+    result = []
+    for start, end in spans:
+        trivia = _LEADING_TRIVIA_RE.match(source, start, end)
+        if trivia is not None:
+            start = trivia.end()
+        if start < end:
+            result.append((start, end))
+    return result
+
+
+# Per-line patterns of strip_unsupported_directives
+_SPACED_LIBINCLUDE_RE = re.compile(r"^\$\s+libinclude")
+_FILE_DECL_RE = re.compile(r"""(?i)^file\s+(?:'[^']*'|"[^"]*"|[A-Za-z_][A-Za-z0-9_]*)\s*(.*)""")
+_PUTCLOSE_RE = re.compile(r"(?i)^putclose\s")
+_PUTTL_RE = re.compile(r"(?i)^puttl\b")
+_SCENRED_ASSIGNMENT_RE = re.compile(r"(?i)^scenred(parms|report)\s*\([^)]*\)\s*=")
+_ONTEXT_RE = re.compile(r"\$ontext", re.IGNORECASE)
+_OFFTEXT_RE = re.compile(r"\$offtext", re.IGNORECASE)
+
+
 def strip_unsupported_directives(source: str) -> str:
     """Remove unsupported GAMS compiler directives from source text.
 
@@ -899,7 +1032,11 @@ def strip_unsupported_directives(source: str) -> str:
         - $include directives are NOT stripped (handled by preprocess_includes)
         - Case-insensitive matching for all directives
     """
-    lines = source.split("\n")
+    return "\n".join(_strip_unsupported_directives_lines(source.split("\n")))
+
+
+def _strip_unsupported_directives_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``strip_unsupported_directives`` (see ``_preprocess_content``)."""
     filtered = []
     in_ontext_block = False
     in_echo_block = False  # Sprint 19 Day 11: $onEchoV/$offEcho and $onEps/$offEps blocks
@@ -967,9 +1104,7 @@ def strip_unsupported_directives(source: str) -> str:
         # Issue #888: Strip $libInclude directives (GAMS system library includes).
         # These reference library files (e.g., scenred.gms) not available to the parser.
         # Match case-insensitive, with optional spaces after $.
-        if stripped_lower.startswith("$libinclude") or re.match(
-            r"^\$\s+libinclude", stripped_lower
-        ):
+        if stripped_lower.startswith("$libinclude") or _SPACED_LIBINCLUDE_RE.match(stripped_lower):
             filtered.append(f"* Stripped: {stripped}")
             # Issue #978: Predeclare symbols exported by known libraries.
             # The scenred library defines ScenRedParms and ScenRedReport
@@ -1004,10 +1139,7 @@ def strip_unsupported_directives(source: str) -> str:
         # But NOT: File sol / path /;  or  File repdat 'desc';  (grammar handles these)
         # The ID may be quoted (grammar: ID = ESCAPED | /[a-zA-Z_]\w*/), so match
         # either a quoted string or an unquoted identifier.
-        file_m = re.match(
-            r"""(?i)^file\s+(?:'[^']*'|"[^"]*"|[A-Za-z_][A-Za-z0-9_]*)\s*(.*)""",
-            stripped,
-        )
+        file_m = _FILE_DECL_RE.match(stripped)
         if file_m:
             rest = file_m.group(1)
             # Grammar-parseable:
@@ -1068,7 +1200,7 @@ def strip_unsupported_directives(source: str) -> str:
                 continue
 
         # Strip putClose with content (grammar only supports: putclose ID? ;)
-        if re.match(r"(?i)^putclose\s", stripped):
+        if _PUTCLOSE_RE.match(stripped):
             # Check if it matches the grammar form: putclose ID? ;
             # ID token in grammar: ESCAPED | /[a-zA-Z_][a-zA-Z0-9_]*/
             # The grammar ignores NEWLINE, so the ; may be on the next line.
@@ -1100,7 +1232,7 @@ def strip_unsupported_directives(source: str) -> str:
                 continue
 
         # Strip puttl statements (not in grammar at all)
-        if re.match(r"(?i)^puttl\b", stripped):
+        if _PUTTL_RE.match(stripped):
             filtered.append(f"* Stripped: {stripped}")
             if not _has_statement_ending_semicolon(stripped):
                 in_put_statement = True
@@ -1110,7 +1242,7 @@ def strip_unsupported_directives(source: str) -> str:
         # These are scenred library-specific and may contain invalid GAMS
         # like ord('0-default') which causes $311 compilation errors.
         # Only match assignments (with =), not declarations/data blocks.
-        if re.match(r"(?i)^scenred(parms|report)\s*\([^)]*\)\s*=", stripped):
+        if _SCENRED_ASSIGNMENT_RE.match(stripped):
             filtered.append(f"* Stripped: {stripped}")
             continue
 
@@ -1123,14 +1255,12 @@ def strip_unsupported_directives(source: str) -> str:
     # Post-process: neutralize $ontext/$offtext in comment lines.
     # The grammar has %ignore /(?si)\$ontext.*?\$offtext/ which can match
     # across commented-out directives like *$offText, swallowing real code.
-    _ontext_re = re.compile(r"\$ontext", re.IGNORECASE)
-    _offtext_re = re.compile(r"\$offtext", re.IGNORECASE)
     for i, line in enumerate(filtered):
-        if line.lstrip().startswith("*") and (_ontext_re.search(line) or _offtext_re.search(line)):
-            filtered[i] = _ontext_re.sub("ontext", line)
-            filtered[i] = _offtext_re.sub("offtext", filtered[i])
+        if line.lstrip().startswith("*") and (_ONTEXT_RE.search(line) or _OFFTEXT_RE.search(line)):
+            filtered[i] = _ONTEXT_RE.sub("ontext", line)
+            filtered[i] = _OFFTEXT_RE.sub("offtext", filtered[i])
 
-    return "\n".join(filtered)
+    return filtered
 
 
 def extract_conditional_sets(source: str) -> dict[str, str]:
@@ -1327,8 +1457,16 @@ def expand_macros(source: str, macros: dict[str, str]) -> str:
         - System macros like %gams.user1% can be added to macros dict
     """
     result = source
+    # For ASCII text and names, a plain substring test on the lowercased text
+    # finds exactly what the case-insensitive regex would, so macros that are
+    # never referenced (most of SYSTEM_MACROS) cost no regex pass.
+    lowered = result.lower() if result.isascii() else None
 
     for var_name, value in macros.items():
+        if "%" not in result:
+            break
+        if lowered is not None and var_name.isascii() and f"%{var_name.lower()}%" not in lowered:
+            continue
         # Replace %varname% with value
         # The % delimiters prevent partial matches
         # Use lambda to prevent interpreting special regex replacement sequences
@@ -1336,6 +1474,7 @@ def expand_macros(source: str, macros: dict[str, str]) -> str:
         # matches %solveLink.CallModule%)
         pattern = f"%{re.escape(var_name)}%"
         result = re.sub(pattern, lambda m: value, result, flags=re.IGNORECASE)
+        lowered = result.lower() if result.isascii() else None
 
     return result
 
@@ -1431,18 +1570,12 @@ def strip_eval_directives(source: str) -> str:
     Returns:
         Source code with $eval directives replaced by comments
     """
-    lines = source.split("\n")
-    filtered = []
+    return "\n".join(_strip_eval_directives_lines(source.split("\n")))
 
-    for line in lines:
-        stripped = line.strip()
-        if re.match(r"\$eval\b", stripped, re.IGNORECASE):
-            leading_ws = line[: len(line) - len(line.lstrip())]
-            filtered.append(f"{leading_ws}* Stripped: {stripped}")
-        else:
-            filtered.append(line)
 
-    return "\n".join(filtered)
+def _strip_eval_directives_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``strip_eval_directives`` (see ``_preprocess_content``)."""
+    return [_comment_out_directive(line, _EVAL_DIRECTIVE_RE) for line in lines]
 
 
 def expand_macro_calls(source: str, macro_defs: dict[str, tuple[list[str], str]]) -> str:
@@ -1484,29 +1617,29 @@ def expand_macro_calls(source: str, macro_defs: dict[str, tuple[list[str], str]]
         # Process all matches from end to start to avoid offset issues
         matches = list(re.finditer(pattern, result))
 
+        # The text is rebuilt back to front: result[:boundary] is still
+        # untouched and ``tail`` holds the pieces after it, in reverse order.
+        # Rebuilding the whole string per call would be quadratic.
+        tail: list[str] = []
+        boundary = len(result)
+
         # Process in reverse order to maintain string positions
         for match in reversed(matches):
             start_pos = match.start()
             # Find the matching closing parenthesis
             paren_start = match.end() - 1  # Position of opening (
-            paren_count = 1
-            pos = paren_start + 1
-            args_str = ""
-
-            while pos < len(result) and paren_count > 0:
-                if result[pos] == "(":
-                    paren_count += 1
-                elif result[pos] == ")":
-                    paren_count -= 1
-                    if paren_count == 0:
-                        # Found matching closing paren
-                        args_str = result[paren_start + 1 : pos]
-                        break
-                pos += 1
-
-            if paren_count != 0:
+            pos = _find_closing_paren(result, paren_start, boundary)
+            if pos == -1 and tail:
+                # The call may close in text that was already expanded
+                result = result[:boundary] + "".join(reversed(tail))
+                tail = []
+                boundary = len(result)
+                pos = _find_closing_paren(result, paren_start, boundary)
+
+            if pos == -1:
                 # Unmatched parentheses - skip this match
                 continue
+            args_str = result[paren_start + 1 : pos]
 
             # Parse arguments (comma-separated, but respect nested parens)
             args = _parse_macro_arguments(args_str)
@@ -1527,11 +1660,35 @@ def expand_macro_calls(source: str, macro_defs: dict[str, tuple[list[str], str]]
 
             # Replace the macro call with the expanded body
             call_end = pos + 1  # Position after closing )
-            result = result[:start_pos] + expanded + result[call_end:]
+            tail.append(result[call_end:boundary])
+            tail.append(expanded)
+            boundary = start_pos
+
+        if tail:
+            result = result[:boundary] + "".join(reversed(tail))
 
     return result
 
 
+_PAREN_RE = re.compile(r"[()]")
+
+
+def _find_closing_paren(text: str, open_pos: int, end: int) -> int:
+    """Return the index of the ``)`` matching ``text[open_pos]``, or -1.
+
+    Only ``text[:end]`` is searched; parentheses inside strings count too.
+    """
+    depth = 0
+    for paren in _PAREN_RE.finditer(text, open_pos, end):
+        if paren.group() == "(":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return paren.start()
+    return -1
+
+
 def _parse_macro_arguments(args_str: str) -> list[str]:
     """Parse comma-separated macro arguments, respecting nested parentheses.
 
@@ -1571,6 +1728,45 @@ def _parse_macro_arguments(args_str: str) -> list[str]:
     return args
 
 
+# Directives whose values steps 1-6 of ``_preprocess_content`` have already
+# consumed; each is matched against the stripped line and commented out.
+_IF_NOT_SET_DIRECTIVE_RE = re.compile(r"^\$if\s+not\s+set\b", re.IGNORECASE)
+_SET_DIRECTIVE_RE = re.compile(r"\$set(?:global)?\b", re.IGNORECASE)
+_EVAL_DIRECTIVE_RE = re.compile(r"^\$eval\b", re.IGNORECASE)
+_MACRO_DIRECTIVE_RE = re.compile(r"\$macro\b", re.IGNORECASE)
+
+
+def _comment_out_directive(line: str, pattern: re.Pattern[str]) -> str:
+    """Replace ``line`` with a comment if its stripped text matches ``pattern``.
+
+    The original indentation is kept, so line numbers are preserved.
+    """
+    stripped = line.strip()
+    if not pattern.search(stripped):
+        return line
+    leading_ws = line[: len(line) - len(line.lstrip())]
+    return f"{leading_ws}* Stripped: {stripped}"
+
+
+def _strip_consumed_directives_lines(lines: list[str]) -> list[str]:
+    """Steps 7-9 of ``_preprocess_content`` in a single pass over the buffer.
+
+    Same result as running strip_conditional_directives, strip_set_directives,
+    strip_eval_directives and strip_macro_directives one after the other:
+    the checks are applied to each line in that order, and lines without a
+    ``$`` cannot match any of them.
+    """
+    result = []
+    for line in lines:
+        if "$" in line:
+            line = _comment_out_directive(line, _IF_NOT_SET_DIRECTIVE_RE)
+            line = _comment_out_directive(line, _SET_DIRECTIVE_RE)
+            line = _comment_out_directive(line, _EVAL_DIRECTIVE_RE)
+            line = _comment_out_directive(line, _MACRO_DIRECTIVE_RE)
+        result.append(line)
+    return result
+
+
 def strip_conditional_directives(source: str) -> str:
     """Strip $if not set directives, replacing with comments.
 
@@ -1592,22 +1788,12 @@ def strip_conditional_directives(source: str) -> str:
         - Preserves line numbers for accurate error reporting
         - Other lines remain unchanged
     """
-    lines = source.split("\n")
-    filtered = []
-
-    for line in lines:
-        stripped = line.strip()
+    return "\n".join(_strip_conditional_directives_lines(source.split("\n")))
 
-        # Check if this line contains $if not set directive (more precise)
-        if re.match(r"^\$if\s+not\s+set\b", stripped, re.IGNORECASE):
-            # Replace with comment to preserve line number, preserving original indentation
-            leading_ws = line[: len(line) - len(line.lstrip())]
-            filtered.append(f"{leading_ws}* Stripped: {stripped}")
-        else:
-            # Keep line unchanged
-            filtered.append(line)
 
-    return "\n".join(filtered)
+def _strip_conditional_directives_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``strip_conditional_directives`` (see ``_preprocess_content``)."""
+    return [_comment_out_directive(line, _IF_NOT_SET_DIRECTIVE_RE) for line in lines]
 
 
 def strip_set_directives(source: str) -> str:
@@ -1633,26 +1819,12 @@ def strip_set_directives(source: str) -> str:
         - Should be called after expand_macros() to avoid losing values
         - Also strips $if set/not set lines containing $set
     """
-    lines = source.split("\n")
-    filtered = []
+    return "\n".join(_strip_set_directives_lines(source.split("\n")))
 
-    for line in lines:
-        stripped = line.strip()
 
-        # Check if this line contains a $set/$setglobal directive (standalone or after $if)
-        # Matches: $set n 10
-        #          $setglobal solver CONOPT
-        #          $if set n $set np %n%
-        #          $if not set n $set n 10
-        if re.search(r"\$set(?:global)?\b", stripped, re.IGNORECASE):
-            # Replace with comment to preserve line number, preserving original indentation
-            leading_ws = line[: len(line) - len(line.lstrip())]
-            filtered.append(f"{leading_ws}* Stripped: {stripped}")
-        else:
-            # Keep line unchanged
-            filtered.append(line)
-
-    return "\n".join(filtered)
+def _strip_set_directives_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``strip_set_directives`` (see ``_preprocess_content``)."""
+    return [_comment_out_directive(line, _SET_DIRECTIVE_RE) for line in lines]
 
 
 def strip_macro_directives(source: str) -> str:
@@ -1676,22 +1848,15 @@ def strip_macro_directives(source: str) -> str:
         - Preserves line numbers for accurate error reporting
         - Should be called after expand_macro_calls() to avoid losing expansions
     """
-    lines = source.split("\n")
-    filtered = []
+    return "\n".join(_strip_macro_directives_lines(source.split("\n")))
 
-    for line in lines:
-        stripped = line.strip()
 
-        # Check if this line contains a $macro directive
-        if re.search(r"\$macro\b", stripped, re.IGNORECASE):
-            # Replace with comment to preserve line number, preserving original indentation
-            leading_ws = line[: len(line) - len(line.lstrip())]
-            filtered.append(f"{leading_ws}* Stripped: {stripped}")
-        else:
-            # Keep line unchanged
-            filtered.append(line)
+def _strip_macro_directives_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``strip_macro_directives`` (see ``_preprocess_content``)."""
+    return [_comment_out_directive(line, _MACRO_DIRECTIVE_RE) for line in lines]
+
 
-    return "\n".join(filtered)
+_TABLE_DECL_WITH_DESC_RE = re.compile(r"^(\s*Table\s+\w+\s*\([^)]*\))\s+(.+)$", re.IGNORECASE)
 
 
 def quote_unquoted_table_descriptions(source: str) -> str:
@@ -1709,11 +1874,14 @@ def quote_unquoted_table_descriptions(source: str) -> str:
     Only applies when the description text contains at least one '('.
     Already-quoted descriptions (starting with ' or ") are left unchanged.
     """
-    _TABLE_DECL = re.compile(r"^(\s*Table\s+\w+\s*\([^)]*\))\s+(.+)$", re.IGNORECASE)
-    lines = source.split("\n")
+    return "\n".join(_quote_unquoted_table_descriptions_lines(source.split("\n")))
+
+
+def _quote_unquoted_table_descriptions_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``quote_unquoted_table_descriptions`` (see ``_preprocess_content``)."""
     result = []
     for line in lines:
-        m = _TABLE_DECL.match(line)
+        m = _TABLE_DECL_WITH_DESC_RE.match(line)
         if m:
             prefix = m.group(1)  # "Table name(domain)"
             desc = m.group(2)  # everything after
@@ -1728,7 +1896,7 @@ def quote_unquoted_table_descriptions(source: str) -> str:
                 result.append(f"{prefix} '{escaped_desc}'{trail}")
                 continue
         result.append(line)
-    return "\n".join(result)
+    return result
 
 
 def normalize_table_continuations(source: str) -> str:
@@ -1755,7 +1923,11 @@ def normalize_table_continuations(source: str) -> str:
                col3  col4
            row1  1     2
     """
-    lines = source.split("\n")
+    return "\n".join(_normalize_table_continuations_lines(source.split("\n")))
+
+
+def _normalize_table_continuations_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``normalize_table_continuations`` (see ``_preprocess_content``)."""
     result = []
     in_table = False
 
@@ -1763,7 +1935,7 @@ def normalize_table_continuations(source: str) -> str:
         stripped = line.strip()
 
         # Check if we're starting a table
-        if re.match(r"^Table\b", stripped, re.IGNORECASE):
+        if _TABLE_START_RE.match(stripped):
             in_table = True
             result.append(line)
             continue
@@ -1793,7 +1965,7 @@ def normalize_table_continuations(source: str) -> str:
 
         result.append(line)
 
-    return "\n".join(result)
+    return result
 
 
 def normalize_multi_line_continuations(source: str) -> str:
@@ -1827,7 +1999,11 @@ def normalize_multi_line_continuations(source: str) -> str:
         - Skips lines that are comments or empty
         - Preserves original whitespace and indentation
     """
-    lines = source.split("\n")
+    return "\n".join(_normalize_multi_line_continuations_lines(source.split("\n")))
+
+
+def _normalize_multi_line_continuations_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``normalize_multi_line_continuations`` (see ``_preprocess_content``)."""
     result = []
     in_data_block = False
     in_declaration = False  # Track if we're in a Set/Parameter/Scalar/Alias block
@@ -1844,7 +2020,7 @@ def normalize_multi_line_continuations(source: str) -> str:
             continue
 
         # Track if we're entering a declaration block
-        if re.match(f"^\\s*{DECLARATION_KEYWORDS_PATTERN}", stripped, re.IGNORECASE):
+        if _DECLARATION_START_RE.match(stripped):
             in_declaration = True
 
         # Track if we're inside a /.../ data block
@@ -1858,9 +2034,7 @@ def normalize_multi_line_continuations(source: str) -> str:
 
             # Check if / appears after a declaration keyword (Set, Parameter, Scalar, Alias)
             # OR if we're currently in a declaration block (keyword was on a previous line)
-            has_keyword_before_slash = re.search(
-                DECLARATION_KEYWORDS_PATTERN, line[: line.find("/")], re.IGNORECASE
-            )
+            has_keyword_before_slash = _DECLARATION_KEYWORD_RE.search(line[: line.find("/")])
             if not has_keyword_before_slash and not in_declaration:
                 # No declaration keyword before / and not in declaration block
                 result.append(line)
@@ -1969,7 +2143,11 @@ def normalize_multi_line_continuations(source: str) -> str:
         if in_declaration and ";" in line:
             in_declaration = False
 
-    return "\n".join(result)
+    return result
+
+
+_DATA_DECLARATION_START_RE = re.compile(r"^\s*(Set|Parameter|Scalar|Alias)\b", re.IGNORECASE)
+_PLUS_IDENTIFIER_RE = re.compile(r"\b[0-9A-Za-z_][0-9A-Za-z_+-]*\+[0-9A-Za-z_+-]+\b")
 
 
 def normalize_special_identifiers(source: str) -> str:
@@ -1998,7 +2176,11 @@ def normalize_special_identifiers(source: str) -> str:
         - Detects identifiers with - or + that aren't arithmetic operators
         - Uses context: no surrounding whitespace = identifier
     """
-    lines = source.split("\n")
+    return "\n".join(_normalize_special_identifiers_lines(source.split("\n")))
+
+
+def _normalize_special_identifiers_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``normalize_special_identifiers`` (see ``_preprocess_content``)."""
     result = []
     in_data_block = False
     in_table = False
@@ -2009,14 +2191,14 @@ def normalize_special_identifiers(source: str) -> str:
         stripped = line.strip()
 
         # Check if we're starting a multi-line declaration
-        if re.match(r"^\s*(Set|Parameter|Scalar|Alias)\b", stripped, re.IGNORECASE):
+        if _DATA_DECLARATION_START_RE.match(stripped):
             in_multi_line_declaration = True
             # Check if this line also has a semicolon (single-line declaration)
             if ";" in line:
                 in_multi_line_declaration = False
 
         # Check if we're starting a table
-        if re.match(r"^Table\b", stripped, re.IGNORECASE):
+        if _TABLE_START_RE.match(stripped):
             in_table = True
             table_header_seen = False
             # Detect whether the Table declaration line has a description
@@ -2059,9 +2241,7 @@ def normalize_special_identifiers(source: str) -> str:
             if not table_header_seen and stripped:
                 table_header_seen = True
                 # Check if line contains identifier with + (always quote these)
-                has_plus_identifier = bool(
-                    re.search(r"\b[0-9A-Za-z_][0-9A-Za-z_+-]*\+[0-9A-Za-z_+-]+\b", stripped)
-                )
+                has_plus_identifier = bool(_PLUS_IDENTIFIER_RE.search(stripped))
                 if table_has_description or has_plus_identifier:
                     # Quote all special identifiers in column headers
                     processed = _quote_special_in_line(line)
@@ -2083,11 +2263,11 @@ def normalize_special_identifiers(source: str) -> str:
         if "/" in line and not in_data_block:
             # Check if this is actually a data block (not division in equations)
             # Data blocks appear after Set, Parameter, Scalar, Alias keywords
-            is_declaration = re.match(r"^\s*(Set|Parameter|Scalar|Alias)\b", line, re.IGNORECASE)
+            is_declaration = _DATA_DECLARATION_START_RE.match(line)
             if is_declaration or in_multi_line_declaration:
                 # Sprint 19 Day 11: Count only slashes outside quoted strings.
                 # A description like 'n / m' contains a slash but does NOT open a data block.
-                unquoted = re.sub(r"'[^']*'|\"[^\"]*\"", "", line)
+                unquoted = _QUOTED_STRING_RE.sub("", line)
                 slash_count = unquoted.count("/")
                 if slash_count == 1:
                     # Opening a data block
@@ -2125,7 +2305,14 @@ def normalize_special_identifiers(source: str) -> str:
         else:
             result.append(line)
 
-    return "\n".join(result)
+    return result
+
+
+_SPECIAL_IDENTIFIER_RE = re.compile(
+    r"\b((?:[a-zA-Z_][a-zA-Z0-9_]*(?:[-+][a-zA-Z0-9_]+)+)|(?:[0-9]+[-+][a-zA-Z0-9_]+(?:[-+][a-zA-Z0-9_]+)*))\b"
+)
+_NUMERIC_DOT_PREFIX_RE = re.compile(r"\b(\d+)\.(?![eE][+-]?\d)(?=[a-zA-Z_('\"])")
+_NUMERIC_DOT_SUFFIX_RE = re.compile(r"(?<=[a-zA-Z_'\"])\.(\d+)\b")
 
 
 def _quote_special_in_line(line: str) -> str:
@@ -2156,8 +2343,6 @@ def _quote_special_in_line(line: str) -> str:
     # Pattern has two alternatives:
     # 1. Letter/underscore start: [a-zA-Z_][a-zA-Z0-9_]*(?:[-+][a-zA-Z0-9_]+)+
     # 2. Number start with hyphen or plus: [0-9]+[-+][a-zA-Z0-9_]+(?:[-+][a-zA-Z0-9_]+)*
-    pattern = r"\b((?:[a-zA-Z_][a-zA-Z0-9_]*(?:[-+][a-zA-Z0-9_]+)+)|(?:[0-9]+[-+][a-zA-Z0-9_]+(?:[-+][a-zA-Z0-9_]+)*))\b"
-
     def replace_if_not_quoted(match):
         """Replace match with quoted version if not already in quotes."""
         matched_text = match.group(1)
@@ -2182,7 +2367,7 @@ def _quote_special_in_line(line: str) -> str:
         return f"'{matched_text}'"
 
     # Apply the replacement
-    processed = re.sub(pattern, replace_if_not_quoted, line)
+    processed = _SPECIAL_IDENTIFIER_RE.sub(replace_if_not_quoted, line)
 
     # Sprint 20 Day 7: Quote numeric prefixes in N.word and N.( tuple patterns
     # e.g. "1.sicartsa" -> "'1'.sicartsa", "4.(hylsa,hylsap)" -> "'4'.(hylsa,hylsap)"
@@ -2201,11 +2386,7 @@ def _quote_special_in_line(line: str) -> str:
     # Also match quoted tuple suffixes like 1.'sch-1' or 2."foo".
     # Use a lookahead so the first character after the dot is not consumed,
     # which keeps quoted suffixes intact.
-    processed = re.sub(
-        r"\b(\d+)\.(?![eE][+-]?\d)(?=[a-zA-Z_('\"])",
-        quote_numeric_dot,
-        processed,
-    )
+    processed = _NUMERIC_DOT_PREFIX_RE.sub(quote_numeric_dot, processed)
 
     # Issue #863: Quote numeric suffixes in dotted table row labels.
     # e.g., "jun.1" -> "jun.'1'", "'9000011'.oct.2" -> "'9000011'.oct.'2'"
@@ -2220,11 +2401,7 @@ def _quote_special_in_line(line: str) -> str:
             return m.group(0)
         return f".'{num}'"
 
-    processed = re.sub(
-        r"(?<=[a-zA-Z_'\"])\.(\d+)\b",
-        quote_suffix_numeric,
-        processed,
-    )
+    processed = _NUMERIC_DOT_SUFFIX_RE.sub(quote_suffix_numeric, processed)
 
     return processed
 
@@ -2250,7 +2427,11 @@ def strip_eol_comments(source: str) -> str:
     Returns:
         Source code with end-of-line comments stripped
     """
-    lines = source.split("\n")
+    return "\n".join(_strip_eol_comments_lines(source.split("\n")))
+
+
+def _strip_eol_comments_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``strip_eol_comments`` (see ``_preprocess_content``)."""
     eol_marker: str | None = None
     result: list[str] = []
 
@@ -2270,6 +2451,11 @@ def strip_eol_comments(source: str) -> str:
             result.append(line)
             continue
 
+        # A line without the marker has nothing to strip
+        if eol_marker not in line:
+            result.append(line)
+            continue
+
         # Strip eol comment, respecting quoted strings
         # Walk character by character to find the marker outside quotes
         in_single_quote = False
@@ -2309,7 +2495,26 @@ def strip_eol_comments(source: str) -> str:
         else:
             result.append(line)
 
-    return "\n".join(result)
+    return result
+
+
+# Words that start a new statement rather than continue a multi-line equation
+_STATEMENT_START_KEYWORDS = frozenset(
+    BLOCK_KEYWORDS
+    + [
+        "model",
+        "solve",
+        "display",
+        "abort",
+        "option",
+        "if",
+        "loop",
+        "while",
+        "for",
+        "equation",
+        "equations",
+    ]
+)
 
 
 def join_multiline_equations(source: str) -> str:
@@ -2354,7 +2559,11 @@ def join_multiline_equations(source: str) -> str:
           This is acceptable because comments in the middle of equations are
           rare in practice, and the comment content is preserved.
     """
-    lines = source.split("\n")
+    return "\n".join(_join_multiline_equations_lines(source.split("\n")))
+
+
+def _join_multiline_equations_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``join_multiline_equations`` (see ``_preprocess_content``)."""
     result: list[str] = []
     in_equation = False
     equation_buffer: list[str] = []
@@ -2435,26 +2644,7 @@ def join_multiline_equations(source: str) -> str:
                     # Check if it looks like an expression continuation (not a new statement)
                     # New statements typically start with keywords
                     # Only check keyword membership if first_word exists to avoid false positives
-                    or (
-                        first_word
-                        and first_word
-                        not in (
-                            BLOCK_KEYWORDS
-                            + [
-                                "model",
-                                "solve",
-                                "display",
-                                "abort",
-                                "option",
-                                "if",
-                                "loop",
-                                "while",
-                                "for",
-                                "equation",
-                                "equations",
-                            ]
-                        )
-                    )
+                    or (first_word and first_word not in _STATEMENT_START_KEYWORDS)
                 )
 
                 if is_continuation:
@@ -2475,7 +2665,7 @@ def join_multiline_equations(source: str) -> str:
         joined = " ".join(equation_buffer)
         result.append(joined)
 
-    return "\n".join(result)
+    return result
 
 
 def join_multiline_assignments(source: str) -> str:
@@ -2509,7 +2699,11 @@ def join_multiline_assignments(source: str) -> str:
         - Stops joining when parentheses are balanced AND line ends with semicolon
         - Does not process lines that look like equation definitions (contain ..)
     """
-    lines = source.split("\n")
+    return "\n".join(_join_multiline_assignments_lines(source.split("\n")))
+
+
+def _join_multiline_assignments_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``join_multiline_assignments`` (see ``_preprocess_content``)."""
     result: list[str] = []
     in_continuation = False
     # Store tuples of (original_line, stripped_line) so we can join stripped
@@ -2641,7 +2835,7 @@ def join_multiline_assignments(source: str) -> str:
         for orig, _ in continuation_buffer:
             result.append(orig)
 
-    return "\n".join(result)
+    return result
 
 
 def insert_missing_semicolons(source: str) -> str:
@@ -2669,12 +2863,12 @@ def insert_missing_semicolons(source: str) -> str:
         >>> result = insert_missing_semicolons(source)
         >>> # Result has semicolon inserted before 'variables'
     """
-    lines = source.split("\n")
-    result = []
+    return "\n".join(_insert_missing_semicolons_lines(source.split("\n")))
+
 
-    # Build regex pattern for block keywords at start of line (case-insensitive)
-    # Pattern matches: optional whitespace, then keyword, then word boundary
-    block_keyword_pattern = re.compile(r"^\s*(" + "|".join(BLOCK_KEYWORDS) + r")\b", re.IGNORECASE)
+def _insert_missing_semicolons_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``insert_missing_semicolons`` (see ``_preprocess_content``)."""
+    result = []
 
     # Track if we need to insert a semicolon
     last_content_line_idx = -1  # Index of last non-empty, non-comment line
@@ -2695,7 +2889,7 @@ def insert_missing_semicolons(source: str) -> str:
             continue
 
         # Check if this line starts with a block keyword
-        if block_keyword_pattern.match(stripped):
+        if _BLOCK_KEYWORD_START_RE.match(stripped):
             # Check if we need to insert a semicolon before this line
             if last_content_line_idx >= 0:
                 last_line = result[last_content_line_idx]
@@ -2708,7 +2902,7 @@ def insert_missing_semicolons(source: str) -> str:
         result.append(line)
         last_content_line_idx = i
 
-    return "\n".join(result)
+    return result
 
 
 def join_multiline_table_row_parens(source: str) -> str:
@@ -2724,7 +2918,11 @@ def join_multiline_table_row_parens(source: str) -> str:
 
     Must run before expand_tuple_only_table_rows.
     """
-    lines = source.split("\n")
+    return "\n".join(_join_multiline_table_row_parens_lines(source.split("\n")))
+
+
+def _join_multiline_table_row_parens_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``join_multiline_table_row_parens`` (see ``_preprocess_content``)."""
     result: list[str] = []
     in_table = False
     table_header_seen = False
@@ -2735,7 +2933,7 @@ def join_multiline_table_row_parens(source: str) -> str:
     for line in lines:
         stripped = line.strip()
 
-        if re.match(r"^Table\b", stripped, re.IGNORECASE):
+        if _TABLE_START_RE.match(stripped):
             in_table = True
             table_header_seen = False
             is_first_line_after_decl = True
@@ -2750,9 +2948,7 @@ def join_multiline_table_row_parens(source: str) -> str:
                 result.append(line)
                 continue
 
-            if stripped and re.match(
-                r"^(?:" + "|".join(BLOCK_KEYWORDS) + r")\b", stripped, re.IGNORECASE
-            ):
+            if stripped and _BLOCK_KEYWORD_START_RE.match(stripped):
                 in_table = False
                 result.append(line)
                 continue
@@ -2764,13 +2960,13 @@ def join_multiline_table_row_parens(source: str) -> str:
                 if accumulating:
                     accum_lines.append(line)
                     # Check for unquoted closing paren
-                    unquoted = re.sub(r"'[^']*'|\"[^\"]*\"", "", line)
+                    unquoted = _QUOTED_STRING_RE.sub("", line)
                     if ")" in unquoted:
                         # Join all accumulated lines
                         joined = " ".join(al.strip() for al in accum_lines)
                         # Find closing paren outside quotes
-                        joined_unquoted = re.sub(
-                            r"'[^']*'|\"[^\"]*\"", lambda m: " " * len(m.group()), joined
+                        joined_unquoted = _QUOTED_STRING_RE.sub(
+                            lambda m: " " * len(m.group()), joined
                         )
                         if ")" not in joined_unquoted:
                             # No unquoted closing paren in joined string — keep accumulating
@@ -2802,7 +2998,7 @@ def join_multiline_table_row_parens(source: str) -> str:
                         continue
                     continue
 
-                unquoted_start = re.sub(r"'[^']*'|\"[^\"]*\"", "", stripped)
+                unquoted_start = _QUOTED_STRING_RE.sub("", stripped)
                 if stripped.startswith("(") and ")" not in unquoted_start:
                     # Start of multi-line parenthesized group
                     accumulating = True
@@ -2816,7 +3012,7 @@ def join_multiline_table_row_parens(source: str) -> str:
     # Flush any remaining accumulated lines
     result.extend(accum_lines)
 
-    return "\n".join(result)
+    return result
 
 
 def expand_table_column_groups(source: str) -> str:
@@ -2846,7 +3042,11 @@ def expand_table_column_groups(source: str) -> str:
     a grouped header will populate only the first expanded column while the
     others default to 0.0 in the current implementation.
     """
-    lines = source.split("\n")
+    return "\n".join(_expand_table_column_groups_lines(source.split("\n")))
+
+
+def _expand_table_column_groups_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``expand_table_column_groups`` (see ``_preprocess_content``)."""
     result = []
     in_table = False
 
@@ -2854,16 +3054,12 @@ def expand_table_column_groups(source: str) -> str:
     saw_table_decl = False
     for line in lines:
         stripped = line.strip()
-        if re.match(r"^table\b", stripped, re.IGNORECASE):
+        if _TABLE_START_RE.match(stripped):
             in_table = True
             saw_table_decl = True
             table_header_line = False
         elif in_table and stripped and not stripped.startswith("*"):
-            if re.match(
-                r"^(?:" + "|".join(BLOCK_KEYWORDS) + r")\b",
-                stripped,
-                re.IGNORECASE,
-            ):
+            if _BLOCK_KEYWORD_START_RE.match(stripped):
                 in_table = False
                 saw_table_decl = False
                 table_header_line = False
@@ -2910,7 +3106,36 @@ def expand_table_column_groups(source: str) -> str:
 
         result.append(line)
 
-    return "\n".join(result)
+    return result
+
+
+# Pattern: optional whitespace, then ( elem1, elem2, ... ), then rest of line
+# elem can be SET_ELEMENT_ID (alphanumeric + hyphens) or GAMS STRING ('...' with '' escapes)
+# GAMS uses '' (double single-quote) as the escape for a literal single-quote inside strings.
+_TUPLE_ELEM = r"(?:'(?:[^']|'')*'|[A-Za-z0-9_][A-Za-z0-9_\-]*)"
+_TUPLE_ROW_RE = re.compile(
+    r"^(\s*)"  # group 1: leading indent
+    r"\(("  # literal ( then group 2: element list
+    + _TUPLE_ELEM
+    + r"(?:\s*,\s*"
+    + _TUPLE_ELEM
+    + r")*"
+    + r")\)"  # end group 2 and )
+    r"(\s*.*)$",  # group 3: rest of line (values)
+    re.IGNORECASE,
+)
+# Quote-aware element splitter: splits on commas outside of single-quoted strings
+_TUPLE_ELEM_SPLIT_RE = re.compile(r"'(?:[^']|'')*'|[^,]+")
+
+
+def _split_tuple_elements(elem_list_str: str) -> list[str]:
+    """Split a comma-separated element list, respecting GAMS quoted strings."""
+    parts = []
+    for m in _TUPLE_ELEM_SPLIT_RE.finditer(elem_list_str):
+        token = m.group(0).strip()
+        if token and token != ",":
+            parts.append(token)
+    return parts
 
 
 def expand_tuple_only_table_rows(source: str) -> str:
@@ -2935,34 +3160,11 @@ def expand_tuple_only_table_rows(source: str) -> str:
     equivalent to the grammar's tuple_label rule, and avoids the grammar ambiguity
     with Table domain declarations like 'Table t(i,j)'.
     """
-    # Pattern: optional whitespace, then ( elem1, elem2, ... ), then rest of line
-    # elem can be SET_ELEMENT_ID (alphanumeric + hyphens) or GAMS STRING ('...' with '' escapes)
-    # GAMS uses '' (double single-quote) as the escape for a literal single-quote inside strings.
-    _ELEM = r"(?:'(?:[^']|'')*'|[A-Za-z0-9_][A-Za-z0-9_\-]*)"
-    _TUPLE_ROW = re.compile(
-        r"^(\s*)"  # group 1: leading indent
-        r"\(("  # literal ( then group 2: element list
-        + _ELEM
-        + r"(?:\s*,\s*"
-        + _ELEM
-        + r")*"
-        + r")\)"  # end group 2 and )
-        r"(\s*.*)$",  # group 3: rest of line (values)
-        re.IGNORECASE,
-    )
-    # Quote-aware element splitter: splits on commas outside of single-quoted strings
-    _SPLIT_ELEM = re.compile(r"'(?:[^']|'')*'|[^,]+")
-
-    def _split_elements(elem_list_str: str) -> list[str]:
-        """Split a comma-separated element list, respecting GAMS quoted strings."""
-        parts = []
-        for m in _SPLIT_ELEM.finditer(elem_list_str):
-            token = m.group(0).strip()
-            if token and token != ",":
-                parts.append(token)
-        return parts
+    return "\n".join(_expand_tuple_only_table_rows_lines(source.split("\n")))
 
-    lines = source.split("\n")
+
+def _expand_tuple_only_table_rows_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``expand_tuple_only_table_rows`` (see ``_preprocess_content``)."""
     result = []
     in_table = False
     table_header_seen = False
@@ -2971,7 +3173,7 @@ def expand_tuple_only_table_rows(source: str) -> str:
     for line in lines:
         stripped = line.strip()
 
-        if re.match(r"^Table\b", stripped, re.IGNORECASE):
+        if _TABLE_START_RE.match(stripped):
             in_table = True
             table_header_seen = False
             is_first_line_after_decl = True
@@ -2989,9 +3191,7 @@ def expand_tuple_only_table_rows(source: str) -> str:
 
             # If a new block keyword starts without a semicolon, terminate the table.
             # This prevents subsequent declaration lines from being misread as table rows.
-            if stripped and re.match(
-                r"^(?:" + "|".join(BLOCK_KEYWORDS) + r")\b", stripped, re.IGNORECASE
-            ):
+            if stripped and _BLOCK_KEYWORD_START_RE.match(stripped):
                 in_table = False
                 result.append(line)
                 continue
@@ -3012,13 +3212,13 @@ def expand_tuple_only_table_rows(source: str) -> str:
                 stripped_no_semi = stripped
 
             if table_header_seen and stripped_no_semi:
-                m = _TUPLE_ROW.match(line_no_semi)
+                m = _TUPLE_ROW_RE.match(line_no_semi)
                 if m:
                     indent = m.group(1)
                     elem_list_str = m.group(2)
                     rest = m.group(3)
                     # Parse elements: use quote-aware splitter to handle 'a,b' strings
-                    raw_elems = _split_elements(elem_list_str)
+                    raw_elems = _split_tuple_elements(elem_list_str)
                     for i_elem, elem in enumerate(raw_elems):
                         # Only append semicolon to the last expanded row if this was last line
                         if is_last_line and i_elem == len(raw_elems) - 1:
@@ -3028,14 +3228,14 @@ def expand_tuple_only_table_rows(source: str) -> str:
                     continue
 
             if is_last_line and not (
-                table_header_seen and stripped_no_semi and _TUPLE_ROW.match(line_no_semi)
+                table_header_seen and stripped_no_semi and _TUPLE_ROW_RE.match(line_no_semi)
             ):
                 result.append(line)
                 continue
 
         result.append(line)
 
-    return "\n".join(result)
+    return result
 
 
 def _expand_gams_range(start: str, end: str) -> list[str]:
@@ -3244,6 +3444,9 @@ def _needs_multi_segment_expansion(label: str) -> bool:
     return False
 
 
+_ROW_LABEL_SPLIT_RE = re.compile(r"^(\s*)(\S+)(.*)")
+
+
 def expand_multi_segment_tuple_row_labels(source: str) -> str:
     """Expand table row labels with tuple groups at any dot-segment position.
 
@@ -3260,7 +3463,11 @@ def expand_multi_segment_tuple_row_labels(source: str) -> str:
     Only operates inside Table blocks. Row labels that don't contain
     tuple groups (no '(.*)' in dot-path position) are passed through unchanged.
     """
-    lines = source.split("\n")
+    return "\n".join(_expand_multi_segment_tuple_row_labels_lines(source.split("\n")))
+
+
+def _expand_multi_segment_tuple_row_labels_lines(lines: list[str]) -> list[str]:
+    """Line-buffer form of ``expand_multi_segment_tuple_row_labels`` (see ``_preprocess_content``)."""
     result = []
     in_table = False
     table_header_seen = False
@@ -3269,7 +3476,7 @@ def expand_multi_segment_tuple_row_labels(source: str) -> str:
     for line in lines:
         stripped = line.strip()
 
-        if re.match(r"^Table\b", stripped, re.IGNORECASE):
+        if _TABLE_START_RE.match(stripped):
             in_table = True
             table_header_seen = False
             is_first_line_after_decl = True
@@ -3285,9 +3492,7 @@ def expand_multi_segment_tuple_row_labels(source: str) -> str:
                 continue
 
             # Terminate on block keyword without semicolon
-            if stripped and re.match(
-                r"^(?:" + "|".join(BLOCK_KEYWORDS) + r")\b", stripped, re.IGNORECASE
-            ):
+            if stripped and _BLOCK_KEYWORD_START_RE.match(stripped):
                 in_table = False
                 result.append(line)
                 continue
@@ -3309,7 +3514,7 @@ def expand_multi_segment_tuple_row_labels(source: str) -> str:
                 # Extract the row label — everything before the first run of whitespace+number
                 # The label is the leading non-space part, values follow whitespace
                 # Match: optional indent, then the label (up to first whitespace-number sequence)
-                m = re.match(r"^(\s*)(\S+)(.*)", line_no_semi)
+                m = _ROW_LABEL_SPLIT_RE.match(line_no_semi)
                 if m:
                     indent = m.group(1)
                     label = m.group(2)
@@ -3339,7 +3544,7 @@ def expand_multi_segment_tuple_row_labels(source: str) -> str:
 
         result.append(line)
 
-    return "\n".join(result)
+    return result
 
 
 def normalize_double_commas(source: str) -> str:
@@ -3366,6 +3571,9 @@ def normalize_double_commas(source: str) -> str:
         - Runs before full parsing, using a simple single-quote aware scan to respect
           string boundaries
     """
+    if ",," not in source:
+        return source
+
     # Perform a single-pass scan, collapsing comma runs only outside of strings.
     result: list[str] = []
     in_string = False
@@ -3416,7 +3624,7 @@ def _is_include_directive(line: str) -> bool:
     """
     # Check if line is already a comment
     stripped = line.lstrip()
-    if stripped.startswith("*"):
+    if stripped.startswith("*") or "$" not in line:
         return False
 
     # Scan through the line, tracking whether we're inside quotes
@@ -3506,6 +3714,11 @@ def _strip_include_directives(source: str) -> str:
     return "\n".join(result)
 
 
+# A line starting a Table statement, in the whole (unsplit) source
+_TABLE_LINE_RE = re.compile(r"^[^\S\n]*Table\b", re.IGNORECASE | re.MULTILINE)
+_ABORT_NOERROR_RE = re.compile(r"\babort\.noerror\b", re.IGNORECASE)
+
+
 def _preprocess_content(content: str) -> str:
     """Shared preprocessing pipeline for GAMS content.
 
@@ -3583,84 +3796,89 @@ def _preprocess_content(content: str) -> str:
     # Replace fx(t('1')) with sin(t('1')) * cos(t('1')-t('1')*t('1'))
     content = expand_macro_calls(content, macro_defs)
 
-    # Step 7: Strip $if not set directives (replaced with comments)
-    content = strip_conditional_directives(content)
+    # Steps 7-16 rewrite the source line by line. They share one line buffer
+    # (a list of lines without their "\n") instead of each splitting and
+    # re-joining the whole source; the result is byte-identical to calling
+    # the public str -> str functions one after the other.
+    lines = content.split("\n")
 
-    # Step 8: Strip $set directives (replaced with comments)
-    content = strip_set_directives(content)
+    # The table-only steps (11c, 12, 15a-15d) leave sources without a Table
+    # statement unchanged. None of the steps before them creates a line
+    # starting with "Table", so this check can be done up front.
+    has_tables = _TABLE_LINE_RE.search(content) is not None
 
-    # Step 8b: Strip $eval directives (Sprint 21 Day 3)
-    content = strip_eval_directives(content)
-
-    # Step 9: Strip $macro directives (replaced with comments)
-    content = strip_macro_directives(content)
+    # Steps 7-9: Strip $if not set, $set, $eval and $macro directives
+    # (replaced with comments), fused into a single pass
+    lines = _strip_consumed_directives_lines(lines)
 
     # Step 9b: Strip end-of-line comments defined by $eolCom directive (Issue #722)
     # This must happen BEFORE strip_unsupported_directives (which strips the
     # $eolCom directive itself) and BEFORE multiline joining (which would embed
     # comment text into the middle of joined expressions).
-    content = strip_eol_comments(content)
+    lines = _strip_eol_comments_lines(lines)
 
     # Step 10: Strip other unsupported directives ($title, $ontext, etc.)
-    content = strip_unsupported_directives(content)
+    lines = _strip_unsupported_directives_lines(lines)
 
     # Step 10b: Normalize abort.noerror to abort (Issue #891)
     # abort.noerror suppresses the error exit in GAMS — since we mock abort,
     # just strip the .noerror suffix so the grammar can parse it.
-    content = re.sub(r"\babort\.noerror\b", "abort", content, flags=re.IGNORECASE)
+    lines = [_ABORT_NOERROR_RE.sub("abort", line) if "." in line else line for line in lines]
 
     # Step 11: Join multi-line equations into single lines
     # This must happen before table continuation normalization to avoid
     # confusing equation continuation with table continuation markers
-    content = join_multiline_equations(content)
+    lines = _join_multiline_equations_lines(lines)
 
     # Step 11b: Join multi-line assignments into single lines (Issue #636)
     # This handles parameter/scalar assignments that span multiple lines
     # due to unbalanced parentheses, like:
     #   at(it) = xd0(it)/(gamma(it)*e0(it)**rhot(it) + (1 - gamma(it))
     #          * xxd0(it)**rhot(it))**(1/rhot(it));
-    content = join_multiline_assignments(content)
+    lines = _join_multiline_assignments_lines(lines)
 
-    # Step 11c: Quote unquoted table descriptions with parentheses
-    # e.g., Table t(i,j) desc text (units) → Table t(i,j) 'desc text (units)'
-    content = quote_unquoted_table_descriptions(content)
+    if has_tables:
+        # Step 11c: Quote unquoted table descriptions with parentheses
+        # e.g., Table t(i,j) desc text (units) → Table t(i,j) 'desc text (units)'
+        lines = _quote_unquoted_table_descriptions_lines(lines)
 
-    # Step 12: Remove table continuation markers (+)
-    content = normalize_table_continuations(content)
+        # Step 12: Remove table continuation markers (+)
+        lines = _normalize_table_continuations_lines(lines)
 
     # Step 13: Normalize multi-line continuations (add missing commas)
-    content = normalize_multi_line_continuations(content)
+    lines = _normalize_multi_line_continuations_lines(lines)
 
     # Step 14: Insert missing semicolons before block keywords
     # This fixes issue #418 where variables from include files weren't recognized
     # because previous blocks (sets, parameters) were missing semicolons
-    content = insert_missing_semicolons(content)
+    lines = _insert_missing_semicolons_lines(lines)
 
     # Step 15: Quote identifiers with special characters (-, +) in data blocks
-    content = normalize_special_identifiers(content)
+    lines = _normalize_special_identifiers_lines(lines)
 
-    # Step 15a: Join multi-line parenthesized table row labels onto one line
-    # e.g., "(ground\n chips ) 40 55;" → "(ground, chips) 40 55;"
-    # Must run before expand_tuple_only_table_rows
-    content = join_multiline_table_row_parens(content)
+    if has_tables:
+        # Step 15a: Join multi-line parenthesized table row labels onto one line
+        # e.g., "(ground\n chips ) 40 55;" → "(ground, chips) 40 55;"
+        # Must run before expand_tuple_only_table_rows
+        lines = _join_multiline_table_row_parens_lines(lines)
 
-    # Step 15b: Expand (a,b,c) tuple-only row labels in tables
-    # Must run after normalize_special_identifiers (which quotes hyphenated IDs)
-    content = expand_tuple_only_table_rows(content)
+        # Step 15b: Expand (a,b,c) tuple-only row labels in tables
+        # Must run after normalize_special_identifiers (which quotes hyphenated IDs)
+        lines = _expand_tuple_only_table_rows_lines(lines)
 
-    # Step 15c: Expand multi-segment tuple row labels: a.(b,c).d, a.b.(c*e), etc.
-    # Must run after 15b (tuple-only labels already handled, this handles the rest)
-    content = expand_multi_segment_tuple_row_labels(content)
+        # Step 15c: Expand multi-segment tuple row labels: a.(b,c).d, a.b.(c*e), etc.
+        # Must run after 15b (tuple-only labels already handled, this handles the rest)
+        lines = _expand_multi_segment_tuple_row_labels_lines(lines)
 
-    # Step 15d: Expand parenthesized column groups in table headers
-    # e.g., (chickpea,drybean,lentil) → chickpea  drybean  lentil
-    # Must run AFTER multi-segment row label expansion (15c) to avoid
-    # rewriting (a,b) patterns in row labels.
-    content = expand_table_column_groups(content)
+        # Step 15d: Expand parenthesized column groups in table headers
+        # e.g., (chickpea,drybean,lentil) → chickpea  drybean  lentil
+        # Must run AFTER multi-segment row label expansion (15c) to avoid
+        # rewriting (a,b) patterns in row labels.
+        lines = _expand_table_column_groups_lines(lines)
 
     # Step 16: Normalize double commas to single commas (Issue #565)
     # This must happen after all other data normalization
-    return normalize_double_commas(content)
+    return normalize_double_commas("\n".join(lines))
 
 
 def preprocess_gams_file(file_path: Path | str) -> str:
@@ -3672,6 +3890,10 @@ def preprocess_gams_file(file_path: Path | str) -> str:
     2. Expand $batInclude directives with argument substitution
     3. Run _preprocess_content() (macro/conditional expansion, stripping, normalization)
 
+    The result is cached on disk keyed by the contents of the file and of
+    every file it includes (see ``preprocess_cache``), so an unchanged model
+    is only preprocessed once.
+
     Args:
         file_path: Path to the GAMS file (Path object or string)
 
@@ -3690,16 +3912,42 @@ def preprocess_gams_file(file_path: Path | str) -> str:
     if isinstance(file_path, str):
         file_path = Path(file_path)
 
+    cached = preprocess_cache.load_preprocessed(file_path)
+    if cached is not None:
+        return cached
+    dependencies: preprocess_cache.IncludeClosure = {}
+
     # Step 1: Expand all $include directives recursively
-    content = preprocess_includes(file_path)
+    content = preprocess_includes(file_path, _dependencies=dependencies)
 
     # Step 2: Expand $batInclude directives with argument substitution
     # This must happen after regular includes so that $batInclude can reference
     # files that were themselves included via $include
-    content = preprocess_bat_includes(file_path, content)
+    content = preprocess_bat_includes(file_path, content, _dependencies=dependencies)
 
     # Step 3: Shared preprocessing pipeline (macro/conditional expansion, stripping, normalization)
-    return _preprocess_content(content)
+    result = _preprocess_content(content)
+    preprocess_cache.store_preprocessed(file_path, dependencies, result)
+    return result
+
+
+def include_closure(file_path: Path | str) -> preprocess_cache.IncludeClosure:
+    """Return every file ``file_path`` pulls in, with the digest of its contents.
+
+    Expands ``$include`` and ``$batInclude`` exactly as preprocess_gams_file()
+    does, without running the rest of the pipeline. A ``$batInclude`` target
+    that does not exist maps to None.
+
+    Raises:
+        FileNotFoundError: If the file or an ``$include``d file doesn't exist
+        CircularIncludeError: If a circular include is detected
+        IncludeDepthExceededError: If nesting exceeds 100 levels
+    """
+    file_path = Path(file_path)
+    dependencies: preprocess_cache.IncludeClosure = {}
+    content = preprocess_includes(file_path, _dependencies=dependencies)
+    preprocess_bat_includes(file_path, content, _dependencies=dependencies)
+    return dependencies
 
 
 def preprocess_text(source: str) -> str:
@@ -3731,3 +3979,32 @@ def preprocess_text(source: str) -> str:
     # This prevents double-wrapping of lines (e.g., Excluded: Stripped: ...) while
     # still ensuring unresolved include directives don't reach the parser.
     return _strip_include_directives(content)
+
+
+def normalize_for_parser(source: str) -> str:
+    """Apply the data-block normalizations ``parse_text`` relies on.
+
+    ``parse_text`` also accepts raw GAMS source that never went through
+    ``preprocess_gams_file``/``preprocess_text``, so it re-applies these steps
+    itself. The result is the same as calling normalize_multi_line_continuations,
+    normalize_double_commas, normalize_special_identifiers,
+    join_multiline_table_row_parens, expand_tuple_only_table_rows and
+    expand_multi_segment_tuple_row_labels in that order, but the source is
+    split into lines only once.
+
+    Args:
+        source: GAMS source code, preprocessed or not
+
+    Returns:
+        Normalized source code
+    """
+    lines = _normalize_multi_line_continuations_lines(source.split("\n"))
+    if any(",," in line for line in lines):
+        # Its quote tracking carries over from line to line, so run it on the text
+        lines = normalize_double_commas("\n".join(lines)).split("\n")
+    lines = _normalize_special_identifiers_lines(lines)
+    if _TABLE_LINE_RE.search(source) is not None:
+        lines = _join_multiline_table_row_parens_lines(lines)
+        lines = _expand_tuple_only_table_rows_lines(lines)
+        lines = _expand_multi_segment_tuple_row_labels_lines(lines)
+    return "\n".join(lines)
@@ -157,7 +157,9 @@ class SimplificationPipeline:
         """Measure the size of an expression.
 
         Size is measured as the number of AST nodes. This is a simple metric
-        that roughly correlates with complexity and evaluation cost.
+        that roughly correlates with complexity and evaluation cost. The count
+        is cached on each node, so re-measuring after a pass only walks the
+        nodes the pass created.
 
         Args:
             expr: Expression to measure
@@ -165,45 +167,4 @@ class SimplificationPipeline:
         Returns:
             Number of nodes in the expression tree
         """
-        # Import here to avoid circular dependency
-        from src.ir.ast import (
-            Binary,
-            Call,
-            CompileTimeConstant,
-            Const,
-            EquationRef,
-            IndexOffset,
-            MultiplierRef,
-            ParamRef,
-            Prod,
-            Sum,
-            SymbolRef,
-            Unary,
-            VarRef,
-        )
-
-        # Leaf nodes (constants and references) - size 1
-        if isinstance(
-            expr,
-            (Const, SymbolRef, VarRef, ParamRef, EquationRef, MultiplierRef, CompileTimeConstant),
-        ):
-            return 1
-        # Unary operations - 1 + child size
-        elif isinstance(expr, Unary):
-            return 1 + self._expression_size(expr.child)
-        # Binary operations - 1 + left + right
-        elif isinstance(expr, Binary):
-            return 1 + self._expression_size(expr.left) + self._expression_size(expr.right)
-        # Function calls - 1 + sum of argument sizes
-        elif isinstance(expr, Call):
-            return 1 + sum(self._expression_size(arg) for arg in expr.args)
-        # Sum/Prod expression - 1 + body size + optional condition size
-        elif isinstance(expr, (Sum, Prod)):
-            cond_size = self._expression_size(expr.condition) if expr.condition is not None else 0
-            return 1 + self._expression_size(expr.body) + cond_size
-        # Index offset - 1 + offset size
-        elif isinstance(expr, IndexOffset):
-            return 1 + self._expression_size(expr.offset)
-        else:
-            # Unknown expression type - should not happen
-            return 1
+        return expr.node_count()
@@ -60,7 +60,7 @@ def nested_cse(expr: Expr, min_occurrences: int = 3) -> tuple[Expr, dict[str, Ex
         >>> # result references t1, temps = {"t1": x+y}
     """
     # Step 1: Collect subexpressions with counts
-    subexpr_counts: dict[str, tuple[Expr, int]] = {}
+    subexpr_counts: dict[Expr, tuple[Expr, int]] = {}
     _collect_subexpressions(expr, subexpr_counts)
 
     # Step 2 & 3: Filter candidates and build dependency graph
@@ -130,7 +130,7 @@ def multiplicative_cse(expr: Expr, min_occurrences: int = 4) -> tuple[Expr, dict
         >>> # result uses m1 for x*y, temps = {"m1": x*y}
     """
     # Step 1: Collect multiplication subexpressions with counts
-    mult_counts: dict[str, tuple[Expr, int]] = {}
+    mult_counts: dict[Expr, tuple[Expr, int]] = {}
     _collect_multiplicative_subexpressions(expr, mult_counts)
 
     # Step 2: Filter candidates by occurrence threshold and cost savings
@@ -167,15 +167,15 @@ def multiplicative_cse(expr: Expr, min_occurrences: int = 4) -> tuple[Expr, dict
     return result_expr, temps
 
 
-def _collect_subexpressions(expr: Expr, counts: dict[str, tuple[Expr, int]]) -> None:
+def _collect_subexpressions(expr: Expr, counts: dict[Expr, tuple[Expr, int]]) -> None:
     """Collect all subexpressions with occurrence counts.
 
     Args:
         expr: Expression to traverse
         counts: Dictionary to populate with {expr_key: (expr, count)}
     """
-    # Generate a key for this expression
-    key = _expression_key(expr)
+    # Structurally equal subexpressions share a key (the expression itself)
+    key = expr
 
     # Update count
     if key in counts:
@@ -198,7 +198,9 @@ def _collect_subexpressions(expr: Expr, counts: dict[str, tuple[Expr, int]]) ->
         _collect_subexpressions(expr.body, counts)
 
 
-def _collect_multiplicative_subexpressions(expr: Expr, counts: dict[str, tuple[Expr, int]]) -> None:
+def _collect_multiplicative_subexpressions(
+    expr: Expr, counts: dict[Expr, tuple[Expr, int]]
+) -> None:
     """Collect only multiplication subexpressions with occurrence counts.
 
     Args:
@@ -207,7 +209,7 @@ def _collect_multiplicative_subexpressions(expr: Expr, counts: dict[str, tuple[E
     """
     # Only count multiplication expressions
     if isinstance(expr, Binary) and expr.op == "*":
-        key = _expression_key(expr)
+        key = expr
         if key in counts:
             counts[key] = (expr, counts[key][1] + 1)
         else:
@@ -228,43 +230,20 @@ def _collect_multiplicative_subexpressions(expr: Expr, counts: dict[str, tuple[E
         _collect_multiplicative_subexpressions(expr.body, counts)
 
 
-def _expression_key(expr: Expr) -> str:
-    """Generate a unique string key for an expression.
+def _same_expr(a: Expr, b: Expr) -> bool:
+    """Check whether two expressions are structurally identical.
 
-    Uses structural representation to identify identical subexpressions.
+    Nodes cache their structural hash, so comparing hashes first rejects
+    almost every mismatch without walking either tree.
 
     Args:
-        expr: Expression to generate key for
+        a: First expression
+        b: Second expression
 
     Returns:
-        Unique string key
+        True if the expressions are structurally equal
     """
-    if isinstance(expr, Const):
-        return f"Const({expr.value})"
-    elif isinstance(expr, SymbolRef):
-        return f"SymbolRef({expr.name})"
-    elif isinstance(expr, VarRef):
-        return f"VarRef({expr.name},{repr(expr.indices)})"
-    elif isinstance(expr, Binary):
-        left_key = _expression_key(expr.left)
-        right_key = _expression_key(expr.right)
-        return f"Binary({expr.op},{left_key},{right_key})"
-    elif isinstance(expr, Call):
-        args_keys = ",".join(_expression_key(arg) for arg in expr.args)
-        return f"Call({expr.func},{args_keys})"
-    elif isinstance(expr, Unary):
-        child_key = _expression_key(expr.child)
-        return f"Unary({expr.op},{child_key})"
-    elif isinstance(expr, Sum):
-        body_key = _expression_key(expr.body)
-        cond_key = _expression_key(expr.condition) if expr.condition is not None else "None"
-        return f"Sum({expr.index_sets},{body_key},{cond_key})"
-    elif isinstance(expr, Prod):
-        body_key = _expression_key(expr.body)
-        cond_key = _expression_key(expr.condition) if expr.condition is not None else "None"
-        return f"Prod({expr.index_sets},{body_key},{cond_key})"
-    else:
-        return f"{type(expr).__name__}({id(expr)})"
+    return a is b or (hash(a) == hash(b) and a == b)
 
 
 def _is_cse_candidate(expr: Expr) -> bool:
@@ -289,8 +268,8 @@ def _is_cse_candidate(expr: Expr) -> bool:
 
 
 def _topological_sort_candidates(
-    candidates: dict[str, tuple[Expr, int]],
-) -> list[tuple[str, tuple[Expr, int]]]:
+    candidates: dict[Expr, tuple[Expr, int]],
+) -> list[tuple[Expr, tuple[Expr, int]]]:
     """Sort CSE candidates by dependency order (innermost first).
 
     Ensures that nested subexpressions are extracted before their containers.
@@ -302,7 +281,7 @@ def _topological_sort_candidates(
         List of (key, (expr, count)) tuples sorted by dependencies
     """
     # Build dependency graph: expr -> [exprs that contain it]
-    dependencies: dict[str, list[str]] = defaultdict(list)
+    dependencies: dict[Expr, list[Expr]] = defaultdict(list)
 
     for key, (expr, _count) in candidates.items():
         # Find which other candidates contain this expression
@@ -311,10 +290,10 @@ def _topological_sort_candidates(
                 dependencies[key].append(other_key)
 
     # Topological sort using DFS
-    visited: set[str] = set()
-    result: list[tuple[str, tuple[Expr, int]]] = []
+    visited: set[Expr] = set()
+    result: list[tuple[Expr, tuple[Expr, int]]] = []
 
-    def visit(key: str) -> None:
+    def visit(key: Expr) -> None:
         if key in visited:
             return
         visited.add(key)
@@ -347,7 +326,7 @@ def _contains_subexpression(container: Expr, target: Expr) -> bool:
     Returns:
         True if target is found as a subexpression of container (including if they're the same)
     """
-    if _expression_key(container) == _expression_key(target):
+    if _same_expr(container, target):
         return True
 
     if isinstance(container, Binary):
@@ -378,7 +357,7 @@ def _replace_subexpression(expr: Expr, target: Expr, replacement: Expr) -> Expr:
         Transformed expression
     """
     # Check if this expression matches the target
-    if _expression_key(expr) == _expression_key(target):
+    if _same_expr(expr, target):
         return replacement
 
     # Recursively replace in subexpressions
@@ -453,20 +432,20 @@ def cse_with_aliasing(
         symbol_table = {}
 
     # Step 1: Collect subexpressions with counts
-    subexpr_counts: dict[str, tuple[Expr, int]] = {}
+    subexpr_counts: dict[Expr, tuple[Expr, int]] = {}
     _collect_subexpressions(expr, subexpr_counts)
 
     # Step 2: Build reverse mapping: expression key -> existing variable name
     # If multiple variables map to same expression, pick lexicographically smallest for determinism
-    expr_to_var: dict[str, str] = {}
+    expr_to_var: dict[Expr, str] = {}
     for var_name, var_expr in symbol_table.items():
-        expr_key = _expression_key(var_expr)
+        expr_key = var_expr
         if expr_key not in expr_to_var or var_name < expr_to_var[expr_key]:
             expr_to_var[expr_key] = var_name
 
     # Step 3: Filter candidates and separate into aliased vs new
-    aliased_candidates: dict[str, str] = {}  # expr_key -> existing var name
-    new_candidates: dict[str, tuple[Expr, int]] = {}  # expr_key -> (expr, count)
+    aliased_candidates: dict[Expr, str] = {}  # expr_key -> existing var name
+    new_candidates: dict[Expr, tuple[Expr, int]] = {}  # expr_key -> (expr, count)
 
     for key, (subexpr, count) in subexpr_counts.items():
         if count >= min_occurrences and _is_cse_candidate(subexpr):
@@ -0,0 +1,139 @@
+"""Iterative traversal of expression trees.
+
+A walker written as plain recursion over ``Expr.children()`` uses one Python
+frame per tree level. Sums in GAMS sources are left-associative, so a
+10^5-term linear sum is a 10^5-deep chain of ``Binary`` nodes, and recursive
+walkers fail on it unless the process raises ``sys.setrecursionlimit()``. The
+helpers here keep their own stack instead:
+
+- ``iter_postorder(expr)`` yields every node after its children.
+- ``rewrite(expr, rule)`` rebuilds a tree bottom-up. Untouched subtrees are
+  shared with the input, not copied.
+- ``fold(visit, *args)`` runs a recursive walker that is written as a
+  generator. Instead of calling itself on a child, it yields that call's
+  arguments. This suits walkers that pass context down (precedence, bound
+  indices) or fold a tree into something other than an ``Expr``.
+- ``flatten_chain(expr, op)`` lists the operands of a nested chain of one
+  associative operator, e.g. the terms of a long sum.
+
+Example:
+    def _count(expr):
+        total = 1
+        for child in expr.children():
+            total += yield (child,)
+        return total
+
+    fold(_count, expr)  # same as a recursive _count, at any depth
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator, Iterator
+from typing import Any, TypeVar
+
+from .ast import Binary, Expr
+
+T = TypeVar("T")
+
+
+def iter_postorder(expr: Expr) -> Iterator[Expr]:
+    """Yield every node of ``expr``, children before parents, left to right.
+
+    A subtree shared by several parents is yielded once per occurrence.
+    """
+    stack: list[tuple[Expr, bool]] = [(expr, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            yield node
+            continue
+        stack.append((node, True))
+        stack.extend((child, False) for child in reversed(list(node.children())))
+
+
+def rewrite(
+    expr: Expr,
+    rule: Callable[[Expr], Expr],
+    descend: Callable[[Expr], bool] | None = None,
+) -> Expr:
+    """Rebuild ``expr`` bottom-up, replacing each node with ``rule(node)``.
+
+    ``rule`` is called once per distinct node, after that node's children were
+    rewritten. It receives the node itself when no child changed, otherwise
+    ``node.with_children(...)`` with the rewritten children. Subtrees the rule
+    leaves alone are therefore returned as-is, metadata included. A subtree
+    shared by several parents is rewritten once.
+
+    When ``descend`` is given, the children of nodes for which it returns
+    False are not visited; such a node goes to ``rule`` as it is.
+    """
+    done: dict[int, Expr] = {}
+    stack: list[tuple[Expr, bool]] = [(expr, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            children = [done[id(child)] for child in node.children()]
+            done[id(node)] = rule(node.with_children(children) if children else node)
+        elif id(node) not in done:
+            if descend is not None and not descend(node):
+                done[id(node)] = rule(node)
+                continue
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children())
+    return done[id(expr)]
+
+
+def fold(visit: Callable[..., Generator[tuple, Any, T]], *args: Any) -> T:
+    """Return ``visit(*args)``'s result, running its recursion on an explicit stack.
+
+    ``visit`` is a generator function written like a recursive walker, except
+    that ``result = yield (child, *child_args)`` stands in for
+    ``result = visit(child, *child_args)``. Its return value is the node's
+    result. An exception raised while visiting a child is thrown into the
+    parent at its ``yield``, so ``try``/``except`` around a sub-visit behaves
+    as it would with recursion.
+    """
+    stack = [visit(*args)]
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        walker = stack[-1]
+        try:
+            if error is None:
+                request = walker.send(value)
+            else:
+                pending, error = error, None
+                request = walker.throw(pending)
+        except StopIteration as stop:
+            stack.pop()
+            if not stack:
+                return stop.value
+            value = stop.value
+            continue
+        except BaseException as exc:
+            stack.pop()
+            if not stack:
+                raise
+            error = exc
+            continue
+        stack.append(visit(*request))
+        value = None
+
+
+def flatten_chain(expr: Expr, op: str) -> list[Expr]:
+    """Operands of the chain of ``Binary(op, ...)`` nodes rooted at ``expr``, left to right.
+
+    ``a + b + c`` parsed as ``(a + b) + c`` and ``a + (b + c)`` both give
+    ``[a, b, c]``; an ``expr`` that is not an ``op`` node gives ``[expr]``.
+    Runs in time linear in the number of operands.
+    """
+    operands: list[Expr] = []
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Binary) and node.op == op:
+            stack.append(node.right)
+            stack.append(node.left)
+        else:
+            operands.append(node)
+    return operands
@@ -1,17 +1,22 @@
 """KKT system assembly for NLP to MCP transformation."""
 
-from .assemble import assemble_kkt_system
-from .complementarity import build_complementarity_pairs
-from .kkt_system import ComplementarityPair, KKTSystem, MultiplierDef
-from .naming import (
-    create_bound_lo_multiplier_name,
-    create_bound_up_multiplier_name,
-    create_eq_multiplier_name,
-    create_ineq_multiplier_name,
-)
-from .objective import ObjectiveInfo, extract_objective_info
-from .partition import BoundDef, PartitionResult, partition_constraints
-from .stationarity import build_stationarity_equations
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .assemble import assemble_kkt_system
+    from .complementarity import build_complementarity_pairs
+    from .kkt_system import ComplementarityPair, KKTSystem, MultiplierDef
+    from .naming import (
+        create_bound_lo_multiplier_name,
+        create_bound_up_multiplier_name,
+        create_eq_multiplier_name,
+        create_ineq_multiplier_name,
+    )
+    from .objective import ObjectiveInfo, extract_objective_info
+    from .partition import BoundDef, PartitionResult, partition_constraints
+    from .stationarity import build_stationarity_equations
 
 __all__ = [
     # Data structures
@@ -32,3 +37,24 @@ __all__ = [
     "create_bound_lo_multiplier_name",
     "create_bound_up_multiplier_name",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "assemble_kkt_system": ".assemble",
+        "build_complementarity_pairs": ".complementarity",
+        "ComplementarityPair": ".kkt_system",
+        "KKTSystem": ".kkt_system",
+        "MultiplierDef": ".kkt_system",
+        "create_bound_lo_multiplier_name": ".naming",
+        "create_bound_up_multiplier_name": ".naming",
+        "create_eq_multiplier_name": ".naming",
+        "create_ineq_multiplier_name": ".naming",
+        "ObjectiveInfo": ".objective",
+        "extract_objective_info": ".objective",
+        "BoundDef": ".partition",
+        "PartitionResult": ".partition",
+        "partition_constraints": ".partition",
+        "build_stationarity_equations": ".stationarity",
+    },
+)
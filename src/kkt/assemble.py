@@ -18,6 +18,7 @@ import logging
 from src.ad.gradient import GradientVector, extract_gradient_conditions
 from src.ad.jacobian import JacobianStructure
 from src.config import Config
+from src.ir.ast import interning
 from src.ir.model_ir import ModelIR
 from src.kkt.complementarity import build_complementarity_pairs
 from src.kkt.kkt_system import KKTSystem, MultiplierDef
@@ -34,6 +35,7 @@ from src.kkt.stationarity import build_stationarity_equations
 logger = logging.getLogger(__name__)
 
 
+@interning()
 def assemble_kkt_system(
     model_ir: ModelIR,
     gradient: GradientVector,
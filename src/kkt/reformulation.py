@@ -199,7 +199,7 @@ References
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from typing import TYPE_CHECKING
 
 from ..ir.ast import Call, Const, Expr
@@ -387,9 +387,9 @@ def detect_min_max_calls(expr: Expr, context: str) -> list[MinMaxCall]:
         if isinstance(node, Call):
             for arg in node.args:
                 traverse(arg)
-        elif hasattr(node, "__dict__"):
+        elif is_dataclass(node):
             # Generic traversal for other expression types
-            for value in node.__dict__.values():
+            for value in (getattr(node, f.name) for f in fields(node)):
                 if isinstance(value, Expr):
                     traverse(value)
                 elif isinstance(value, list):
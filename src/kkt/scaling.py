@@ -55,11 +55,11 @@ def curtis_reid_scaling(
         >>> R, C = curtis_reid_scaling(J)
         >>> # Scaled Jacobian would be: R @ J @ C
     """
-    # Convert sparse Jacobian to dense for scaling computation
-    # In production, we'd use sparse operations, but dense is simpler for now
-    dense_jac = _jacobian_to_dense(jacobian)
+    # Structural scaling on the nonzeros only: the value of entry k is scaled
+    # in place of a dense matrix, so memory and time are O(nnz) per iteration
+    rows, cols, values = _structural_coo(jacobian)
 
-    m, n = dense_jac.shape  # m = rows (equations), n = cols (variables)
+    m, n = jacobian.num_rows, jacobian.num_cols  # m = rows (equations), n = cols (variables)
 
     # Initialize scaling factors (cumulative product of all iterations)
     R = np.ones(m)
@@ -67,29 +67,29 @@ def curtis_reid_scaling(
 
     for _ in range(max_iter):
         # Row scaling
-        row_norms = np.linalg.norm(dense_jac, axis=1, ord=2)  # L2 norm of each row
+        row_norms = _norms(rows, values, m)  # L2 norm of each row
         # Avoid division by zero for empty rows
         row_norms = np.where(row_norms > min_norm, row_norms, 1.0)
         R_k = 1.0 / np.sqrt(row_norms)
 
         # Apply row scaling: each row i is multiplied by R_k[i]
-        dense_jac = R_k[:, np.newaxis] * dense_jac
+        values = values * R_k[rows]
         R = R_k * R  # Accumulate scaling
 
         # Column scaling
-        col_norms = np.linalg.norm(dense_jac, axis=0, ord=2)  # L2 norm of each column
+        col_norms = _norms(cols, values, n)  # L2 norm of each column
         # Avoid division by zero for empty columns
         col_norms = np.where(col_norms > min_norm, col_norms, 1.0)
         C_k = 1.0 / np.sqrt(col_norms)
 
         # Apply column scaling: each column j is multiplied by C_k[j]
-        dense_jac = dense_jac * C_k[np.newaxis, :]
+        values = values * C_k[cols]
         C = C_k * C  # Accumulate scaling
 
         # Check convergence
         # Recompute norms after both row and column scaling to verify balance
-        row_norms_post = np.linalg.norm(dense_jac, axis=1, ord=2)
-        col_norms_post = np.linalg.norm(dense_jac, axis=0, ord=2)
+        row_norms_post = _norms(rows, values, m)
+        col_norms_post = _norms(cols, values, n)
         max_row_dev = np.abs(row_norms_post - 1.0).max()
         max_col_dev = np.abs(col_norms_post - 1.0).max()
 
@@ -121,10 +121,10 @@ def byvar_scaling(jacobian: JacobianStructure) -> np.ndarray:
         >>> C = byvar_scaling(J)
         >>> # Scaled Jacobian would be: J @ C (no row scaling)
     """
-    dense_jac = _jacobian_to_dense(jacobian)
+    _, cols, values = _structural_coo(jacobian)
 
     # Compute column norms
-    col_norms = np.linalg.norm(dense_jac, axis=0, ord=2)
+    col_norms = _norms(cols, values, jacobian.num_cols)
 
     # Avoid division by zero
     col_norms = np.where(col_norms > 1e-10, col_norms, 1.0)
@@ -135,41 +135,30 @@ def byvar_scaling(jacobian: JacobianStructure) -> np.ndarray:
     return C
 
 
-def _jacobian_to_dense(jacobian: JacobianStructure) -> np.ndarray:
+def _structural_coo(jacobian: JacobianStructure) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Convert sparse Jacobian structure to dense numpy array.
+    Get the nonzero pattern of a Jacobian as coordinate arrays.
 
-    This is a helper function for scaling computation. In the current
-    implementation, derivatives are symbolic, so we use a placeholder
-    value of 1.0 for all nonzero entries to compute structural scaling.
+    Derivatives are symbolic, so every structurally nonzero entry gets the
+    placeholder value 1.0 for structural scaling.
 
     Args:
         jacobian: Sparse Jacobian structure
 
     Returns:
-        Dense numpy array with 1.0 for each structurally nonzero entry
+        Tuple of (rows, cols, values), one element per nonzero entry
 
     Note:
-        For purely structural scaling, we use 1.0 for all entries.
         For value-based scaling (future work), we'd need to evaluate
-        the symbolic derivatives at a point.
+        the symbolic derivatives (the expression table of ``to_coo``) at a point.
     """
-    # Get dimensions from jacobian structure
-    num_rows = jacobian.num_rows
-    num_cols = jacobian.num_cols
-
-    # Initialize dense matrix
-    dense = np.zeros((num_rows, num_cols))
-
-    # Fill in nonzero entries
-    # jacobian.entries is a dict[int, dict[int, Expr]]
-    for row_id, row_dict in jacobian.entries.items():
-        for col_id, _deriv_expr in row_dict.items():
-            # Use 1.0 as placeholder for structural scaling
-            # Future: could evaluate deriv_expr at a point for value-based scaling
-            dense[row_id, col_id] = 1.0
-
-    return dense
+    rows, cols, _exprs = jacobian.to_coo()
+    return rows, cols, np.ones(len(rows))
+
+
+def _norms(index: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """L2 norm of the values sharing each index (a row or column norm), for indices 0..size-1."""
+    return np.sqrt(np.bincount(index, weights=values * values, minlength=size))
 
 
 def apply_scaling_to_jacobian(
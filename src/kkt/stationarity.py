@@ -4407,61 +4407,13 @@ def _collect_free_indices(expr: Expr, model_ir: ModelIR) -> set[str]:
     expressions that need to be wrapped in Sum nodes.
     """
 
-    def _is_known_set(name: str) -> bool:
-        # model_ir.sets and model_ir.aliases are CaseInsensitiveDicts whose
-        # __contains__ already lowercases the key, so this is case-safe.
-        return name in model_ir.sets or name in model_ir.aliases
-
-    def _walk(e: Expr, bound: frozenset[str]) -> set[str]:
-        # bound contains lowercase-normalized names; all returned names are also lowercase
-        # so that set arithmetic with IR-derived domains (also lowercase) is correct.
-        if isinstance(e, (VarRef, ParamRef, MultiplierRef)):
-            free: set[str] = set()
-            for idx in e.indices or ():
-                if isinstance(idx, str) and _is_known_set(idx) and idx.lower() not in bound:
-                    free.add(idx.lower())
-                elif isinstance(idx, IndexOffset):
-                    free |= _walk(idx, bound)
-            return free
-        if isinstance(e, (Sum, Prod)):
-            new_bound = bound | frozenset(s.lower() for s in e.index_sets)
-            result = _walk(e.body, new_bound)
-            if e.condition is not None:
-                result |= _walk(e.condition, new_bound)
-            return result
-        if isinstance(e, Binary):
-            return _walk(e.left, bound) | _walk(e.right, bound)
-        if isinstance(e, Unary):
-            return _walk(e.child, bound)
-        if isinstance(e, Call):
-            free = set()
-            for arg in e.args:
-                free |= _walk(arg, bound)
-            return free
-        if isinstance(e, DollarConditional):
-            return _walk(e.condition, bound) | _walk(e.value_expr, bound)
-        if isinstance(e, SetMembershipTest):
-            # Walk the index expressions inside the membership test (e.g. rn(i) → walk i)
-            free = set()
-            for child_expr in e.indices:
-                free |= _walk(child_expr, bound)
-            return free
-        if isinstance(e, SymbolRef):
-            # A bare symbol reference used as an index (e.g. SymbolRef('i'))
-            if _is_known_set(e.name) and e.name.lower() not in bound:
-                return {e.name.lower()}
-            return set()
-        if isinstance(e, IndexOffset):
-            # Lead/lag expression: base is a set index; offset may contain SymbolRef
-            free = set()
-            if _is_known_set(e.base) and e.base.lower() not in bound:
-                free.add(e.base.lower())
-            free |= _walk(e.offset, bound)
-            return free
-        # Const, etc. — no indices
-        return set()
-
-    return _walk(expr, frozenset())
+    # Expr.free_indices() caches the lowercased candidates (reference indices,
+    # IndexOffset bases, bare SymbolRefs) not bound by an enclosing Sum/Prod.
+    # model_ir.sets and model_ir.aliases are CaseInsensitiveDicts whose
+    # __contains__ already lowercases the key, so this is case-safe.
+    return {
+        name for name in expr.free_indices() if name in model_ir.sets or name in model_ir.aliases
+    }
 
 
 def _resolve_alias_target(name: str, model_ir: ModelIR) -> str:
@@ -5472,60 +5424,17 @@ def _substitute_elements(expr: Expr, subs: dict[str, str]) -> Expr:
     return _walk(expr)
 
 
-def _derivative_structure_key(expr: Expr) -> str:
+def _derivative_structure_key(expr: Expr) -> tuple:
     """Compute a structural fingerprint of a derivative AST.
 
     Issue #1110: Captures the AST *shape* — node types, operators, param/set
     names — but replaces concrete index tuples with arity counts, so that
     entries differing only in element values produce the same key while
     structurally different trees (e.g. ``Binary('+', Const(1), X)`` vs ``X``)
-    produce different keys.
+    produce different keys. The key is cached on each node
+    (``Expr.structure_key``), so derivatives sharing subtrees are walked once.
     """
-
-    def _walk(e: Expr) -> str:
-        if isinstance(e, Const):
-            return f"C({e.value})"
-        if isinstance(e, SymbolRef):
-            # Normalize to ignore concrete element labels so fingerprints
-            # depend only on structure/shape, not values.
-            return "S(*)"
-        if isinstance(e, ParamRef):
-            arity = len(e.indices) if e.indices else 0
-            return f"P({e.name},{arity})"
-        if isinstance(e, VarRef):
-            arity = len(e.indices) if e.indices else 0
-            return f"V({e.name},{arity})"
-        if isinstance(e, MultiplierRef):
-            arity = len(e.indices) if e.indices else 0
-            return f"M({e.name},{arity})"
-        if isinstance(e, Binary):
-            return f"B({e.op},{_walk(e.left)},{_walk(e.right)})"
-        if isinstance(e, Unary):
-            return f"U({e.op},{_walk(e.child)})"
-        if isinstance(e, Call):
-            args = ",".join(_walk(a) for a in e.args)
-            return f"F({e.func},{args})"
-        if isinstance(e, Sum):
-            body = _walk(e.body)
-            n = len(e.index_sets) if e.index_sets else 0
-            cond = _walk(e.condition) if e.condition else ""
-            return f"Sum({n},{body},{cond})"
-        if isinstance(e, DollarConditional):
-            return f"DC({_walk(e.value_expr)},{_walk(e.condition)})"
-        if isinstance(e, Prod):
-            body = _walk(e.body)
-            n = len(e.index_sets) if e.index_sets else 0
-            cond = _walk(e.condition) if e.condition else ""
-            return f"Prod({n},{body},{cond})"
-        if isinstance(e, SetMembershipTest):
-            n = len(e.indices) if e.indices else 0
-            return f"SMT({e.set_name},{n})"
-        if isinstance(e, EquationRef):
-            arity = len(e.indices) if e.indices else 0
-            return f"EQ({e.name},{arity},{e.attribute})"
-        return type(e).__name__
-
-    return _walk(expr)
+    return expr.structure_key()
 
 
 def _filter_boundary_singleton_offset_groups(
@@ -5569,19 +5478,11 @@ def _expr_mentions_var(e: Expr, var_name: str) -> bool:
     inside index expressions** (e.g. an ``IndexOffset`` offset).
 
     ``VarRef.children()`` (and ``ParamRef``/``MultiplierRef``) do **not** yield their
-    index expressions, so — like :func:`_collect_referenced_variable_names` — we walk
-    the indices explicitly; otherwise a variable buried in an index would be missed
-    and ``_collect_signed_varrefs`` could wrongly treat an unsupported shape as safe.
+    index expressions, but ``Expr.free_variables()`` covers them; otherwise a variable
+    buried in an index would be missed and ``_collect_signed_varrefs`` could wrongly
+    treat an unsupported shape as safe.
     """
-    from ..ir.ast import MultiplierRef, ParamRef, VarRef
-
-    if isinstance(e, VarRef) and e.name == var_name:
-        return True
-    if isinstance(e, (VarRef, ParamRef, MultiplierRef)):
-        for idx in e.indices:
-            if isinstance(idx, Expr) and _expr_mentions_var(idx, var_name):
-                return True
-    return any(_expr_mentions_var(c, var_name) for c in e.children())
+    return var_name in e.free_variables()
 
 
 def _collect_signed_varrefs(expr: Expr, sign: int, var_name: str) -> list[tuple[int, Any]] | None:
@@ -6120,11 +6021,7 @@ def _add_indexed_jacobian_terms(
     constraint_entries: dict[str, list[tuple[int, int]]] = {}  # eq_name -> [(row_id, col_id)]
 
     for col_id, _ in instances:
-        for row_id in range(jacobian.num_rows):
-            derivative = jacobian.get_derivative(row_id, col_id)
-            if derivative is None:
-                continue
-
+        for row_id in jacobian.get_col(col_id):
             eq_name, _ = jacobian.index_mapping.row_to_eq[row_id]
 
             # Skip objective defining equation
@@ -6540,7 +6437,7 @@ def _add_indexed_jacobian_terms(
                             if _k != rep_key:
                                 _has_second_pattern = True
                                 break
-                        _sg: dict[str, list[tuple[int, int]]] | None = None
+                        _sg: dict[tuple, list[tuple[int, int]]] | None = None
                         if _has_second_pattern:
                             # Build the full sub-group map only when needed.
                             _sg = {}
@@ -7516,7 +7413,7 @@ def _add_indexed_jacobian_terms(
                 # Group entries by derivative structure and emit one guarded term
                 # per group. When all entries share one structure (the common
                 # case) this reduces to the original single-term behavior.
-                deriv_groups: dict[str, list[tuple[int, int]]] = {}
+                deriv_groups: dict[tuple, list[tuple[int, int]]] = {}
                 for _rid, _cid in entries:
                     _d = jacobian.get_derivative(_rid, _cid)
                     deriv_groups.setdefault(_derivative_structure_key(_d), []).append((_rid, _cid))
@@ -7881,11 +7778,7 @@ def _add_jacobian_transpose_terms_scalar(
 
     # Group Jacobian entries by constraint name (mirrors _add_indexed_jacobian_terms)
     constraint_entries: dict[str, list[tuple[int, int]]] = {}
-    for row_id in range(jacobian.num_rows):
-        derivative = jacobian.get_derivative(row_id, col_id)
-        if derivative is None:
-            continue
-
+    for row_id in jacobian.get_col(col_id):
         eq_name, _ = jacobian.index_mapping.row_to_eq[row_id]
 
         if skip_eq and eq_name == skip_eq:
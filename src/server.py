@@ -0,0 +1,416 @@
+"""Resident translation server for nlp2mcp.
+
+Batch drivers that start one ``python -m src.cli`` process per model pay the
+interpreter start-up, the import of every pipeline stage and the loading of
+the GAMS parsers for each model. ``nlp2mcp-serve`` pays those once: it keeps
+a pool of long-lived worker processes, each with the parsers loaded, and
+runs translations in them on request.
+
+Protocol (JSON lines on stdin/stdout)::
+
+    -> {"id": 1, "args": ["model.gms", "-o", "model_mcp.gms", "--quiet"]}
+    <- {"id": 1, "status": "ok", "exit_code": 0, "stdout": "", "stderr": "",
+        "elapsed": 0.42}
+
+``args`` are exactly the command-line arguments of ``nlp2mcp`` (see
+``src/cli.py``), so every option is available and behaves the same. A
+request may set ``"timeout"`` (seconds) to override the server default.
+``stdout`` holds the MCP text when no ``-o`` is given; ``stderr`` holds the
+diagnostics and warnings the CLI would have printed. ``status`` is one of:
+
+- ``ok``: the CLI exited with code 0,
+- ``failed``: the CLI exited with a non-zero ``exit_code``,
+- ``timeout``: the request exceeded its timeout; its worker was killed,
+- ``crashed``: the worker died (e.g. it hit ``--max-memory-mb``),
+- ``invalid``: the request line was not a valid request.
+
+Responses are written as requests complete, so with ``--workers N > 1`` they
+may arrive out of order; match them by ``id``. The server exits at the end
+of its input.
+
+Usage:
+    nlp2mcp-serve --workers 4 --timeout 600 < requests.jsonl
+    python -m src.server --workers 4
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import queue
+import sys
+import threading
+import time
+import warnings
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing.connection import Connection
+from typing import Any, TextIO
+
+import click
+
+from .cli import main as cli_main
+from .ir.parser import parse_text
+
+try:
+    import resource
+except ImportError:  # Windows: no memory caps or RSS reporting
+    resource = None  # type: ignore[assignment]
+
+# Same per-model limit as scripts/gamslib/batch_translate.py
+DEFAULT_TIMEOUT = 600.0
+# A worker is replaced after this many translations to bound leaked state
+DEFAULT_MAX_REQUESTS = 200
+# Seconds a fresh worker may take to import the pipeline and load the parsers
+_STARTUP_TIMEOUT = 120.0
+
+# Tiny model whose parse loads both the Earley parser and the LALR fast path
+_WARMUP_SOURCE = "Scalar s;\ns = 1;\n"
+
+# Pipeline stages src.cli imports lazily; workers load them before serving
+_PRELOAD_MODULES = (
+    "src.validation.discreteness",
+    "src.validation.driver",
+    "src.validation.model",
+    "src.validation.numerical",
+    "src.diagnostics.convexity.patterns",
+    "src.ir.normalize",
+    "src.kkt.reformulation",
+    "src.kkt.sqr_reformulation",
+    "src.ad.constraint_jacobian",
+    "src.ad.gradient",
+    "src.kkt.assemble",
+    "src.kkt.scaling",
+    "src.emit.emit_gams",
+)
+
+
+@dataclass
+class TranslateResult:
+    """Outcome of one translation request."""
+
+    status: str
+    exit_code: int | None
+    stdout: str
+    stderr: str
+    elapsed: float
+
+
+def run_cli(args: Sequence[str]) -> tuple[int, str, str]:
+    """Run ``nlp2mcp`` with ``args`` in this process.
+
+    Returns ``(exit_code, stdout, stderr)`` with the output the CLI would
+    have printed as a separate process. Warnings are re-armed for every
+    call so a long-lived process reports them as often as fresh processes
+    would.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with (
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+        warnings.catch_warnings(),
+    ):
+        try:
+            result = cli_main.main(args=list(args), prog_name="nlp2mcp", standalone_mode=False)
+            exit_code = result if isinstance(result, int) else 0
+        except click.ClickException as exc:
+            exc.show(file=stderr)
+            exit_code = exc.exit_code
+        except click.Abort:
+            stderr.write("Aborted!\n")
+            exit_code = 1
+        except SystemExit as exc:
+            if exc.code is None:
+                exit_code = 0
+            elif isinstance(exc.code, int):
+                exit_code = exc.code
+            else:
+                stderr.write(f"{exc.code}\n")
+                exit_code = 1
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _worker_main(conn: Connection, max_memory_mb: float | None) -> None:
+    """Entry point of a worker process: serve ``run_cli`` calls over ``conn``."""
+    if max_memory_mb is not None and resource is not None:
+        limit = int(max_memory_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    for module in _PRELOAD_MODULES:
+        importlib.import_module(module)
+    parse_text(_WARMUP_SOURCE)
+    conn.send("ready")
+    while True:
+        try:
+            args = conn.recv()
+        except EOFError:
+            break
+        exit_code, stdout, stderr = run_cli(args)
+        conn.send((exit_code, stdout, stderr, _peak_rss_mb()))
+
+
+class TranslationWorker:
+    """One long-lived worker process running ``nlp2mcp`` translations.
+
+    The process is started on first use (and again after it was killed or
+    recycled). ``translate`` enforces the per-request timeout by killing the
+    process, so a runaway translation never blocks later requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory_mb: float | None = None,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        recycle_rss_mb: float | None = None,
+    ):
+        self.max_memory_mb = max_memory_mb
+        self.max_requests = max_requests
+        self.recycle_rss_mb = recycle_rss_mb
+        self.served = 0
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._conn: Connection | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Start the worker process and wait until its parsers are loaded."""
+        self.stop()
+        # spawn, not fork: the server runs dispatcher threads while it starts workers
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(
+            target=_worker_main, args=(child_conn, self.max_memory_mb), daemon=True
+        )
+        try:
+            process.start()
+        except OSError as exc:  # e.g. out of memory or process slots
+            parent_conn.close()
+            child_conn.close()
+            raise RuntimeError(f"nlp2mcp worker process failed to start: {exc}") from exc
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+        self.served = 0
+        try:
+            ready = parent_conn.poll(_STARTUP_TIMEOUT) and parent_conn.recv() == "ready"
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            self.stop()
+            raise RuntimeError("nlp2mcp worker process failed to start")
+
+    def stop(self) -> None:
+        """Kill the worker process, if any."""
+        if self._conn is not None:
+            self._conn.close()
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.kill()
+            self._process.join()
+        self._process, self._conn = None, None
+
+    def translate(self, args: Sequence[str], timeout: float = DEFAULT_TIMEOUT) -> TranslateResult:
+        """Run ``nlp2mcp args`` in the worker process."""
+        if not self.alive:
+            try:
+                self.start()
+            except RuntimeError as exc:
+                return TranslateResult("crashed", None, "", str(exc), 0.0)
+        assert self._conn is not None and self._process is not None
+        start = time.perf_counter()
+        try:
+            self._conn.send(list(args))
+            ready = self._conn.poll(timeout)
+            reply = self._conn.recv() if ready else None
+        except (EOFError, OSError):
+            ready, reply = True, None
+        elapsed = round(time.perf_counter() - start, 4)
+
+        if not ready:
+            self.stop()
+            message = f"Translation timeout after {timeout:g} seconds"
+            return TranslateResult("timeout", None, "", message, elapsed)
+        if reply is None:
+            self._process.join(1)
+            code = self._process.exitcode
+            self.stop()
+            message = f"Worker process died (exit code {code})"
+            return TranslateResult("crashed", None, "", message, elapsed)
+
+        exit_code, stdout, stderr, rss_mb = reply
+        self.served += 1
+        if self.served >= self.max_requests or (
+            self.recycle_rss_mb is not None and rss_mb > self.recycle_rss_mb
+        ):
+            self.stop()
+        status = "ok" if exit_code == 0 else "failed"
+        return TranslateResult(status, exit_code, stdout, stderr, elapsed)
+
+
+class TranslationPool:
+    """A fixed number of ``TranslationWorker`` processes shared by threads.
+
+    ``translate`` blocks until a worker is idle, so calling it from up to
+    ``size`` threads runs that many translations in parallel.
+    """
+
+    def __init__(self, size: int = 1, **worker_options: Any):
+        self.size = size
+        self._workers = [TranslationWorker(**worker_options) for _ in range(size)]
+        self._idle: queue.Queue[TranslationWorker] = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def start(self) -> int:
+        """Start every worker up front instead of on its first request.
+
+        A worker that fails to start is left stopped rather than taking the
+        server down: it is started again on its first request, which gets a
+        ``crashed`` reply if that fails too. Returns the number of workers
+        running.
+        """
+
+        def start_worker(worker: TranslationWorker) -> bool:
+            try:
+                worker.start()
+            except RuntimeError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return sum(executor.map(start_worker, self._workers))
+
+    def translate(self, args: Sequence[str], timeout: float = DEFAULT_TIMEOUT) -> TranslateResult:
+        worker = self._idle.get()
+        try:
+            return worker.translate(args, timeout)
+        finally:
+            self._idle.put(worker)
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+
+    def __enter__(self) -> TranslationPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _parse_request(line: str) -> tuple[Any, list[str], float | None]:
+    """Return ``(id, args, timeout)`` of a request line; raises ValueError if invalid."""
+    request = json.loads(line)
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    args = request.get("args")
+    if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        raise ValueError("'args' must be a list of strings")
+    timeout = request.get("timeout")
+    if timeout is not None and (
+        isinstance(timeout, bool) or not isinstance(timeout, int | float) or timeout <= 0
+    ):
+        raise ValueError("'timeout' must be a positive number of seconds")
+    return request.get("id"), args, timeout
+
+
+def serve(
+    pool: TranslationPool,
+    stdin: TextIO,
+    stdout: TextIO,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> None:
+    """Answer JSON-lines translate requests from ``stdin`` until end of input."""
+    lock = threading.Lock()
+
+    def respond(payload: dict[str, Any]) -> None:
+        with lock:
+            stdout.write(json.dumps(payload) + "\n")
+            stdout.flush()
+
+    def handle(request_id: Any, args: list[str], request_timeout: float | None) -> None:
+        result = pool.translate(args, request_timeout or timeout)
+        respond({"id": request_id, **asdict(result)})
+
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        for line in stdin:
+            if not line.strip():
+                continue
+            try:
+                request_id, args, request_timeout = _parse_request(line)
+            except ValueError as exc:
+                result = TranslateResult("invalid", None, "", f"Invalid request: {exc}", 0.0)
+                respond({"id": None, **asdict(result)})
+                continue
+            executor.submit(handle, request_id, args, request_timeout)
+
+
+@click.command()
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes translating in parallel",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_TIMEOUT,
+    show_default=True,
+    help="Per-request timeout in seconds (requests may override it)",
+)
+@click.option(
+    "--max-memory-mb",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Address-space limit of each worker process (POSIX only)",
+)
+@click.option(
+    "--max-requests",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_REQUESTS,
+    show_default=True,
+    help="Replace a worker process after this many translations",
+)
+@click.option(
+    "--recycle-rss-mb",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Replace a worker process once its peak RSS exceeds this",
+)
+def main(workers, timeout, max_memory_mb, max_requests, recycle_rss_mb):
+    """Serve nlp2mcp translate requests as JSON lines on stdin/stdout."""
+    pool = TranslationPool(
+        workers,
+        max_memory_mb=max_memory_mb,
+        max_requests=max_requests,
+        recycle_rss_mb=recycle_rss_mb,
+    )
+    with pool:
+        started = pool.start()
+        if started < workers:
+            click.echo(
+                f"nlp2mcp-serve: {workers - started} of {workers} worker processes failed "
+                "to start; retrying on their first request",
+                err=True,
+            )
+        serve(pool, sys.stdin, sys.stdout, timeout)
+
+
+if __name__ == "__main__":
+    main()
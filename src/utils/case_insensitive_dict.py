@@ -126,6 +126,14 @@ class CaseInsensitiveDict(dict[str, T]):
         for key, value in kwargs.items():
             self[key] = value
 
+    def __reduce__(self):
+        """Pickle through ``__setitem__`` so original casings are rebuilt.
+
+        The default dict-subclass reduction replays the items before
+        restoring ``_original_names``, which ``__setitem__`` needs.
+        """
+        return (self.__class__, (), None, None, self.items())
+
     def __repr__(self) -> str:
         """Return string representation using original keys."""
         items = ", ".join(f"{k!r}: {v!r}" for k, v in self.items())
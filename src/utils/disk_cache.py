@@ -0,0 +1,122 @@
+"""
+On-disk cache helpers shared by the parser-side caches.
+
+Every persistent cache nlp2mcp keeps (compiled grammar, preprocessed source,
+parsed ModelIR) lives under a single root directory so it can be inspected,
+relocated or wiped in one place:
+
+- ``NLP2MCP_CACHE_DIR`` if set,
+- otherwise ``$XDG_CACHE_HOME/nlp2mcp``,
+- otherwise ``~/.cache/nlp2mcp``.
+
+Setting ``NLP2MCP_NO_CACHE=1`` disables all of them; every cache treats a
+missing, unreadable or corrupt entry as a miss and never lets a cache failure
+turn into a translation failure.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_DIR_ENV = "NLP2MCP_CACHE_DIR"
+NO_CACHE_ENV = "NLP2MCP_NO_CACHE"
+
+
+def cache_enabled() -> bool:
+    """Return False when persistent caching has been disabled via the environment."""
+    return os.environ.get(NO_CACHE_ENV, "").strip().lower() not in ("1", "true", "yes")
+
+
+def cache_root() -> Path:
+    """Return the root directory for nlp2mcp's on-disk caches (not created)."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "nlp2mcp"
+
+
+def cache_subdir(name: str) -> Path:
+    """Return ``cache_root() / name`` (not created)."""
+    return cache_root() / name
+
+
+def hash_bytes(*parts: bytes | str) -> str:
+    """Return a hex SHA-256 digest over the given parts.
+
+    Parts are length-prefixed so that ``("ab", "c")`` and ``("a", "bc")``
+    produce different digests.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` atomically.
+
+    The payload is written to a temporary file in the same directory and then
+    moved into place with ``os.replace``, so concurrent readers (e.g. parallel
+    batch workers) see either the old entry or the complete new one, never a
+    partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def touch(path: Path) -> None:
+    """Mark a cache entry as recently used (its mtime drives LRU eviction)."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def prune_lru(directory: Path, max_bytes: int) -> None:
+    """Delete the least recently used files in ``directory`` until it fits ``max_bytes``.
+
+    Recency is the file's mtime (see ``touch``). Files that vanish or cannot
+    be removed (e.g. a concurrent worker pruning the same directory) are
+    skipped.
+    """
+    entries = []
+    total = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if entry.is_file():
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+    except OSError:
+        return
+    if total <= max_bytes:
+        return
+    for _mtime, size, path in sorted(entries):
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
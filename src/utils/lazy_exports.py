@@ -0,0 +1,45 @@
+"""Lazy re-exports for package ``__init__`` modules.
+
+Pipeline packages (``src.ad``, ``src.kkt``, ``src.emit``, ...) re-export
+their public API from submodules. Importing every submodule up front makes
+``import src.cli`` (and so ``nlp2mcp --help``) pay for NumPy, the AD engine
+and the emitter. ``lazy_exports`` builds a module-level ``__getattr__``
+(PEP 562) that imports the defining submodule the first time a name is used:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"differentiate": ".ad_core"})
+
+Type checkers do not see names resolved this way, so packages also import
+them under ``if TYPE_CHECKING:``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return ``(__getattr__, __dir__)`` for ``package``.
+
+    ``exports`` maps each public name to the (relative or absolute) module
+    that defines it. A resolved name is stored on the package, so the
+    submodule is only looked up once.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
@@ -5,15 +5,20 @@ as well as numerical validation (NaN/Inf detection) for model parameters and
 computed values.
 """
 
-from src.validation.gams_check import validate_gams_syntax
-from src.validation.model import validate_model_structure
-from src.validation.numerical import (
-    check_value_finite,
-    validate_bounds,
-    validate_expression_value,
-    validate_jacobian_entries,
-    validate_parameter_values,
-)
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from src.validation.gams_check import validate_gams_syntax
+    from src.validation.model import validate_model_structure
+    from src.validation.numerical import (
+        check_value_finite,
+        validate_bounds,
+        validate_expression_value,
+        validate_jacobian_entries,
+        validate_parameter_values,
+    )
 
 __all__ = [
     "validate_gams_syntax",
@@ -24,3 +29,16 @@ __all__ = [
     "validate_bounds",
     "validate_model_structure",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "validate_gams_syntax": "src.validation.gams_check",
+        "validate_model_structure": "src.validation.model",
+        "check_value_finite": "src.validation.numerical",
+        "validate_bounds": "src.validation.numerical",
+        "validate_expression_value": "src.validation.numerical",
+        "validate_jacobian_entries": "src.validation.numerical",
+        "validate_parameter_values": "src.validation.numerical",
+    },
+)
@@ -8,28 +8,58 @@ Establishes baselines for:
 - GAMS emission time
 - End-to-end time
 - Memory usage
+- Process start-up with a cold vs. warm grammar cache
+- Parser peak memory with statement-level chunking vs. a whole-document parse
+- Table data fast path on synthetic 10^5- and 10^6-cell tables
+- Preprocessing a 70k-line source through the shared line buffer
+- parse_model_file with a cold vs. warm ModelIR cache
+- `import src.cli` cold-start budget (pipeline stages are imported lazily)
+- Memory kept by derivatives and the KKT system with and without interned AST nodes
+- Bytes retained per Jacobian entry with slotted AST nodes and interned index labels
+- Differentiating and simplifying a 10^4-term linear objective
+- Objective gradient of a 10^4-term objective over 10^4 variable instances
+- KKT assembly time against Jacobian nonzeros (column queries use a cached index)
+- Curtis-Reid scaling of a 10^5 x 10^5 Jacobian from its coordinate arrays
 
 Run with: pytest tests/benchmarks/ -v --benchmark-only
 Or without pytest-benchmark: pytest tests/benchmarks/ -v
 """
 
+import gc
+import os
+import subprocess
+import sys
 import time
 import tracemalloc
 from pathlib import Path
 
 import pytest
 
+from src.ad.ad_core import apply_simplification, simplify_advanced
 from src.ad.constraint_jacobian import compute_constraint_jacobian
+from src.ad.derivative_rules import differentiate_expr
 from src.ad.gradient import compute_objective_gradient
+from src.ad.jacobian import JacobianStructure
 from src.emit.emit_gams import emit_gams_mcp
+from src.emit.expr_to_gams import expr_to_gams
+from src.ir.ast import Binary, Call, Const, Expr, ParamRef, VarRef
+from src.ir.model_ir import ModelIR, ObjectiveIR
 from src.ir.normalize import normalize_model
-from src.ir.parser import parse_model_file
+from src.ir.parser import _build_lark, parse_model_file, parse_model_text, parse_text
+from src.ir.preprocessor import preprocess_text
+from src.ir.symbols import ObjSense, ParameterDef, SetDef, VariableDef
 from src.kkt.assemble import assemble_kkt_system
+from src.kkt.scaling import curtis_reid_scaling
 
 
 class TestPerformanceBenchmarks:
     """Performance benchmarks at different scales."""
 
+    @pytest.fixture(autouse=True)
+    def _no_disk_cache(self, monkeypatch):
+        # Time the parser, not the preprocess/ModelIR caches
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+
     @pytest.fixture
     def small_model(self, tmp_path):
         """10 variables, 5 constraints."""
@@ -329,3 +359,491 @@ class TestPerformanceBenchmarks:
 
         model_file.write_text("".join(lines))
         return model_file
+
+
+class TestStartupBenchmarks:
+    """Process start-up cost with and without the compiled-grammar cache."""
+
+    _PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+    def _time_parser_startup(self, cache_dir: Path) -> float:
+        """Time a fresh interpreter that imports the parser and builds the grammar."""
+        env = {**os.environ, "NLP2MCP_CACHE_DIR": str(cache_dir)}
+        env.pop("NLP2MCP_NO_CACHE", None)
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", "from src.ir.parser import _build_lark; _build_lark()"],
+            cwd=self._PROJECT_ROOT,
+            env=env,
+            check=True,
+        )
+        return time.perf_counter() - start
+
+    @pytest.mark.slow
+    def test_warm_grammar_cache_speeds_up_process_start(self, tmp_path):
+        """Benchmark: cold (compile grammar) vs. warm (load cached parser) start."""
+        cache_dir = tmp_path / "cache"
+
+        cold = self._time_parser_startup(cache_dir)
+        assert any((cache_dir / "grammar").iterdir()), "cold start did not populate the cache"
+        warm = min(self._time_parser_startup(cache_dir) for _ in range(3))
+
+        print(f"\nParser start-up: cold {cold:.3f}s, warm {warm:.3f}s ({cold / warm:.1f}x)")
+        # Grammar compilation is ~0.4s locally against ~0.03s to load the
+        # pickled parser; the interpreter + import floor is shared by both.
+        assert warm < cold, f"Warm start ({warm:.3f}s) not faster than cold ({cold:.3f}s)"
+
+
+class TestImportTimeBenchmarks:
+    """`import src.cli` must not pull in the pipeline stages (CLI cold start)."""
+
+    _PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+    # Loaded by main() only once a translation reaches the stage that needs them
+    _STAGE_MODULES = ("numpy", "lark", "src.ir.parser", "src.ad.", "src.kkt.", "src.emit.")
+
+    # ~75 ms locally; the whole graph (pre lazy imports) was ~550 ms
+    _IMPORT_BUDGET_SECONDS = 0.25
+
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, *args],
+            cwd=self._PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def test_cli_import_skips_pipeline_stages(self):
+        result = self._run("-c", "import sys, src.cli; print('\\n'.join(sys.modules))")
+        loaded = [
+            name
+            for name in result.stdout.splitlines()
+            if any(name == m or name.startswith(m) for m in self._STAGE_MODULES)
+        ]
+        assert loaded == [], f"import src.cli loaded pipeline modules: {loaded}"
+
+    @pytest.mark.slow
+    def test_cli_import_time_budget(self):
+        """Benchmark: cumulative `python -X importtime` cost of src.cli."""
+
+        def import_seconds() -> float:
+            # Lines look like "import time:  self [us] | cumulative | name"
+            result = self._run("-X", "importtime", "-c", "import src.cli")
+            for line in result.stderr.splitlines():
+                fields = [field.strip() for field in line.split("|")]
+                if len(fields) == 3 and fields[2] == "src.cli":
+                    return int(fields[1]) / 1e6
+            raise AssertionError(f"src.cli missing from -X importtime output:\n{result.stderr}")
+
+        elapsed = min(import_seconds() for _ in range(5))
+        print(f"\nimport src.cli: {elapsed * 1000:.0f} ms")
+        assert (
+            elapsed < self._IMPORT_BUDGET_SECONDS
+        ), f"import src.cli took {elapsed:.3f}s (budget {self._IMPORT_BUDGET_SECONDS}s)"
+
+
+class TestParserMemoryBenchmarks:
+    """Peak parser memory: one Earley chart per statement vs. one per file."""
+
+    @staticmethod
+    def _generate_source(num_params: int, num_elems: int, num_eqs: int) -> str:
+        lines = [f"Set r / r0*r{num_elems - 1} /;", "Variable x(r), z;"]
+        for k in range(num_params):
+            data = ", ".join(f"r{i} {(i * k) % 17 + 1}" for i in range(num_elems))
+            lines.append(f"Parameter p{k}(r) / {data} /;")
+        lines.append("Equation " + ", ".join(f"e{k}" for k in range(num_eqs)) + ";")
+        for k in range(num_eqs):
+            lines.append(f"e{k}.. sum(r, p{k % num_params}(r) * x(r)) =g= {k};")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _peak_mb(fn, source: str) -> float:
+        tracemalloc.start()
+        fn(source)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak / 1024 / 1024
+
+    @pytest.mark.slow
+    def test_chunked_parse_bounds_peak_memory(self, monkeypatch):
+        """Benchmark: peak memory of parse_text vs. a single whole-file Earley parse."""
+        # Parse every statement with Earley so only the chunking differs
+        monkeypatch.setenv("NLP2MCP_NO_LALR_FASTPATH", "1")
+        monkeypatch.setenv("NLP2MCP_NO_DATA_FASTPATH", "1")
+        source = self._generate_source(num_params=20, num_elems=10, num_eqs=20)
+        earley = _build_lark()
+
+        whole = self._peak_mb(earley.parse, source)
+        chunked = self._peak_mb(parse_text, source)
+
+        print(f"\nParser peak memory: whole-document {whole:.1f} MB, chunked {chunked:.1f} MB")
+        # ~12 MB vs. ~2 MB locally; the chunked peak tracks the largest statement
+        assert chunked < whole / 2, f"Chunked parse ({chunked:.1f} MB) vs whole ({whole:.1f} MB)"
+
+
+class TestTableScannerBenchmarks:
+    """Large Table statements read by the data scanner instead of the grammar."""
+
+    @staticmethod
+    def _generate_table(num_rows: int, num_cols: int) -> str:
+        width = 10
+        lines = [
+            f"Set i / r1*r{num_rows} /;",
+            f"Set j / c1*c{num_cols} /;",
+            "Table d(i,j) 'synthetic data'",
+            " " * 8 + "".join(f"c{c + 1}".rjust(width) for c in range(num_cols)),
+        ]
+        for r in range(num_rows):
+            cells = "".join(
+                f"{(r * num_cols + c) % 997 / 7:.3f}".rjust(width) for c in range(num_cols)
+            )
+            lines.append(f"r{r + 1}".ljust(8) + cells)
+        return "\n".join(lines) + ";\n"
+
+    def _time_parse(self, source: str) -> tuple[float, int]:
+        start = time.perf_counter()
+        model = parse_model_text(source)
+        return time.perf_counter() - start, len(model.params["d"].values)
+
+    @pytest.mark.slow
+    def test_scanner_matches_and_outpaces_grammar(self, monkeypatch):
+        """Benchmark: 200-cell table, data scanner vs. Earley grammar path."""
+        source = self._generate_table(num_rows=10, num_cols=20)
+        start = time.perf_counter()
+        model = parse_model_text(source)
+        scanned = time.perf_counter() - start
+        monkeypatch.setenv("NLP2MCP_NO_DATA_FASTPATH", "1")
+        start = time.perf_counter()
+        reference = parse_model_text(source)
+        grammar = time.perf_counter() - start
+
+        assert model == reference
+        print(f"\n200-cell table: grammar {grammar:.2f}s, scanner {scanned:.3f}s")
+        # ~4s against ~0.01s locally; the grammar path grows superlinearly
+        assert scanned < grammar / 10
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        ("num_rows", "num_cols", "budget"),
+        [(1000, 100, 3.0), (2000, 500, 30.0)],
+        ids=["1e5-cells", "1e6-cells"],
+    )
+    def test_large_table_parse_time(self, num_rows, num_cols, budget):
+        """Benchmark: parse a 10^5- / 10^6-cell table through the data scanner."""
+        elapsed, cells = self._time_parse(self._generate_table(num_rows, num_cols))
+
+        assert cells == num_rows * num_cols
+        print(f"\n{cells:,}-cell table: {elapsed:.2f}s")
+        # ~0.2s and ~2s locally
+        assert elapsed < budget, f"{cells:,}-cell table took {elapsed:.2f}s (target < {budget}s)"
+
+
+class TestPreprocessorBenchmarks:
+    """Preprocessing time on a large source with directives, tables and equations."""
+
+    @staticmethod
+    def _generate_source(num_blocks: int) -> str:
+        lines = [
+            "$title synthetic",
+            "$set n 20",
+            "$eolcom //",
+            "Set i / i1*i%n% /, j / c1*c4 /;",
+            "Variable x(i), z;",
+        ]
+        for k in range(num_blocks):
+            lines += [
+                f"Parameter p{k}(i) 'data block {k}' /",
+                "    i1  1.5",
+                "    i2  2.5   // trailing note",
+                "/;",
+                f"Table t{k}(i,j) 'table {k}'",
+                "          c1     c2     c3     c4",
+                "   i1    1.0    2.0    3.0    4.0",
+                "   i2    5.0    6.0    7.0    8.0;",
+                f"Equation e{k};",
+                f"e{k}..  sum(i, p{k}(i) * x(i))",
+                f"      + sum(i, t{k}(i,'c1') * x(i))",
+                f"     =g= {k};",
+                f"p{k}(i) = (p{k}(i) + 1",
+                "        * 2);",
+            ]
+        return "\n".join(lines) + "\n"
+
+    @pytest.mark.slow
+    def test_preprocess_large_source(self):
+        """Benchmark: preprocess_text on a 70k-line source."""
+        source = self._generate_source(num_blocks=5000)
+
+        start = time.perf_counter()
+        result = preprocess_text(source)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        preprocess_text(source)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert "p4999(i) = (p4999(i) + 1 * 2);" in result
+        print(f"\nPreprocess 70k lines: {elapsed:.2f}s, peak {peak / 1024 / 1024:.1f} MB")
+        # ~0.5s / 10 MB locally (1.2s / 11.5 MB with one split/join per step)
+        assert elapsed < 3.0, f"Preprocessing took {elapsed:.2f}s (target < 3.0s)"
+
+
+class TestModelCacheBenchmarks:
+    """parse_model_file on a repeat translation, with and without the IR cache."""
+
+    @pytest.mark.slow
+    def test_warm_model_cache_skips_parsing(self, tmp_path, monkeypatch):
+        """Benchmark: parse a 200-variable model, then load it from the cache."""
+        monkeypatch.setenv("NLP2MCP_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.delenv("NLP2MCP_NO_CACHE", raising=False)
+        model_file = TestPerformanceBenchmarks()._generate_model(
+            tmp_path, name="large", num_vars=200, num_constraints=100
+        )
+
+        start = time.perf_counter()
+        cold_model = parse_model_file(model_file)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        warm_model = parse_model_file(model_file)
+        warm = time.perf_counter() - start
+
+        assert warm_model is not cold_model
+        assert warm_model.equations.keys() == cold_model.equations.keys()
+        print(f"\nparse_model_file: cold {cold:.3f}s, warm {warm:.4f}s ({cold / warm:.0f}x)")
+        # ~0.6s cold against ~3ms warm locally
+        assert warm < 0.1, f"Cached parse took {warm:.3f}s (target < 0.1s)"
+
+
+class TestInterningBenchmarks:
+    """Memory held by the gradient, Jacobians and KKT system with hash-consed nodes."""
+
+    _RAW_DIR = Path(__file__).resolve().parents[2] / "data" / "gamslib" / "raw"
+
+    @staticmethod
+    def _generate_source(num_rows: int, num_cols: int) -> str:
+        return f"""
+Set i / i1*i{num_rows} /, j / j1*j{num_cols} /;
+Parameter a(i,j), b(i);
+a(i,j) = 1 + ord(i) / ord(j);
+b(i) = 2;
+Positive Variable x(i), y(j);
+Variable z;
+Equation obj, rows(i), cols(j);
+obj.. z =e= sum(i, sqr(x(i) - b(i))) + sum(j, exp(y(j)) * log(1 + y(j)));
+rows(i).. sum(j, a(i,j) * x(i) * y(j)) + sqr(x(i)) =g= b(i);
+cols(j).. sum(i, a(i,j) * exp(x(i) / (1 + y(j)))) =l= 10;
+Model m /all/;
+Solve m using nlp minimizing z;
+"""
+
+    @staticmethod
+    def _retained_mb(model_ir, monkeypatch, *, intern: bool) -> float:
+        """Bytes allocated by the derivative and KKT stages and still referenced after."""
+        monkeypatch.setenv("NLP2MCP_INTERNING", "1" if intern else "0")
+        normalized_eqs, _ = normalize_model(model_ir)
+        gc.collect()
+        tracemalloc.start()
+        gradient = compute_objective_gradient(model_ir)
+        J_eq, J_ineq = compute_constraint_jacobian(model_ir, normalized_eqs)
+        kkt = assemble_kkt_system(model_ir, gradient, J_eq, J_ineq)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert kkt.stationarity
+        return current / 1024 / 1024
+
+    @pytest.mark.slow
+    def test_interning_shrinks_derivative_memory(self, monkeypatch):
+        """Benchmark: retained memory of a 30x15 indexed model with and without interning."""
+        source = self._generate_source(num_rows=30, num_cols=15)
+
+        plain = self._retained_mb(parse_model_text(source), monkeypatch, intern=False)
+        interned = self._retained_mb(parse_model_text(source), monkeypatch, intern=True)
+
+        print(f"\nDerivative/KKT memory: plain {plain:.2f} MB, interned {interned:.2f} MB")
+        # ~2.7 MB vs. ~1.2 MB locally
+        assert interned < plain * 0.75, f"Interned {interned:.2f} MB vs plain {plain:.2f} MB"
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("rank", range(3))
+    def test_interning_on_largest_gamslib_models(self, rank, monkeypatch):
+        """Benchmark: the same comparison on the largest downloaded GAMSLIB models."""
+        models = sorted(self._RAW_DIR.glob("*.gms"), key=lambda p: p.stat().st_size)[::-1]
+        if rank >= len(models):
+            pytest.skip("GAMSLIB models not downloaded (scripts/gamslib/download_models.py)")
+        old_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(old_limit, 50000))
+        try:
+            plain = self._retained_mb(parse_model_file(models[rank]), monkeypatch, intern=False)
+            interned = self._retained_mb(parse_model_file(models[rank]), monkeypatch, intern=True)
+        except Exception as e:  # not every GAMSLIB model translates
+            pytest.skip(f"{models[rank].stem} does not translate: {type(e).__name__}")
+        finally:
+            sys.setrecursionlimit(old_limit)
+
+        print(f"\n{models[rank].stem}: plain {plain:.2f} MB, interned {interned:.2f} MB")
+        assert interned <= plain * 1.05
+
+
+class TestNodeLayoutBenchmarks:
+    """Memory retained per Jacobian entry by the slotted AST representation."""
+
+    @staticmethod
+    def _bytes_per_entry(source: str, monkeypatch, *, intern: bool) -> float:
+        monkeypatch.setenv("NLP2MCP_INTERNING", "1" if intern else "0")
+        model_ir = parse_model_text(source)
+        normalized_eqs, _ = normalize_model(model_ir)
+        gc.collect()
+        tracemalloc.start()
+        J_eq, J_ineq = compute_constraint_jacobian(model_ir, normalized_eqs)
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return current / (J_eq.num_nonzeros() + J_ineq.num_nonzeros())
+
+    @pytest.mark.slow
+    def test_bytes_per_jacobian_entry(self, monkeypatch):
+        """Benchmark: Jacobian memory of a 60x30 indexed model (3781 entries)."""
+        source = TestInterningBenchmarks._generate_source(num_rows=60, num_cols=30)
+
+        plain = self._bytes_per_entry(source, monkeypatch, intern=False)
+        interned = self._bytes_per_entry(source, monkeypatch, intern=True)
+
+        print(f"\nJacobian bytes/entry: plain {plain:.0f}, interned {interned:.0f}")
+        # ~1100 and ~455 locally; nodes with a per-instance __dict__ and
+        # uninterned labels took ~1600 and ~830
+        assert plain < 1350, f"{plain:.0f} bytes per Jacobian entry without interning"
+        assert interned < 650, f"{interned:.0f} bytes per Jacobian entry with interning"
+
+
+class TestLongSumBenchmarks:
+    """A 10^4-term objective written out term by term (a left-nested chain of "+")."""
+
+    @staticmethod
+    def _objective(num_terms: int, num_vars: int) -> Expr:
+        expr: Expr = Binary("*", ParamRef("c", ("k0",)), VarRef("x", ("v0",)))
+        for k in range(1, num_terms):
+            term = Binary("*", ParamRef("c", (f"k{k}",)), VarRef("x", (f"v{k % num_vars}",)))
+            expr = Binary("+", expr, term)
+        return expr
+
+    @pytest.mark.slow
+    def test_long_objective_is_linear(self):
+        """Benchmark: simplify, differentiate and emit a 10^4-term linear objective."""
+        objective = self._objective(num_terms=10_000, num_vars=50)
+
+        start = time.perf_counter()
+        simplified = simplify_advanced(objective)
+        derivative = simplify_advanced(differentiate_expr(objective, "x", ("v3",)))
+        gams = expr_to_gams(simplified)
+        elapsed = time.perf_counter() - start
+
+        assert gams.count(" + ") == 9_999
+        assert expr_to_gams(derivative).count("c(") == 200
+        print(f"\n10^4-term objective: {elapsed:.2f}s")
+        # ~3s locally; collecting terms at every nested "+" node took ~19s
+        # for 10^3 terms and hit the recursion limit well before 10^4
+        assert elapsed < 10.0, f"Long objective took {elapsed:.2f}s (target < 10.0s)"
+
+    @pytest.mark.slow
+    def test_gradient_of_long_objective(self):
+        """Benchmark: gradient of a 10^4-term objective over 10^4 variable instances."""
+        num_vars = 10_000
+        model_ir = ModelIR()
+        model_ir.add_set(SetDef("v", [f"v{k}" for k in range(num_vars)]))
+        model_ir.params["c"] = ParameterDef(name="c", domain=("v",))
+        model_ir.add_var(VariableDef("x", ("v",)))
+        # sum of c('vk') * x('vk') + sqr(x('vk')), written out term by term
+        objective: Expr = Call("sqr", (VarRef("x", ("v0",)),))
+        for k in range(num_vars):
+            term = Binary("*", ParamRef("c", (f"v{k}",)), VarRef("x", (f"v{k}",)))
+            objective = Binary("+", objective, term)
+            if k:
+                objective = Binary("+", objective, Call("sqr", (VarRef("x", (f"v{k}",)),)))
+        model_ir.objective = ObjectiveIR(ObjSense.MIN, "obj", expr=objective)
+
+        start = time.perf_counter()
+        gradient = compute_objective_gradient(model_ir)
+        elapsed = time.perf_counter() - start
+
+        assert gradient.num_nonzeros() == num_vars
+        whole = apply_simplification(differentiate_expr(objective, "x", ("v7",)), "advanced")
+        assert gradient.get_derivative_by_name("x", ("v7",)) == whole
+        print(f"\nGradient of a 10^4-term objective: {elapsed:.2f}s")
+        # ~6s locally; differentiating the whole objective per instance took
+        # ~550s for 2x10^3 terms and grows quadratically
+        assert elapsed < 30.0, f"Gradient took {elapsed:.2f}s (target < 30.0s)"
+
+
+class TestStationarityBenchmarks:
+    """KKT assembly reads each Jacobian column once through the cached column index."""
+
+    @staticmethod
+    def _generate_source(n: int) -> str:
+        return f"""
+Set i / i1*i{n} /;
+Parameter b(i);
+b(i) = ord(i);
+Positive Variable x(i), y(i);
+Variable z;
+Equation obj, link(i), cap(i);
+obj.. z =e= sum(i, sqr(x(i) - b(i)) + y(i));
+link(i).. x(i) * y(i) =g= 1;
+cap(i).. x(i) + 2 * y(i) =l= b(i) + 10;
+Model m /all/;
+Solve m using nlp minimizing z;
+"""
+
+    def _assembly_time(self, n: int) -> float:
+        model_ir = parse_model_text(self._generate_source(n))
+        normalized_eqs, _ = normalize_model(model_ir)
+        gradient = compute_objective_gradient(model_ir)
+        J_eq, J_ineq = compute_constraint_jacobian(model_ir, normalized_eqs)
+        assert J_ineq.num_nonzeros() == 4 * n
+
+        start = time.perf_counter()
+        kkt = assemble_kkt_system(model_ir, gradient, J_eq, J_ineq)
+        elapsed = time.perf_counter() - start
+        assert kkt.stationarity
+        return elapsed
+
+    @pytest.mark.slow
+    def test_assembly_is_linear_in_nonzeros(self):
+        """Benchmark: KKT assembly for 2x10^3 vs. 8x10^3 inequality rows."""
+        small = self._assembly_time(1_000)
+        large = self._assembly_time(4_000)
+
+        print(f"\nKKT assembly: {small:.3f}s for 4x10^3 nonzeros, {large:.3f}s for 1.6x10^4")
+        # ~0.1s and ~0.3s locally; scanning every row for each column took
+        # ~1s and ~18s (4x the nonzeros, 16x the time)
+        assert large < 3.0, f"KKT assembly took {large:.2f}s for 1.6x10^4 nonzeros"
+        assert large < small * 10, f"{small:.3f}s -> {large:.3f}s for 4x the nonzeros"
+
+
+class TestSparseScalingBenchmarks:
+    """Structural scaling works on the Jacobian's nonzeros, not a dense copy."""
+
+    @pytest.mark.slow
+    def test_curtis_reid_on_large_jacobian(self):
+        """Benchmark: Curtis-Reid scaling of a 10^5 x 10^5 Jacobian with 3x10^5 nonzeros."""
+        n = 100_000
+        jac = JacobianStructure(num_rows=n, num_cols=n)
+        one = Const(1.0)
+        for i in range(n):
+            for j in (i, (i + 1) % n, (7 * i) % n):
+                jac.set_derivative(i, j, one)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        R, C = curtis_reid_scaling(jac)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert R.shape == C.shape == (n,)
+        print(f"\nCurtis-Reid 10^5 x 10^5: {elapsed:.2f}s, peak {peak / 1024 / 1024:.0f} MB")
+        # ~0.6s and ~20 MB locally; the dense matrix alone would take 80 GB
+        # (5000 x 5000 took ~1s and 200 MB per copy)
+        assert elapsed < 5.0, f"Scaling took {elapsed:.2f}s (target < 5.0s)"
+        assert peak < 500 * 1024 * 1024, f"Scaling peaked at {peak / 1024 / 1024:.0f} MB"
@@ -4,6 +4,8 @@ This module provides pytest fixtures and helper functions used across
 multiple test files to reduce duplication and ensure consistency.
 """
 
+import dataclasses
+import math
 import sys
 from pathlib import Path
 
@@ -17,6 +19,23 @@ if str(tests_dir) not in sys.path:
     sys.path.insert(0, str(tests_dir))
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_disk_caches(tmp_path_factory):
+    """Keep the on-disk caches (grammar, preprocessed source, ModelIR) out of the suite.
+
+    Caching is disabled, so ``parse_model_file`` always reaches the parser
+    and tests that patch parser internals cannot pass on a stale cache hit.
+    The cache root also points at a temporary directory, so a test that
+    re-enables caching without choosing its own directory writes nothing to
+    ``~/.cache/nlp2mcp``. Cache tests opt back in by unsetting
+    ``NLP2MCP_NO_CACHE`` and setting ``NLP2MCP_CACHE_DIR`` themselves.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("NLP2MCP_CACHE_DIR", str(tmp_path_factory.mktemp("nlp2mcp-cache")))
+        mp.setenv("NLP2MCP_NO_CACHE", "1")
+        yield
+
+
 @pytest.fixture
 def manual_index_mapping():
     """Fixture that returns a helper function to manually create IndexMapping for tests.
@@ -58,3 +77,31 @@ def manual_index_mapping():
         return mapping
 
     return _manual_index_mapping
+
+
+@pytest.fixture
+def same_structure():
+    """Fixture that returns a structural equality check for parsed ModelIR objects.
+
+    Dataclasses are compared field by field, dicts by key order and values,
+    and NaN (GAMS ``na``) is treated as equal to itself.
+
+    Example:
+        >>> def test_something(same_structure):
+        >>>     assert same_structure(parse_model_text(src), parse_model_text(src))
+    """
+
+    def _same(a, b) -> bool:
+        if isinstance(a, float) and isinstance(b, float):
+            return a == b or (math.isnan(a) and math.isnan(b))
+        if type(a) is not type(b):
+            return False
+        if dataclasses.is_dataclass(a):
+            return all(_same(getattr(a, f.name), getattr(b, f.name)) for f in dataclasses.fields(a))
+        if isinstance(a, dict):
+            return list(a) == list(b) and all(_same(a[k], b[k]) for k in a)
+        if isinstance(a, list | tuple):
+            return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b, strict=True))
+        return a == b
+
+    return _same
@@ -81,6 +81,7 @@ import pytest
 #   dynamic_complete lexer to standard lexer with ambiguity="resolve"
 #   https://github.com/jeffreyhorn/nlp2mcp/issues/20
 from src.ad.api import compute_derivatives
+from src.ad.index_mapping import enumerate_equation_instances
 from src.ir.normalize import normalize_model
 from src.ir.parser import parse_model_file, parse_tree
 
@@ -109,6 +110,23 @@ def parse_and_normalize(filename: str):
     return model_ir
 
 
+# Helper to count the rows a list of equations expands to
+def count_equation_instances(model_ir, equation_names: list[str]) -> int:
+    """Count instances of indexed equations and of normalized bounds (e.g. fixed variables)."""
+    total_count = 0
+    for eq_name in equation_names:
+        if eq_name in model_ir.equations:
+            eq_def = model_ir.equations[eq_name]
+            domain, condition = eq_def.domain, eq_def.condition
+        elif eq_name in model_ir.normalized_bounds:
+            norm_eq = model_ir.normalized_bounds[eq_name]
+            domain, condition = norm_eq.domain_sets, norm_eq.condition
+        else:
+            continue
+        total_count += len(enumerate_equation_instances(eq_name, domain, model_ir, condition))
+    return total_count
+
+
 @pytest.mark.e2e
 class TestScalarModels:
     """Test integration on scalar (non-indexed) models."""
@@ -259,18 +277,19 @@ class TestConsistency:
         # All three should have same variable mappings
         assert gradient.index_mapping.num_vars == J_g.index_mapping.num_vars
         assert gradient.index_mapping.num_vars == J_h.index_mapping.num_vars
+        # The Jacobians share one variable side rather than each copying it
+        assert J_h.index_mapping.var_to_col is J_g.index_mapping.var_to_col
+        assert J_h.index_mapping.col_to_var is J_g.index_mapping.col_to_var
 
         # Note: Equation mappings are now separate for J_eq and J_ineq,
-        # so num_eqs will differ between them. The gradient uses a global
-        # equation mapping that includes all equations.
+        # so num_eqs will differ between them. The gradient's mapping has
+        # columns only.
 
         # The number of equation instances (rows) should equal the total number of
         # expanded instances (indexed equations expand to multiple rows).
         # Verify exact counts to catch unexpected dimension inflation.
-        from src.ad.constraint_jacobian import _count_equation_instances
-
-        expected_eq_rows = _count_equation_instances(model_ir, model_ir.equalities)
-        expected_ineq_rows = _count_equation_instances(model_ir, model_ir.inequalities)
+        expected_eq_rows = count_equation_instances(model_ir, model_ir.equalities)
+        expected_ineq_rows = count_equation_instances(model_ir, model_ir.inequalities)
 
         assert J_h.index_mapping.num_eqs == expected_eq_rows
         assert J_g.index_mapping.num_eqs == expected_ineq_rows
@@ -323,6 +323,12 @@ Solve test_model using lp minimizing obj;
 class TestRunBatchParse:
     """Tests for run_batch_parse function."""
 
+    @pytest.fixture(autouse=True)
+    def upserts(self):
+        """Capture per-model database updates instead of journaling them."""
+        with patch("scripts.gamslib.batch_parse.upsert_model") as mock_upsert:
+            yield mock_upsert
+
     def _make_args(
         self,
         dry_run: bool = False,
@@ -350,7 +356,7 @@ class TestRunBatchParse:
             model_type=model_type,
         )
 
-    def test_dry_run_does_not_modify_database(self, tmp_path: Path) -> None:
+    def test_dry_run_does_not_modify_database(self, tmp_path: Path, upserts: MagicMock) -> None:
         """Test dry run mode doesn't modify the database."""
         database = {
             "models": [
@@ -361,13 +367,14 @@ class TestRunBatchParse:
         model_file.write_text("* Test model")
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database") as mock_save:
+            with patch("scripts.gamslib.batch_parse.compact_database") as mock_save:
                 with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                     args = self._make_args(dry_run=True)
                     stats = run_batch_parse(args)
 
-        # save_database should not be called in dry run
+        # The database should not be written in dry run
         mock_save.assert_not_called()
+        upserts.assert_not_called()
         assert stats["processed"] == 1
         assert "nlp2mcp_parse" not in database["models"][0]
 
@@ -381,7 +388,7 @@ class TestRunBatchParse:
         }
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database"):
+            with patch("scripts.gamslib.batch_parse.compact_database"):
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         args = self._make_args(dry_run=True, limit=3)
@@ -402,7 +409,7 @@ class TestRunBatchParse:
         model_file.write_text("* Target model")
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database"):
+            with patch("scripts.gamslib.batch_parse.compact_database"):
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         args = self._make_args(dry_run=True, model="target_model")
@@ -435,7 +442,7 @@ class TestRunBatchParse:
         # Don't create the file - it should be skipped
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database"):
+            with patch("scripts.gamslib.batch_parse.compact_database"):
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         args = self._make_args()
@@ -444,7 +451,7 @@ class TestRunBatchParse:
         assert stats["skipped"] == 1
         assert stats["processed"] == 0
 
-    def test_successful_parse_updates_database(self, tmp_path: Path) -> None:
+    def test_successful_parse_updates_database(self, tmp_path: Path, upserts: MagicMock) -> None:
         """Test successful parse updates database with results."""
         database = {
             "models": [
@@ -459,7 +466,7 @@ class TestRunBatchParse:
         mock_model.equations = {"eq1": {}}
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database"):
+            with patch("scripts.gamslib.batch_parse.compact_database"):
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         with patch("src.ir.parser.parse_model_file", return_value=mock_model):
@@ -473,6 +480,13 @@ class TestRunBatchParse:
         assert database["models"][0]["nlp2mcp_parse"]["status"] == "success"
         assert database["models"][0]["nlp2mcp_parse"]["variables_count"] == 2
         assert database["models"][0]["nlp2mcp_parse"]["equations_count"] == 1
+        upserts.assert_called_once_with(
+            "good_model",
+            {
+                "nlp2mcp_parse": database["models"][0]["nlp2mcp_parse"],
+                "model_statistics": database["models"][0]["model_statistics"],
+            },
+        )
 
     def test_failed_parse_updates_database_with_error(self, tmp_path: Path) -> None:
         """Test failed parse updates database with error information."""
@@ -485,7 +499,7 @@ class TestRunBatchParse:
         model_file.write_text("* Bad model")
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database"):
+            with patch("scripts.gamslib.batch_parse.compact_database"):
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         with patch("src.ir.parser.parse_model_file") as mock_parse:
@@ -500,8 +514,8 @@ class TestRunBatchParse:
         assert database["models"][0]["nlp2mcp_parse"]["status"] == "failure"
         assert database["models"][0]["nlp2mcp_parse"]["error"]["category"] == "internal_error"
 
-    def test_periodic_save(self, tmp_path: Path) -> None:
-        """Test database is saved periodically based on save_every."""
+    def test_periodic_save(self, tmp_path: Path, upserts: MagicMock) -> None:
+        """Test every result is journaled and the journal compacted based on save_every."""
         database = {
             "models": [
                 {"model_id": f"model{i}", "convexity": {"status": "verified_convex"}}
@@ -517,7 +531,7 @@ class TestRunBatchParse:
         mock_model.equations = {}
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database") as mock_save:
+            with patch("scripts.gamslib.batch_parse.compact_database") as mock_save:
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         with patch("src.ir.parser.parse_model_file", return_value=mock_model):
@@ -525,8 +539,9 @@ class TestRunBatchParse:
                                 args = self._make_args(save_every=2)
                                 run_batch_parse(args)
 
-        # Should save at processed=2, processed=4, and final save = 3 calls
+        # Should compact at processed=2, processed=4, and final save = 3 calls
         assert mock_save.call_count == 3
+        assert [c.args[0] for c in upserts.call_args_list] == [f"model{i}" for i in range(5)]
 
     def test_calculates_success_rate(self, tmp_path: Path) -> None:
         """Test success rate calculation."""
@@ -545,7 +560,7 @@ class TestRunBatchParse:
         mock_model.equations = {}
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database"):
+            with patch("scripts.gamslib.batch_parse.compact_database"):
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         with patch("src.ir.parser.parse_model_file", return_value=mock_model):
@@ -570,7 +585,7 @@ class TestRunBatchParse:
         mock_model.equations = {}
 
         with patch("scripts.gamslib.batch_parse.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_parse.save_database"):
+            with patch("scripts.gamslib.batch_parse.compact_database"):
                 with patch("scripts.gamslib.batch_parse.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_parse.RAW_MODELS_DIR", tmp_path):
                         with patch("src.ir.parser.parse_model_file", return_value=mock_model):
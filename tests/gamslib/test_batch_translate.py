@@ -18,11 +18,14 @@ from scripts.gamslib.batch_translate import (  # noqa: E402
     get_parsed_models,
     print_summary,
     run_batch_translate,
+    translate_models,
     translate_single_model,
     validate_filter_args,
     validate_mcp_file,
+    warm_grammar_cache,
 )
 from scripts.gamslib.error_taxonomy import categorize_translate_error  # noqa: E402
+from src.server import TranslateResult  # noqa: E402
 
 
 class TestCategorizeTranslateError:
@@ -212,10 +215,163 @@ class TestTranslateSingleModel:
 
         assert output_file.parent.exists()
 
+    def test_pool_runs_same_cli_arguments(self, tmp_path: Path) -> None:
+        """Test a worker pool receives the subprocess arguments and timeout."""
+        output_file = tmp_path / "output" / "test_model_mcp.gms"
+        pool = MagicMock()
+        pool.translate.return_value = TranslateResult("ok", 0, "", "", 0.25)
+
+        with patch("scripts.gamslib.batch_translate.PROJECT_ROOT", tmp_path):
+            result = translate_single_model(
+                tmp_path / "test_model.gms", output_file, nlp_presolve=True, pool=pool
+            )
+
+        args = [str(tmp_path / "test_model.gms"), "-o", str(output_file), "--quiet"]
+        pool.translate.assert_called_once_with([*args, "--nlp-presolve"], timeout=600)
+        assert result == {
+            "status": "success",
+            "translate_time_seconds": 0.25,
+            "output_file": "output/test_model_mcp.gms",
+        }
+
+    def test_pool_failure_uses_stderr(self, tmp_path: Path) -> None:
+        """Test a failed pool translation is categorized from its stderr."""
+        pool = MagicMock()
+        pool.translate.return_value = TranslateResult(
+            "failed", 1, "", "Error: Differentiation not yet implemented for function 'gamma'", 0.1
+        )
+
+        result = translate_single_model(tmp_path / "m.gms", tmp_path / "m_mcp.gms", pool=pool)
+
+        assert result["status"] == "failure"
+        assert result["error"]["category"] == "diff_unsupported_func"
+
+    def test_pool_timeout(self, tmp_path: Path) -> None:
+        """Test a pool timeout is recorded like a subprocess timeout."""
+        pool = MagicMock()
+        pool.translate.return_value = TranslateResult(
+            "timeout", None, "", "Translation timeout after 600 seconds", 600.0
+        )
+
+        result = translate_single_model(tmp_path / "m.gms", tmp_path / "m_mcp.gms", pool=pool)
+
+        assert result["status"] == "failure"
+        assert result["error"] == {
+            "category": "timeout",
+            "message": "Translation timeout after 600 seconds",
+        }
+
+    def test_pool_worker_crash_is_failure(self, tmp_path: Path) -> None:
+        """Test a worker that died mid-translation records a failure."""
+        pool = MagicMock()
+        pool.translate.return_value = TranslateResult(
+            "crashed", None, "", "Worker process died (exit code -9)", 3.0
+        )
+
+        result = translate_single_model(tmp_path / "m.gms", tmp_path / "m_mcp.gms", pool=pool)
+
+        assert result["status"] == "failure"
+        assert "Worker process died" in result["error"]["message"]
+
+
+class TestTranslateModels:
+    """Tests for translate_models function."""
+
+    def test_sequential_in_order(self, tmp_path: Path) -> None:
+        """Test jobs=1 translates in a subprocess per model, in order."""
+        tasks = [(tmp_path / f"m{i}.gms", tmp_path / f"m{i}_mcp.gms") for i in range(3)]
+        with patch(
+            "scripts.gamslib.batch_translate.translate_single_model",
+            side_effect=lambda model_path, output_path, pool: {"status": model_path.stem},
+        ) as mock_translate:
+            results = list(translate_models(tasks))
+
+        assert results == [(0, {"status": "m0"}), (1, {"status": "m1"}), (2, {"status": "m2"})]
+        assert all(c.kwargs["pool"] is None for c in mock_translate.call_args_list)
+
+    def test_parallel_uses_pool(self, tmp_path: Path) -> None:
+        """Test jobs>1 dispatches every model to one worker pool."""
+        tasks = [(tmp_path / f"m{i}.gms", tmp_path / f"m{i}_mcp.gms") for i in range(4)]
+        pool = MagicMock()
+        pool.__enter__.return_value = pool
+        with (
+            patch(
+                "scripts.gamslib.batch_translate.make_translation_pool", return_value=pool
+            ) as mock_make,
+            patch(
+                "scripts.gamslib.batch_translate.translate_single_model",
+                side_effect=lambda model_path, output_path, pool: {"status": model_path.stem},
+            ) as mock_translate,
+        ):
+            results = dict(translate_models(tasks, jobs=2))
+
+        mock_make.assert_called_once_with(2)
+        pool.__exit__.assert_called_once()
+        assert results == {i: {"status": f"m{i}"} for i in range(4)}
+        assert all(c.kwargs["pool"] is pool for c in mock_translate.call_args_list)
+
+    def test_validates_successful_outputs(self, tmp_path: Path) -> None:
+        """Test validate=True compile-checks only successful translations."""
+        tasks = [(tmp_path / "good.gms", tmp_path / "good_mcp.gms")]
+        tasks.append((tmp_path / "bad.gms", tmp_path / "bad_mcp.gms"))
+        with (
+            patch(
+                "scripts.gamslib.batch_translate.translate_single_model",
+                side_effect=lambda model_path, output_path, pool: {
+                    "status": "success" if model_path.stem == "good" else "failure"
+                },
+            ),
+            patch(
+                "scripts.gamslib.batch_translate.validate_mcp_file",
+                return_value={"valid": True},
+            ) as mock_validate,
+        ):
+            results = dict(translate_models(tasks, validate=True))
+
+        mock_validate.assert_called_once_with(tmp_path / "good_mcp.gms")
+        assert results[0]["validation"] == {"valid": True}
+        assert "validation" not in results[1]
+
+    @pytest.mark.integration
+    def test_worker_pool_matches_subprocess(self, tmp_path: Path) -> None:
+        """Test pooled and subprocess translations record the same outcomes."""
+        (tmp_path / "broken.gms").write_text("Variable x;\nEquation e;\ne.. x =e= (1;\n")
+        models = [PROJECT_ROOT / "examples" / "simple_nlp.gms", tmp_path / "broken.gms"]
+
+        outcomes = {}
+        with patch("scripts.gamslib.batch_translate.PROJECT_ROOT", tmp_path):
+            for jobs in (1, 2):
+                tasks = [(m, tmp_path / f"jobs{jobs}" / f"{m.stem}_mcp.gms") for m in models]
+                results = dict(translate_models(tasks, jobs=jobs))
+                outcomes[jobs] = [
+                    (r["status"], r.get("error", {}).get("category"))
+                    for _, r in sorted(results.items())
+                ]
+                if jobs == 2:
+                    assert (tmp_path / "jobs2" / "simple_nlp_mcp.gms").read_text() == (
+                        tmp_path / "jobs1" / "simple_nlp_mcp.gms"
+                    ).read_text()
+
+        assert outcomes[1] == outcomes[2]
+        assert outcomes[1][0] == ("success", None)
+        assert outcomes[1][1][0] == "failure"
+
 
 class TestRunBatchTranslate:
     """Tests for run_batch_translate function."""
 
+    @pytest.fixture(autouse=True)
+    def upserts(self):
+        """Capture per-model database updates instead of journaling them."""
+        with patch("scripts.gamslib.batch_translate.upsert_model") as mock_upsert:
+            yield mock_upsert
+
+    @pytest.fixture(autouse=True)
+    def _no_grammar_cache_warmup(self):
+        """Keep the real ``--warm-grammar-cache`` subprocess out of unit tests."""
+        with patch("scripts.gamslib.batch_translate.warm_grammar_cache") as mock_warm:
+            yield mock_warm
+
     def _make_args(
         self,
         dry_run: bool = False,
@@ -230,9 +386,11 @@ class TestRunBatchTranslate:
         error_category: str | None = None,
         model_type: str | None = None,
         validate: bool = False,
+        jobs: int = 1,
     ) -> argparse.Namespace:
         """Create argparse.Namespace with default values."""
         return argparse.Namespace(
+            jobs=jobs,
             dry_run=dry_run,
             limit=limit,
             model=model,
@@ -258,7 +416,7 @@ class TestRunBatchTranslate:
         model_file.write_text("* Test model")
 
         with patch("scripts.gamslib.batch_translate.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_translate.save_database") as mock_save:
+            with patch("scripts.gamslib.batch_translate.compact_database") as mock_save:
                 with patch("scripts.gamslib.batch_translate.RAW_MODELS_DIR", tmp_path):
                     with patch("scripts.gamslib.batch_translate.subprocess.Popen") as mock_popen:
                         args = self._make_args(dry_run=True)
@@ -277,7 +435,7 @@ class TestRunBatchTranslate:
         }
 
         with patch("scripts.gamslib.batch_translate.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_translate.save_database"):
+            with patch("scripts.gamslib.batch_translate.compact_database"):
                 with patch("scripts.gamslib.batch_translate.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_translate.RAW_MODELS_DIR", tmp_path):
                         args = self._make_args(dry_run=True, limit=3)
@@ -298,7 +456,7 @@ class TestRunBatchTranslate:
         model_file.write_text("* Target model")
 
         with patch("scripts.gamslib.batch_translate.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_translate.save_database"):
+            with patch("scripts.gamslib.batch_translate.compact_database"):
                 with patch("scripts.gamslib.batch_translate.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_translate.RAW_MODELS_DIR", tmp_path):
                         args = self._make_args(dry_run=True, model="target_model")
@@ -330,7 +488,7 @@ class TestRunBatchTranslate:
         }
 
         with patch("scripts.gamslib.batch_translate.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_translate.save_database"):
+            with patch("scripts.gamslib.batch_translate.compact_database"):
                 with patch("scripts.gamslib.batch_translate.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_translate.RAW_MODELS_DIR", tmp_path):
                         args = self._make_args()
@@ -339,7 +497,9 @@ class TestRunBatchTranslate:
         assert stats["skipped"] == 1
         assert stats["processed"] == 0
 
-    def test_successful_translation_updates_database(self, tmp_path: Path) -> None:
+    def test_successful_translation_updates_database(
+        self, tmp_path: Path, upserts: MagicMock
+    ) -> None:
         """Test successful translation updates database with results."""
         database = {
             "models": [
@@ -354,7 +514,7 @@ class TestRunBatchTranslate:
         mock_proc.returncode = 0
 
         with patch("scripts.gamslib.batch_translate.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_translate.save_database"):
+            with patch("scripts.gamslib.batch_translate.compact_database"):
                 with patch("scripts.gamslib.batch_translate.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_translate.RAW_MODELS_DIR", tmp_path):
                         with patch(
@@ -368,6 +528,9 @@ class TestRunBatchTranslate:
         assert stats["failure"] == 0
         assert "nlp2mcp_translate" in database["models"][0]
         assert database["models"][0]["nlp2mcp_translate"]["status"] == "success"
+        upserts.assert_called_once_with(
+            "good_model", {"nlp2mcp_translate": database["models"][0]["nlp2mcp_translate"]}
+        )
 
     def test_failed_translation_updates_database_with_error(self, tmp_path: Path) -> None:
         """Test failed translation updates database with error information."""
@@ -384,7 +547,7 @@ class TestRunBatchTranslate:
         mock_proc.returncode = 1
 
         with patch("scripts.gamslib.batch_translate.load_database", return_value=database):
-            with patch("scripts.gamslib.batch_translate.save_database"):
+            with patch("scripts.gamslib.batch_translate.compact_database"):
                 with patch("scripts.gamslib.batch_translate.create_backup", return_value=None):
                     with patch("scripts.gamslib.batch_translate.RAW_MODELS_DIR", tmp_path):
                         with patch(
@@ -400,6 +563,27 @@ class TestRunBatchTranslate:
         assert database["models"][0]["nlp2mcp_translate"]["status"] == "failure"
 
 
+class TestWarmGrammarCache:
+    """Tests for warm_grammar_cache function."""
+
+    def test_invokes_cli_warm_flag(self) -> None:
+        """Test the CLI is run once with --warm-grammar-cache."""
+        with patch("scripts.gamslib.batch_translate.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            warm_grammar_cache()
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[1:] == ["-m", "src.cli", "--warm-grammar-cache"]
+
+    def test_failure_is_not_fatal(self) -> None:
+        """Test a failing warm-up only logs and returns."""
+        with patch(
+            "scripts.gamslib.batch_translate.subprocess.run",
+            side_effect=subprocess.TimeoutExpired(cmd="nlp2mcp", timeout=120),
+        ):
+            warm_grammar_cache()
+
+
 class TestPrintSummary:
     """Tests for print_summary function."""
 
@@ -0,0 +1,167 @@
+"""Tests for model input fingerprints and ``run_full_test.py --incremental``."""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.gamslib import run_full_test as rft
+from scripts.gamslib.model_fingerprint import (
+    FINGERPRINT_FIELD,
+    fingerprint_entry,
+    is_unchanged,
+    model_fingerprint,
+    source_tree_digest,
+)
+
+
+@pytest.fixture
+def model(tmp_path: Path) -> Path:
+    folder = tmp_path / "raw"
+    folder.mkdir()
+    (folder / "data.inc").write_text("Set i / a, b /;\n")
+    root = folder / "model.gms"
+    root.write_text("$include data.inc\n$batInclude optional.inc x\nScalar s / 3 /;\n")
+    return root
+
+
+class TestModelFingerprint:
+    """Tests for model_fingerprint()."""
+
+    @pytest.mark.parametrize("changed", ["model.gms", "data.inc", "optional.inc"])
+    def test_any_file_in_the_closure_changes_it(self, model: Path, changed: str) -> None:
+        before = model_fingerprint(model, "src")
+        path = model.parent / changed
+        path.write_text((path.read_text() if path.exists() else "") + "* edit\n")
+
+        assert model_fingerprint(model, "src") != before
+
+    def test_unrelated_files_do_not_change_it(self, model: Path) -> None:
+        before = model_fingerprint(model, "src")
+        (model.parent / "other.gms").write_text("Scalar t;\n")
+
+        assert model_fingerprint(model, "src") == before
+
+    def test_source_digest_changes_it(self, model: Path) -> None:
+        assert model_fingerprint(model, "src-a") != model_fingerprint(model, "src-b")
+
+    def test_independent_of_checkout_location(self, model: Path, tmp_path: Path) -> None:
+        moved = shutil.copytree(model.parent, tmp_path / "elsewhere" / "raw")
+
+        assert model_fingerprint(moved / "model.gms", "src") == model_fingerprint(model, "src")
+
+    def test_missing_include_has_no_fingerprint(self, model: Path) -> None:
+        (model.parent / "data.inc").unlink()
+
+        assert model_fingerprint(model, "src") is None
+
+    def test_source_tree_digest_is_stable(self) -> None:
+        source_tree_digest.cache_clear()
+        first = source_tree_digest()
+        source_tree_digest.cache_clear()
+
+        assert source_tree_digest() == first
+
+
+class TestIsUnchanged:
+    """Tests for is_unchanged() and fingerprint_entry()."""
+
+    def test_requires_same_digest_and_covered_stages(self) -> None:
+        model = {"model_id": "m"}
+        model[FINGERPRINT_FIELD] = fingerprint_entry(model, "d1", ["parse", "translate"])
+
+        assert is_unchanged(model, "d1", ["translate"])
+        assert not is_unchanged(model, "d2", ["translate"])
+        assert not is_unchanged(model, "d1", ["parse", "translate", "solve", "compare"])
+        assert not is_unchanged(model, None, [])
+        assert not is_unchanged({"model_id": "m"}, "d1", ["parse"])
+
+    def test_stages_accumulate_under_the_same_digest(self) -> None:
+        model = {"model_id": "m"}
+        model[FINGERPRINT_FIELD] = fingerprint_entry(model, "d1", ["translate"])
+        model[FINGERPRINT_FIELD] = fingerprint_entry(model, "d1", ["parse"])
+        assert model[FINGERPRINT_FIELD]["stages"] == ["parse", "translate"]
+
+        model[FINGERPRINT_FIELD] = fingerprint_entry(model, "d2", ["solve", "compare"])
+        assert model[FINGERPRINT_FIELD]["stages"] == ["solve", "compare"]
+
+
+def _args(**overrides) -> argparse.Namespace:
+    flags = (
+        "dry_run json only_failing only_parse only_solve only_translate parse_failure "
+        "parse_success quick quiet skip_completed solve_failure solve_success "
+        "translate_failure translate_success verbose incremental"
+    )
+    values = dict.fromkeys(flags.split(), False)
+    values.update(limit=None, model=None, random=None, type=None, jobs=1, quiet=True)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class TestIncrementalRun:
+    """``run_full_test.py --incremental`` re-runs only models whose inputs changed."""
+
+    @pytest.fixture
+    def corpus(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict:
+        monkeypatch.setattr(rft, "PROJECT_ROOT", tmp_path)
+        monkeypatch.setattr(rft, "upsert_model", MagicMock())
+        monkeypatch.setattr(rft, "compact_database", MagicMock())
+        raw = tmp_path / "data" / "gamslib" / "raw"
+        raw.mkdir(parents=True)
+        models = []
+        for i in range(3):
+            (raw / f"m{i}.gms").write_text(f"* model {i}\n")
+            models.append(
+                {
+                    "model_id": f"m{i}",
+                    "convexity": {"status": "verified_convex"},
+                    "nlp2mcp_parse": {"status": "success"},
+                }
+            )
+        return {"models": models}
+
+    def _run(self, corpus: dict, **overrides) -> tuple[dict, MagicMock]:
+        with (
+            patch.object(rft, "load_database", return_value=corpus),
+            patch.object(rft, "create_backup", return_value=None),
+            patch(
+                "scripts.gamslib.batch_translate.translate_single_model",
+                return_value={"status": "success", "translate_time_seconds": 0.01},
+            ) as mock_translate,
+        ):
+            stats = rft.run_full_test(_args(**{"only_translate": True, **overrides}))
+        return stats, mock_translate
+
+    def test_unchanged_models_are_skipped(self, corpus: dict, tmp_path: Path) -> None:
+        self._run(corpus)
+        assert all(m[FINGERPRINT_FIELD]["stages"] == ["translate"] for m in corpus["models"])
+
+        stats, mock_translate = self._run(corpus, incremental=True)
+        mock_translate.assert_not_called()
+        assert stats["unchanged"] == 3
+        assert "error" not in stats
+
+        (tmp_path / "data" / "gamslib" / "raw" / "m1.gms").write_text("* edited\n")
+        stats, mock_translate = self._run(corpus, incremental=True)
+        assert [c.args[0].stem for c in mock_translate.call_args_list] == ["m1"]
+        assert (stats["processed"], stats["unchanged"]) == (1, 2)
+
+    def test_stages_not_yet_run_are_not_skipped(self, corpus: dict) -> None:
+        self._run(corpus)
+
+        with patch(
+            "scripts.gamslib.batch_parse.parse_single_model",
+            return_value={"status": "success", "parse_time_seconds": 0.01},
+        ) as mock_parse:
+            stats, mock_translate = self._run(corpus, only_translate=False, only_parse=True)
+            assert mock_parse.call_count == 3
+
+        stats, mock_translate = self._run(corpus, incremental=True)
+        assert stats["unchanged"] == 3
+        assert all(
+            m[FINGERPRINT_FIELD]["stages"] == ["parse", "translate"] for m in corpus["models"]
+        )
@@ -0,0 +1,123 @@
+"""Tests for the --jobs stage scheduler (scripts/gamslib/pipeline_scheduler.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from scripts.gamslib import pipeline_scheduler
+from scripts.gamslib.pipeline_scheduler import StageScheduler
+
+
+def _run_concurrently(scheduler: StageScheduler, stage: str, count: int, meet: int) -> int:
+    """Enter ``stage`` from ``count`` threads; return the peak occupancy.
+
+    Inside the slot the threads meet in groups of ``meet`` at a barrier, which
+    only releases once that many are in the stage together.
+    """
+    inside, peak, lock = 0, 0, threading.Lock()
+    barrier = threading.Barrier(meet, timeout=10)
+
+    def work(i: int) -> None:
+        nonlocal inside, peak
+        with scheduler.slot(f"m{i}", stage):
+            with lock:
+                inside += 1
+                peak = max(peak, inside)
+            barrier.wait()
+            with lock:
+                inside -= 1
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return peak
+
+
+@pytest.mark.unit
+class TestStageScheduler:
+    def test_stage_limit_bounds_concurrency(self):
+        scheduler = StageScheduler({"solve": 2})
+        assert _run_concurrently(scheduler, "solve", 6, meet=2) == 2
+
+    def test_unlisted_stage_is_unlimited(self):
+        scheduler = StageScheduler({"solve": 1})
+        assert _run_concurrently(scheduler, "compare", 4, meet=4) == 4
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            StageScheduler({"parse": 0})
+
+    def test_critical_path_records_each_pass(self):
+        scheduler = StageScheduler({"translate": 1, "solve": 1})
+        for stage in ("translate", "solve", "translate", "solve"):
+            with scheduler.slot("rocket", stage):
+                time.sleep(0.01)
+
+        path = scheduler.critical_path("rocket")
+        assert [st["stage"] for st in path["stages"]] == ["translate", "solve"] * 2
+        assert path["wall_seconds"] >= sum(st["run_seconds"] for st in path["stages"]) - 1e-3
+        assert scheduler.critical_path("unknown") == {}
+
+    def test_slot_released_and_timed_on_error(self):
+        scheduler = StageScheduler({"parse": 1})
+        with pytest.raises(RuntimeError):
+            with scheduler.slot("bad", "parse"):
+                raise RuntimeError("boom")
+        with scheduler.slot("good", "parse"):
+            pass
+        assert [t.stage for t in scheduler.timings("bad")] == ["parse"]
+
+    def test_wait_for_slot_is_reported(self, monkeypatch):
+        scheduler = StageScheduler({"solve": 1})
+        entered = threading.Event()
+        queued = {"m1": threading.Event(), "m2": threading.Event()}
+
+        # slot() reads the clock when a model queues; flag it from the waiting threads
+        def clock() -> float:
+            now = time.perf_counter()
+            event = queued.get(threading.current_thread().name)
+            if event is not None:
+                event.set()
+            return now
+
+        monkeypatch.setattr(pipeline_scheduler, "time", SimpleNamespace(perf_counter=clock))
+
+        def hold_slot() -> None:
+            with scheduler.slot("m0", "solve"):
+                entered.set()
+                # Keep the slot until both other models are queued behind it
+                assert all(event.wait(10) for event in queued.values())
+
+        def solve(name: str) -> None:
+            with scheduler.slot(name, "solve"):
+                pass
+
+        threads = [threading.Thread(target=hold_slot, name="m0")]
+        threads[0].start()
+        assert entered.wait(10)
+        threads += [threading.Thread(target=solve, args=(n,), name=n) for n in queued]
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        paths = scheduler.critical_paths()
+        assert set(paths) == {"m0", "m1", "m2"}
+        walls = [p["wall_seconds"] for p in paths.values()]
+        assert walls == sorted(walls, reverse=True)
+
+        first, middle, last = sorted(
+            (scheduler.timings(m)[0] for m in paths), key=lambda t: t.started
+        )
+        assert first is scheduler.timings("m0")[0]
+        for timing in (middle, last):
+            assert timing.queued < first.finished <= timing.started
+        assert middle.finished <= last.started
+        # The last model in had to wait for both others to finish solving
+        assert last.wait_seconds > middle.run_seconds
@@ -0,0 +1,165 @@
+"""Unit tests for results_store.py (journaled gamslib_status.json updates)."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.gamslib.db_manager import (  # noqa: E402
+    compact_database,
+    create_backup,
+    load_database,
+    save_database,
+    upsert_model,
+)
+from scripts.gamslib.results_store import ResultsStore  # noqa: E402
+
+
+@pytest.fixture
+def database() -> dict:
+    return {
+        "schema_version": "2.1.0",
+        "models": [
+            {"model_id": "trnsport", "gamslib_type": "LP", "convexity": {"status": "verified"}},
+            {"model_id": "circle", "gamslib_type": "NLP"},
+        ],
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, database: dict) -> Path:
+    path = tmp_path / "gamslib_status.json"
+    save_database(database, path)
+    return path
+
+
+def _upsert_many(path: str, worker: int, count: int) -> None:
+    store = ResultsStore(Path(path))
+    for i in range(count):
+        store.upsert(f"w{worker}_m{i}", {"nlp2mcp_parse": {"status": "success", "n": i}})
+
+
+class TestUpsert:
+    """Tests for journaled per-model updates."""
+
+    def test_load_replays_journal(self, db_path: Path) -> None:
+        upsert_model("trnsport", {"nlp2mcp_parse": {"status": "success"}}, db_path)
+        upsert_model("trnsport", {"nlp2mcp_parse": {"status": "failure"}}, db_path)
+        upsert_model("circle", {"mcp_solve": {"status": "success"}}, db_path)
+
+        models = {m["model_id"]: m for m in load_database(db_path)["models"]}
+
+        assert models["trnsport"]["nlp2mcp_parse"] == {"status": "failure"}
+        assert models["trnsport"]["convexity"] == {"status": "verified"}  # untouched
+        assert models["circle"]["mcp_solve"] == {"status": "success"}
+
+    def test_snapshot_untouched_until_compaction(self, db_path: Path) -> None:
+        before = db_path.read_bytes()
+        upsert_model("circle", {"mcp_solve": {"status": "success"}}, db_path)
+
+        assert db_path.read_bytes() == before
+        assert ResultsStore(db_path).pending() == 1
+
+    def test_unknown_model_is_appended(self, db_path: Path) -> None:
+        upsert_model("newmodel", {"gamslib_type": "QCP"}, db_path)
+
+        models = load_database(db_path)["models"]
+
+        assert models[-1] == {"model_id": "newmodel", "gamslib_type": "QCP"}
+
+    def test_torn_record_is_skipped(self, db_path: Path) -> None:
+        store = ResultsStore(db_path)
+        store.upsert("trnsport", {"nlp2mcp_parse": {"status": "success"}})
+        # A writer killed mid-append
+        with open(store.journal_path, "a") as f:
+            f.write('{"model_id": "circle", "fields": {"mcp_s')
+        store.upsert("circle", {"nlp2mcp_parse": {"status": "success"}})
+
+        models = {m["model_id"]: m for m in store.load()["models"]}
+
+        assert store.pending() == 2
+        assert models["trnsport"]["nlp2mcp_parse"]["status"] == "success"
+        assert models["circle"]["nlp2mcp_parse"]["status"] == "success"
+        assert "mcp_solve" not in models["circle"]
+
+    def test_concurrent_writers_keep_every_update(self, db_path: Path) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_upsert_many, args=(str(db_path), w, 25)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        model_ids = {m["model_id"] for m in load_database(db_path)["models"]}
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert {f"w{w}_m{i}" for w in range(4) for i in range(25)} <= model_ids
+
+    def test_large_journal_compacts_itself(self, db_path: Path) -> None:
+        store = ResultsStore(db_path, compact_after_bytes=200)
+        store.upsert("trnsport", {"nlp2mcp_parse": {"status": "success"}})
+        assert store.pending() == 1
+
+        store.upsert("circle", {"nlp2mcp_parse": {"status": "success", "note": "x" * 200}})
+
+        assert store.pending() == 0
+        on_disk = json.loads(db_path.read_text())
+        assert all(m["nlp2mcp_parse"]["status"] == "success" for m in on_disk["models"])
+
+
+class TestCompaction:
+    """Tests for folding the journal into gamslib_status.json."""
+
+    def test_compact_matches_full_save(self, db_path: Path, tmp_path: Path) -> None:
+        upsert_model("trnsport", {"nlp2mcp_parse": {"status": "success"}}, db_path)
+        upsert_model("circle", {"mcp_solve": {"status": "failure"}}, db_path)
+        expected = tmp_path / "expected.json"
+        save_database(load_database(db_path), expected)
+
+        compact_database(db_path)
+
+        assert db_path.read_bytes() == expected.read_bytes()
+        assert db_path.read_text().endswith("}\n")
+        assert not ResultsStore(db_path).journal_path.exists()
+
+    def test_compact_without_journal_is_noop(self, db_path: Path) -> None:
+        before = db_path.stat().st_mtime_ns
+
+        compact_database(db_path)
+
+        assert db_path.stat().st_mtime_ns == before
+
+    def test_save_discards_journal(self, db_path: Path, database: dict) -> None:
+        upsert_model("trnsport", {"nlp2mcp_parse": {"status": "success"}}, db_path)
+
+        save_database(database, db_path)
+
+        assert load_database(db_path) == database
+
+    def test_export_leaves_store_alone(self, db_path: Path, tmp_path: Path) -> None:
+        upsert_model("trnsport", {"nlp2mcp_parse": {"status": "success"}}, db_path)
+        before = db_path.read_bytes()
+        dest = tmp_path / "export.json"
+
+        ResultsStore(db_path).export(dest)
+
+        assert json.loads(dest.read_text()) == load_database(db_path)
+        assert db_path.read_bytes() == before
+        assert ResultsStore(db_path).pending() == 1
+
+    def test_backup_includes_journal(self, db_path: Path, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setattr("scripts.gamslib.db_manager.BACKUP_DIR", tmp_path / "archive")
+        upsert_model("trnsport", {"nlp2mcp_parse": {"status": "success"}}, db_path)
+
+        backup_path = create_backup(db_path)
+
+        assert backup_path is not None
+        assert json.loads(backup_path.read_text()) == load_database(db_path)
@@ -0,0 +1,218 @@
+"""``run_full_test.py --jobs N``: models stream through the stages concurrently.
+
+Stages run under per-stage limits; each model's database entry and stats
+must come out exactly as a sequential run would record them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.gamslib import run_full_test as rft
+
+
+def _args(**overrides) -> argparse.Namespace:
+    flags = (
+        "dry_run json only_failing only_parse only_solve only_translate parse_failure "
+        "parse_success quick quiet skip_completed solve_failure solve_success "
+        "translate_failure translate_success verbose"
+    )
+    values = dict.fromkeys(flags.split(), False)
+    values.update(limit=None, model=None, random=None, type=None, jobs=1, quiet=True)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+@pytest.fixture
+def corpus(tmp_path, monkeypatch):
+    """Four parsed candidate models with raw files under a temporary PROJECT_ROOT."""
+    monkeypatch.setattr(rft, "PROJECT_ROOT", tmp_path)
+    raw = tmp_path / "data" / "gamslib" / "raw"
+    raw.mkdir(parents=True)
+    models = []
+    for i in range(4):
+        (raw / f"m{i}.gms").write_text("* model\n")
+        models.append(
+            {
+                "model_id": f"m{i}",
+                "convexity": {"status": "verified_convex"},
+                "nlp2mcp_parse": {"status": "success"},
+            }
+        )
+    return {"models": models}
+
+
+@pytest.fixture(autouse=True)
+def journal(monkeypatch):
+    """Capture per-model database updates; nothing is written to data/gamslib."""
+    upserts = MagicMock()
+    monkeypatch.setattr(rft, "upsert_model", upserts)
+    monkeypatch.setattr(rft, "compact_database", MagicMock())
+    return upserts
+
+
+@pytest.mark.unit
+def test_only_translate_jobs_translates_concurrently(corpus, journal):
+    active, peak, lock = 0, 0, threading.Lock()
+    pool = MagicMock()
+    pool.__enter__.return_value = pool
+
+    def translate(model_path, output_path, *, pool):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return {"status": "success", "translate_time_seconds": 0.05, "output_file": "x"}
+
+    with (
+        patch.object(rft, "load_database", return_value=corpus),
+        patch.object(rft, "create_backup", return_value=None),
+        patch("scripts.gamslib.batch_translate.make_translation_pool", return_value=pool),
+        patch("scripts.gamslib.batch_translate.translate_single_model", side_effect=translate),
+    ):
+        stats = rft.run_full_test(_args(only_translate=True, jobs=2))
+
+    assert peak == 2
+    pool.__exit__.assert_called_once()
+    assert stats["translate_success"] == 4
+    assert sorted(model_id for model_id, _ in stats["translate_times"]) == ["m0", "m1", "m2", "m3"]
+    assert all(m["nlp2mcp_translate"]["status"] == "success" for m in corpus["models"])
+    # Each model's new translate entry and fingerprint are journaled, and nothing else
+    journaled = {c.args[0]: c.args[1] for c in journal.call_args_list}
+    assert journaled == {
+        m["model_id"]: {
+            "nlp2mcp_translate": m["nlp2mcp_translate"],
+            "pipeline_fingerprint": m["pipeline_fingerprint"],
+        }
+        for m in corpus["models"]
+    }
+    assert all(m["pipeline_fingerprint"]["stages"] == ["translate"] for m in corpus["models"])
+
+
+@pytest.mark.unit
+def test_default_runs_without_pool(corpus, journal):
+    with (
+        patch.object(rft, "load_database", return_value=corpus),
+        patch.object(rft, "create_backup", return_value=None),
+        patch("scripts.gamslib.batch_translate.make_translation_pool") as mock_make,
+        patch(
+            "scripts.gamslib.batch_translate.translate_single_model",
+            return_value={"status": "failure", "error": {"category": "internal_error"}},
+        ) as mock_translate,
+    ):
+        stats = rft.run_full_test(_args(only_translate=True))
+
+    mock_make.assert_not_called()
+    assert mock_translate.call_count == 4
+    assert stats["translate_failure"] == 4
+    assert [c.args[0] for c in journal.call_args_list] == ["m0", "m1", "m2", "m3"]
+    assert all(
+        set(c.args[1]) == {"nlp2mcp_translate", "pipeline_fingerprint"}
+        for c in journal.call_args_list
+    )
+
+
+class _InThreadParse:
+    """Stands in for the parse process pool (mocks do not cross processes)."""
+
+    def __init__(self, jobs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def __call__(self, model_path):
+        if model_path.stem == "m3":
+            return {"status": "failure", "error": {"category": "syntax_error"}}
+        return {"status": "success", "parse_time_seconds": 0.01}
+
+
+@pytest.mark.unit
+def test_models_stream_through_stages(corpus):
+    events: list[tuple[str, str]] = []
+    solving, solve_peak, lock = 0, 0, threading.Lock()
+    pool = MagicMock()
+    pool.__enter__.return_value = pool
+
+    def translate(model_path, output_path, *, pool, nlp_presolve=False):
+        events.append(("translate", model_path.stem))
+        if model_path.stem == "m0":
+            time.sleep(0.3)  # m1 and m2 solve while m0 is still translating
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text("* mcp\n")
+        return {"status": "success", "translate_time_seconds": 0.01, "output_file": "x"}
+
+    def solve(mcp_path, timeout=None):
+        nonlocal solving, solve_peak
+        with lock:
+            solving += 1
+            solve_peak = max(solve_peak, solving)
+        events.append(("solve", mcp_path.stem.removesuffix("_mcp")))
+        time.sleep(0.05)
+        with lock:
+            solving -= 1
+        return {"status": "success", "objective_value": 1.0, "outcome_category": "model_optimal"}
+
+    with (
+        patch.object(rft, "load_database", return_value=corpus),
+        patch.object(rft, "create_backup", return_value=None),
+        patch.object(rft, "_ParsePool", _InThreadParse),
+        patch("scripts.gamslib.batch_translate.make_translation_pool", return_value=pool),
+        patch("scripts.gamslib.batch_translate.translate_single_model", side_effect=translate),
+        patch("scripts.gamslib.test_solve.solve_mcp", side_effect=solve),
+        patch(
+            "scripts.gamslib.test_solve.compare_solutions",
+            return_value={"comparison_status": "match"},
+        ),
+    ):
+        stats = rft.run_full_test(_args(jobs=2, solve_jobs=1))
+
+    # m1 and m2 were solved while m0 was still translating
+    assert {("solve", "m1"), ("solve", "m2")} <= set(events[:-1])
+    assert events[-1] == ("solve", "m0")
+    assert solve_peak == 1
+    assert stats["processed"] == 4
+    assert (stats["parse_success"], stats["parse_failure"]) == (3, 1)
+    assert stats["translate_cascade_skip"] == 1
+    assert stats["solve_success"] == 3
+    models = {m["model_id"]: m for m in corpus["models"]}
+    assert models["m3"]["nlp2mcp_translate"]["status"] == "not_tested"
+    assert models["m0"]["mcp_solve"]["status"] == "success"
+
+    paths = stats["critical_paths"]
+    assert next(iter(paths)) == "m0"  # slowest first
+    assert [st["stage"] for st in paths["m0"]["stages"]] == [
+        "parse",
+        "translate",
+        "solve",
+        "compare",
+    ]
+    assert [st["stage"] for st in paths["m3"]["stages"]] == ["parse"]
+
+
+@pytest.mark.integration
+def test_parse_pool_matches_in_process_parse(tmp_path):
+    model = rft.PROJECT_ROOT / "examples" / "simple_nlp.gms"
+    broken = tmp_path / "broken.gms"
+    broken.write_text("Variable x;\nEquation e;\ne.. x =e= (1;\n")
+    parse = rft.get_parse_function()
+
+    with rft._ParsePool(1) as parse_pool:
+        pooled = [parse_pool(model), parse_pool(broken)]
+
+    for path, result in zip([model, broken], pooled, strict=True):
+        expected = parse(path)
+        assert result["status"] == expected["status"]
+        assert result.get("model_statistics") == expected.get("model_statistics")
+        assert result.get("error", {}).get("category") == expected.get("error", {}).get("category")
@@ -11,6 +11,7 @@ Test Coverage:
 6. Scalar variable gradients
 7. Indexed variable gradients
 8. Sum aggregation in objectives
+9. Objectives written out term by term (per-term sparsity index)
 """
 
 import pytest
@@ -20,9 +21,11 @@ from src.ad.gradient import (
     compute_objective_gradient,
     find_objective_expression,
 )
-from src.ir.ast import Binary, Call, Const, ParamRef, Sum, SymbolRef, VarRef
+from src.config import Config
+from src.emit.expr_to_gams import expr_to_gams
+from src.ir.ast import Binary, Call, Const, IndexOffset, ParamRef, Sum, SymbolRef, Unary, VarRef
 from src.ir.model_ir import ModelIR, ObjectiveIR
-from src.ir.symbols import EquationDef, ObjSense, Rel, SetDef, VariableDef
+from src.ir.symbols import EquationDef, ObjSense, ParameterDef, Rel, SetDef, VariableDef
 
 pytestmark = pytest.mark.integration
 
@@ -514,3 +517,70 @@ class TestObjectiveFromDefiningEquation:
         deriv = gradient.get_derivative_by_name("x")
         assert deriv is not None
         assert isinstance(deriv, Binary)
+
+
+# ============================================================================
+# Test Objectives Written Out Term by Term
+# ============================================================================
+
+
+def _term_by_term_model(sense: ObjSense) -> ModelIR:
+    model_ir = ModelIR()
+    model_ir.add_set(SetDef("i", ["i1", "i2", "i3", "i4"]))
+    model_ir.add_var(VariableDef("x", ("i",)))
+    model_ir.add_var(VariableDef("y", ()))
+    model_ir.params["c"] = ParameterDef(name="c", domain=("i",))
+    # 3 - c('i1')*x('i1') + sqr(x('i2')) - x('i1')*y + sum(i, x(i)) - x(i+1)$... - 2*y
+    terms = [
+        Binary("*", ParamRef("c", ("i1",)), VarRef("x", ("i1",))),
+        Call("sqr", (VarRef("x", ("i2",)),)),
+        Binary("*", VarRef("x", ("'I1'",)), VarRef("y", ())),
+        Sum(("i",), VarRef("x", ("i",))),
+        VarRef("x", (IndexOffset("i2", Const(1), False),)),
+        Binary("*", Const(2.0), VarRef("y", ())),
+    ]
+    obj_expr = Const(3.0)
+    for op, term in zip(["-", "+", "-", "+", "-", "-"], terms, strict=True):
+        obj_expr = Binary(op, obj_expr, term)
+    model_ir.objective = ObjectiveIR(sense, "obj", expr=obj_expr)
+    return model_ir
+
+
+@pytest.mark.integration
+class TestGradientTermByTerm:
+    """Partials differentiate only the terms that reference their instance."""
+
+    @pytest.mark.parametrize("sense", [ObjSense.MIN, ObjSense.MAX])
+    @pytest.mark.parametrize("simplification", ["basic", "advanced", "aggressive"])
+    def test_matches_differentiating_the_whole_objective(self, monkeypatch, sense, simplification):
+        config = Config(simplification=simplification)
+        monkeypatch.delenv("NLP2MCP_NO_REVERSE_GRADIENT", raising=False)
+        by_term = compute_objective_gradient(_term_by_term_model(sense), config)
+        monkeypatch.setenv("NLP2MCP_NO_REVERSE_GRADIENT", "1")
+        whole = compute_objective_gradient(_term_by_term_model(sense), config)
+
+        assert by_term.entries == whole.entries
+        for col_id, derivative in whole.entries.items():
+            assert expr_to_gams(by_term.entries[col_id]) == expr_to_gams(derivative)
+
+    def test_unreferenced_instances(self):
+        model_ir = _term_by_term_model(ObjSense.MIN)
+
+        gradient = compute_objective_gradient(model_ir)
+
+        # Only sum(i, x(i)) refers to x('i4')
+        assert gradient.get_derivative_by_name("x", ("i4",)) == Const(1.0)
+        # -c('i1') - y + 1
+        assert gradient.get_derivative_by_name("x", ("i1",)) == Binary(
+            "+",
+            Binary("-", Unary("-", ParamRef("c", ("i1",))), VarRef("y", ())),
+            Const(1.0),
+        )
+
+    def test_expression_gradient(self):
+        model_ir = _term_by_term_model(ObjSense.MIN)
+        expr = model_ir.objective.expr
+
+        gradient = compute_gradient_for_expression(expr, model_ir, negate=True)
+
+        assert gradient.get_derivative_by_name("x", ("i4",)) == Const(-1.0)
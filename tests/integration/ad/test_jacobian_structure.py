@@ -128,6 +128,42 @@ class TestJacobianRowColumn:
         col0 = jac.get_col(0)
         assert len(col0) == 0
 
+    def test_get_col_sees_later_entries(self):
+        """Test that the column index is rebuilt after set_derivative."""
+        jac = JacobianStructure(num_rows=3, num_cols=2)
+        jac.set_derivative(2, 0, Const(1.0))
+        assert list(jac.get_col(0)) == [2]
+
+        jac.set_derivative(0, 0, Const(2.0))
+        jac.set_derivative(1, 1, Const(3.0))
+
+        # Rows come back in ascending order, whatever order they were set in
+        assert list(jac.get_col(0).items()) == [(0, Const(2.0)), (2, Const(1.0))]
+        assert jac.get_col(1) == {1: Const(3.0)}
+
+    def test_to_coo(self):
+        """Test coordinate arrays and expression table in row-major order."""
+        jac = JacobianStructure(num_rows=3, num_cols=3)
+        jac.set_derivative(2, 0, Const(1.0))
+        jac.set_derivative(0, 2, Const(2.0))
+        jac.set_derivative(0, 1, Const(3.0))
+
+        rows, cols, exprs = jac.to_coo()
+
+        assert rows.tolist() == [0, 0, 2]
+        assert cols.tolist() == [1, 2, 0]
+        assert exprs == [Const(3.0), Const(2.0), Const(1.0)]
+        assert jac.to_coo()[0] is rows
+
+        jac.set_derivative(1, 1, Const(4.0))
+        assert jac.to_coo()[0].tolist() == [0, 0, 1, 2]
+
+    def test_empty_to_coo(self):
+        """Test coordinate arrays of an empty Jacobian."""
+        rows, cols, exprs = JacobianStructure(num_rows=2, num_cols=2).to_coo()
+
+        assert len(rows) == len(cols) == len(exprs) == 0
+
 
 @pytest.mark.integration
 class TestJacobianSparsity:
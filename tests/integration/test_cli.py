@@ -1,5 +1,7 @@
 """Integration tests for CLI."""
 
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
 
@@ -248,3 +250,46 @@ class TestCLI:
         # Should fail early — no MCP code printed to stdout
         assert "Solve" not in result.output
         assert "--check-convexity-numerical requires -o" in result.output
+
+    def test_cli_parse_workers_matches_serial_output(self, tmp_path):
+        """--parse-workers N produces the same MCP as the in-process parse."""
+        runner = CliRunner()
+        serial = tmp_path / "serial.gms"
+        parallel = tmp_path / "parallel.gms"
+
+        result = runner.invoke(main, ["examples/simple_nlp.gms", "-o", str(serial)])
+        assert result.exit_code == 0, result.output
+        result = runner.invoke(
+            main, ["examples/simple_nlp.gms", "-o", str(parallel), "--parse-workers", "2"]
+        )
+        assert result.exit_code == 0, result.output
+
+        assert parallel.read_text() == serial.read_text()
+
+    def test_cli_parse_workers_must_be_positive(self):
+        """--parse-workers 0 is rejected by option validation."""
+        runner = CliRunner()
+        result = runner.invoke(main, ["examples/simple_nlp.gms", "--parse-workers", "0"])
+
+        assert result.exit_code != 0
+        assert "--parse-workers" in result.output
+
+    def test_cli_incremental_matches_full_parse(self, tmp_path, monkeypatch):
+        """--incremental re-runs after an edit produce the same MCP as a full parse."""
+        monkeypatch.setenv("NLP2MCP_CACHE_DIR", str(tmp_path / "cache"))
+        runner = CliRunner()
+        model = tmp_path / "model.gms"
+        model.write_text(Path("examples/simple_nlp.gms").read_text())
+        full = tmp_path / "full.gms"
+        incremental = tmp_path / "incremental.gms"
+
+        result = runner.invoke(main, [str(model), "-o", str(incremental), "--incremental"])
+        assert result.exit_code == 0, result.output
+        model.write_text(model.read_text() + "\n* edited\n")
+        result = runner.invoke(main, [str(model), "-o", str(incremental), "--incremental"])
+        assert result.exit_code == 0, result.output
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+        result = runner.invoke(main, [str(model), "-o", str(full)])
+        assert result.exit_code == 0, result.output
+
+        assert incremental.read_text() == full.read_text()
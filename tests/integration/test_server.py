@@ -0,0 +1,117 @@
+"""Integration tests for the resident translation server (src/server.py)."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import main
+from src.server import TranslationPool, TranslationWorker, run_cli, serve
+
+_MODEL = "examples/simple_nlp.gms"
+
+
+def _serve(pool: TranslationPool, *requests: dict | str, timeout: float = 60) -> list[dict]:
+    lines = [r if isinstance(r, str) else json.dumps(r) for r in requests]
+    stdout = io.StringIO()
+    serve(pool, io.StringIO("\n".join(lines) + "\n"), stdout, timeout)
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with TranslationPool(2) as pool:
+        pool.start()
+        yield pool
+
+
+@pytest.mark.integration
+class TestRunCli:
+    def test_matches_cli_runner(self):
+        expected = CliRunner().invoke(main, [_MODEL, "--quiet"])
+        exit_code, stdout, _ = run_cli([_MODEL, "--quiet"])
+        assert exit_code == expected.exit_code == 0
+        assert stdout == expected.stdout
+
+    def test_usage_error_exit_code(self):
+        exit_code, stdout, stderr = run_cli(["missing.gms"])
+        assert exit_code == 2
+        assert stdout == ""
+        assert "does not exist" in stderr
+
+
+@pytest.mark.integration
+class TestServe:
+    def test_translate_requests(self, pool, tmp_path):
+        output = tmp_path / "out.gms"
+        responses = _serve(
+            pool,
+            {"id": "stdout", "args": [_MODEL, "--quiet"]},
+            {"id": "file", "args": [_MODEL, "-o", str(output), "--quiet"]},
+            {"id": "missing", "args": ["missing.gms"]},
+        )
+        by_id = {r["id"]: r for r in responses}
+        assert set(by_id) == {"stdout", "file", "missing"}
+        assert by_id["stdout"]["status"] == "ok"
+        assert by_id["stdout"]["stdout"] == run_cli([_MODEL, "--quiet"])[1]
+        assert by_id["file"]["status"] == "ok"
+        assert output.read_text() == by_id["stdout"]["stdout"].rstrip("\n")
+        assert by_id["missing"]["status"] == "failed"
+        assert by_id["missing"]["exit_code"] == 2
+
+    @pytest.mark.parametrize(
+        "line",
+        ["not json", '["a list"]', '{"args": "model.gms"}', '{"args": [], "timeout": -1}'],
+    )
+    def test_invalid_request(self, pool, line):
+        (response,) = _serve(pool, line)
+        assert response["status"] == "invalid"
+        assert response["id"] is None
+
+    def test_timeout_kills_worker_and_recovers(self, pool):
+        responses = _serve(pool, {"id": 1, "args": [_MODEL], "timeout": 0.001})
+        assert responses[0]["status"] == "timeout"
+        assert "timeout" in responses[0]["stderr"]
+        (response,) = _serve(pool, {"id": 2, "args": [_MODEL, "--quiet"]})
+        assert response["status"] == "ok"
+
+
+@pytest.mark.integration
+class TestTranslationWorker:
+    def test_recycled_after_max_requests(self):
+        worker = TranslationWorker(max_requests=1)
+        try:
+            assert worker.translate([_MODEL, "--quiet"]).status == "ok"
+            assert not worker.alive
+            assert worker.translate([_MODEL, "--quiet"]).status == "ok"
+        finally:
+            worker.stop()
+
+
+@pytest.mark.integration
+class TestTranslationPool:
+    def test_failed_start_is_retried_on_first_request(self, monkeypatch):
+        def fail_to_start(worker):
+            raise RuntimeError("nlp2mcp worker process failed to start")
+
+        with TranslationPool(2) as pool:
+            with monkeypatch.context() as mp:
+                mp.setattr(TranslationWorker, "start", fail_to_start)
+                assert pool.start() == 0
+            (response,) = _serve(pool, {"id": 1, "args": [_MODEL, "--quiet"]})
+        assert response["status"] == "ok"
+
+    def test_start_failure_is_a_crashed_reply(self, monkeypatch):
+        def fail_to_start(worker):
+            raise RuntimeError("nlp2mcp worker process failed to start")
+
+        monkeypatch.setattr(TranslationWorker, "start", fail_to_start)
+        with TranslationPool(1) as pool:
+            assert pool.start() == 0
+            (response,) = _serve(pool, {"id": 1, "args": [_MODEL, "--quiet"]})
+        assert response["id"] == 1
+        assert response["status"] == "crashed"
+        assert "failed to start" in response["stderr"]
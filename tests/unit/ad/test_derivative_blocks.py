@@ -0,0 +1,216 @@
+"""Tests for shared derivatives of indexed constraints (src/ad/derivative_blocks.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.ad.constraint_jacobian import compute_constraint_jacobian
+from src.ad.derivative_blocks import DerivativeMemo, derivative_block
+from src.config import Config
+from src.ir.ast import (
+    Binary,
+    Call,
+    Const,
+    IndexOffset,
+    ParamRef,
+    Sum,
+    SymbolRef,
+    VarRef,
+)
+from src.ir.model_ir import ModelIR
+from src.ir.normalize import normalize_model
+from src.ir.symbols import EquationDef, ParameterDef, Rel, SetDef, VariableDef
+
+pytestmark = pytest.mark.unit
+
+
+def _config() -> Config:
+    config = Config()
+    config.model_ir = _model()
+    return config
+
+
+def _model() -> ModelIR:
+    m = ModelIR()
+    m.sets["i"] = SetDef(name="i", members=["a", "b", "c"])
+    m.sets["j"] = SetDef(name="j", members=["a", "b", "k"])
+    m.params["p"] = ParameterDef(name="p", domain=("i",))
+    m.params["d"] = ParameterDef(name="d", domain=("i",))
+    m.params["w"] = ParameterDef(name="w", domain=("i", "j"))
+    for name, domain in (("y", ("i",)), ("z", ("i",)), ("x", ("j", "i"))):
+        m.add_var(VariableDef(name, domain))
+    return m
+
+
+# demand(i)..  y(i) * p(i) - (d(i) + z(i))
+DEMAND = Binary(
+    "-",
+    Binary("*", VarRef("y", ("i",)), ParamRef("p", ("i",))),
+    Binary("+", ParamRef("d", ("i",)), VarRef("z", ("i",))),
+)
+
+
+class TestDerivativeBlock:
+    def test_template_is_differentiated_once_and_relabeled(self):
+        block = derivative_block(DEMAND, ("i",), "y", _config(), "advanced")
+
+        assert block is not None
+        assert block.columns == (0,)
+        assert block.template == ParamRef("p", ("i",))
+        assert block.instantiate(("b",)) == (("b",), ParamRef("p", ("b",)))
+
+    def test_columns_follow_the_variable_index_order(self):
+        # flow(i,j).. w(i,j) * x(j,i)
+        expr = Binary("*", ParamRef("w", ("i", "j")), VarRef("x", ("j", "i")))
+
+        block = derivative_block(expr, ("i", "j"), "x", _config(), "advanced")
+
+        assert block is not None
+        assert block.columns == (1, 0)
+        assert block.instantiate(("b", "k")) == (("k", "b"), ParamRef("w", ("b", "k")))
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            # Summed over: one row depends on several instances
+            Sum(("j",), Binary("*", ParamRef("w", ("i", "j")), VarRef("x", ("j", "i"))), None),
+            Call("smax", (SymbolRef("j"), VarRef("x", ("j", "i")))),
+            # Two different index patterns
+            Binary("+", VarRef("y", ("i",)), VarRef("y", ("j",))),
+            # Literal and lead/lag indices
+            VarRef("y", ("a",)),
+            VarRef("y", (IndexOffset("i", Const(1), False),)),
+            # Not referenced at all
+            ParamRef("p", ("i",)),
+        ],
+    )
+    def test_declines_pairs_that_are_not_blocks(self, expr):
+        assert derivative_block(expr, ("i", "j"), "y", _config(), "advanced") is None
+        assert derivative_block(expr, ("i", "j"), "x", _config(), "advanced") is None
+
+    def test_declines_without_simplification(self):
+        assert derivative_block(DEMAND, ("i",), "y", _config(), "none") is None
+
+    def test_rows_with_repeated_or_reserved_labels_are_declined(self):
+        # w(i,'k') * x(j,i)
+        expr = Binary("*", ParamRef("w", ("i", "'k'")), VarRef("x", ("j", "i")))
+
+        block = derivative_block(expr, ("i", "j"), "x", _config(), "advanced")
+
+        assert block is not None
+        assert block.instantiate(("a", "b")) is not None
+        assert block.instantiate(("a", "A")) is None
+        assert block.instantiate(("a", "K")) is None
+        assert block.instantiate(("a", "i")) is None
+
+
+def _row(label: str) -> Binary:
+    # y(r) * y(r) * w(r,'k') + 3 * z(r), i.e. a non-linear row of one equation
+    return Binary(
+        "+",
+        Binary(
+            "*",
+            Binary("*", VarRef("y", (label,)), VarRef("y", (label,))),
+            ParamRef("w", (label, "'k'")),
+        ),
+        Binary("*", Const(3.0), VarRef("z", (label,))),
+    )
+
+
+class TestDerivativeMemo:
+    def test_rows_of_one_shape_share_a_derivative(self):
+        config = _config()
+        memo = DerivativeMemo(config, "advanced")
+
+        results = [memo.derivative(_row(label), (label,), "y", (label,)) for label in "abc"]
+
+        assert (memo.hits, memo.lookups) == (2, 3)
+        for label, result in zip("abc", results, strict=True):
+            # w(r,'k') * (2 * y(r))
+            assert result == Binary(
+                "*",
+                ParamRef("w", (label, "'k'")),
+                Binary("*", Const(2.0), VarRef("y", (label,))),
+            )
+
+    def test_rows_colliding_with_literals_are_not_shared(self):
+        memo = DerivativeMemo(_config(), "advanced")
+
+        memo.derivative(_row("a"), ("a",), "y", ("a",))
+        result = memo.derivative(_row("K"), ("K",), "y", ("K",))
+
+        assert memo.hits == 0
+        assert result == DerivativeMemo(_config(), "advanced").derivative(
+            _row("K"), ("K",), "y", ("K",)
+        )
+
+    def test_membership_of_column_labels_is_part_of_the_key(self):
+        # sum(j, y(j)) w.r.t. y('a') and y('c'); only 'a' is in j
+        memo = DerivativeMemo(_config(), "advanced")
+        expr = Sum(("j",), VarRef("y", ("j",)), None)
+
+        assert memo.derivative(expr, (), "y", ("a",)) == Const(1.0)
+        assert memo.derivative(expr, (), "y", ("c",)) == Const(0.0)
+        assert memo.derivative(expr, (), "y", ("b",)) == Const(1.0)
+        assert memo.hits == 1
+
+    def test_env_var_disables_memo(self, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_NO_DERIVATIVE_MEMO", "1")
+        memo = DerivativeMemo(_config(), "advanced")
+
+        for label in "ab":
+            memo.derivative(_row(label), (label,), "y", (label,))
+
+        assert (memo.hits, memo.lookups) == (0, 2)
+
+
+class TestBlockJacobian:
+    def _jacobians(self, monkeypatch, disabled: bool):
+        for env in ("NLP2MCP_NO_BLOCK_JACOBIAN", "NLP2MCP_NO_DERIVATIVE_MEMO"):
+            if disabled:
+                monkeypatch.setenv(env, "1")
+            else:
+                monkeypatch.delenv(env, raising=False)
+        m = _model()
+        m.equations["demand"] = EquationDef(
+            name="demand",
+            domain=("i",),
+            relation=Rel.EQ,
+            lhs_rhs=(
+                Binary("*", VarRef("y", ("i",)), ParamRef("p", ("i",))),
+                Binary("+", ParamRef("d", ("i",)), VarRef("z", ("i",))),
+            ),
+        )
+        m.equations["cap"] = EquationDef(
+            name="cap",
+            domain=("i", "j"),
+            relation=Rel.LE,
+            lhs_rhs=(
+                Binary("*", ParamRef("w", ("i", "j")), Call("exp", (VarRef("x", ("j", "i")),))),
+                Binary("*", Const(2.0), VarRef("y", ("i",))),
+            ),
+        )
+        # total(i).. sum(j, w(i,j) * x(j,i)) =e= d(i)
+        m.equations["total"] = EquationDef(
+            name="total",
+            domain=("i",),
+            relation=Rel.EQ,
+            lhs_rhs=(
+                Sum(("j",), Binary("*", ParamRef("w", ("i", "j")), VarRef("x", ("j", "i"))), None),
+                ParamRef("d", ("i",)),
+            ),
+        )
+        normalized_eqs, _ = normalize_model(m)
+        return compute_constraint_jacobian(m, normalized_eqs, Config())
+
+    def test_matches_per_instance_differentiation(self, monkeypatch):
+        shared = self._jacobians(monkeypatch, disabled=False)
+        per_instance = self._jacobians(monkeypatch, disabled=True)
+
+        for with_sharing, without in zip(shared, per_instance, strict=True):
+            assert with_sharing.num_nonzeros() > 0
+            assert with_sharing.entries == without.entries
+            assert without.derivative_memo_hits == 0
+
+        J_h = shared[0]
+        assert 0 < J_h.derivative_memo_hits < J_h.derivative_memo_lookups
@@ -284,6 +284,35 @@ class TestIndexMapping:
         assert mapping.get_eq_instance(1) == ("g", ("i2",))
         assert mapping.get_eq_instance(2) == ("obj", ())
 
+    def test_variables_only_mapping(self):
+        """Test that include_equations=False numbers columns and no rows."""
+        model_ir = ModelIR()
+        model_ir.add_set(SetDef("i", ["i1", "i2"]))
+        model_ir.add_var(VariableDef("x", ("i",)))
+        model_ir.add_equation(EquationDef("g", ("i",), Rel.LE, (None, None)))
+
+        mapping = build_index_mapping(model_ir, include_equations=False)
+
+        assert mapping.var_to_col == build_index_mapping(model_ir).var_to_col
+        assert mapping.num_eqs == 0
+        assert mapping.eq_to_row == {}
+
+    def test_with_same_variables_shares_columns(self):
+        """Test that derived mappings share the variable dicts and number their own rows."""
+        model_ir = ModelIR()
+        model_ir.add_set(SetDef("i", ["i1", "i2"]))
+        model_ir.add_var(VariableDef("x", ("i",)))
+        model_ir.add_equation(EquationDef("g", ("i",), Rel.LE, (None, None)))
+        base = build_index_mapping(model_ir)
+
+        derived = base.with_same_variables()
+
+        assert derived.var_to_col is base.var_to_col
+        assert derived.col_to_var is base.col_to_var
+        assert derived.num_vars == 2
+        assert derived.num_eqs == 0
+        assert derived.get_row_id("g", ("i1",)) is None
+
     def test_bijective_mapping(self):
         """Test that variable mapping is bijective (one-to-one)."""
         model_ir = ModelIR()
@@ -6,6 +6,7 @@ algebraic simplification rules are correctly applied to expression ASTs.
 
 from src.ad.ad_core import simplify, simplify_advanced
 from src.ir.ast import Binary, Call, Const, MultiplierRef, ParamRef, Sum, Unary, VarRef
+from src.ir.traversal import flatten_chain
 
 
 class TestConstantFolding:
@@ -662,3 +663,16 @@ class TestAdvancedSimplification:
         assert result.op == "*"
         assert result.left == Const(2)
         assert result.right == VarRef("x", ())
+
+    def test_long_sum_collected_in_one_pass(self):
+        # sum over k < 10^4 of (k+1)*x(k mod 50) → 50 collected terms, under the
+        # default recursion limit
+        expr = Binary("*", Const(1), VarRef("x", ("i0",)))
+        for k in range(1, 10_000):
+            expr = Binary("+", expr, Binary("*", Const(k + 1), VarRef("x", (f"i{k % 50}",))))
+
+        result = simplify_advanced(expr)
+
+        terms = flatten_chain(result, "+")
+        assert len(terms) == 50
+        assert terms[0] == Binary("*", Const(sum(range(1, 10_001, 50))), VarRef("x", ("i0",)))
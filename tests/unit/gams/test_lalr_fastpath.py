@@ -0,0 +1,131 @@
+"""Tests for the LALR parser fast path (src/gams/gams_grammar_lalr.lark).
+
+The fast path must be invisible: every statement the LALR subset grammar
+accepts has to produce exactly the tree the Earley parser produces, and
+everything it rejects must still parse through Earley.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from lark import Tree
+from lark.exceptions import UnexpectedInput
+
+from src.ir.parser import (
+    _build_lalr,
+    _build_lark,
+    _lalr_start_symbol,
+    _parse_span,
+    _resolve_ambiguities,
+    parse_model_text,
+    parse_text,
+)
+from src.ir.preprocessor import preprocess_gams_file, split_statements
+from src.utils.errors import ParseError
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+# GAMSLIB Tier 1 models: small, real-world, and all parse
+_CORPUS = sorted((_PROJECT_ROOT / "tests" / "fixtures" / "gamslib").glob("*.gms"))
+
+
+def _earley_only(monkeypatch) -> None:
+    monkeypatch.setenv("NLP2MCP_NO_LALR_FASTPATH", "1")
+
+
+class TestLalrStatementEquivalence:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "x = 1;",
+            "x.lo(i) = -inf;",
+            "p(i,j) = a(i) * b(j) ** 2 - c / d;",
+            "p(i)$(q(i) > 0 and r(i) <> 1) = yes$s(i);",
+            "q(t) = sum(tt$(ord(tt) <= ord(t)), d(tt)) + x(t-1) + y(t++1);",
+            "obj.. z =e= sum((i,j), c(i,j) * x(i,j));",
+            "bal(i)$(ord(i) > 1).. sum(j, x(i,j)) =l= smax(j, cap(j));",
+            "e(i).. x(i) =g= power(y(i), 2) + log(z(i)) + sqr(w[i]);",
+        ],
+    )
+    def test_accepted_statement_matches_earley(self, statement):
+        start_symbol = _lalr_start_symbol(statement)
+        assert start_symbol is not None
+
+        lalr_tree = _parse_span(_build_lalr(), statement, 0, len(statement), start_symbol)
+        earley_tree = _resolve_ambiguities(_build_lark().parse(statement))
+
+        assert Tree("program", [lalr_tree]) == earley_tree
+
+    @pytest.mark.parametrize("model_path", _CORPUS, ids=lambda p: p.name)
+    def test_corpus_statements_match_earley(self, model_path):
+        source = preprocess_gams_file(model_path)
+        for start, end in split_statements(source):
+            start_symbol = _lalr_start_symbol(source[start:end])
+            if start_symbol is None:
+                continue
+            try:
+                lalr_tree = _parse_span(_build_lalr(), source, start, end, start_symbol)
+            except UnexpectedInput:
+                continue
+            earley_tree = _resolve_ambiguities(_parse_span(_build_lark(), source, start, end))
+            assert Tree("program", [lalr_tree]) == earley_tree, source[start:end]
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            # `gamma` is a function name in the LALR lexer
+            "y = gamma + 1;",
+            # Offsets with arithmetic are Earley-only
+            "p(t) = x(t+(card(t)-ord(t)));",
+            # Earley reads `not(...)` as an indexed symbol
+            "x.fx(i)$(not (k(i))) = 0;",
+            # Attribute access other than bounds
+            "x.scale(i) = 10;",
+        ],
+    )
+    def test_rejected_statement_is_left_to_earley(self, statement):
+        with pytest.raises(UnexpectedInput):
+            _build_lalr().parse(statement, start="assignment_stmt")
+        assert parse_text(statement).children
+
+    def test_classifier_skips_context_sensitive_statements(self):
+        assert _lalr_start_symbol("Set i / a, b /;") == "assignment_stmt"
+        assert _lalr_start_symbol("eq(i).. x(i) =e= 1;") == "equation_def"
+        assert _lalr_start_symbol("x('a') = 1;") is None
+        assert _lalr_start_symbol("x = %val%;") is None
+        assert _lalr_start_symbol("x = {y};") is None
+        assert _lalr_start_symbol("(x) = 1;") is None
+
+
+class TestFastPathDocumentParse:
+    @pytest.mark.parametrize("model_path", _CORPUS, ids=lambda p: p.name)
+    def test_model_ir_identical_to_earley_only(self, model_path, monkeypatch):
+        source = preprocess_gams_file(model_path)
+        fast = parse_model_text(source)
+        _earley_only(monkeypatch)
+        reference = parse_model_text(source)
+        assert fast == reference
+
+    def test_token_positions_are_absolute(self):
+        source = "Scalar a, b;\n\n  a = 1;   b = a +\n   2;\n"
+        tree = parse_text(source)
+
+        assigns = [c for c in tree.children if isinstance(c, Tree) and c.data == "assign"]
+        assert len(assigns) == 2
+        second_b = assigns[1].children[0].children[0]
+        assert (second_b.line, second_b.column) == (3, 12)
+        assert source[second_b.start_pos : second_b.end_pos] == "b"
+        two = assigns[1].children[2].children[2].children[0]
+        assert (two.line, two.column) == (4, 4)
+
+    def test_syntax_error_reported_against_whole_document(self, monkeypatch):
+        source = "Scalar a;\na = 1;\na = = 2;\n"
+        with pytest.raises(ParseError) as fast_error:
+            parse_text(source)
+        _earley_only(monkeypatch)
+        with pytest.raises(ParseError) as reference_error:
+            parse_text(source)
+
+        assert str(fast_error.value) == str(reference_error.value)
+        assert fast_error.value.line == 3
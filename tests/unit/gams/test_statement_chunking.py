@@ -0,0 +1,143 @@
+"""Tests for statement-level chunked parsing in ``parse_text``.
+
+The preprocessed source is split into top-level statements that are parsed
+independently and stitched back into one ``program`` tree. The ModelIR built
+from that tree must match the one built from a whole-document Earley parse.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.ir import parser as parser_module
+from src.ir.parser import (
+    _ModelBuilder,
+    _normalize_parsed_tables,
+    _resolve_ambiguities,
+    parse_model_text,
+    parse_text,
+)
+from src.ir.preprocessor import preprocess_gams_file
+from src.utils.errors import ParseError
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_CORPUS = sorted((_PROJECT_ROOT / "tests" / "fixtures" / "gamslib").glob("*.gms"))
+
+_MODEL = """
+Sets
+    i /a, b, c/
+    j /x, y/;
+
+Table d(i,j) 'distance'
+        x     y
+    a   1.5   2.0
+    b   2.5   3.0
+    c   0.5   1.0;
+
+Parameter cap(i) / a 10, b 20, c 30 /;
+Variables z, f(i,j);
+Positive Variable f;
+Equations cost, supply(i);
+
+cost.. z =e= sum((i,j), d(i,j) * f(i,j));
+supply(i).. sum(j, f(i,j)) =l= cap(i);
+
+Model m /all/;
+Solve m using nlp minimizing z;
+"""
+
+
+@pytest.fixture(autouse=True)
+def _no_data_fastpath(monkeypatch):
+    # The Table/Parameter statements of _MODEL would otherwise bypass the
+    # grammar entirely (see test_data_scanner.py)
+    monkeypatch.setenv("NLP2MCP_NO_DATA_FASTPATH", "1")
+
+
+def _whole_document_model(source: str):
+    tree = parser_module._build_lark().parse(source)
+    tree = _normalize_parsed_tables(_resolve_ambiguities(tree))
+    return _ModelBuilder(source=source).build(tree)
+
+
+class TestStatementChunking:
+    def test_each_statement_is_parsed_separately(self, monkeypatch):
+        parsed: list[tuple[int, str]] = []
+        real_parse_span = parser_module._parse_span
+
+        def spy(parser, source, start, end, start_symbol=None):
+            parsed.append((start, source[start:end]))
+            return real_parse_span(parser, source, start, end, start_symbol)
+
+        monkeypatch.setattr(parser_module, "_parse_span", spy)
+        parse_text(_MODEL)
+
+        # Declarations are offered to the LALR parser first, then to Earley
+        statements = [text for _, text in sorted(set(parsed))]
+        assert len(statements) == 10
+        assert statements[1].startswith("Table d(i,j)") and statements[1].endswith("1.0;")
+        assert statements[-1] == "Solve m using nlp minimizing z;"
+
+    def test_model_ir_matches_whole_document_parse(self):
+        assert parse_model_text(_MODEL) == _whole_document_model(_MODEL)
+
+    @pytest.mark.parametrize("model_path", _CORPUS, ids=lambda p: p.name)
+    def test_corpus_model_ir_matches_whole_document_parse(self, model_path):
+        source = preprocess_gams_file(model_path)
+        assert parse_model_text(source) == _whole_document_model(source)
+
+    def test_table_positions_survive_chunking(self):
+        model = parse_model_text(_MODEL)
+        assert model.params["d"].values[("b", "y")] == 3.0
+        assert model.params["d"].values[("c", "x")] == 0.5
+
+    def test_earley_never_sees_more_than_one_statement(self, monkeypatch):
+        lengths: list[int] = []
+        earley = parser_module._build_lark()
+        real_parse = type(earley).parse
+
+        def recording_parse(self, text, *args, **kwargs):
+            if self is earley:
+                lengths.append(len(text.strip()))
+            return real_parse(self, text, *args, **kwargs)
+
+        monkeypatch.setattr(type(earley), "parse", recording_parse)
+        parse_text(_MODEL)
+
+        table = _MODEL[_MODEL.index("Table") : _MODEL.index("1.0;") + 4]
+        assert lengths and max(lengths) == len(table)
+
+    def test_star_after_semicolon_is_not_a_comment(self):
+        # `*` only starts a comment at the beginning of a line; a statement
+        # chunk starting mid-line with `*` must not be parsed in isolation.
+        source = "Scalar a;\na = 2;    * trailing note\n"
+        with pytest.raises(ParseError) as excinfo:
+            parse_text(source)
+        assert (excinfo.value.line, excinfo.value.column) == (2, 11)
+
+
+class TestParallelStatementParsing:
+    def test_worker_pool_matches_in_process_parse(self):
+        assert parse_model_text(_MODEL, parse_workers=2) == parse_model_text(_MODEL)
+
+    def test_worker_pool_tree_keeps_source_order_and_positions(self):
+        serial = parse_text(_MODEL)
+        parallel = parse_text(_MODEL, parse_workers=2)
+        assert parallel == serial
+        serial_tokens = [
+            (t.line, t.column, t.start_pos) for t in serial.scan_values(lambda _: True)
+        ]
+        parallel_tokens = [
+            (t.line, t.column, t.start_pos) for t in parallel.scan_values(lambda _: True)
+        ]
+        assert parallel_tokens == serial_tokens
+
+    def test_worker_syntax_error_reported_against_whole_document(self):
+        source = "Set i / a, b /;\nParameter p(i);\nScalar s / 1 /;\nSet j / x y z\n"
+        with pytest.raises(ParseError) as serial:
+            parse_text(source)
+        with pytest.raises(ParseError) as parallel:
+            parse_text(source, parse_workers=2)
+        assert str(parallel.value) == str(serial.value)
@@ -0,0 +1,142 @@
+"""Tests for hash-consed expression nodes (``interning()`` in src/ir/ast.py)."""
+
+from __future__ import annotations
+
+import gc
+import threading
+
+import pytest
+
+from src.ir import ast
+from src.ir.ast import (
+    Binary,
+    Call,
+    Const,
+    IndexOffset,
+    ParamRef,
+    Sum,
+    Unary,
+    VarRef,
+    interning,
+)
+
+
+@pytest.fixture(autouse=True)
+def _enable_interning(monkeypatch):
+    monkeypatch.setenv("NLP2MCP_INTERNING", "1")
+
+
+def _term() -> Binary:
+    return Binary("*", ParamRef("a", ("i", "j")), Call("exp", (VarRef("x", ("i",)),)))
+
+
+class TestInterning:
+    """Structurally equal nodes built in a block are one object."""
+
+    def test_outside_block_nodes_are_distinct(self):
+        assert _term() is not _term()
+        assert _term() == _term()
+
+    def test_equal_trees_are_identical(self):
+        with interning():
+            first = Sum(("j",), _term(), None)
+            second = Sum(("j",), _term(), None)
+
+        assert first is second
+
+    def test_different_trees_stay_distinct(self):
+        with interning():
+            left = Binary("+", VarRef("x", ("i",)), Const(1.0))
+            right = Binary("+", VarRef("x", ("j",)), Const(1.0))
+
+        assert left is not right
+        assert left != right
+
+    def test_constants_keep_their_type_and_sign(self):
+        with interning():
+            assert Const(1) is not Const(1.0)
+            assert Const(0.0) is not Const(-0.0)
+            assert Const(True) is not Const(1)
+            assert Const(2.5) is Const(2.5)
+
+    def test_index_offsets_and_keyword_arguments(self):
+        with interning():
+            lag = VarRef("x", (IndexOffset("t", Const(-1), False),))
+            same = VarRef(name="x", indices=(IndexOffset("t", Const(-1), circular=False),))
+            circular = VarRef("x", (IndexOffset("t", Const(-1), True),))
+
+        assert lag is same
+        assert lag is not circular
+
+    def test_children_built_outside_match_by_identity(self):
+        outside = _term()
+        with interning():
+            shared = (Unary("-", outside), Unary("-", outside))
+            copy = Unary("-", _term())
+
+        assert shared[0] is shared[1]
+        assert copy is not shared[0]
+        assert copy == shared[0]
+
+    def test_nested_blocks_share_one_table(self):
+        with interning():
+            outer = _term()
+            with interning():
+                inner = _term()
+            after = _term()
+
+        assert outer is inner is after
+
+    def test_table_is_dropped_after_block(self):
+        with interning():
+            kept = _term()
+        with interning():
+            fresh = _term()
+
+        assert kept is not fresh
+        assert kept == fresh
+        assert len(ast._intern_state.table) == 0
+
+    def test_unused_nodes_are_not_kept_alive(self):
+        with interning():
+            kept = _term()
+            for k in range(100):
+                Binary("+", kept, Const(float(k)))
+            gc.collect()
+
+            # Only kept's four nodes (Binary, ParamRef, Call, VarRef) survive
+            assert len(ast._intern_state.table) == 4
+
+    def test_interning_is_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("NLP2MCP_INTERNING")
+        with interning():
+            assert _term() is not _term()
+
+    def test_env_var_value_zero_leaves_interning_off(self, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_INTERNING", "0")
+        with interning():
+            assert _term() is not _term()
+
+    def test_blocks_are_per_thread(self):
+        seen = []
+
+        def build():
+            seen.append(_term())
+
+        with interning():
+            worker = threading.Thread(target=build)
+            worker.start()
+            worker.join()
+            local = _term()
+
+        assert seen[0] is not local
+
+    def test_decorator_form(self):
+        @interning()
+        def build() -> tuple[Binary, Binary]:
+            return _term(), _term()
+
+        first, second = build()
+
+        assert first is second
+        assert _term() is not _term()
@@ -0,0 +1,183 @@
+"""Tests for the cached structural hash and summaries on expression nodes."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import sys
+import time
+import timeit
+
+import pytest
+from lark import Token
+
+from src.ir.ast import (
+    Binary,
+    Call,
+    Const,
+    DollarConditional,
+    IndexOffset,
+    ParamRef,
+    Prod,
+    Sum,
+    SymbolRef,
+    Unary,
+    VarRef,
+)
+
+
+def _lagged() -> Binary:
+    # a(i,j) * x(t-k(i))
+    return Binary(
+        "*",
+        ParamRef("a", ("i", "j")),
+        VarRef("x", (IndexOffset("t", VarRef("k", ("i",)), False),)),
+    )
+
+
+class TestStructuralHash:
+    """Equality and hashing are structural; the hash is computed once."""
+
+    def test_equal_trees_hash_equal(self):
+        assert _lagged() == _lagged()
+        assert hash(_lagged()) == hash(_lagged())
+        assert len({_lagged(), _lagged(), Unary("-", _lagged())}) == 2
+
+    def test_numeric_constants_compare_by_value(self):
+        assert Const(1) == Const(1.0)
+        assert {Const(1): "one"}[Const(1.0)] == "one"
+
+    def test_hash_is_cached(self):
+        expr = _lagged()
+        value = hash(expr)
+
+        assert expr._hash == value
+        assert hash(expr) == value
+
+    def test_different_cached_hashes_short_circuit(self):
+        left, right = _lagged(), Binary("*", ParamRef("a", ("i", "j")), Const(2.0))
+        hash(left), hash(right)
+        # Poison the fields: a structural comparison would raise
+        object.__setattr__(left, "op", None)
+
+        assert left != right
+
+    @pytest.mark.slow
+    def test_field_comparison_cost(self):
+        """Timing: ``==`` on fresh nodes stays within a small factor of comparing field tuples."""
+        x, one = VarRef("x", ("i",)), Const(1.0)
+        nodes = [(Binary("+", x, one), Binary("+", x, one)) for _ in range(20_000)]
+        tuples = [(("+", x, one), ("+", x, one)) for _ in range(20_000)]
+
+        def best(pairs) -> float:
+            # CPU time of this process, so parallel test workers do not skew the ratio
+            runs = timeit.repeat(
+                lambda: [a == b for a, b in pairs], number=1, repeat=7, timer=time.process_time
+            )
+            return min(runs)
+
+        ratio = best(nodes) / best(tuples)
+        # ~22x locally; reading the fields through a getattr generator was ~50x
+        assert ratio < 35, f"node == is {ratio:.0f}x a tuple comparison"
+
+    def test_pickle_and_copy_drop_cached_values(self):
+        expr = _lagged()
+        hash(expr), expr.node_count(), expr.free_indices()
+
+        for clone in (pickle.loads(pickle.dumps(expr)), copy.deepcopy(expr), copy.copy(expr)):
+            assert clone == expr
+            assert not hasattr(clone, "_hash")
+            assert not hasattr(clone, "_cache")
+
+    def test_metadata_survives_pickling(self):
+        expr = VarRef("x", ("i",))
+        object.__setattr__(expr, "domain", ("i",))
+        hash(expr)
+
+        clone = pickle.loads(pickle.dumps(expr))
+
+        assert clone.domain == ("i",)
+
+
+class TestSummaries:
+    """node_count, depth, free_variables, free_indices and structure_key."""
+
+    def test_node_count_and_depth(self):
+        expr = DollarConditional(Unary("-", _lagged()), ParamRef("flag", ("i",)))
+
+        # DollarConditional, Unary, Binary, ParamRef a, VarRef x, ParamRef flag
+        assert expr.node_count() == 6
+        assert expr.depth() == 4
+        assert Const(3.0).node_count() == Const(3.0).depth() == 1
+
+    def test_free_variables_include_index_expressions(self):
+        expr = Binary("+", _lagged(), Call("exp", (VarRef("y", ()),)))
+
+        assert expr.free_variables() == {"x", "k", "y"}
+        assert ParamRef("a", ("i",)).free_variables() == frozenset()
+
+    def test_free_indices_exclude_bound_names(self):
+        body = Binary(
+            "*", ParamRef("c", ("I", "j")), VarRef("x", (IndexOffset("T", Const(1), False),))
+        )
+        expr = Binary("+", Sum(("i",), body, ParamRef("ok", ("j",))), SymbolRef("n"))
+
+        assert body.free_indices() == {"i", "j", "t"}
+        assert expr.free_indices() == {"j", "t", "n"}
+        assert Prod(("i", "j", "t"), body).free_indices() == frozenset()
+
+    def test_structure_key_ignores_index_labels(self):
+        diag = Binary("*", ParamRef("a", ("i1", "i1")), VarRef("x", ("i1",)))
+        other = Binary("*", ParamRef("a", ("i2", "i7")), VarRef("x", ("i7",)))
+        scaled = Binary("*", Const(2.0), VarRef("x", ("i1",)))
+
+        assert diag.structure_key() == other.structure_key()
+        assert diag.structure_key() != scaled.structure_key()
+        assert Const(1).structure_key() != Const(1.0).structure_key()
+
+    def test_summaries_are_cached(self):
+        expr = _lagged()
+        first = expr.free_variables()
+
+        assert expr.free_variables() is first
+        assert expr.right.free_variables() <= first
+
+
+class TestCompactLayout:
+    """Nodes are slotted; metadata and caches live in lazily created dicts."""
+
+    def test_nodes_have_no_instance_dict(self):
+        expr = _lagged()
+
+        assert not hasattr(expr, "__dict__")
+        with pytest.raises(AttributeError):
+            object.__setattr__(expr, "note", "x")
+
+    def test_metadata_reads_like_plain_attributes(self):
+        expr = VarRef("x", ("i",))
+
+        assert not hasattr(expr, "domain")
+        assert getattr(expr, "rank", None) is None
+        assert not hasattr(expr, "_metadata")
+
+        object.__setattr__(expr, "domain", ("i",))
+        object.__setattr__(expr, "rank", 1)
+
+        assert (expr.domain, expr.rank) == (("i",), 1)
+        assert not hasattr(expr, "free_domain")
+
+    def test_index_labels_are_interned(self):
+        label = "".join(["i", "17"])
+        token = Token("ID", "t3")
+        expr = ParamRef("".join(["a", "b"]), (label, token, IndexOffset("t", Const(1), False)))
+
+        assert expr.name is sys.intern("ab")
+        assert expr.indices[0] is sys.intern("i17")
+        assert type(expr.indices[1]) is str and expr.indices[1] is sys.intern("t3")
+        assert isinstance(expr.indices[2], IndexOffset)
+
+    def test_interned_index_tuple_is_shared(self):
+        indices = ("i", "j")
+
+        assert VarRef("x", indices).indices is indices
+        assert ParamRef("a", VarRef("x", indices).indices).indices is indices
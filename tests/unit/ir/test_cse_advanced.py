@@ -1,6 +1,6 @@
 """Unit tests for advanced CSE transformations (T5.2, T5.3, and T5.4)."""
 
-from src.ir.ast import Binary, Call, Const, SymbolRef
+from src.ir.ast import Binary, Call, Const, ParamRef, SymbolRef, VarRef
 from src.ir.transformations.cse_advanced import cse_with_aliasing, multiplicative_cse, nested_cse
 
 
@@ -195,6 +195,23 @@ class TestNestedCSE:
         result, temps = nested_cse(expr, min_occurrences=3)
         assert len(temps) == 0
 
+    def test_separately_built_indexed_subexpressions(self):
+        """Test: a(i)*x(i) built three times is still one candidate"""
+
+        def ax():
+            return Binary("*", ParamRef("a", ("i",)), VarRef("x", ("i",)))
+
+        expr = Binary("+", Binary("+", ax(), Call("exp", (ax(),))), Call("sqr", (ax(),)))
+
+        result, temps = nested_cse(expr, min_occurrences=3)
+
+        assert temps == {"t1": ax()}
+        assert result == Binary(
+            "+",
+            Binary("+", SymbolRef("t1"), Call("exp", (SymbolRef("t1"),))),
+            Call("sqr", (SymbolRef("t1"),)),
+        )
+
 
 class TestMultiplicativeCSE:
     """Test T5.3: Multiplicative Subexpression CSE."""
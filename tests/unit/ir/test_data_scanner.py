@@ -0,0 +1,206 @@
+"""Tests for the Table/Parameter data fast path (src/ir/data_scanner.py).
+
+Whatever the scanner accepts must produce exactly the ModelIR the grammar
+path produces, and everything else must be left to the grammar.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from pathlib import Path
+
+import pytest
+from lark import Tree
+
+from src.ir.data_scanner import (
+    COL_LEFT_TOLERANCE,
+    _match_column,
+    scan_parameter,
+    scan_table,
+)
+from src.ir.parser import ParserSemanticError, parse_model_text, parse_text
+from src.ir.preprocessor import preprocess_gams_file
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_CORPUS = sorted((_PROJECT_ROOT / "tests" / "fixtures" / "gamslib").glob("*.gms"))
+
+_SETS = "Set i / a, b, c, r1, r2 /;\nSet j / x, y, z, k1, k2, 1990, 2000 /;\n"
+
+
+def _grammar_only(monkeypatch) -> None:
+    monkeypatch.setenv("NLP2MCP_NO_DATA_FASTPATH", "1")
+
+
+def _scanned_nodes(source: str) -> list[str]:
+    return [
+        child.data
+        for child in parse_text(source).children
+        if isinstance(child, Tree) and child.data.startswith("scanned_")
+    ]
+
+
+class TestScanTable:
+    def test_reads_aligned_table(self):
+        table = scan_table(
+            "Table d(i,j) 'distance'\n        x     y\n    a   1.5   2.0\n    b   2.5;"
+        )
+        assert table is not None
+        assert (table.name, table.domain) == ("d", ("i", "j"))
+        assert table.values == {
+            ("a", "x"): 1.5,
+            ("a", "y"): 2.0,
+            ("b", "x"): 2.5,
+            ("b", "y"): 0.0,
+        }
+
+    def test_right_aligned_values_match_their_header(self):
+        table = scan_table("Table d(i,j)\n         x         y\n  a  -12.5   1.5e+03\n  b   7;")
+        assert table is not None
+        assert table.values[("a", "x")] == -12.5
+        assert table.values[("a", "y")] == 1500.0
+        assert table.values[("b", "x")] == 7.0
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            # `+` continuation blocks, quoted labels and special values
+            "Table d(i,j)\n     x   y\n a   1   2\n+    z\n a   3;",
+            "Table d(i,j)\n       x   y\n 'a-1'   1   2;",
+            "Table d(i,j)\n     x   y\n a   1   inf;",
+            # Dotted column headers, comments and unquoted descriptions
+            "Table d(i,j,k)\n     x.k1   y.k2\n a   1      2;",
+            "Table d(i,j)\n     x   y\n* note\n a   1   2;",
+            "Table d(i,j) distance table\n     x   y\n a   1   2;",
+            # Header on the declaration line, no data rows
+            "Table d(i,j)  x   y\n a   1   2;",
+            "Table d(i,j)\n     x   y;",
+            # A value one space after the label is read as part of the label
+            "Table d(i,j)\n         x   y\n 1990 5     2;",
+        ],
+    )
+    def test_unsupported_layouts_are_left_to_the_grammar(self, statement):
+        assert scan_table(statement) is None
+
+
+class TestScanParameter:
+    def test_reads_data_list_with_positions(self):
+        scanned = scan_parameter("Parameter\n p(I) 'x' / a 1,\n  b.c -2.5e3 /;", first_line=5)
+        assert scanned is not None
+        assert (scanned.name, scanned.domain) == ("p", ("i",))
+        assert scanned.keys == [("a",), ("b", "c")]
+        assert scanned.values == [1.0, -2500.0]
+        assert scanned.name_position == (6, 2)
+        assert scanned.positions == [(6, 13), (7, 3)]
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "Parameter p(i) / a inf /;",
+            "Parameter p(i) / 'a-1' 1 /;",
+            "Parameter p(i) / (a,b) 1 /;",
+            "Parameter p(i) / a 1, /;",
+            "Parameter p(i) / a 1 b 2 /;",
+            "Parameter p(i), q(i) / a 1 /;",
+            "Parameter p(i);",
+            "Parameter p / 5 /;",
+        ],
+    )
+    def test_unsupported_data_is_left_to_the_grammar(self, statement):
+        assert scan_parameter(statement) is None
+
+
+class TestMatchColumn:
+    def test_matches_builder_column_assignment(self):
+        """Compare against a direct port of ``_handle_table_block``'s matching loop."""
+
+        def reference(col, headers, used):
+            for cidx, (name, pos, width) in enumerate(headers):
+                if name in used:
+                    continue
+                if cidx > 0:
+                    start = (headers[cidx - 1][1] + headers[cidx - 1][2] + pos) / 2
+                else:
+                    start = pos - COL_LEFT_TOLERANCE
+                if cidx + 1 < len(headers):
+                    end = (pos + width + headers[cidx + 1][1]) / 2
+                else:
+                    end = float("inf")
+                if start <= col <= end:
+                    return name
+            best, best_distance = None, math.inf
+            for name, pos, _width in headers:
+                if name not in used and abs(pos - col) < best_distance:
+                    best, best_distance = name, abs(pos - col)
+            return best
+
+        rng = random.Random(1283)
+        for _ in range(300):
+            headers, pos = [], rng.randint(2, 12)
+            for k in range(rng.randint(1, 8)):
+                width = rng.randint(1, 6)
+                headers.append((f"h{k}", pos, width))
+                pos += width + rng.randint(1, 5)
+            positions = [p for _, p, _ in headers]
+            bounds = [
+                (p + w + q) / 2 for (_, p, w), (_, q, _) in zip(headers, headers[1:], strict=False)
+            ]
+            expected_used: set[str] = set()
+            used: set[str] = set()
+            for col in sorted(rng.randint(1, pos + 4) for _ in range(rng.randint(1, 10))):
+                expected = reference(col, headers, expected_used)
+                assert _match_column(col, headers, positions, bounds, used) == expected
+                if expected is not None:
+                    expected_used.add(expected)
+                    used.add(expected)
+
+
+class TestDataFastPathEquivalence:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "Table d(i,j) 'distance'\n        x     y\n    a   1.5   2.0\n    b   2.5   3.0\n    c;",
+            "Table d(i,j)\n           x       y       z\n  a     100     -20\n  b            3.5e2     7\n;",
+            "table d(*,j)\n         1990    2000\n  r1      1.5      .5\n  r2       2.    -1e-3;",
+            "Table d(i,j,*)\n            k1    k2\n  a.x        1     2\n  b.y        3\n  a.x        5     6;",
+            "Table d(i,j)\n          x        y\n  a      11        12\n  b   1000.25\n  c        13   14   15;",
+            "Parameter p(i) / a 1, b -2.5, c 1e3 /;",
+            "Parameters p(i,j) 'cost' /\n  a.x 1,\n  b.y 2\n/;",
+            "Parameter p / x 1, y 2 /;",
+            "Parameter p(j) / 1990 1, 2000 2 /;",
+            "Parameter p(*, j) / r1.x 1, r2.z 2 /;",
+        ],
+    )
+    def test_model_ir_matches_grammar_path(self, statement, monkeypatch):
+        source = _SETS + statement + "\n"
+        assert len(_scanned_nodes(source)) == 1
+
+        fast = parse_model_text(source)
+        _grammar_only(monkeypatch)
+        assert _scanned_nodes(source) == []
+        assert fast == parse_model_text(source)
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "Parameter p(i) / a 1,\n d 2 /;",
+            "Parameter p(i) / a 1,\n a.x 2 /;",
+            "Parameter p / x 1,\n x.y 2 /;",
+            "Parameter p(k) / a 1 /;",
+        ],
+    )
+    def test_semantic_errors_match_grammar_path(self, statement, monkeypatch):
+        source = _SETS + statement + "\n"
+        with pytest.raises(ParserSemanticError) as fast_error:
+            parse_model_text(source)
+        _grammar_only(monkeypatch)
+        with pytest.raises(ParserSemanticError) as reference_error:
+            parse_model_text(source)
+        assert str(fast_error.value) == str(reference_error.value)
+
+    @pytest.mark.parametrize("model_path", _CORPUS, ids=lambda p: p.name)
+    def test_corpus_model_ir_matches_grammar_path(self, model_path, monkeypatch):
+        source = preprocess_gams_file(model_path)
+        fast = parse_model_text(source)
+        _grammar_only(monkeypatch)
+        assert fast == parse_model_text(source)
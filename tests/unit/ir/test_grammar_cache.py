@@ -0,0 +1,110 @@
+"""Tests for the on-disk compiled-grammar cache (src/ir/grammar_cache.py)."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import main
+from src.ir import grammar_cache
+from src.ir.parser import _GRAMMAR_PATH, _LALR_GRAMMAR_PATH, _LALR_OPTIONS, _LARK_OPTIONS
+
+_SOURCE = "Set i / a, b /;\nParameter p(i) / a 1, b 2 /;\n"
+
+_TINY_GRAMMAR = """
+start: WORD+
+%import common.WORD
+%import common.WS
+%ignore WS
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NLP2MCP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("NLP2MCP_NO_CACHE", raising=False)
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def tiny_grammar(tmp_path):
+    path = tmp_path / "tiny.lark"
+    path.write_text(_TINY_GRAMMAR)
+    return path
+
+
+class TestGrammarCache:
+    def test_miss_writes_entry_and_hit_loads_it(self, cache_dir, tiny_grammar):
+        entry = grammar_cache.grammar_cache_path(tiny_grammar, {"parser": "earley"})
+        assert not entry.exists()
+
+        built = grammar_cache.load_or_build_parser(tiny_grammar, parser="earley")
+        assert entry.exists()
+        assert entry.parent.parent == cache_dir
+
+        loaded = grammar_cache.load_or_build_parser(tiny_grammar, parser="earley")
+        assert loaded is not built
+        assert loaded.parse("a b c") == built.parse("a b c")
+
+    def test_key_changes_with_grammar_contents(self, cache_dir, tiny_grammar):
+        before = grammar_cache.grammar_cache_path(tiny_grammar, {"parser": "earley"})
+        tiny_grammar.write_text(_TINY_GRAMMAR + "\n// edited\n")
+        after = grammar_cache.grammar_cache_path(tiny_grammar, {"parser": "earley"})
+        assert before != after
+
+    def test_key_changes_with_options_and_lark_version(self, tiny_grammar, monkeypatch):
+        earley = grammar_cache.grammar_cache_key(tiny_grammar, {"parser": "earley"})
+        lalr = grammar_cache.grammar_cache_key(tiny_grammar, {"parser": "lalr"})
+        assert earley != lalr
+
+        monkeypatch.setattr(grammar_cache.lark, "__version__", "0.0.0-test")
+        assert grammar_cache.grammar_cache_key(tiny_grammar, {"parser": "earley"}) != earley
+
+    def test_corrupt_entry_is_rebuilt(self, cache_dir, tiny_grammar):
+        entry = grammar_cache.grammar_cache_path(tiny_grammar, {"parser": "earley"})
+        entry.parent.mkdir(parents=True)
+        entry.write_bytes(b"not a pickle")
+
+        parser = grammar_cache.load_or_build_parser(tiny_grammar, parser="earley")
+        assert parser.parse("x") is not None
+        # The corrupt payload was replaced by a loadable entry
+        assert grammar_cache._load_entry(entry, {"parser": "earley"}) is not None
+
+    def test_disabled_cache_writes_nothing(self, cache_dir, tiny_grammar, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+        grammar_cache.load_or_build_parser(tiny_grammar, parser="earley")
+        assert not cache_dir.exists()
+
+    def test_cached_gams_parser_matches_fresh_build(self, cache_dir):
+        grammar_cache.warm_grammar_cache(_GRAMMAR_PATH, **_LARK_OPTIONS)
+        cached = grammar_cache.load_or_build_parser(_GRAMMAR_PATH, **_LARK_OPTIONS)
+        fresh = grammar_cache.Lark.open(str(_GRAMMAR_PATH), **_LARK_OPTIONS)
+        assert cached.parse(_SOURCE) == fresh.parse(_SOURCE)
+
+    def test_cached_lalr_parser_matches_fresh_build(self, cache_dir):
+        statement = "x(i)$(p(i) > 0) = sum(j, a(i,j));"
+        grammar_cache.warm_grammar_cache(_LALR_GRAMMAR_PATH, **_LALR_OPTIONS)
+        cached = grammar_cache.load_or_build_parser(_LALR_GRAMMAR_PATH, **_LALR_OPTIONS)
+        fresh = grammar_cache.Lark.open(str(_LALR_GRAMMAR_PATH), **_LALR_OPTIONS)
+        assert cached.parse(statement, start="assignment_stmt") == fresh.parse(
+            statement, start="assignment_stmt"
+        )
+
+
+class TestWarmGrammarCacheCLI:
+    def test_warm_flag_writes_entry_without_input_file(self, cache_dir):
+        result = CliRunner().invoke(main, ["--warm-grammar-cache"])
+
+        assert result.exit_code == 0, result.output
+        assert "Grammar cache written" in result.output
+        assert grammar_cache.grammar_cache_path(_GRAMMAR_PATH, _LARK_OPTIONS).exists()
+        assert grammar_cache.grammar_cache_path(_LALR_GRAMMAR_PATH, _LALR_OPTIONS).exists()
+
+    def test_warm_flag_respects_disabled_cache(self, cache_dir, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+
+        result = CliRunner().invoke(main, ["--warm-grammar-cache"])
+
+        assert result.exit_code == 0, result.output
+        assert "caching is disabled" in result.output
+        assert not cache_dir.exists()
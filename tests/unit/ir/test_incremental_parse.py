@@ -0,0 +1,175 @@
+"""Tests for incremental re-parsing (IncrementalParser in src/ir/parser.py).
+
+The harness mutates each GAMSLIB fixture at statement granularity and checks
+that the incrementally patched ModelIR equals a from-scratch parse.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.ir import parser as parser_module
+from src.ir.parser import IncrementalParser, parse_model_file, parse_model_text
+from src.ir.preprocessor import preprocess_gams_file, split_statements
+from src.utils.errors import ParseError
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_CORPUS = sorted((_PROJECT_ROOT / "tests" / "fixtures" / "gamslib").glob("*.gms"))
+
+_MODEL = """
+Sets i /a, b, c/;
+Scalar s / 1 /;
+Parameter c(i) / a 1, b 2, c 3 /;
+Positive Variable x(i);
+Variable z;
+Equations obj, bal(i);
+obj.. z =e= sum(i, c(i) * sqr(x(i)));
+bal(i)$(ord(i) > 1).. x(i) =g= x(i-1) + 1;
+s = 4;
+loop(i, c(i) = c(i) * 2);
+Model m /all/;
+Solve m using nlp minimizing z;
+"""
+
+
+def _statements(source: str, predicate: Callable[[str], bool]) -> list[tuple[int, int]]:
+    return [(s, e) for s, e in split_statements(source) if predicate(source[s:e])]
+
+
+def _perturb_first_equation(source: str) -> str | None:
+    spans = _statements(source, lambda text: ".." in text)
+    if not spans:
+        return None
+    _, end = spans[0]
+    return source[: end - 1] + " + 0" + source[end - 1 :]
+
+
+def _perturb_last_equation(source: str) -> str | None:
+    spans = _statements(source, lambda text: ".." in text)
+    if not spans:
+        return None
+    _, end = spans[-1]
+    return source[: end - 1] + " * 1" + source[end - 1 :]
+
+
+def _insert_lines_midway(source: str) -> str:
+    spans = split_statements(source)
+    start, _ = spans[len(spans) // 2]
+    return source[:start] + "\n* edited\n\n" + source[start:]
+
+
+def _prepend_blank_lines(source: str) -> str:
+    return "\n\n" + source
+
+
+def _append_assignment(source: str) -> str:
+    return source + "\nScalar incr_extra / 4 /;\nincr_extra = incr_extra + 1;\n"
+
+
+_MUTATIONS = {
+    "first-equation": _perturb_first_equation,
+    "last-equation": _perturb_last_equation,
+    "insert-lines": _insert_lines_midway,
+    "prepend-lines": _prepend_blank_lines,
+    "append": _append_assignment,
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_disk_cache(monkeypatch):
+    monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+
+
+class TestGamslibMutations:
+    @pytest.mark.parametrize("model_path", _CORPUS, ids=lambda p: p.name)
+    def test_mutations_match_full_parse(self, model_path, same_structure):
+        original = preprocess_gams_file(model_path)
+        incremental = IncrementalParser(checkpoint_interval=4)
+        assert same_structure(incremental.parse(original), parse_model_text(original))
+
+        for name, mutate in _MUTATIONS.items():
+            mutated = mutate(original)
+            if mutated is None:
+                continue
+            assert same_structure(incremental.parse(mutated), parse_model_text(mutated)), name
+            # ...and back again, against the state of the mutated version
+            assert same_structure(incremental.parse(original), parse_model_text(original)), name
+
+
+class TestIncrementalParser:
+    def test_unchanged_source_parses_nothing(self, same_structure):
+        incremental = IncrementalParser()
+        first = incremental.parse(_MODEL)
+        second = incremental.parse(_MODEL)
+        assert incremental.last_parsed == 0
+        assert second is not first
+        assert same_structure(second, first)
+
+    def test_edit_parses_only_changed_statement(self, same_structure):
+        incremental = IncrementalParser(checkpoint_interval=2)
+        incremental.parse(_MODEL)
+        edited = _MODEL.replace("x(i-1) + 1", "x(i-1) + 2")
+        model = incremental.parse(edited)
+        assert incremental.last_parsed == 1
+        # Resumed from the checkpoint before the edited statement (index 7)
+        assert incremental.last_replayed == 12 - 6
+        assert same_structure(model, parse_model_text(edited))
+
+    def test_moved_statements_get_new_positions(self, same_structure):
+        incremental = IncrementalParser()
+        incremental.parse(_MODEL)
+        edited = _MODEL.replace("Variable z;", "Variable z;\n\n\n")
+        model = incremental.parse(edited)
+        assert incremental.last_parsed == 0
+        assert model.equations["obj"].source_location.line == 11
+        assert same_structure(model, parse_model_text(edited))
+
+    def test_edit_before_assignments_replays_them(self):
+        incremental = IncrementalParser()
+        incremental.parse(_MODEL)
+        model = incremental.parse(_MODEL.replace("s / 1 /", "s / 5 /"))
+        # The later `s = 4;` still overrides the edited initial value
+        assert model.params["s"].values[()] == 4.0
+
+    def test_syntax_error_reports_and_recovers(self, same_structure):
+        incremental = IncrementalParser()
+        incremental.parse(_MODEL)
+        with pytest.raises(ParseError):
+            incremental.parse(_MODEL.replace("sqr(x(i)))", "sqr(x(i))"))
+        assert same_structure(incremental.parse(_MODEL), parse_model_text(_MODEL))
+
+    def test_toggle_change_starts_over(self, monkeypatch):
+        incremental = IncrementalParser()
+        incremental.parse(_MODEL)
+        monkeypatch.setenv("NLP2MCP_NO_LALR_FASTPATH", "1")
+        incremental.parse(_MODEL)
+        assert incremental.last_parsed == len(split_statements(_MODEL))
+
+
+class TestIncrementalParseModelFile:
+    @pytest.fixture
+    def model_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.delenv("NLP2MCP_NO_CACHE")
+        path = tmp_path / "model.gms"
+        path.write_text(_MODEL)
+        return path
+
+    def test_state_persists_between_calls(self, same_structure, model_file, monkeypatch):
+        parsed: list[int] = []
+        real = IncrementalParser.parse
+
+        def recording(self, source):
+            model = real(self, source)
+            parsed.append(self.last_parsed)
+            return model
+
+        monkeypatch.setattr(parser_module.IncrementalParser, "parse", recording)
+        parse_model_file(model_file, incremental=True)
+        model_file.write_text(_MODEL.replace("x(i-1) + 1", "x(i-1) + 3"))
+        model = parse_model_file(model_file, incremental=True)
+        assert parsed == [12, 1]
+        assert same_structure(model, parse_model_text(model_file.read_text()))
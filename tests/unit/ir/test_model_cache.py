@@ -0,0 +1,135 @@
+"""Tests for the on-disk ModelIR cache (src/ir/model_cache.py)."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.ir import model_cache
+from src.ir import parser as parser_module
+from src.ir.parser import parse_model_file
+from src.utils.case_insensitive_dict import CaseInsensitiveDict
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_CORPUS = sorted((_PROJECT_ROOT / "tests" / "fixtures" / "gamslib").glob("*.gms"))
+
+_MODEL = """
+Sets i /a, b/;
+Alias (i, ii);
+Parameter c(i) / a 1, b 2 /;
+Positive Variable x(i);
+Variable z;
+Equations obj, bal(i);
+obj.. z =e= sum(i, c(i) * sqr(x(i)));
+bal(i)$(ord(i) > 1).. x(i) =g= x(i-1) + 1;
+loop(i, c(i) = c(i) + 1);
+Model m /all/;
+Solve m using nlp minimizing z;
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NLP2MCP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("NLP2MCP_NO_CACHE", raising=False)
+    return tmp_path / "cache" / "model_ir"
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "model.gms"
+    path.write_text(_MODEL)
+    return path
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    parses: list[str] = []
+    real = parser_module.parse_model_text
+
+    def counting(source, **kwargs):
+        parses.append(source)
+        return real(source, **kwargs)
+
+    monkeypatch.setattr(parser_module, "parse_model_text", counting)
+    return parses
+
+
+class TestSerialization:
+    def test_round_trip_preserves_model(self, same_structure, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+        model = parser_module.parse_model_text(_MODEL)
+        loaded = model_cache.loads_model(model_cache.dumps_model(model))
+        assert loaded is not model
+        assert same_structure(loaded, model)
+        assert loaded.params.get_original_name("C") == model.params.get_original_name("c")
+        assert loaded.loop_statements[0].raw_node == model.loop_statements[0].raw_node
+
+    @pytest.mark.parametrize("model_path", _CORPUS, ids=lambda p: p.name)
+    def test_corpus_round_trip(self, model_path, same_structure, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+        model = parse_model_file(model_path)
+        data = model_cache.dumps_model(model)
+        assert len(data) < len(pickle.dumps(model, protocol=5))
+        assert same_structure(model_cache.loads_model(data), model)
+
+    @pytest.mark.parametrize("data", [b"", b"garbage", model_cache._MAGIC + b"\x00\x01"])
+    def test_foreign_data_is_rejected(self, data):
+        with pytest.raises(ValueError):
+            model_cache.loads_model(data)
+
+    def test_case_insensitive_dict_pickles_original_names(self):
+        names: CaseInsensitiveDict[int] = CaseInsensitiveDict()
+        names["MyParam"] = 1
+        loaded = pickle.loads(pickle.dumps(names))
+        assert loaded["MYPARAM"] == 1
+        assert list(loaded.original_keys()) == ["MyParam"]
+
+
+class TestModelCache:
+    def test_miss_writes_entry_and_hit_skips_parsing(
+        self, same_structure, cache_dir, model_file, count_parses
+    ):
+        first = parse_model_file(model_file)
+        assert len(count_parses) == 1
+        assert len(list(cache_dir.glob("*.ir"))) == 1
+
+        second = parse_model_file(model_file)
+        assert len(count_parses) == 1
+        assert second is not first
+        assert same_structure(second, first)
+
+    def test_hits_return_independent_copies(self, cache_dir, model_file):
+        parse_model_file(model_file)
+        hit = parse_model_file(model_file)
+        hit.params["c"].values[("a",)] = 99.0
+        assert parse_model_file(model_file).params["c"].values[("a",)] == 1.0
+
+    def test_edited_source_misses(self, cache_dir, model_file, count_parses):
+        parse_model_file(model_file)
+        model_file.write_text(_MODEL.replace("a 1, b 2", "a 3, b 4"))
+        assert parse_model_file(model_file).params["c"].values[("a",)] == 3.0
+        assert len(count_parses) == 2
+
+    def test_key_changes_with_fingerprint_and_toggles(self, monkeypatch):
+        before = model_cache.model_cache_key(_MODEL)
+        monkeypatch.setenv("NLP2MCP_NO_DATA_FASTPATH", "1")
+        toggled = model_cache.model_cache_key(_MODEL)
+        monkeypatch.setattr(model_cache, "_parser_fingerprint", lambda: "edited")
+        assert len({before, toggled, model_cache.model_cache_key(_MODEL)}) == 3
+
+    def test_no_cache_env_disables_cache(self, cache_dir, model_file, count_parses, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+        parse_model_file(model_file)
+        parse_model_file(model_file)
+        assert len(count_parses) == 2
+        assert not cache_dir.exists()
+
+    def test_corrupt_entry_is_a_miss(self, cache_dir, model_file, count_parses):
+        parse_model_file(model_file)
+        for path in cache_dir.glob("*.ir"):
+            path.write_bytes(model_cache._MAGIC + b"truncated")
+        assert parse_model_file(model_file).params["c"].values[("b",)] == 2.0
+        assert len(count_parses) == 2
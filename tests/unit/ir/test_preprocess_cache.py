@@ -0,0 +1,142 @@
+"""Tests for the on-disk preprocessed-source cache (src/ir/preprocess_cache.py)."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from src.ir import preprocess_cache, preprocessor
+from src.ir.preprocessor import preprocess_gams_file
+from src.utils.disk_cache import prune_lru
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NLP2MCP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("NLP2MCP_NO_CACHE", raising=False)
+    return tmp_path / "cache" / "preprocess"
+
+
+@pytest.fixture
+def model(tmp_path):
+    (tmp_path / "data.inc").write_text("Set i / a, b /;\n")
+    (tmp_path / "helper.inc").write_text("Parameter p%1(i) / a %2 /;\n")
+    root = tmp_path / "model.gms"
+    root.write_text(
+        "$include data.inc\n"
+        "$batInclude helper.inc x 1\n"
+        "$batInclude optional.inc y 2\n"
+        "Scalar s / 3 /;\n"
+    )
+    return root
+
+
+@pytest.fixture
+def count_runs(monkeypatch):
+    """Count how often the preprocessing pipeline actually runs."""
+    runs: list[str] = []
+    real = preprocessor._preprocess_content
+
+    def counting(content):
+        runs.append(content)
+        return real(content)
+
+    monkeypatch.setattr(preprocessor, "_preprocess_content", counting)
+    return runs
+
+
+class TestPreprocessCache:
+    def test_miss_writes_entry_and_hit_skips_preprocessing(self, cache_dir, model, count_runs):
+        first = preprocess_gams_file(model)
+        assert len(count_runs) == 1
+        assert len(list(cache_dir.glob("*.gms"))) == 1
+        assert len(list(cache_dir.glob("*.manifest.json"))) == 1
+
+        assert preprocess_gams_file(str(model)) == first
+        assert len(count_runs) == 1
+
+    def test_closure_lists_every_file_looked_up(self, cache_dir, model):
+        closure = preprocessor.include_closure(model)
+        folder = model.parent.resolve()
+        assert closure.keys() == {
+            folder / "model.gms",
+            folder / "data.inc",
+            folder / "helper.inc",
+            folder / "optional.inc",
+        }
+        assert closure[folder / "optional.inc"] is None
+        assert closure[folder / "data.inc"] == preprocess_cache.file_digest(folder / "data.inc")
+
+    @pytest.mark.parametrize("changed", ["model.gms", "data.inc", "helper.inc"])
+    def test_editing_any_file_in_the_closure_invalidates(
+        self, cache_dir, model, count_runs, changed
+    ):
+        preprocess_gams_file(model)
+        path = model.parent / changed
+        path.write_text(path.read_text() + "Scalar t / 4 /;\n")
+
+        result = preprocess_gams_file(model)
+        assert len(count_runs) == 2
+        assert "Scalar t / 4 /;" in result
+        assert preprocess_gams_file(model) == result
+        assert len(count_runs) == 2
+
+    def test_creating_a_missing_bat_include_invalidates(self, cache_dir, model, count_runs):
+        assert "optional.inc y 2 - file not found" in preprocess_gams_file(model)
+        (model.parent / "optional.inc").write_text("Parameter q%1 / %2 /;\n")
+        assert "Parameter qy / 2 /;" in preprocess_gams_file(model)
+        assert len(count_runs) == 2
+
+    def test_unrelated_files_do_not_invalidate(self, cache_dir, model, count_runs):
+        preprocess_gams_file(model)
+        (model.parent / "other.inc").write_text("Set k / z /;\n")
+        preprocess_gams_file(model)
+        assert len(count_runs) == 1
+
+    def test_key_changes_with_preprocessor_fingerprint(self, model, monkeypatch):
+        closure = {model.resolve(): preprocess_cache.file_digest(model)}
+        before = preprocess_cache.preprocess_cache_key(closure)
+        monkeypatch.setattr(preprocess_cache, "_preprocessor_fingerprint", lambda: "edited")
+        assert preprocess_cache.preprocess_cache_key(closure) != before
+
+    def test_no_cache_env_disables_cache(self, cache_dir, model, count_runs, monkeypatch):
+        monkeypatch.setenv("NLP2MCP_NO_CACHE", "1")
+        preprocess_gams_file(model)
+        preprocess_gams_file(model)
+        assert len(count_runs) == 2
+        assert not cache_dir.exists()
+
+    @pytest.mark.parametrize("pattern", ["*.gms", "*.manifest.json"])
+    def test_corrupt_files_are_a_miss(self, cache_dir, model, count_runs, pattern):
+        expected = preprocess_gams_file(model)
+        for path in cache_dir.glob(pattern):
+            path.write_bytes(b"\xff\xfe not valid")
+        assert preprocess_gams_file(model) == expected
+        assert len(count_runs) == 2
+
+    def test_cache_is_bounded_lru(self, cache_dir, tmp_path, monkeypatch):
+        monkeypatch.setenv(preprocess_cache.MAX_SIZE_ENV, "0.002")  # ~2 KB
+        models = []
+        for k in range(6):
+            path = tmp_path / f"m{k}.gms"
+            path.write_text(f"Set i{k} / {', '.join(f'e{n}' for n in range(100))} /;\n")
+            models.append(path)
+            preprocess_gams_file(path)
+        total = sum(path.stat().st_size for path in cache_dir.iterdir())
+        assert total <= int(0.002 * 1024 * 1024)
+        assert preprocess_cache.load_preprocessed(models[-1]) is not None
+        assert preprocess_cache.load_preprocessed(models[0]) is None
+
+
+class TestPruneLru:
+    def test_removes_oldest_files_first(self, tmp_path):
+        for k in range(5):
+            path = tmp_path / f"f{k}"
+            path.write_bytes(b"x" * 100)
+            os.utime(path, (1000 + k, 1000 + k))
+        prune_lru(tmp_path, 250)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["f3", "f4"]
+
+    def test_missing_directory_is_ignored(self, tmp_path):
+        prune_lru(tmp_path / "absent", 0)
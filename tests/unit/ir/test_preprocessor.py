@@ -11,6 +11,7 @@ Tests the integrated preprocessing pipeline added in Sprint 7 Day 2:
 Based on design from docs/research/preprocessor_directives.md
 """
 
+import re
 from pathlib import Path
 
 import pytest
@@ -20,22 +21,36 @@ from src.ir.preprocessor import (
     _expand_gams_range,
     _needs_multi_segment_expansion,
     _parse_label_group,
+    _preprocess_content,
     _safe_eval_arithmetic,
     _split_dotted_label_segments,
+    expand_macro_calls,
     expand_macros,
     expand_multi_segment_tuple_row_labels,
+    expand_table_column_groups,
     expand_tuple_only_table_rows,
     extract_conditional_sets,
     extract_eval_directives,
+    extract_macro_definitions,
     extract_set_directives,
+    insert_missing_semicolons,
     join_multiline_assignments,
     join_multiline_equations,
+    join_multiline_table_row_parens,
+    normalize_double_commas,
+    normalize_for_parser,
     normalize_multi_line_continuations,
+    normalize_special_identifiers,
+    normalize_table_continuations,
     preprocess_gams_file,
     preprocess_text,
     process_conditionals,
+    quote_unquoted_table_descriptions,
+    split_statements,
     strip_conditional_directives,
+    strip_eol_comments,
     strip_eval_directives,
+    strip_macro_directives,
     strip_set_directives,
     strip_unsupported_directives,
 )
@@ -2251,3 +2266,132 @@ $endIf"""
         # Other branches (and the $else fallback) commented out:
         assert "* [Excluded: Parameter theta(i) / 1 0.2 /;]" in out
         assert "* [Excluded: theta(i) = ord(i)/card(i);]" in out
+
+
+class TestSplitStatements:
+    """Test split_statements() statement boundary detection."""
+
+    @staticmethod
+    def _texts(source: str) -> list[str]:
+        return [source[start:end] for start, end in split_statements(source)]
+
+    def test_splits_at_top_level_semicolons(self):
+        source = "Set i / a, b /;\nx(i) = 1;  y = 2;"
+        assert self._texts(source) == ["Set i / a, b /;", "x(i) = 1;", "y = 2;"]
+
+    def test_skips_leading_comments_and_whitespace(self):
+        source = "* header\n\n  x = 1;\n$ontext\nignored; text\n$offtext\n// note;\ny = 2;"
+        assert self._texts(source) == ["x = 1;", "y = 2;"]
+
+    def test_semicolons_in_strings_and_brackets_do_not_split(self):
+        source = "Set i 'a;b' / x /;\nloop(i, p = 1; q = 2;);\nz = 3;"
+        assert self._texts(source) == [
+            "Set i 'a;b' / x /;",
+            "loop(i, p = 1; q = 2;);",
+            "z = 3;",
+        ]
+
+    def test_unterminated_quote_ends_at_newline(self):
+        source = "Parameter p  farmer's share;\nx = 1;"
+        assert self._texts(source) == ["Parameter p  farmer's share;\nx = 1;"]
+        source = "Parameter p  farmer's share\n;\nx = 1;"
+        assert self._texts(source) == ["Parameter p  farmer's share\n;", "x = 1;"]
+
+    def test_trailing_code_without_semicolon(self):
+        assert self._texts("x = 1;\nsolve m using nlp min z") == [
+            "x = 1;",
+            "solve m using nlp min z",
+        ]
+        assert self._texts("x = 1;\n* trailing comment\n") == ["x = 1;"]
+
+    def test_spans_index_the_original_source(self):
+        source = "  a = 1;\n* c\nb = 2;"
+        assert split_statements(source) == [(2, 8), (13, 19)]
+
+    def test_many_ontext_blocks(self):
+        block = "$onText\nignored; text\n$OFFTEXT\nx = 1;\n"
+        assert self._texts(block * 20_000) == ["x = 1;"] * 20_000
+
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_FIXTURE_MODELS = sorted((_PROJECT_ROOT / "tests" / "fixtures").rglob("*.gms"))
+
+
+def _stepwise_preprocess(content: str) -> str:
+    """_preprocess_content as one whole-source pass per step, via the public functions."""
+    macros = extract_conditional_sets(content)
+    macros.update(extract_set_directives(content, macros))
+    macros.update(extract_eval_directives(content, macros))
+    for key, val in SYSTEM_MACROS.items():
+        macros.setdefault(key, val)
+    content = process_conditionals(content, macros)
+    content = expand_macros(content, macros)
+    content = expand_macro_calls(content, extract_macro_definitions(content))
+    for step in (
+        strip_conditional_directives,
+        strip_set_directives,
+        strip_eval_directives,
+        strip_macro_directives,
+        strip_eol_comments,
+        strip_unsupported_directives,
+        lambda text: re.sub(r"\babort\.noerror\b", "abort", text, flags=re.IGNORECASE),
+        join_multiline_equations,
+        join_multiline_assignments,
+        quote_unquoted_table_descriptions,
+        normalize_table_continuations,
+        normalize_multi_line_continuations,
+        insert_missing_semicolons,
+        normalize_special_identifiers,
+        join_multiline_table_row_parens,
+        expand_tuple_only_table_rows,
+        expand_multi_segment_tuple_row_labels,
+        expand_table_column_groups,
+        normalize_double_commas,
+    ):
+        content = step(content)
+    return content
+
+
+class TestLineBufferPipeline:
+    """The shared line buffer must not change what the preprocessor produces."""
+
+    @pytest.mark.parametrize(
+        "model_path", _FIXTURE_MODELS, ids=lambda p: str(p.relative_to(_PROJECT_ROOT))
+    )
+    def test_matches_stepwise_pipeline_on_fixture_models(self, model_path):
+        content = model_path.read_text()
+        assert _preprocess_content(content) == _stepwise_preprocess(content)
+
+    def test_matches_stepwise_pipeline_on_mixed_directives(self):
+        content = (
+            "$eolcom //\n$set n 3\n$if not set m $set m 2\n$macro dbl(x) 2*x\n"
+            "$ontext\nTable hidden(i,j)\n$offtext\n"
+            "Set i / light-ind, food+agr,, i%n% /\n"
+            "Table t(i,j) flows (units)\n         a     b\n+        c\n"
+            "(x,y)    1     2   // note\n   z.(p,q).r  3;\n"
+            "e..  sum(i, dbl(v(i)))\n   + 1\n   =e= 2;\n"
+            "p(i) = (q(i)\n      * 2);\nabort.noerror 'done';\n"
+        )
+        assert _preprocess_content(content) == _stepwise_preprocess(content)
+
+    @pytest.mark.parametrize(
+        "model_path", _FIXTURE_MODELS[:20], ids=lambda p: str(p.relative_to(_PROJECT_ROOT))
+    )
+    def test_normalize_for_parser_matches_individual_steps(self, model_path):
+        source = model_path.read_text()
+        expected = source
+        for step in (
+            normalize_multi_line_continuations,
+            normalize_double_commas,
+            normalize_special_identifiers,
+            join_multiline_table_row_parens,
+            expand_tuple_only_table_rows,
+            expand_multi_segment_tuple_row_labels,
+        ):
+            expected = step(expected)
+        assert normalize_for_parser(source) == expected
+
+    def test_expand_macro_calls_nested_and_repeated(self):
+        macro_defs = {"f": (["t"], "t*2"), "g": (["a", "b"], "(a-b)")}
+        source = "y = f(f(x)) + f(2) + g(1, f(3));"
+        assert expand_macro_calls(source, macro_defs) == "y = x*2*2 + 2*2 + (1-3*2);"
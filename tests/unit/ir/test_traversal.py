@@ -0,0 +1,161 @@
+"""Tests for the iterative tree walkers in src/ir/traversal.py.
+
+The deep-tree tests build 10^5-term linear sums (a 10^5-deep left-nested
+chain of Binary nodes) and run them through each walker under the default
+recursion limit. Results are checked with ``iter_postorder`` and string
+output, since ``==`` and ``repr`` on such trees are themselves recursive.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from src.ad.ad_core import simplify
+from src.ad.constraint_jacobian import _resolve_index_offsets
+from src.ad.derivative_rules import differentiate_expr
+from src.emit.expr_to_gams import expr_to_gams
+from src.ir.ast import Binary, Call, Const, IndexOffset, ParamRef, Unary, VarRef
+from src.ir.condition_eval import evaluate_condition
+from src.ir.model_ir import ModelIR
+from src.ir.symbols import ParameterDef, SetDef
+from src.ir.traversal import flatten_chain, fold, iter_postorder, rewrite
+
+pytestmark = pytest.mark.unit
+
+N_TERMS = 100_000
+
+
+def _linear_sum(n: int, term) -> Binary:
+    expr = term(0)
+    for k in range(1, n):
+        expr = Binary("+", expr, term(k))
+    return expr
+
+
+def _count(expr):
+    total = 1
+    for child in expr.children():
+        total += yield (child,)
+    return total
+
+
+class TestHelpers:
+    def test_iter_postorder_order(self):
+        x, y = VarRef("x", ()), VarRef("y", ())
+        neg = Unary("-", y)
+        expr = Binary("*", x, neg)
+
+        assert list(iter_postorder(expr)) == [x, y, neg, expr]
+
+    def test_rewrite_shares_untouched_subtrees(self):
+        kept = Call("exp", (VarRef("x", ("i",)),))
+        expr = Binary("+", kept, ParamRef("p", ("i",)))
+
+        def to_one(node):
+            return Const(1.0) if isinstance(node, ParamRef) else node
+
+        result = rewrite(expr, to_one)
+
+        assert result == Binary("+", kept, Const(1.0))
+        assert result.left is kept
+        assert rewrite(kept, to_one) is kept
+
+    def test_rewrite_descend_skips_children(self):
+        expr = Call("f", (ParamRef("p", ()),))
+
+        def to_one(node):
+            return Const(1.0) if isinstance(node, ParamRef) else node
+
+        assert rewrite(expr, to_one, descend=lambda node: False) is expr
+
+    def test_flatten_chain(self):
+        x, y, z = VarRef("x", ()), VarRef("y", ()), VarRef("z", ())
+
+        assert flatten_chain(Binary("+", Binary("+", x, y), z), "+") == [x, y, z]
+        assert flatten_chain(Binary("+", x, Binary("+", y, z)), "+") == [x, y, z]
+        assert flatten_chain(Binary("-", Binary("+", x, y), z), "+") == [
+            Binary("-", Binary("+", x, y), z)
+        ]
+        assert flatten_chain(Binary("*", Binary("+", x, y), z), "*") == [Binary("+", x, y), z]
+
+    def test_fold_matches_recursion(self):
+        expr = Binary("*", VarRef("x", ()), Unary("-", Const(2.0)))
+
+        assert fold(_count, expr) == 4
+
+    def test_fold_throws_child_errors_into_parent(self):
+        def visit(expr):
+            if isinstance(expr, Const):
+                raise ValueError("leaf")
+            try:
+                yield (expr.child,)
+            except ValueError:
+                return "caught"
+            return "not reached"
+
+        assert fold(visit, Unary("-", Const(1.0))) == "caught"
+        with pytest.raises(ValueError, match="leaf"):
+            fold(visit, Const(1.0))
+
+
+class TestDeepTrees:
+    """10^5-term sums go through every converted walker without RecursionError."""
+
+    @pytest.fixture(autouse=True)
+    def _default_recursion_limit(self):
+        assert sys.getrecursionlimit() < N_TERMS
+
+    def test_fold_and_iter_postorder(self):
+        expr = _linear_sum(N_TERMS, lambda k: VarRef("x", (f"i{k}",)))
+
+        assert fold(_count, expr) == 2 * N_TERMS - 1
+        assert sum(1 for _ in iter_postorder(expr)) == 2 * N_TERMS - 1
+        assert len(flatten_chain(expr, "+")) == N_TERMS
+
+    def test_differentiate_and_simplify(self):
+        expr = _linear_sum(N_TERMS, lambda k: VarRef("x", (f"i{k}",)))
+
+        deriv = differentiate_expr(expr, "x", ("i7",))
+        assert sum(1 for _ in iter_postorder(deriv)) == 2 * N_TERMS - 1
+
+        simplified = simplify(deriv)
+        assert isinstance(simplified, Const)
+        assert simplified.value == 1.0
+
+    def test_expr_to_gams(self):
+        expr = _linear_sum(N_TERMS, lambda k: VarRef("x", (f"i{k}",)))
+
+        gams = expr_to_gams(expr)
+
+        assert gams.startswith('x("i0") + x("i1") + ')
+        assert gams.endswith(f' + x("i{N_TERMS - 1}")')
+        assert gams.count(" + ") == N_TERMS - 1
+
+    def test_expr_to_gams_subtracting_negative_constants(self):
+        expr = Binary("-", Binary("-", VarRef("x", ()), Const(-2.0)), Const(3.0))
+
+        assert expr_to_gams(expr) == "x + 2 - 3"
+        assert expr_to_gams(expr, parent_op="*") == "(x + 2 - 3)"
+
+    def test_resolve_index_offsets(self):
+        model_ir = ModelIR()
+        model_ir.sets["t"] = SetDef(name="t", domain=(), members=["1", "2", "3"])
+        model_ir.params["p"] = ParameterDef(name="p", domain=("t",))
+        lead = ParamRef("p", (IndexOffset("1", Const(1.0), False),))
+        expr = _linear_sum(N_TERMS, lambda k: lead)
+
+        resolved = _resolve_index_offsets(expr, model_ir)
+
+        leaves = [node for node in iter_postorder(resolved) if isinstance(node, ParamRef)]
+        assert len(leaves) == N_TERMS
+        assert all(leaf.indices == ("2",) for leaf in leaves)
+
+    def test_evaluate_condition(self):
+        model_ir = ModelIR()
+        model_ir.params["p"] = ParameterDef(name="p", values={(): 1.0})
+        total = _linear_sum(N_TERMS, lambda k: ParamRef("p", ()))
+
+        assert evaluate_condition(Binary(">=", total, Const(N_TERMS)), (), (), model_ir)
+        assert not evaluate_condition(Binary(">", total, Const(N_TERMS)), (), (), model_ir)